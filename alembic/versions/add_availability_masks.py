@@ -0,0 +1,65 @@
+"""Add per-entity availability bitmasks
+
+Revision ID: add_availability_masks
+Revises: add_keyset_indexes
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'add_availability_masks'
+down_revision = 'add_keyset_indexes'
+branch_labels = None
+depends_on = None
+
+# (mask table, owner table, owner column, cell table)
+MASKS = [
+    ('teacher_availability_masks', 'teachers', 'teacher_id', 'teacher_availability'),
+    ('group_unavailability_masks', 'groups', 'group_id', 'group_unavailability'),
+]
+
+# Builds every owner's mask from its rows. Ordinals and the key follow
+# TimeslotCodec: timeslots sorted by day, lesson and frequency, and the md5
+# of their comma-joined IDs in that order. Position i of the bit string is
+# ordinal i.
+BACKFILL = """
+    WITH slots AS (
+        SELECT timeslot_id,
+               row_number() OVER (ORDER BY day, lesson_id, frequency::text COLLATE "C") AS ordinal
+        FROM timeslots
+    ), codec AS (
+        SELECT md5(coalesce(string_agg(timeslot_id::text, ',' ORDER BY ordinal), '')) AS codec_key FROM slots
+    )
+    INSERT INTO {mask_table} ({owner}, mask, codec_key)
+    SELECT o.{owner},
+           CAST(string_agg(CASE WHEN c.timeslot_id IS NULL THEN '0' ELSE '1' END, '' ORDER BY s.ordinal) AS varbit),
+           (SELECT codec_key FROM codec)
+    FROM {owner_table} o
+    CROSS JOIN slots s
+    LEFT JOIN {cell_table} c ON c.{owner} = o.{owner} AND c.timeslot_id = s.timeslot_id
+    GROUP BY o.{owner}
+"""
+
+
+def upgrade() -> None:
+    for mask_table, owner_table, owner, cell_table in MASKS:
+        op.create_table(
+            mask_table,
+            sa.Column(
+                owner, postgresql.UUID(as_uuid=True),
+                sa.ForeignKey(f'{owner_table}.{owner}', onupdate='CASCADE', ondelete='CASCADE'),
+                primary_key=True,
+            ),
+            sa.Column('mask', postgresql.BIT(varying=True), nullable=False),
+            sa.Column('codec_key', sa.String(length=32), nullable=False),
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        )
+        op.execute(BACKFILL.format(mask_table=mask_table, owner_table=owner_table, owner=owner, cell_table=cell_table))
+
+
+def downgrade() -> None:
+    for mask_table, *_ in reversed(MASKS):
+        op.drop_table(mask_table)
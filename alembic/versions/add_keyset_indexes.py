@@ -0,0 +1,34 @@
+"""Add indexes backing keyset pagination of catalog lists
+
+Revision ID: add_keyset_indexes
+Revises: add_semester_calendars
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_keyset_indexes'
+down_revision = 'add_semester_calendars'
+branch_labels = None
+depends_on = None
+
+# Each index matches a list sort and ends in a unique column, so a page is an
+# index range scan starting right after the cursor
+INDEXES = [
+    ('ix_teachers_name_keyset', 'teachers', ['last_name', 'first_name', 'teacher_id']),
+    ('ix_students_name_keyset', 'students', ['last_name', 'first_name', 'student_id']),
+    ('ix_users_name_keyset', 'users', ['last_name', 'first_name', 'user_id']),
+    ('ix_users_created_keyset', 'users', ['created_at', 'user_id']),
+    ('ix_groups_course_name', 'groups', ['course', 'name']),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
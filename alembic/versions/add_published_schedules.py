@@ -0,0 +1,35 @@
+"""Add published_schedules table
+
+Revision ID: add_published_schedules
+Revises: partition_assignments_by_schedule
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'add_published_schedules'
+down_revision = 'partition_assignments_by_schedule'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'published_schedules',
+        sa.Column('scope', sa.String(length=100), primary_key=True),
+        sa.Column('schedule_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('published_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(
+            ['schedule_id'], ['schedules.schedule_id'],
+            onupdate='CASCADE', ondelete='RESTRICT'
+        ),
+    )
+    op.create_index('ix_published_schedules_schedule_id', 'published_schedules', ['schedule_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_published_schedules_schedule_id', table_name='published_schedules')
+    op.drop_table('published_schedules')
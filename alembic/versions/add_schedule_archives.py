@@ -0,0 +1,32 @@
+"""Add schedule_archives table
+
+Revision ID: add_schedule_archives
+Revises: make_assignment_uniques_deferrable
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'add_schedule_archives'
+down_revision = 'make_assignment_uniques_deferrable'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'schedule_archives',
+        sa.Column('schedule_id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('label', sa.String(length=255), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('archived_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('assignments_count', sa.Integer(), nullable=False),
+        sa.Column('payload', sa.LargeBinary(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('schedule_archives')
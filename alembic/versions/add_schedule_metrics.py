@@ -0,0 +1,34 @@
+"""Add schedule_metrics table
+
+Revision ID: add_schedule_metrics
+Revises: add_timetable_entries
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'add_schedule_metrics'
+down_revision = 'add_timetable_entries'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'schedule_metrics',
+        sa.Column('schedule_id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('snapshot_built_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('computed_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('metrics', postgresql.JSONB(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['schedule_id'], ['schedules.schedule_id'],
+            onupdate='CASCADE', ondelete='CASCADE'
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('schedule_metrics')
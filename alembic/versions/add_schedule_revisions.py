@@ -0,0 +1,68 @@
+"""Add schedule revisions (parent_schedule_id, materialized) and assignment_deltas
+
+Revision ID: add_schedule_revisions
+Revises: add_published_schedules
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'add_schedule_revisions'
+down_revision = 'add_published_schedules'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('schedules', sa.Column('parent_schedule_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.add_column(
+        'schedules',
+        sa.Column('materialized', sa.Boolean(), nullable=False, server_default=sa.true())
+    )
+    op.create_foreign_key(
+        'schedules_parent_schedule_id_fkey', 'schedules', 'schedules',
+        ['parent_schedule_id'], ['schedule_id'],
+        onupdate='CASCADE', ondelete='SET NULL'
+    )
+    op.create_index('ix_schedules_parent_schedule_id', 'schedules', ['parent_schedule_id'])
+
+    op.create_table(
+        'assignment_deltas',
+        sa.Column('schedule_id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('assignment_id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('op', sa.String(length=6), nullable=False),
+        sa.Column('timeslot_id', sa.Integer(), nullable=True),
+        sa.Column('group_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('subgroup_no', sa.SmallInteger(), nullable=True),
+        sa.Column('course_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('teacher_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('room_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column(
+            'course_type',
+            postgresql.ENUM('lec', 'prac', 'lab', name='course_type', create_type=False),
+            nullable=True
+        ),
+        sa.CheckConstraint("op IN ('add', 'remove')", name='ck_assignment_deltas_op'),
+        sa.CheckConstraint(
+            "op = 'remove' OR (timeslot_id IS NOT NULL AND group_id IS NOT NULL AND subgroup_no IS NOT NULL "
+            "AND course_id IS NOT NULL AND teacher_id IS NOT NULL AND course_type IS NOT NULL)",
+            name='ck_assignment_deltas_add_complete'
+        ),
+        sa.ForeignKeyConstraint(['schedule_id'], ['schedules.schedule_id'], onupdate='CASCADE', ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['timeslot_id'], ['timeslots.timeslot_id'], onupdate='CASCADE', ondelete='RESTRICT'),
+        sa.ForeignKeyConstraint(['group_id'], ['groups.group_id'], onupdate='CASCADE', ondelete='RESTRICT'),
+        sa.ForeignKeyConstraint(['course_id'], ['courses.course_id'], onupdate='CASCADE', ondelete='RESTRICT'),
+        sa.ForeignKeyConstraint(['teacher_id'], ['teachers.teacher_id'], onupdate='CASCADE', ondelete='RESTRICT'),
+        sa.ForeignKeyConstraint(['room_id'], ['rooms.room_id'], onupdate='CASCADE', ondelete='RESTRICT'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('assignment_deltas')
+    op.drop_index('ix_schedules_parent_schedule_id', table_name='schedules')
+    op.drop_constraint('schedules_parent_schedule_id_fkey', 'schedules', type_='foreignkey')
+    op.drop_column('schedules', 'materialized')
+    op.drop_column('schedules', 'parent_schedule_id')
@@ -0,0 +1,37 @@
+"""Add schedule_snapshots table
+
+Revision ID: add_schedule_snapshots
+Revises: add_schedule_revisions
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'add_schedule_snapshots'
+down_revision = 'add_schedule_revisions'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'schedule_snapshots',
+        sa.Column('schedule_id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('format', sa.SmallInteger(), nullable=False),
+        sa.Column('assignments_count', sa.Integer(), nullable=False),
+        sa.Column('built_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('payload', sa.LargeBinary(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['schedule_id'], ['schedules.schedule_id'],
+            onupdate='CASCADE', ondelete='CASCADE'
+        ),
+    )
+    # The payload is already compressed; keep it out of TOAST compression
+    op.execute("ALTER TABLE schedule_snapshots ALTER COLUMN payload SET STORAGE EXTERNAL")
+
+
+def downgrade() -> None:
+    op.drop_table('schedule_snapshots')
@@ -0,0 +1,40 @@
+"""Add pg_trgm indexes for admin search
+
+Revision ID: add_search_trigram_indexes
+Revises: add_teacher_preferences_gin
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_search_trigram_indexes'
+down_revision = 'add_teacher_preferences_gin'
+branch_labels = None
+depends_on = None
+
+FULL_NAME = "(last_name || ' ' || first_name || ' ' || coalesce(patronymic, ''))"
+EMAIL = "(email::text)"
+
+INDEXES = [
+    ('ix_teachers_name_trgm', 'teachers', FULL_NAME),
+    ('ix_students_name_trgm', 'students', FULL_NAME),
+    ('ix_users_name_trgm', 'users', FULL_NAME),
+    ('ix_users_email_trgm', 'users', EMAIL),
+    ('ix_registration_requests_name_trgm', 'registration_requests', FULL_NAME),
+    ('ix_registration_requests_email_trgm', 'registration_requests', EMAIL),
+    ('ix_groups_name_trgm', 'groups', 'name'),
+    ('ix_courses_name_trgm', 'courses', 'name'),
+    ('ix_courses_code_trgm', 'courses', 'code'),
+]
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS "pg_trgm"')
+    for name, table, expression in INDEXES:
+        op.execute(f"CREATE INDEX {name} ON {table} USING gin ({expression} gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
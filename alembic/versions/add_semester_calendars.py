@@ -0,0 +1,34 @@
+"""Add semester_calendars table
+
+Revision ID: add_semester_calendars
+Revises: add_schedule_metrics
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'add_semester_calendars'
+down_revision = 'add_schedule_metrics'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'semester_calendars',
+        sa.Column('calendar_id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('name', sa.String(length=100), nullable=False, unique=True),
+        sa.Column('start_date', sa.Date(), nullable=False),
+        sa.Column('end_date', sa.Date(), nullable=False),
+        sa.Column('parity_anchor', sa.Date(), nullable=False),
+        sa.Column('holidays', postgresql.ARRAY(sa.Date()), nullable=False, server_default=sa.text("'{}'::date[]")),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.CheckConstraint('end_date >= start_date', name='ck_semester_calendars_dates'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('semester_calendars')
@@ -0,0 +1,27 @@
+"""Add GIN index on teacher preferences
+
+Revision ID: add_teacher_preferences_gin
+Revises: add_availability_masks
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_teacher_preferences_gin'
+down_revision = 'add_availability_masks'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # jsonb_path_ops only supports @>, which is all the preference queries use,
+    # and is smaller and faster than the default jsonb_ops
+    op.create_index(
+        'ix_teacher_preferences_gin', 'teacher_preferences', ['preferences'],
+        postgresql_using='gin', postgresql_ops={'preferences': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_teacher_preferences_gin', table_name='teacher_preferences')
@@ -0,0 +1,68 @@
+"""Add timetable_entries read model and schedules.entries_built
+
+Revision ID: add_timetable_entries
+Revises: add_schedule_snapshots
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'add_timetable_entries'
+down_revision = 'add_schedule_snapshots'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'schedules', sa.Column('entries_built', sa.Boolean(), nullable=False, server_default=sa.false())
+    )
+    op.create_table(
+        'timetable_entries',
+        sa.Column('schedule_id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('assignment_id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('timeslot_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.SmallInteger(), nullable=False),
+        sa.Column('lesson_id', sa.Integer(), nullable=False),
+        sa.Column(
+            'frequency',
+            postgresql.ENUM('ALL', 'ODD', 'EVEN', name='timeslot_frequency_enum', create_type=False),
+            nullable=False
+        ),
+        sa.Column('start_time', sa.Time(), nullable=False),
+        sa.Column('end_time', sa.Time(), nullable=False),
+        sa.Column('group_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('group_name', sa.String(length=100), nullable=False),
+        sa.Column('subgroup_no', sa.SmallInteger(), nullable=False),
+        sa.Column('course_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('course_name', sa.String(length=255), nullable=False),
+        sa.Column(
+            'course_type',
+            postgresql.ENUM('lec', 'prac', 'lab', name='course_type', create_type=False),
+            nullable=False
+        ),
+        sa.Column('teacher_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('teacher_name', sa.Text(), nullable=False),
+        sa.Column('room_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('room_name', sa.String(length=100), nullable=True),
+        sa.ForeignKeyConstraint(
+            ['schedule_id'], ['schedules.schedule_id'],
+            onupdate='CASCADE', ondelete='RESTRICT'
+        ),
+    )
+    op.create_index('ix_tte_group', 'timetable_entries', ['schedule_id', 'group_id', 'day', 'lesson_id'])
+    op.create_index('ix_tte_teacher', 'timetable_entries', ['schedule_id', 'teacher_id', 'day', 'lesson_id'])
+    op.create_index('ix_tte_room', 'timetable_entries', ['schedule_id', 'room_id', 'day', 'lesson_id'])
+    op.create_index('ix_tte_day', 'timetable_entries', ['schedule_id', 'day', 'lesson_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tte_day', table_name='timetable_entries')
+    op.drop_index('ix_tte_room', table_name='timetable_entries')
+    op.drop_index('ix_tte_teacher', table_name='timetable_entries')
+    op.drop_index('ix_tte_group', table_name='timetable_entries')
+    op.drop_table('timetable_entries')
+    op.drop_column('schedules', 'entries_built')
@@ -0,0 +1,38 @@
+"""Make assignment uniqueness constraints deferrable
+
+Revision ID: make_assignment_uniques_deferrable
+Revises: add_registration_group_id
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'make_assignment_uniques_deferrable'
+down_revision = 'add_registration_group_id'
+branch_labels = None
+depends_on = None
+
+
+_CONSTRAINTS = {
+    'uq_asg_subgroup_time': ['schedule_id', 'timeslot_id', 'group_id', 'subgroup_no'],
+    'uq_asg_teacher_time': ['schedule_id', 'timeslot_id', 'teacher_id'],
+    'uq_asg_room_time': ['schedule_id', 'timeslot_id', 'room_id'],
+}
+
+
+def upgrade() -> None:
+    # DEFERRABLE INITIALLY IMMEDIATE: still checked per statement, but at the
+    # end of it, so a single UPDATE can swap two assignments' timeslots.
+    for name, columns in _CONSTRAINTS.items():
+        op.drop_constraint(name, 'assignments', type_='unique')
+        op.create_unique_constraint(
+            name, 'assignments', columns,
+            deferrable=True, initially='IMMEDIATE'
+        )
+
+
+def downgrade() -> None:
+    for name, columns in _CONSTRAINTS.items():
+        op.drop_constraint(name, 'assignments', type_='unique')
+        op.create_unique_constraint(name, 'assignments', columns)
@@ -0,0 +1,113 @@
+"""Partition assignments by schedule_id
+
+Revision ID: partition_assignments_by_schedule
+Revises: add_schedule_archives
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'partition_assignments_by_schedule'
+down_revision = 'add_schedule_archives'
+branch_labels = None
+depends_on = None
+
+
+_COLUMNS = (
+    "assignment_id, schedule_id, timeslot_id, group_id, subgroup_no, "
+    "course_id, teacher_id, room_id, course_type"
+)
+_INDEXES = ('ix_asg_group_view', 'ix_asg_teacher_view', 'ix_asg_room_view')
+_CONSTRAINTS = ('uq_asg_subgroup_time', 'uq_asg_teacher_time', 'uq_asg_room_time', 'ck_assignments_subgroup_no')
+
+_CREATE_PARTITIONED = """
+CREATE TABLE assignments (
+    assignment_id UUID NOT NULL,
+    schedule_id UUID NOT NULL REFERENCES schedules (schedule_id) ON DELETE RESTRICT ON UPDATE CASCADE,
+    timeslot_id INTEGER NOT NULL REFERENCES timeslots (timeslot_id) ON DELETE RESTRICT ON UPDATE CASCADE,
+    group_id UUID NOT NULL REFERENCES groups (group_id) ON DELETE RESTRICT ON UPDATE CASCADE,
+    subgroup_no SMALLINT NOT NULL,
+    course_id UUID NOT NULL REFERENCES courses (course_id) ON DELETE RESTRICT ON UPDATE CASCADE,
+    teacher_id UUID NOT NULL REFERENCES teachers (teacher_id) ON DELETE RESTRICT ON UPDATE CASCADE,
+    room_id UUID REFERENCES rooms (room_id) ON DELETE RESTRICT ON UPDATE CASCADE,
+    course_type course_type NOT NULL,
+    PRIMARY KEY (assignment_id, schedule_id),
+    CONSTRAINT uq_asg_subgroup_time UNIQUE (schedule_id, timeslot_id, group_id, subgroup_no) DEFERRABLE INITIALLY IMMEDIATE,
+    CONSTRAINT uq_asg_teacher_time UNIQUE (schedule_id, timeslot_id, teacher_id) DEFERRABLE INITIALLY IMMEDIATE,
+    CONSTRAINT uq_asg_room_time UNIQUE (schedule_id, timeslot_id, room_id) DEFERRABLE INITIALLY IMMEDIATE,
+    CONSTRAINT ck_assignments_subgroup_no CHECK (subgroup_no > 0)
+) PARTITION BY LIST (schedule_id)
+"""
+
+_CREATE_PLAIN = """
+CREATE TABLE assignments (
+    assignment_id UUID PRIMARY KEY,
+    schedule_id UUID NOT NULL REFERENCES schedules (schedule_id) ON DELETE RESTRICT ON UPDATE CASCADE,
+    timeslot_id INTEGER NOT NULL REFERENCES timeslots (timeslot_id) ON DELETE RESTRICT ON UPDATE CASCADE,
+    group_id UUID NOT NULL REFERENCES groups (group_id) ON DELETE RESTRICT ON UPDATE CASCADE,
+    subgroup_no SMALLINT NOT NULL,
+    course_id UUID NOT NULL REFERENCES courses (course_id) ON DELETE RESTRICT ON UPDATE CASCADE,
+    teacher_id UUID NOT NULL REFERENCES teachers (teacher_id) ON DELETE RESTRICT ON UPDATE CASCADE,
+    room_id UUID REFERENCES rooms (room_id) ON DELETE RESTRICT ON UPDATE CASCADE,
+    course_type course_type NOT NULL,
+    CONSTRAINT uq_asg_subgroup_time UNIQUE (schedule_id, timeslot_id, group_id, subgroup_no) DEFERRABLE INITIALLY IMMEDIATE,
+    CONSTRAINT uq_asg_teacher_time UNIQUE (schedule_id, timeslot_id, teacher_id) DEFERRABLE INITIALLY IMMEDIATE,
+    CONSTRAINT uq_asg_room_time UNIQUE (schedule_id, timeslot_id, room_id) DEFERRABLE INITIALLY IMMEDIATE,
+    CONSTRAINT ck_assignments_subgroup_no CHECK (subgroup_no > 0)
+)
+"""
+
+_CREATE_INDEXES = (
+    "CREATE INDEX ix_asg_group_view ON assignments (schedule_id, group_id, subgroup_no, timeslot_id)",
+    "CREATE INDEX ix_asg_teacher_view ON assignments (schedule_id, teacher_id, timeslot_id)",
+    "CREATE INDEX ix_asg_room_view ON assignments (schedule_id, room_id, timeslot_id)",
+)
+
+
+def _move_aside() -> None:
+    """Renames the current table and its globally named objects out of the way."""
+    op.execute("ALTER TABLE assignments RENAME TO assignments_old")
+    for name in _CONSTRAINTS:
+        op.execute(f"ALTER TABLE assignments_old RENAME CONSTRAINT {name} TO {name}_old")
+    for name in _INDEXES:
+        op.execute(f"ALTER INDEX {name} RENAME TO {name}_old")
+    op.execute("ALTER INDEX assignments_pkey RENAME TO assignments_old_pkey")
+
+
+def upgrade() -> None:
+    _move_aside()
+
+    op.execute(_CREATE_PARTITIONED)
+    for ddl in _CREATE_INDEXES:
+        op.execute(ddl)
+    op.execute("CREATE TABLE assignments_default PARTITION OF assignments DEFAULT")
+
+    # One partition per existing schedule
+    op.execute("""
+        DO $$
+        DECLARE s uuid;
+        BEGIN
+            FOR s IN SELECT schedule_id FROM schedules LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF assignments FOR VALUES IN (%L)',
+                    'assignments_p_' || replace(s::text, '-', ''), s
+                );
+            END LOOP;
+        END $$;
+    """)
+
+    op.execute(f"INSERT INTO assignments ({_COLUMNS}) SELECT {_COLUMNS} FROM assignments_old")
+    op.execute("DROP TABLE assignments_old")
+
+
+def downgrade() -> None:
+    _move_aside()
+
+    op.execute(_CREATE_PLAIN)
+    for ddl in _CREATE_INDEXES:
+        op.execute(ddl)
+
+    op.execute(f"INSERT INTO assignments ({_COLUMNS}) SELECT {_COLUMNS} FROM assignments_old")
+    # Dropping the partitioned parent drops all of its partitions
+    op.execute("DROP TABLE assignments_old")
@@ -1,10 +1,11 @@
 from fastapi import APIRouter, Depends, Query, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
-from sqlalchemy.orm import aliased
+from typing import Optional
 
 from app.db.session import get_db
 from app.core.security import get_current_admin
+from app.db.models.common_enums import StudentStatus, TeacherStatus
 from app.db.models.people.student import Student
 from app.db.models.people.teacher import Teacher
 from app.db.models.people.user import User
@@ -16,6 +17,7 @@ from app.schemas.admin import (
 )
 from app.schemas.student import StudentCreate, StudentUpdate, StudentOut
 from app.schemas.teacher import TeacherResponse
+from app.repositories.pagination import MAX_PAGE_SIZE, TotalMode
 from app.repositories.students_repository import StudentRepository
 from app.repositories.teacher_repository import TeacherRepository
 from app.utils.unset import UNSET
@@ -48,72 +50,66 @@ async def get_admin_stats(
 async def list_students(
     db: AsyncSession = Depends(get_db),
     _: User = Depends(get_current_admin),
-    offset: int = Query(0, ge=0),
-    limit: int = Query(50, ge=1, le=200),
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="nextCursor of the previous page"),
+    status_filter: Optional[StudentStatus] = Query(None, alias="status", description="Only students with this status"),
+    group_id: Optional[uuid.UUID] = Query(None, description="Only students of this group"),
+    total: TotalMode = Query("exact", description="exact, estimated (planner estimate) or none"),
 ):
-    # total count
-    total_res = await db.execute(select(func.count()).select_from(Student))
-    total = total_res.scalar_one()
+    # keyset page, with the linked user's email if present
+    try:
+        page = await StudentRepository(db).find_page(
+            limit, cursor, status=status_filter, group_id=group_id, total=total
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-    # left join user to get email if present
-    user_alias = aliased(User)
-    stmt = (
-        select(Student, user_alias.email)
-        .select_from(Student)
-        .join(user_alias, user_alias.user_id == Student.user_id, isouter=True)
-        .order_by(Student.last_name, Student.first_name)
-        .offset(offset)
-        .limit(limit)
-    )
-    res = await db.execute(stmt)
     items: list[AdminStudent] = []
-    for s, email in res.all():
+    for row in page.rows:
+        s = row.Student
         items.append(AdminStudent(
             student_id=s.student_id,
             first_name=s.first_name,
             last_name=s.last_name,
             patronymic=s.patronymic,
             status=s.status,
-            email=email,
+            email=row.email,
             group_id=s.group_id,
         ))
 
-    return AdminStudentListResponse(students=items, total=total)
+    return AdminStudentListResponse(students=items, total=page.total, next_cursor=page.next_cursor)
 
 
 @router.get("/teachers", response_model=AdminTeacherListResponse)
 async def list_teachers(
     db: AsyncSession = Depends(get_db),
     _: User = Depends(get_current_admin),
-    offset: int = Query(0, ge=0),
-    limit: int = Query(50, ge=1, le=200),
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="nextCursor of the previous page"),
+    status_filter: Optional[TeacherStatus] = Query(None, alias="status", description="Only teachers with this status"),
+    total: TotalMode = Query("exact", description="exact, estimated (planner estimate) or none"),
 ):
-    total_res = await db.execute(select(func.count()).select_from(Teacher))
-    total = total_res.scalar_one()
+    try:
+        page = await TeacherRepository(db).find_page(
+            limit, cursor, status=status_filter, total=total, with_email=True
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-    user_alias = aliased(User)
-    stmt = (
-        select(Teacher, user_alias.email)
-        .select_from(Teacher)
-        .join(user_alias, user_alias.user_id == Teacher.user_id, isouter=True)
-        .order_by(Teacher.last_name, Teacher.first_name)
-        .offset(offset)
-        .limit(limit)
-    )
-    res = await db.execute(stmt)
     items: list[AdminTeacher] = []
-    for t, email in res.all():
+    for row in page.rows:
+        t = row.Teacher
         items.append(AdminTeacher(
             teacher_id=t.teacher_id,
             first_name=t.first_name,
             last_name=t.last_name,
             patronymic=t.patronymic,
             status=t.status,
-            email=email,
+            email=row.email,
             user_id=t.user_id,
         ))
 
-    return AdminTeacherListResponse(teachers=items, total=total)
+    return AdminTeacherListResponse(teachers=items, total=page.total, next_cursor=page.next_cursor)
 
 
 @router.post("/students", response_model=StudentOut, status_code=status.HTTP_201_CREATED)
@@ -5,6 +5,7 @@ from sqlalchemy import select
 from datetime import datetime, timezone
 
 from app.db.session import get_db
+from app.core.deps import get_registration_service
 from app.core.security import get_current_admin
 from app.db.models.people.user import User, UserRole
 from app.db.models.people.teacher import Teacher
@@ -16,7 +17,11 @@ from app.schemas.registration import (
     UpdateRegistrationRequest,
     ApproveRegistrationRequest,
     RejectRegistrationRequest,
+    BulkApproveRegistrations,
+    BulkRejectRegistrations,
+    BulkRegistrationResult,
 )
+from app.services.registration_service import RegistrationService
 
 router = APIRouter(prefix="/admin/registrations")
 
@@ -63,6 +68,31 @@ async def list_registration_requests(
     return requests
 
 
+@router.post("/bulk/approve", response_model=BulkRegistrationResult)
+async def bulk_approve_registration_requests(
+    body: BulkApproveRegistrations,
+    service: RegistrationService = Depends(get_registration_service),
+    _: User = Depends(get_current_admin),
+):
+    """
+    Схвалює кілька заявок в одній транзакції: користувачі, викладачі та
+    студенти створюються чи оновлюються для всіх заявок разом. Для кожної
+    заявки повертається результат; відсутні, уже розглянуті та конфліктні
+    заявки пропускаються, не зупиняючи решту.
+    """
+    return await service.approve(body)
+
+
+@router.post("/bulk/reject", response_model=BulkRegistrationResult)
+async def bulk_reject_registration_requests(
+    body: BulkRejectRegistrations,
+    service: RegistrationService = Depends(get_registration_service),
+    _: User = Depends(get_current_admin),
+):
+    """Відхиляє кілька заявок одним запитом; для кожної повертається результат."""
+    return await service.reject(body)
+
+
 @router.put("/{request_id}", response_model=RegistrationRequestOut)
 async def update_registration_request(
     request_id: uuid.UUID,
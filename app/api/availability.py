@@ -0,0 +1,77 @@
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.exc import NoResultFound
+
+from app.core.deps import get_group_unavailability_service, get_teacher_availability_service
+from app.core.security import get_current_admin
+from app.db.models.people.user import User
+from app.schemas.availability import (
+    AvailabilityMatrix,
+    AvailabilityMatrixUpdate,
+    AvailabilityMatrixUpdateResult,
+    MatrixEncoding,
+)
+from app.services.group_unavailability_service import GroupUnavailabilityService
+from app.services.teacher_availability_service import TeacherAvailabilityService
+
+router = APIRouter(prefix="/availability")
+
+
+@router.get("/teachers", response_model=AvailabilityMatrix)
+async def get_teacher_availability_matrix(
+    teacher_ids: Optional[List[UUID]] = Query(None, alias="teacher_id", description="Repeat for several; all if omitted"),
+    encoding: MatrixEncoding = Query("bitmask", description="bitmask (hex) or rle (runs of ordinals)"),
+    service: TeacherAvailabilityService = Depends(get_teacher_availability_service),
+    _: User = Depends(get_current_admin),
+):
+    """Доступність викладачів як матриця викладач × таймслот."""
+    return await service.get_matrix(teacher_ids, encoding)
+
+
+@router.put("/teachers", response_model=AvailabilityMatrixUpdateResult)
+async def update_teacher_availability_matrix(
+    update: AvailabilityMatrixUpdate,
+    service: TeacherAvailabilityService = Depends(get_teacher_availability_service),
+    _: User = Depends(get_current_admin),
+):
+    """
+    Замінює доступність перелічених викладачів одним запитом; змінюються
+    лише клітинки, що відрізняються від збережених.
+    """
+    try:
+        return await service.apply_matrix(update)
+    except NoResultFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/groups", response_model=AvailabilityMatrix)
+async def get_group_unavailability_matrix(
+    group_ids: Optional[List[UUID]] = Query(None, alias="group_id", description="Repeat for several; all if omitted"),
+    encoding: MatrixEncoding = Query("bitmask", description="bitmask (hex) or rle (runs of ordinals)"),
+    service: GroupUnavailabilityService = Depends(get_group_unavailability_service),
+    _: User = Depends(get_current_admin),
+):
+    """Недоступні таймслоти груп як матриця група × таймслот."""
+    return await service.get_matrix(group_ids, encoding)
+
+
+@router.put("/groups", response_model=AvailabilityMatrixUpdateResult)
+async def update_group_unavailability_matrix(
+    update: AvailabilityMatrixUpdate,
+    service: GroupUnavailabilityService = Depends(get_group_unavailability_service),
+    _: User = Depends(get_current_admin),
+):
+    """
+    Замінює недоступні таймслоти перелічених груп одним запитом; змінюються
+    лише клітинки, що відрізняються від збережених.
+    """
+    try:
+        return await service.apply_matrix(update)
+    except NoResultFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
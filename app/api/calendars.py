@@ -0,0 +1,81 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException
+
+from app.core.deps import get_semester_calendar_service
+from app.core.security import get_current_admin
+from app.db.models.people.user import User
+from app.schemas.semester_calendar import (
+    SemesterCalendarCreate,
+    SemesterCalendarListResponse,
+    SemesterCalendarResponse,
+    SemesterCalendarUpdate,
+)
+from app.services.semester_calendar_service import SemesterCalendarService
+
+router = APIRouter(prefix="/calendars")
+
+
+@router.get("", response_model=SemesterCalendarListResponse)
+async def list_calendars(
+    service: SemesterCalendarService = Depends(get_semester_calendar_service),
+):
+    """Список семестрових календарів, від найпізнішого семестру."""
+    return await service.list_calendars()
+
+
+@router.get("/{calendar_id}", response_model=SemesterCalendarResponse)
+async def get_calendar(
+    calendar_id: UUID,
+    service: SemesterCalendarService = Depends(get_semester_calendar_service),
+):
+    """Повертає семестровий календар."""
+    calendar = await service.get_calendar(calendar_id)
+    if calendar is None:
+        raise HTTPException(status_code=404, detail="Semester calendar not found")
+    return calendar
+
+
+@router.post("", response_model=SemesterCalendarResponse, status_code=201)
+async def create_calendar(
+    data: SemesterCalendarCreate,
+    service: SemesterCalendarService = Depends(get_semester_calendar_service),
+    _: User = Depends(get_current_admin),
+):
+    """
+    Створює семестровий календар: межі семестру, святкові дні та якір
+    парності — будь-який день першого непарного тижня.
+    """
+    try:
+        return await service.create_calendar(data)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+
+@router.patch("/{calendar_id}", response_model=SemesterCalendarResponse)
+async def update_calendar(
+    calendar_id: UUID,
+    data: SemesterCalendarUpdate,
+    service: SemesterCalendarService = Depends(get_semester_calendar_service),
+    _: User = Depends(get_current_admin),
+):
+    """Змінює семестровий календар; розгорнуті за ним розклади перебудовуються."""
+    try:
+        calendar = await service.update_calendar(calendar_id, data)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if calendar is None:
+        raise HTTPException(status_code=404, detail="Semester calendar not found")
+    return calendar
+
+
+@router.delete("/{calendar_id}")
+async def delete_calendar(
+    calendar_id: UUID,
+    service: SemesterCalendarService = Depends(get_semester_calendar_service),
+    _: User = Depends(get_current_admin),
+) -> dict[str, str]:
+    """Видаляє семестровий календар."""
+    if not await service.delete_calendar(calendar_id):
+        raise HTTPException(status_code=404, detail="Semester calendar not found")
+    return {"message": "Semester calendar successfully deleted"}
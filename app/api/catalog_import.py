@@ -0,0 +1,74 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
+
+from app.core.deps import get_catalog_import_service
+from app.core.security import get_current_admin
+from app.db.models.people.user import User
+from app.schemas.catalog_import import CatalogImportBundle, CatalogImportResponse
+from app.services.catalog_import_service import CatalogImportService, bundle_from_csv
+
+router = APIRouter(prefix="/admin/catalog")
+
+
+async def _import(service: CatalogImportService, bundle: CatalogImportBundle) -> CatalogImportResponse:
+    try:
+        return await service.import_bundle(bundle)
+    except IntegrityError as e:
+        # A concurrent change slipped in between validation and the upsert
+        raise HTTPException(status_code=409, detail=f"Catalog changed during import: {e.orig}")
+
+
+@router.post("/import", response_model=CatalogImportResponse)
+async def import_catalog(
+    bundle: CatalogImportBundle,
+    service: CatalogImportService = Depends(get_catalog_import_service),
+    _: User = Depends(get_current_admin),
+):
+    """
+    Масовий імпорт каталогу: аудиторії, курси, викладачі, групи (з батьківськими
+    групами за назвою) та зв'язки групи-курси і викладачі-курси. Записи
+    оновлюються за природними ключами; якщо хоч один рядок не проходить
+    перевірку, нічого не записується, а відповідь містить звіт по рядках.
+    """
+    return await _import(service, bundle)
+
+
+@router.post("/import/csv", response_model=CatalogImportResponse)
+async def import_catalog_csv(
+    rooms: Optional[UploadFile] = File(None),
+    courses: Optional[UploadFile] = File(None),
+    teachers: Optional[UploadFile] = File(None),
+    groups: Optional[UploadFile] = File(None),
+    group_courses: Optional[UploadFile] = File(None),
+    teacher_courses: Optional[UploadFile] = File(None),
+    service: CatalogImportService = Depends(get_catalog_import_service),
+    _: User = Depends(get_current_admin),
+):
+    """
+    Той самий імпорт із CSV-файлів (UTF-8, рядок заголовків з назвами полів),
+    по файлу на розділ; порожні клітинки вважаються не заданими.
+    """
+    uploads = {
+        "rooms": rooms,
+        "courses": courses,
+        "teachers": teachers,
+        "groups": groups,
+        "group_courses": group_courses,
+        "teacher_courses": teacher_courses,
+    }
+    files = {}
+    for section, upload in uploads.items():
+        if upload is not None:
+            try:
+                files[section] = (await upload.read()).decode("utf-8")
+            except UnicodeDecodeError:
+                raise HTTPException(status_code=400, detail=f"{section}: file is not valid UTF-8")
+    try:
+        bundle = bundle_from_csv(files)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+    return await _import(service, bundle)
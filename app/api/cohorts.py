@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.exc import NoResultFound
+
+from app.core.deps import get_cohort_service
+from app.core.security import get_current_admin
+from app.db.models.people.user import User
+from app.schemas.cohort import (
+    SemesterRolloverRequest,
+    SemesterRolloverResult,
+    StudentTransferRequest,
+    StudentTransferResult,
+)
+from app.services.cohort_service import CohortService
+
+router = APIRouter(prefix="/admin/cohorts")
+
+
+@router.post("/transfer", response_model=StudentTransferResult)
+async def transfer_students(
+    request: StudentTransferRequest,
+    service: CohortService = Depends(get_cohort_service),
+    _: User = Depends(get_current_admin),
+):
+    """
+    Переводить студентів (за списком ID або всіх студентів групи) до іншої
+    групи одним запитом; з dry_run лише повертає кількість.
+    """
+    try:
+        return await service.transfer_students(request)
+    except NoResultFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.post("/rollover", response_model=SemesterRolloverResult)
+async def rollover_semester(
+    request: SemesterRolloverRequest,
+    service: CohortService = Depends(get_cohort_service),
+    _: User = Depends(get_current_admin),
+):
+    """
+    Перехід на новий семестр: групи переводяться на наступний курс, а
+    зв'язки з курсами копіюються із груп-шаблонів; з dry_run лише
+    повертає кількість.
+    """
+    try:
+        return await service.rollover(request)
+    except NoResultFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
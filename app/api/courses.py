@@ -1,18 +1,36 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, Depends, Query
+from sqlalchemy.exc import NoResultFound
+from typing import List, Literal, Optional
 from uuid import UUID
 from app.services.course_service import CourseService
 from app.core.deps import get_course_service
-from app.schemas.course import CourseCreate, CourseUpdate, CourseResponse, CourseListResponse
+from app.core.security import get_current_admin
+from app.db.models.people.user import User
+from app.repositories.pagination import MAX_PAGE_SIZE, TotalMode
+from app.schemas.course import (
+    CourseCreate,
+    CourseUpdate,
+    CourseResponse,
+    CourseListResponse,
+    CourseLinksBulkUpdate,
+    CourseLinksBulkResult,
+)
 
 router = APIRouter()
 
 
 @router.get("/", response_model=CourseListResponse)
 async def get_all_courses(
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: Optional[str] = Query(None, description="nextCursor of the previous page"),
+    sort: Literal["name"] = Query("name", description="Sort order"),
+    total: TotalMode = Query("exact", description="exact, estimated (planner estimate) or none"),
     course_service: CourseService = Depends(get_course_service)
 ) -> CourseListResponse:
-    return await course_service.get_all_courses()
+    try:
+        return await course_service.get_all_courses(limit, cursor, sort, total=total)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/{course_id}", response_model=CourseResponse)
@@ -47,6 +65,22 @@ async def create_course(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.put("/links", response_model=CourseLinksBulkResult)
+async def update_course_links(
+    update: CourseLinksBulkUpdate,
+    course_service: CourseService = Depends(get_course_service),
+    _: User = Depends(get_current_admin),
+) -> CourseLinksBulkResult:
+    """
+    Задає групи та викладачів багатьох курсів одним запитом; змінюються лише
+    зв'язки, що відрізняються, а збережені зберігають count_per_week і frequency.
+    """
+    try:
+        return await course_service.apply_links(update)
+    except NoResultFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
 @router.put("/{course_id}", response_model=CourseResponse)
 async def update_course(
     course_id: UUID,
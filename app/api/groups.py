@@ -1,9 +1,10 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, Depends, Query
+from typing import List, Literal, Optional
 from uuid import UUID
 
 from app.core.deps import get_group_service
 from app.services.group_service import GroupService
+from app.repositories.pagination import MAX_PAGE_SIZE, TotalMode
 from app.schemas.group import GroupCreate, GroupUpdate, GroupResponse, GroupListResponse
 
 router = APIRouter()
@@ -11,9 +12,18 @@ router = APIRouter()
 
 @router.get("/", response_model=GroupListResponse)
 async def get_all_groups(
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: Optional[str] = Query(None, description="nextCursor of the previous page"),
+    sort: Literal["name", "course"] = Query("name", description="Sort order"),
+    type: Optional[Literal["bachelor", "master"]] = Query(None, description="Only groups of this type"),
+    course: Optional[int] = Query(None, ge=1, le=6, description="Only groups of this study year"),
+    total: TotalMode = Query("exact", description="exact, estimated (planner estimate) or none"),
     group_service: GroupService = Depends(get_group_service)
 ) -> GroupListResponse:
-    return await group_service.get_all_groups()
+    try:
+        return await group_service.get_all_groups(limit, cursor, sort, type=type, course=course, total=total)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/{group_id}", response_model=GroupResponse)
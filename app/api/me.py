@@ -0,0 +1,65 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy.exc import NoResultFound
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.security.http import HTTPAuthorizationCredentials
+
+from app.core.deps import get_semester_calendar_service, get_timetable_service
+from app.core.security import security, decode_access_token
+from app.schemas.semester_calendar import NextLessonsResponse
+from app.schemas.timetable import TimetableResponse
+from app.services.semester_calendar_service import SemesterCalendarService
+from app.services.timetable_service import TimetableService
+
+router = APIRouter(prefix="/me")
+
+
+@router.get("/timetable", response_model=TimetableResponse)
+async def get_my_timetable(
+    schedule_id: Optional[UUID] = Query(None, description="Defaults to the schedule published in `scope`"),
+    scope: str = Query("default", max_length=100, description="Publication scope (faculty or semester)"),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    service: TimetableService = Depends(get_timetable_service),
+) -> TimetableResponse:
+    """
+    Timetable of the authenticated student (own group and its parent groups)
+    or teacher, resolved from the JWT in a single database query. Unless
+    `schedule_id` is given, the published schedule of `scope` is shown
+    (the latest one if nothing has been published yet).
+    """
+    token_payload = decode_access_token(credentials.credentials)
+    timetable = await service.get_user_timetable(token_payload.sub, schedule_id, scope)
+    if timetable is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found or inactive"
+        )
+    return timetable
+
+
+@router.get("/next", response_model=NextLessonsResponse)
+async def get_my_next_lessons(
+    at: Optional[datetime] = Query(None, description="Moment to look from; the current server time if omitted"),
+    scope: str = Query("default", max_length=100, description="Publication scope (faculty or semester)"),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    service: SemesterCalendarService = Depends(get_semester_calendar_service),
+) -> NextLessonsResponse:
+    """
+    Current and next lessons of the authenticated student (own group and
+    its parent groups) or teacher, with week parity and lesson times of the
+    semester calendar applied. Meant for frequent polling: once warm it is
+    answered from the cached per-user timeline without database queries.
+    """
+    token_payload = decode_access_token(credentials.credentials)
+    try:
+        lessons = await service.get_next_lessons(token_payload.sub, at, scope)
+    except NoResultFound as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    if lessons is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found or inactive"
+        )
+    return lessons
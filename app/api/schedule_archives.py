@@ -0,0 +1,75 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.exc import NoResultFound
+
+from app.core.deps import get_schedule_archive_service
+from app.core.security import get_current_admin
+from app.db.models.people.user import User
+from app.schemas.schedule_archive import (
+    ScheduleArchiveListResponse,
+    SchedulePurgeResult,
+    ScheduleRetentionReport,
+    ScheduleRetentionRequest,
+)
+from app.services.schedule_archive_service import ScheduleArchiveService
+
+router = APIRouter(prefix="/schedule-archives")
+
+
+@router.get("", response_model=ScheduleArchiveListResponse)
+async def list_schedule_archives(
+    service: ScheduleArchiveService = Depends(get_schedule_archive_service),
+    _: User = Depends(get_current_admin),
+):
+    """Список заархівованих розкладів."""
+    return await service.list_archives()
+
+
+@router.post("/retention", response_model=ScheduleRetentionReport)
+async def apply_schedule_retention(
+    request: ScheduleRetentionRequest,
+    service: ScheduleArchiveService = Depends(get_schedule_archive_service),
+    _: User = Depends(get_current_admin),
+):
+    """
+    Застосовує політику зберігання: для кожного префікса мітки лишає останні
+    keepLast розкладів, решту архівує та видаляє пакетами.
+    Найновіший розклад не архівується ніколи. За замовчуванням dryRun=true.
+    """
+    return await service.apply_retention(
+        label_prefixes=request.label_prefixes,
+        keep_last=request.keep_last,
+        batch_size=request.batch_size,
+        dry_run=request.dry_run,
+    )
+
+
+@router.post("/{schedule_id}", response_model=SchedulePurgeResult)
+async def archive_schedule(
+    schedule_id: UUID,
+    service: ScheduleArchiveService = Depends(get_schedule_archive_service),
+    _: User = Depends(get_current_admin),
+):
+    """Архівує один розклад і видаляє його з робочих таблиць."""
+    try:
+        return await service.archive_schedule(schedule_id)
+    except NoResultFound:
+        raise HTTPException(status_code=404, detail=f"Schedule with id {schedule_id} not found")
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+
+@router.post("/{schedule_id}/restore", response_model=SchedulePurgeResult)
+async def restore_schedule(
+    schedule_id: UUID,
+    service: ScheduleArchiveService = Depends(get_schedule_archive_service),
+    _: User = Depends(get_current_admin),
+):
+    """Відновлює розклад з архіву з початковими ідентифікаторами."""
+    try:
+        return await service.restore_schedule(schedule_id)
+    except NoResultFound:
+        raise HTTPException(status_code=404, detail=f"Archive for schedule {schedule_id} not found")
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
@@ -1,13 +1,55 @@
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Dict, Any
+from typing import Dict, Any, List, Literal, Optional, Union
 from uuid import UUID
 
-from app.core.deps import get_schedule_generation_service, get_schedule_service
-from app.schemas.schedule import ScheduleGenerationResponse, ScheduleResponse
+from app.core.deps import (
+    get_schedule_generation_service,
+    get_schedule_service,
+    get_room_occupancy_service,
+    get_assignment_edit_service,
+    get_schedule_diff_service,
+    get_schedule_clone_service,
+    get_published_schedule_service,
+    get_schedule_revision_service,
+    get_timetable_service,
+    get_schedule_metrics_service,
+    get_schedule_utilization_service,
+    get_semester_calendar_service,
+)
+from app.core.security import get_current_admin
+from app.db.models.people.user import User
+from app.schemas.assignment import AssignmentBatchRequest, AssignmentBatchResponse, AssignmentResponse
+from app.schemas.room import FreeRoomsResponse, FreeRoomsRangeResponse
+from app.schemas.timetable import TimetableEntry
+from app.schemas.schedule_metrics import ScheduleMetricsResponse
+from app.schemas.schedule_utilization import ScheduleUtilizationResponse
+from app.schemas.semester_calendar import OccurrencesResponse
+from app.schemas.schedule import (
+    ScheduleGenerationResponse,
+    ScheduleResponse,
+    ScheduleDiffResponse,
+    ScheduleDiffSummary,
+    ScheduleCloneRequest,
+    ScheduleCloneResponse,
+    PublishedScheduleResponse,
+    PublishedScheduleListResponse,
+)
+from app.services.assignment_edit_service import AssignmentEditService, AssignmentConflictError
+from app.services.room_occupancy_service import RoomOccupancyService
+from app.services.schedule_diff_service import DiffTotals, ScheduleDiffService
+from app.services.schedule_clone_service import ScheduleCloneService
 from app.services.schedule_generation_service import ScheduleGenerationService
 from app.services.schedule_service import ScheduleService
-from sqlalchemy.exc import NoResultFound
+from app.services.published_schedule_service import DEFAULT_SCOPE, PublishedScheduleService
+from app.services.schedule_revision_service import ScheduleRevisionService
+from app.services.timetable_service import TimetableService
+from app.services.schedule_metrics_service import ScheduleMetricsService
+from app.services.schedule_utilization_service import ScheduleUtilizationService
+from app.services.semester_calendar_service import SemesterCalendarService
+from sqlalchemy.exc import IntegrityError, NoResultFound
 
 router = APIRouter(
     prefix="/schedules"
@@ -43,7 +85,8 @@ async def generate_new_schedule(
         )
         return {
             "message": f"Successfully generated and saved a new schedule with {len(saved_assignments)} assignments.",
-            "schedule": saved_assignments
+            "schedule": saved_assignments,
+            "diff": service.last_diff
         }
 
     except Exception as e:
@@ -59,7 +102,8 @@ async def get_latest_schedule(
     """
     Отримує останній створений розклад.
     
-    Повертає розклад з найбільш пізньою датою створення.
+    Повертає розклад з найбільш пізньою датою створення. Студенти та
+    викладачі бачать опублікований розклад: /schedules/published/{scope}.
     """
     try:
         schedule = await service.get_latest_schedule()
@@ -70,6 +114,33 @@ async def get_latest_schedule(
         raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
 
 
+@router.get("/published", response_model=PublishedScheduleListResponse)
+async def list_published_schedules(
+    service: PublishedScheduleService = Depends(get_published_schedule_service)
+):
+    """
+    Повертає опубліковані розклади для всіх областей (факультет, семестр).
+    """
+    published = await service.list_published()
+    return PublishedScheduleListResponse(published=published, total=len(published))
+
+
+@router.get("/published/{scope}", response_model=PublishedScheduleResponse)
+async def get_published_schedule(
+    scope: str,
+    service: PublishedScheduleService = Depends(get_published_schedule_service)
+):
+    """
+    Повертає розклад, опублікований для вказаної області.
+
+    Відповідь береться з кешу процесу, без звернення до таблиці розкладів.
+    """
+    try:
+        return await service.get_published(scope)
+    except NoResultFound:
+        raise HTTPException(status_code=404, detail=f"No schedule published for scope '{scope}'")
+
+
 @router.get("/{schedule_id}", response_model=ScheduleResponse)
 async def get_schedule_by_id(
     schedule_id: UUID,
@@ -88,3 +159,283 @@ async def get_schedule_by_id(
         raise HTTPException(status_code=404, detail=f"Schedule with id {schedule_id} not found")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
+
+
+@router.get("/{schedule_id}/assignments", response_model=List[AssignmentResponse])
+async def get_schedule_assignments(
+    schedule_id: UUID,
+    group_id: Optional[UUID] = Query(None, description="Only this group's assignments"),
+    teacher_id: Optional[UUID] = Query(None, description="Only this teacher's assignments"),
+    revisions: ScheduleRevisionService = Depends(get_schedule_revision_service)
+):
+    """
+    Повертає призначення розкладу, за потреби лише для групи чи викладача.
+
+    Для ревізій, які ще не матеріалізовані, призначення збираються з ланцюжка
+    змін відносно батьківського розкладу одним запитом.
+    """
+    try:
+        return await revisions.get_assignments(schedule_id, group_id, teacher_id)
+    except NoResultFound:
+        raise HTTPException(status_code=404, detail=f"Schedule with id {schedule_id} not found")
+
+
+@router.get("/{schedule_id}/timetable", response_model=List[TimetableEntry])
+async def get_schedule_timetable(
+    schedule_id: UUID,
+    group_id: Optional[UUID] = Query(None, description="Only this group's lessons"),
+    teacher_id: Optional[UUID] = Query(None, description="Only this teacher's lessons"),
+    room_id: Optional[UUID] = Query(None, description="Only lessons in this room"),
+    day: Optional[int] = Query(None, ge=1, le=7, description="Day of week; whole week if omitted"),
+    service: TimetableService = Depends(get_timetable_service)
+):
+    """
+    Повертає готовий до показу розклад групи, викладача чи аудиторії.
+
+    Читається з денормалізованої таблиці timetable_entries без з'єднань
+    з довідниками; при першому зверненні до розкладу вона будується.
+    """
+    try:
+        return await service.get_schedule_timetable(schedule_id, group_id, teacher_id, room_id, day)
+    except NoResultFound:
+        raise HTTPException(status_code=404, detail=f"Schedule with id {schedule_id} not found")
+
+
+@router.get("/{schedule_id}/metrics", response_model=ScheduleMetricsResponse)
+async def get_schedule_metrics(
+    schedule_id: UUID,
+    refresh: bool = Query(False, description="Recompute even if stored metrics are current"),
+    service: ScheduleMetricsService = Depends(get_schedule_metrics_service)
+):
+    """
+    Повертає метрики якості розкладу: вікна, дні та розкид пар для груп і
+    викладачів, порушення побажань викладачів, запас місткості аудиторій.
+
+    Метрики зберігаються разом із розкладом і перераховуються після його
+    змін; після зміни довідників (розміри груп, місткість) — з refresh=true.
+    """
+    try:
+        return await service.get_metrics(schedule_id, refresh)
+    except NoResultFound:
+        raise HTTPException(status_code=404, detail=f"Schedule with id {schedule_id} not found")
+
+
+@router.get("/{schedule_id}/utilization", response_model=ScheduleUtilizationResponse)
+async def get_schedule_utilization(
+    schedule_id: UUID,
+    min_capacity: Optional[int] = Query(None, ge=0, description="Only rooms with at least this capacity"),
+    max_capacity: Optional[int] = Query(None, ge=0, description="Only rooms with at most this capacity"),
+    group_type: Optional[Literal["bachelor", "master"]] = Query(None, description="Only groups of this type"),
+    group_course: Optional[int] = Query(None, ge=1, le=6, description="Only groups of this study year"),
+    teacher_id: Optional[UUID] = Query(None, description="Only this teacher's lessons"),
+    service: ScheduleUtilizationService = Depends(get_schedule_utilization_service)
+):
+    """
+    Повертає теплові карти завантаженості: зайнятість аудиторій по днях і
+    парах, навантаження викладачів за парністю тижнів і пари груп по днях.
+
+    Фільтри комбінуються довільно; результат кешується для версії розкладу.
+    """
+    try:
+        return await service.get_utilization(
+            schedule_id, min_capacity, max_capacity, group_type, group_course, teacher_id
+        )
+    except NoResultFound:
+        raise HTTPException(status_code=404, detail=f"Schedule with id {schedule_id} not found")
+
+
+@router.get("/{schedule_id}/occurrences", response_model=OccurrencesResponse)
+async def get_schedule_occurrences(
+    schedule_id: UUID,
+    date_from: date = Query(..., description="First date"),
+    date_to: Optional[date] = Query(None, description="Last date; date_from if omitted"),
+    calendar_id: Optional[UUID] = Query(
+        None, description="Semester calendar; the one containing date_from if omitted"
+    ),
+    group_id: Optional[UUID] = Query(None, description="Only this group's lessons"),
+    teacher_id: Optional[UUID] = Query(None, description="Only this teacher's lessons"),
+    room_id: Optional[UUID] = Query(None, description="Only lessons in this room"),
+    service: SemesterCalendarService = Depends(get_semester_calendar_service)
+):
+    """
+    Повертає заняття розкладу на конкретні дати з урахуванням парності
+    тижнів і святкових днів семестрового календаря.
+
+    Розклад розгортається за календарем один раз для кожної їх версії;
+    запити за діапазоном дат обслуговуються з кешу.
+    """
+    if date_to is not None and date_to < date_from:
+        raise HTTPException(status_code=422, detail="date_to must not be before date_from")
+    try:
+        return await service.get_occurrences(
+            schedule_id, date_from, date_to, calendar_id, group_id, teacher_id, room_id
+        )
+    except NoResultFound as e:
+        raise HTTPException(status_code=404, detail=str(e) or f"Schedule with id {schedule_id} not found")
+
+
+@router.get("/{schedule_id}/free-rooms", response_model=FreeRoomsResponse)
+async def get_free_rooms(
+    schedule_id: UUID,
+    timeslot: int = Query(..., description="Timeslot ID"),
+    min_capacity: int = Query(0, ge=0, description="Minimum room capacity"),
+    revisions: ScheduleRevisionService = Depends(get_schedule_revision_service),
+    service: RoomOccupancyService = Depends(get_room_occupancy_service)
+):
+    """
+    Повертає аудиторії, вільні в заданому таймслоті розкладу.
+
+    Аудиторії з місткістю не меншою за min_capacity, від найменшої до найбільшої.
+    Враховує тижні ODD/EVEN: слот ALL конфліктує з обома.
+    """
+    try:
+        await revisions.ensure_materialized(schedule_id)
+        return await service.find_free_rooms(schedule_id, timeslot, min_capacity)
+    except NoResultFound:
+        raise HTTPException(status_code=404, detail=f"Schedule with id {schedule_id} not found")
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.get("/{schedule_id}/free-rooms/range", response_model=FreeRoomsRangeResponse)
+async def get_free_rooms_range(
+    schedule_id: UUID,
+    day: Optional[int] = Query(None, ge=1, le=7, description="Day of week; whole week if omitted"),
+    min_capacity: int = Query(0, ge=0, description="Minimum room capacity"),
+    revisions: ScheduleRevisionService = Depends(get_schedule_revision_service),
+    service: RoomOccupancyService = Depends(get_room_occupancy_service)
+):
+    """
+    Повертає вільні аудиторії для кожного таймслоту дня (або всього тижня).
+    """
+    try:
+        await revisions.ensure_materialized(schedule_id)
+        return await service.find_free_rooms_in_range(schedule_id, day, min_capacity)
+    except NoResultFound:
+        raise HTTPException(status_code=404, detail=f"Schedule with id {schedule_id} not found")
+
+
+@router.post("/{schedule_id}/assignments/batch", response_model=AssignmentBatchResponse)
+async def edit_assignments_batch(
+    schedule_id: UUID,
+    request: AssignmentBatchRequest,
+    schedule_service: ScheduleService = Depends(get_schedule_service),
+    service: AssignmentEditService = Depends(get_assignment_edit_service),
+    _: User = Depends(get_current_admin),
+):
+    """
+    Застосовує пакет ручних змін розкладу (move, swap, reassign_room, reassign_teacher).
+
+    Весь пакет перевіряється в пам'яті на конфлікти викладачів, аудиторій,
+    груп (з урахуванням батьківських груп і підгруп), доступності викладачів та
+    на неіснуючих викладачів і аудиторії.
+    Якщо є хоч один конфлікт, нічого не змінюється і повертається 409 зі списком
+    усіх конфліктів; інакше зміни записуються одним запитом.
+    """
+    try:
+        await schedule_service.get_schedule_by_id(schedule_id)
+        return await service.apply_batch(schedule_id, request.operations)
+    except NoResultFound:
+        raise HTTPException(status_code=404, detail=f"Schedule with id {schedule_id} not found")
+    except AssignmentConflictError as e:
+        raise HTTPException(
+            status_code=409,
+            detail={
+                "message": str(e),
+                "conflicts": [c.model_dump(by_alias=True, mode="json") for c in e.conflicts],
+            }
+        )
+    except IntegrityError as e:
+        raise HTTPException(status_code=409, detail=f"Edit violates a database constraint: {e.orig}")
+
+
+@router.get("/{base_schedule_id}/diff/{target_schedule_id}", response_model=Union[ScheduleDiffResponse, ScheduleDiffSummary])
+async def get_schedule_diff(
+    base_schedule_id: UUID,
+    target_schedule_id: UUID,
+    summary_only: bool = Query(False, description="Return only totals and per-entity counts"),
+    format: Literal["json", "ndjson"] = Query("json", description="ndjson streams one change per line, then the summary"),
+    revisions: ScheduleRevisionService = Depends(get_schedule_revision_service),
+    service: ScheduleDiffService = Depends(get_schedule_diff_service)
+):
+    """
+    Порівнює два розклади: додані, видалені та переміщені заняття.
+
+    Заняття зіставляються за (група, курс, підгрупа, тип); зміна часу, викладача
+    чи аудиторії вважається переміщенням. Підсумки групуються по групах і викладачах.
+    У форматі ndjson зміни передаються потоком, по рядку на кожну, у міру
+    читання з БД; останній рядок містить підсумок.
+    """
+    for schedule_id in (base_schedule_id, target_schedule_id):
+        try:
+            await revisions.ensure_materialized(schedule_id)
+        except NoResultFound:
+            raise HTTPException(status_code=404, detail=f"Schedule with id {schedule_id} not found")
+
+    if summary_only:
+        return await service.summarize(base_schedule_id, target_schedule_id)
+    if format == "json":
+        return await service.diff(base_schedule_id, target_schedule_id)
+
+    async def lines():
+        totals = DiffTotals()
+        async for change in service.stream_changes(base_schedule_id, target_schedule_id):
+            totals.add(change)
+            yield change.model_dump_json(by_alias=True) + "\n"
+        yield totals.summary(base_schedule_id, target_schedule_id).model_dump_json(by_alias=True) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.post("/{schedule_id}/clone", response_model=ScheduleCloneResponse, status_code=201)
+async def clone_schedule(
+    schedule_id: UUID,
+    request: ScheduleCloneRequest,
+    service: ScheduleCloneService = Depends(get_schedule_clone_service),
+    _: User = Depends(get_current_admin),
+):
+    """
+    Створює копію розкладу (чернетку) повністю на стороні БД.
+
+    Призначення та обмеження підгруп копіюються одним INSERT ... SELECT;
+    за потреби лише для вказаних груп (разом з їхніми підгрупами).
+    З asRevision призначення не копіюються: нова ревізія зберігає лише
+    свої зміни відносно джерела.
+    """
+    try:
+        return await service.clone_schedule(
+            schedule_id,
+            label=request.label,
+            group_ids=request.group_ids,
+            include_subgroups=request.include_subgroups,
+            as_revision=request.as_revision
+        )
+    except NoResultFound:
+        raise HTTPException(status_code=404, detail=f"Schedule with id {schedule_id} not found")
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except IntegrityError:
+        # Another clone took the label between the check and the insert
+        raise HTTPException(status_code=409, detail=f"Schedule with label '{request.label}' already exists")
+
+
+@router.post("/{schedule_id}/publish", response_model=PublishedScheduleResponse)
+async def publish_schedule(
+    schedule_id: UUID,
+    scope: str = Query(DEFAULT_SCOPE, min_length=1, max_length=100, description="Faculty, semester or 'default'"),
+    revisions: ScheduleRevisionService = Depends(get_schedule_revision_service),
+    service: PublishedScheduleService = Depends(get_published_schedule_service),
+    _: User = Depends(get_current_admin),
+):
+    """
+    Публікує розклад для області: саме його бачать студенти та викладачі.
+
+    Перемикання виконується одним атомарним upsert; попередньо опублікований
+    розклад області замінюється.
+    """
+    try:
+        # Published schedules are read by everyone, so revisions are materialized first
+        await revisions.ensure_materialized(schedule_id)
+        return await service.publish(schedule_id, scope)
+    except NoResultFound:
+        raise HTTPException(status_code=404, detail=f"Schedule with id {schedule_id} not found")
@@ -0,0 +1,29 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.core.deps import get_search_service
+from app.core.security import get_current_admin
+from app.db.models.people.user import User
+from app.schemas.search import SearchResponse, SearchType
+from app.services.search_service import MIN_QUERY_LENGTH, SearchService
+
+router = APIRouter()
+
+
+@router.get("/search", response_model=SearchResponse)
+async def search(
+    q: str = Query(..., min_length=MIN_QUERY_LENGTH, max_length=100, description="Part of a name, email or course code"),
+    types: Optional[List[SearchType]] = Query(None, alias="type", description="Repeat for several; all if omitted"),
+    limit: int = Query(5, ge=1, le=50, description="Top results per type"),
+    service: SearchService = Depends(get_search_service),
+    _: User = Depends(get_current_admin),
+):
+    """
+    Пошук викладачів, студентів, користувачів, заявок на реєстрацію, груп і
+    курсів за частиною імені, email або коду одним запитом до БД.
+    """
+    try:
+        return await service.search(q, types, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
@@ -1,21 +1,49 @@
-from fastapi import APIRouter, HTTPException, Depends, status
-from typing import List
+from fastapi import APIRouter, HTTPException, Depends, Query, status
+from sqlalchemy.exc import NoResultFound
+from typing import List, Literal, Optional
 import uuid
 
 from app.services.teacher_service import TeacherService
 from app.services.course_service import CourseService
 from app.services.group_service import GroupService
-from app.core.deps import get_teacher_service, get_course_service, get_group_service
+from app.services.teacher_preference_service import TeacherPreferenceService
+from app.core.deps import get_teacher_service, get_course_service, get_group_service, get_teacher_preference_service
+from app.core.security import get_current_admin
+from app.db.models.common_enums import TeacherStatus
+from app.db.models.people.user import User
+from app.repositories.pagination import MAX_PAGE_SIZE, TotalMode
 from app.schemas.teacher import TeacherCreate, TeacherUpdate, TeacherResponse, TeacherListResponse
+from app.schemas.teacher_preference import SLOT_PATTERN, DayName, TeacherPreferences
 
 router = APIRouter()
 
 
 @router.get("/", response_model=TeacherListResponse)
 async def get_all_teachers(
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: Optional[str] = Query(None, description="nextCursor of the previous page"),
+    sort: Literal["name"] = Query("name", description="Sort order"),
+    status_filter: Optional[TeacherStatus] = Query(None, alias="status", description="Only teachers with this status"),
+    total: TotalMode = Query("exact", description="exact, estimated (planner estimate) or none"),
     teacher_service: TeacherService = Depends(get_teacher_service)
 ) -> TeacherListResponse:
-    return await teacher_service.get_all_teachers()
+    try:
+        return await teacher_service.get_all_teachers(limit, cursor, sort, status=status_filter, total=total)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/preferences", response_model=TeacherListResponse)
+async def find_teachers_by_preferences(
+    avoid_slot: Optional[str] = Query(
+        None, pattern=SLOT_PATTERN, description="Teachers avoiding a slot overlapping this one"
+    ),
+    preferred_day: Optional[DayName] = Query(None, description="Teachers preferring this day"),
+    preference_service: TeacherPreferenceService = Depends(get_teacher_preference_service),
+    _: User = Depends(get_current_admin),
+) -> TeacherListResponse:
+    """Викладачі за побажаннями, наприклад хто уникає першої пари в понеділок (avoid_slot=mon.all.1)."""
+    return await preference_service.find_teachers(avoid_slot, preferred_day)
 
 
 @router.get("/{teacher_id}", response_model=TeacherResponse)
@@ -80,6 +108,28 @@ async def get_teacher_groups(
     return [group.model_dump() for group in groups]
 
 
+@router.get("/{teacher_id}/preferences", response_model=TeacherPreferences)
+async def get_teacher_preferences(
+    teacher_id: uuid.UUID,
+    preference_service: TeacherPreferenceService = Depends(get_teacher_preference_service)
+) -> TeacherPreferences:
+    return await preference_service.get_preferences(teacher_id)
+
+
+@router.put("/{teacher_id}/preferences", response_model=TeacherPreferences)
+async def update_teacher_preferences(
+    teacher_id: uuid.UUID,
+    preferences: TeacherPreferences,
+    preference_service: TeacherPreferenceService = Depends(get_teacher_preference_service),
+    _: User = Depends(get_current_admin),
+) -> TeacherPreferences:
+    """Замінює побажання викладача; дні та слоти перевіряються і нормалізуються при записі."""
+    try:
+        return await preference_service.update_preferences(teacher_id, preferences)
+    except NoResultFound as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
 @router.post("/", response_model=TeacherResponse, status_code=status.HTTP_201_CREATED)
 async def create_teacher(
     teacher_data: TeacherCreate,
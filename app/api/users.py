@@ -1,7 +1,9 @@
-from fastapi import APIRouter, HTTPException, Depends, status
-from typing import List
+from fastapi import APIRouter, HTTPException, Depends, Query, status
+from typing import List, Literal, Optional
 import uuid
 
+from app.db.models.people.user import UserRole
+from app.repositories.pagination import MAX_PAGE_SIZE, TotalMode
 from app.services.user_service import UserService
 from app.core.deps import get_user_service
 from app.schemas.user import UserResponse, UserListResponse
@@ -11,10 +13,19 @@ router = APIRouter()
 
 @router.get("/", response_model=UserListResponse)
 async def get_all_users(
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: Optional[str] = Query(None, description="nextCursor of the previous page"),
+    sort: Literal["name", "created"] = Query("name", description="Sort order"),
+    role: Optional[UserRole] = Query(None, description="Only users with this role"),
+    is_active: Optional[bool] = Query(None, description="Only active or inactive users"),
+    total: TotalMode = Query("exact", description="exact, estimated (planner estimate) or none"),
     user_service: UserService = Depends(get_user_service)
 ) -> UserListResponse:
-    """Отримати всіх користувачів"""
-    return await user_service.get_all_users()
+    """Отримати сторінку користувачів (keyset-пагінація за cursor)"""
+    try:
+        return await user_service.get_all_users(limit, cursor, sort, role=role, is_active=is_active, total=total)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/{user_id}", response_model=UserResponse)
@@ -36,7 +36,12 @@ class Settings(BaseSettings):
         "http://localhost,http://localhost:80,"
         "http://127.0.0.1,http://127.0.0.1:80"
     )
-    
+
+    # Serve availability from the per-entity bitmasks (falling back to the
+    # per-timeslot rows for missing or stale masks). Both are always written;
+    # turn off to read only the rows during the transition.
+    AVAILABILITY_MASK_READS: bool = True
+
     class Config:
         # In Docker-first setup we rely on real environment variables provided
         # by docker-compose (env_file) and do not auto-load local files.
@@ -15,6 +15,18 @@ from app.repositories.assignment_repository import AssignmentRepository
 from app.repositories.timeslot_repository import TimeslotRepository
 from app.repositories.availability_repository import AvailabilityRepository
 from app.repositories.constraint_repository import ConstraintRepository
+from app.repositories.timetable_repository import TimetableRepository
+from app.repositories.assignment_partition_repository import AssignmentPartitionRepository
+from app.repositories.published_schedule_repository import PublishedScheduleRepository
+from app.repositories.schedule_revision_repository import ScheduleRevisionRepository
+from app.repositories.schedule_snapshot_repository import ScheduleSnapshotRepository
+from app.repositories.timetable_entry_repository import TimetableEntryRepository
+from app.repositories.schedule_metrics_repository import ScheduleMetricsRepository
+from app.repositories.semester_calendar_repository import SemesterCalendarRepository
+from app.repositories.catalog_import_repository import CatalogImportRepository
+from app.repositories.search_repository import SearchRepository
+from app.repositories.cohort_repository import CohortRepository
+from app.repositories.registration_repository import RegistrationRepository
 
 # --- Import Services ---
 from app.services.group_service import GroupService
@@ -32,6 +44,22 @@ from app.services.group_course_service import GroupCourseService
 from app.services.teacher_course_service import TeacherCourseService
 from app.services.subgroup_constraint_service import SubgroupConstraintService
 from app.services.schedule_generation_service import ScheduleGenerationService
+from app.services.timetable_service import TimetableService
+from app.services.semester_calendar_service import SemesterCalendarService
+from app.services.catalog_import_service import CatalogImportService
+from app.services.search_service import SearchService
+from app.services.cohort_service import CohortService
+from app.services.registration_service import RegistrationService
+from app.services.room_occupancy_service import RoomOccupancyService
+from app.services.assignment_edit_service import AssignmentEditService
+from app.services.schedule_diff_service import ScheduleDiffService
+from app.services.schedule_clone_service import ScheduleCloneService
+from app.services.published_schedule_service import PublishedScheduleService
+from app.services.schedule_revision_service import ScheduleRevisionService
+from app.services.schedule_snapshot_service import ScheduleSnapshotService
+from app.services.schedule_metrics_service import ScheduleMetricsService
+from app.services.schedule_utilization_service import ScheduleUtilizationService
+from app.services.schedule_archive_service import ScheduleArchiveService
 
 
 async def get_session():
@@ -83,6 +111,11 @@ def get_assignment_repository(
 ) -> AssignmentRepository:
     return AssignmentRepository(session)
 
+def get_assignment_partition_repository(
+    session: AsyncSession = Depends(get_session)
+) -> AssignmentPartitionRepository:
+    return AssignmentPartitionRepository(session)
+
 def get_timeslot_repository(
     session: AsyncSession = Depends(get_session)
 ) -> TimeslotRepository:
@@ -98,18 +131,75 @@ def get_constraint_repository(
 ) -> ConstraintRepository:
     return ConstraintRepository(session)
 
+def get_timetable_repository(
+    session: AsyncSession = Depends(get_session)
+) -> TimetableRepository:
+    return TimetableRepository(session)
+
+def get_published_schedule_repository(
+    session: AsyncSession = Depends(get_session)
+) -> PublishedScheduleRepository:
+    return PublishedScheduleRepository(session)
+
+def get_schedule_revision_repository(
+    session: AsyncSession = Depends(get_session)
+) -> ScheduleRevisionRepository:
+    return ScheduleRevisionRepository(session)
+
+def get_schedule_snapshot_repository(
+    session: AsyncSession = Depends(get_session)
+) -> ScheduleSnapshotRepository:
+    return ScheduleSnapshotRepository(session)
+
+def get_timetable_entry_repository(
+    session: AsyncSession = Depends(get_session)
+) -> TimetableEntryRepository:
+    return TimetableEntryRepository(session)
+
+def get_schedule_metrics_repository(
+    session: AsyncSession = Depends(get_session)
+) -> ScheduleMetricsRepository:
+    return ScheduleMetricsRepository(session)
+
+def get_semester_calendar_repository(
+    session: AsyncSession = Depends(get_session)
+) -> SemesterCalendarRepository:
+    return SemesterCalendarRepository(session)
+
+def get_catalog_import_repository(
+    session: AsyncSession = Depends(get_session)
+) -> CatalogImportRepository:
+    return CatalogImportRepository(session)
+
+def get_search_repository(
+    session: AsyncSession = Depends(get_session)
+) -> SearchRepository:
+    return SearchRepository(session)
+
+def get_cohort_repository(
+    session: AsyncSession = Depends(get_session)
+) -> CohortRepository:
+    return CohortRepository(session)
+
+def get_registration_repository(
+    session: AsyncSession = Depends(get_session)
+) -> RegistrationRepository:
+    return RegistrationRepository(session)
+
 
 # --- Service Providers ---
 
 def get_group_service(
-    repo: GroupRepository = Depends(get_group_repository)
+    repo: GroupRepository = Depends(get_group_repository),
+    entries_repo: TimetableEntryRepository = Depends(get_timetable_entry_repository)
 ) -> GroupService:
-    return GroupService(repo)
+    return GroupService(repo, entries_repo)
 
 def get_teacher_service(
-    repo: TeacherRepository = Depends(get_teacher_repository)
+    repo: TeacherRepository = Depends(get_teacher_repository),
+    entries_repo: TimetableEntryRepository = Depends(get_timetable_entry_repository)
 ) -> TeacherService:
-    return TeacherService(repo)
+    return TeacherService(repo, entries_repo)
 
 def get_user_service(
     repo: UserRepository = Depends(get_user_repository)
@@ -117,19 +207,38 @@ def get_user_service(
     return UserService(repo)
 
 def get_room_service(
-    repo: RoomRepository = Depends(get_room_repository)
+    repo: RoomRepository = Depends(get_room_repository),
+    entries_repo: TimetableEntryRepository = Depends(get_timetable_entry_repository)
 ) -> RoomService:
-    return RoomService(repo)
+    return RoomService(repo, entries_repo)
 
 def get_course_service(
-    repo: CourseRepository = Depends(get_course_repository)
+    repo: CourseRepository = Depends(get_course_repository),
+    entries_repo: TimetableEntryRepository = Depends(get_timetable_entry_repository)
 ) -> CourseService:
-    return CourseService(repo)
+    return CourseService(repo, entries_repo)
+
+def get_schedule_revision_service(
+    repo: ScheduleRevisionRepository = Depends(get_schedule_revision_repository),
+    schedule_repo: ScheduleRepository = Depends(get_schedule_repository),
+    partition_repo: AssignmentPartitionRepository = Depends(get_assignment_partition_repository)
+) -> ScheduleRevisionService:
+    return ScheduleRevisionService(repo, schedule_repo, partition_repo)
+
+def get_schedule_snapshot_service(
+    repo: ScheduleSnapshotRepository = Depends(get_schedule_snapshot_repository),
+    assignment_repo: AssignmentRepository = Depends(get_assignment_repository),
+    revision_service: ScheduleRevisionService = Depends(get_schedule_revision_service)
+) -> ScheduleSnapshotService:
+    return ScheduleSnapshotService(repo, assignment_repo, revision_service)
 
 def get_assignment_service(
-    repo: AssignmentRepository = Depends(get_assignment_repository)
+    repo: AssignmentRepository = Depends(get_assignment_repository),
+    partition_repo: AssignmentPartitionRepository = Depends(get_assignment_partition_repository),
+    snapshot_service: ScheduleSnapshotService = Depends(get_schedule_snapshot_service),
+    entries_repo: TimetableEntryRepository = Depends(get_timetable_entry_repository)
 ) -> AssignmentService:
-    return AssignmentService(repo)
+    return AssignmentService(repo, partition_repo, snapshot_service, entries_repo)
 
 def get_timeslot_service(
     repo: TimeslotRepository = Depends(get_timeslot_repository)
@@ -138,9 +247,10 @@ def get_timeslot_service(
 
 # Renamed: This is the simple CRUD for the 'schedules' table
 def get_schedule_service(
-    repo: ScheduleRepository = Depends(get_schedule_repository)
+    repo: ScheduleRepository = Depends(get_schedule_repository),
+    partition_repo: AssignmentPartitionRepository = Depends(get_assignment_partition_repository)
 ) -> ScheduleService:
-    return ScheduleService(repo)
+    return ScheduleService(repo, partition_repo)
 
 def get_group_course_service(
     repo: ConstraintRepository = Depends(get_constraint_repository)
@@ -174,6 +284,102 @@ def get_group_unavailability_service(
 ) -> GroupUnavailabilityService:
     return GroupUnavailabilityService(repo, timeslot_service)
 
+def get_published_schedule_service(
+    repo: PublishedScheduleRepository = Depends(get_published_schedule_repository),
+    schedule_repo: ScheduleRepository = Depends(get_schedule_repository),
+    entries_repo: TimetableEntryRepository = Depends(get_timetable_entry_repository)
+) -> PublishedScheduleService:
+    return PublishedScheduleService(repo, schedule_repo, entries_repo)
+
+def get_timetable_service(
+    repo: TimetableRepository = Depends(get_timetable_repository),
+    published_service: PublishedScheduleService = Depends(get_published_schedule_service),
+    revision_service: ScheduleRevisionService = Depends(get_schedule_revision_service),
+    entries_repo: TimetableEntryRepository = Depends(get_timetable_entry_repository)
+) -> TimetableService:
+    return TimetableService(repo, published_service, revision_service, entries_repo)
+
+def get_semester_calendar_service(
+    repo: SemesterCalendarRepository = Depends(get_semester_calendar_repository),
+    timetable_service: TimetableService = Depends(get_timetable_service)
+) -> SemesterCalendarService:
+    return SemesterCalendarService(repo, timetable_service)
+
+def get_catalog_import_service(
+    repo: CatalogImportRepository = Depends(get_catalog_import_repository)
+) -> CatalogImportService:
+    return CatalogImportService(repo)
+
+def get_search_service(
+    repo: SearchRepository = Depends(get_search_repository)
+) -> SearchService:
+    return SearchService(repo)
+
+def get_cohort_service(
+    repo: CohortRepository = Depends(get_cohort_repository)
+) -> CohortService:
+    return CohortService(repo)
+
+def get_registration_service(
+    repo: RegistrationRepository = Depends(get_registration_repository)
+) -> RegistrationService:
+    return RegistrationService(repo)
+
+def get_room_occupancy_service(
+    assignment_repo: AssignmentRepository = Depends(get_assignment_repository),
+    room_repo: RoomRepository = Depends(get_room_repository),
+    timeslot_service: TimeslotService = Depends(get_timeslot_service)
+) -> RoomOccupancyService:
+    return RoomOccupancyService(assignment_repo, room_repo, timeslot_service)
+
+def get_assignment_edit_service(
+    repo: AssignmentRepository = Depends(get_assignment_repository),
+    group_repo: GroupRepository = Depends(get_group_repository),
+    availability_repo: AvailabilityRepository = Depends(get_availability_repository),
+    timeslot_service: TimeslotService = Depends(get_timeslot_service),
+    revision_repo: ScheduleRevisionRepository = Depends(get_schedule_revision_repository),
+    snapshot_service: ScheduleSnapshotService = Depends(get_schedule_snapshot_service),
+    entries_repo: TimetableEntryRepository = Depends(get_timetable_entry_repository)
+) -> AssignmentEditService:
+    return AssignmentEditService(
+        repo, group_repo, availability_repo, timeslot_service, revision_repo, snapshot_service, entries_repo
+    )
+
+def get_schedule_metrics_service(
+    repo: ScheduleMetricsRepository = Depends(get_schedule_metrics_repository),
+    snapshot_service: ScheduleSnapshotService = Depends(get_schedule_snapshot_service),
+    timeslot_service: TimeslotService = Depends(get_timeslot_service),
+    group_repo: GroupRepository = Depends(get_group_repository),
+    room_repo: RoomRepository = Depends(get_room_repository),
+    preference_service: TeacherPreferenceService = Depends(get_teacher_preference_service)
+) -> ScheduleMetricsService:
+    return ScheduleMetricsService(repo, snapshot_service, timeslot_service, group_repo, room_repo, preference_service)
+
+def get_schedule_utilization_service(
+    assignment_repo: AssignmentRepository = Depends(get_assignment_repository),
+    room_repo: RoomRepository = Depends(get_room_repository),
+    revision_service: ScheduleRevisionService = Depends(get_schedule_revision_service)
+) -> ScheduleUtilizationService:
+    return ScheduleUtilizationService(assignment_repo, room_repo, revision_service)
+
+def get_schedule_archive_service() -> ScheduleArchiveService:
+    # Opens its own sessions: every purge batch commits on its own
+    return ScheduleArchiveService()
+
+def get_schedule_diff_service(
+    repo: AssignmentRepository = Depends(get_assignment_repository)
+) -> ScheduleDiffService:
+    return ScheduleDiffService(repo)
+
+def get_schedule_clone_service(
+    repo: ScheduleRepository = Depends(get_schedule_repository),
+    assignment_repo: AssignmentRepository = Depends(get_assignment_repository),
+    constraint_repo: ConstraintRepository = Depends(get_constraint_repository),
+    partition_repo: AssignmentPartitionRepository = Depends(get_assignment_partition_repository),
+    revision_service: ScheduleRevisionService = Depends(get_schedule_revision_service)
+) -> ScheduleCloneService:
+    return ScheduleCloneService(repo, assignment_repo, constraint_repo, partition_repo, revision_service)
+
 # --- Orchestrator Provider ---
 
 def get_schedule_generation_service(
@@ -193,7 +399,8 @@ def get_schedule_generation_service(
     group_unavailability_service: GroupUnavailabilityService = Depends(get_group_unavailability_service),
     # Saving services
     schedule_service: ScheduleService = Depends(get_schedule_service),
-    assignment_service: AssignmentService = Depends(get_assignment_service)
+    assignment_service: AssignmentService = Depends(get_assignment_service),
+    schedule_diff_service: ScheduleDiffService = Depends(get_schedule_diff_service)
 ) -> ScheduleGenerationService:
     return ScheduleGenerationService(
         group_service=group_service,
@@ -208,7 +415,8 @@ def get_schedule_generation_service(
         teacher_preference_service=teacher_preference_service,
         group_unavailability_service=group_unavailability_service,
         schedule_service=schedule_service,
-        assignment_service=assignment_service
+        assignment_service=assignment_service,
+        schedule_diff_service=schedule_diff_service
     )
 
 
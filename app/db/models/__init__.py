@@ -18,14 +18,22 @@ from .people.user import User, UserRole
 
 # Scheduling
 from .scheduling.assignment import Assignment
+from .scheduling.assignment_delta import AssignmentDelta
 from .scheduling.schedule import Schedule
+from .scheduling.schedule_archive import ScheduleArchive
+from .scheduling.schedule_metrics import ScheduleMetrics
+from .scheduling.schedule_snapshot import ScheduleSnapshot
+from .scheduling.semester_calendar import SemesterCalendar
+from .scheduling.published_schedule import PublishedSchedule
 from .scheduling.subgroup_constraints import SubgroupConstraints
 from .scheduling.timeslot import Timeslot
+from .scheduling.timetable_entry import TimetableEntry
 
 # --- New Models ---
 from .scheduling.teacher_availability import TeacherAvailability
 from .scheduling.teacher_preference import TeacherPreference
 from .scheduling.group_availability import GroupUnavailability
+from .scheduling.availability_mask import TeacherAvailabilityMask, GroupUnavailabilityMask
 from .common_enums import CourseFrequency, TimeslotFrequency
 
 __all__ = [
@@ -48,13 +56,22 @@ __all__ = [
     "UserRole",
     # Scheduling
     "Assignment",
+    "AssignmentDelta",
     "Schedule",
+    "ScheduleArchive",
+    "ScheduleMetrics",
+    "ScheduleSnapshot",
+    "SemesterCalendar",
+    "PublishedSchedule",
     "SubgroupConstraints",
     "Timeslot",
+    "TimetableEntry",
     # New
     "TeacherAvailability",
     "TeacherPreference",
     "GroupUnavailability",
+    "TeacherAvailabilityMask",
+    "GroupUnavailabilityMask",
     "CourseFrequency",
     "TimeslotFrequency",
 ]
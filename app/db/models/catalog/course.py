@@ -2,6 +2,7 @@ from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy import Integer, String, CheckConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from app.db.models.base import Base
+from app.db.models.trigram import trigram_index
 import uuid
 
 
@@ -9,6 +10,8 @@ class Course(Base):
     __tablename__ = "courses"
     __table_args__ = (
         CheckConstraint("duration > 0", name="ck_courses_duration"),
+        trigram_index("ix_courses_name_trgm", "name"),
+        trigram_index("ix_courses_code_trgm", "code"),
     )
 
     course_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -1,7 +1,8 @@
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import Integer, String, CheckConstraint, ForeignKey, Enum as SQLEnum, text
+from sqlalchemy import Integer, String, CheckConstraint, ForeignKey, Index, Enum as SQLEnum, text
 from sqlalchemy.dialects.postgresql import UUID
 from app.db.models.base import Base
+from app.db.models.trigram import trigram_index
 import uuid
 import enum
 
@@ -22,6 +23,8 @@ class Group(Base):
     __table_args__ = (
         CheckConstraint("size > 0", name="ck_groups_size"),
         CheckConstraint("course >= 1 AND course <= 6", name="ck_groups_course"),
+        Index("ix_groups_course_name", "course", "name"),
+        trigram_index("ix_groups_name_trgm", "name"),
     )
 
     group_id: Mapped[uuid.UUID] = mapped_column(
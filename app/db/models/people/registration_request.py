@@ -3,6 +3,7 @@ from sqlalchemy import String, DateTime, func, Enum as SQLEnum, Text, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID, CITEXT
 from app.db.models.base import Base
 from app.db.models.people.user import UserRole
+from app.db.models.trigram import EMAIL, FULL_NAME, trigram_index
 import uuid
 import enum
 
@@ -15,6 +16,10 @@ class RegistrationStatus(str, enum.Enum):
 
 class RegistrationRequest(Base):
     __tablename__ = "registration_requests"
+    __table_args__ = (
+        trigram_index("ix_registration_requests_name_trgm", FULL_NAME),
+        trigram_index("ix_registration_requests_email_trgm", EMAIL),
+    )
 
     request_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
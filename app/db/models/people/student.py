@@ -1,8 +1,9 @@
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import String, ForeignKey, UniqueConstraint
+from sqlalchemy import String, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.dialects.postgresql import UUID
 from app.db.models.base import Base
 from app.db.models.common_enums import StudentStatus, StudentStatusEnum
+from app.db.models.trigram import FULL_NAME, trigram_index
 import uuid
 
 
@@ -10,6 +11,8 @@ class Student(Base):
     __tablename__ = "students"
     __table_args__ = (
         UniqueConstraint("user_id", name="uq_students_user"),
+        Index("ix_students_name_keyset", "last_name", "first_name", "student_id"),
+        trigram_index("ix_students_name_trgm", FULL_NAME),
     )
 
     student_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -1,8 +1,9 @@
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import String, UniqueConstraint, ForeignKey
+from sqlalchemy import String, UniqueConstraint, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from app.db.models.base import Base
 from app.db.models.common_enums import TeacherStatus, TeacherStatusEnum
+from app.db.models.trigram import FULL_NAME, trigram_index
 import uuid
 
 
@@ -11,6 +12,8 @@ class Teacher(Base):
     __table_args__ = (
         UniqueConstraint("first_name", "last_name", "patronymic", name="uq_teachers_name"),
         UniqueConstraint("user_id", name="uq_teachers_user"),
+        Index("ix_teachers_name_keyset", "last_name", "first_name", "teacher_id"),
+        trigram_index("ix_teachers_name_trgm", FULL_NAME),
     )
 
     teacher_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -1,7 +1,8 @@
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import String, Boolean, DateTime, func, UniqueConstraint, Enum as SQLEnum
+from sqlalchemy import String, Boolean, DateTime, func, UniqueConstraint, Index, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID, CITEXT
 from app.db.models.base import Base
+from app.db.models.trigram import EMAIL, FULL_NAME, trigram_index
 import uuid
 import enum
 
@@ -17,6 +18,10 @@ class User(Base):
     __table_args__ = (
         UniqueConstraint("google_sub", name="uq_users_google_sub"),
         UniqueConstraint("email", name="uq_users_email"),
+        Index("ix_users_name_keyset", "last_name", "first_name", "user_id"),
+        Index("ix_users_created_keyset", "created_at", "user_id"),
+        trigram_index("ix_users_name_trgm", FULL_NAME),
+        trigram_index("ix_users_email_trgm", EMAIL),
     )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import SmallInteger, CheckConstraint, UniqueConstraint, Index, ForeignKey, Enum
+from sqlalchemy import SmallInteger, CheckConstraint, UniqueConstraint, Index, ForeignKey, Enum, DDL, event
 from sqlalchemy.dialects.postgresql import UUID
 from app.db.models.base import Base
 import uuid
@@ -10,21 +10,29 @@ CourseTypeEnum = Enum("lec", "prac", "lab", name="course_type", native_enum=True
 class Assignment(Base):
     __tablename__ = "assignments"
     __table_args__ = (
-        UniqueConstraint("schedule_id", "timeslot_id", "group_id", "subgroup_no", name="uq_asg_subgroup_time"),
-        UniqueConstraint("schedule_id", "timeslot_id", "teacher_id", name="uq_asg_teacher_time"),
-        UniqueConstraint("schedule_id", "timeslot_id", "room_id", name="uq_asg_room_time"),
+        # Deferrable so that swaps applied in one UPDATE are checked at statement end
+        UniqueConstraint("schedule_id", "timeslot_id", "group_id", "subgroup_no", name="uq_asg_subgroup_time",
+                         deferrable=True, initially="IMMEDIATE"),
+        UniqueConstraint("schedule_id", "timeslot_id", "teacher_id", name="uq_asg_teacher_time",
+                         deferrable=True, initially="IMMEDIATE"),
+        UniqueConstraint("schedule_id", "timeslot_id", "room_id", name="uq_asg_room_time",
+                         deferrable=True, initially="IMMEDIATE"),
         Index("ix_asg_group_view", "schedule_id", "group_id", "subgroup_no", "timeslot_id"),
         Index("ix_asg_teacher_view", "schedule_id", "teacher_id", "timeslot_id"),
         Index("ix_asg_room_view", "schedule_id", "room_id", "timeslot_id"),
         CheckConstraint("subgroup_no > 0", name="ck_assignments_subgroup_no"),
+        # One partition per schedule (see assignment_partition_repository);
+        # rows of schedules without their own partition land in assignments_default
+        {"postgresql_partition_by": "LIST (schedule_id)"},
     )
 
     assignment_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
+    # Part of the primary key because unique keys of a partitioned table must include the partition key
     schedule_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("schedules.schedule_id", onupdate="CASCADE", ondelete="RESTRICT"),
-        nullable=False,
+        primary_key=True,
     )
     timeslot_id: Mapped[int] = mapped_column(
         ForeignKey("timeslots.timeslot_id", onupdate="CASCADE", ondelete="RESTRICT"),
@@ -54,3 +62,10 @@ class Assignment(Base):
     )
 
     course_type: Mapped[str] = mapped_column(CourseTypeEnum, nullable=False)  # 'lec' | 'prac' | 'lab'
+
+
+event.listen(
+    Assignment.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS assignments_default PARTITION OF assignments DEFAULT").execute_if(dialect="postgresql"),
+)
@@ -0,0 +1,60 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import SmallInteger, String, CheckConstraint, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from app.db.models.base import Base
+from app.db.models.scheduling.assignment import CourseTypeEnum
+import uuid
+
+
+class AssignmentDelta(Base):
+    """
+    A change recorded by a schedule revision against its parent.
+
+    'add' rows carry the full assignment; an 'add' reusing an assignment_id
+    of the parent replaces that assignment. 'remove' rows only carry the
+    assignment_id of the parent's assignment they hide.
+    """
+    __tablename__ = "assignment_deltas"
+    __table_args__ = (
+        CheckConstraint("op IN ('add', 'remove')", name="ck_assignment_deltas_op"),
+        CheckConstraint(
+            "op = 'remove' OR (timeslot_id IS NOT NULL AND group_id IS NOT NULL AND subgroup_no IS NOT NULL "
+            "AND course_id IS NOT NULL AND teacher_id IS NOT NULL AND course_type IS NOT NULL)",
+            name="ck_assignment_deltas_add_complete",
+        ),
+    )
+
+    schedule_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("schedules.schedule_id", onupdate="CASCADE", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    assignment_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    op: Mapped[str] = mapped_column(String(6), nullable=False)  # 'add' | 'remove'
+
+    timeslot_id: Mapped[int | None] = mapped_column(
+        ForeignKey("timeslots.timeslot_id", onupdate="CASCADE", ondelete="RESTRICT"),
+        nullable=True,
+    )
+    group_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("groups.group_id", onupdate="CASCADE", ondelete="RESTRICT"),
+        nullable=True,
+    )
+    subgroup_no: Mapped[int | None] = mapped_column(SmallInteger, nullable=True)
+    course_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("courses.course_id", onupdate="CASCADE", ondelete="RESTRICT"),
+        nullable=True,
+    )
+    teacher_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("teachers.teacher_id", onupdate="CASCADE", ondelete="RESTRICT"),
+        nullable=True,
+    )
+    room_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("rooms.room_id", onupdate="CASCADE", ondelete="RESTRICT"),
+        nullable=True,
+    )
+    course_type: Mapped[str | None] = mapped_column(CourseTypeEnum, nullable=True)
@@ -0,0 +1,47 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import ForeignKey, String, DateTime, func
+from sqlalchemy.dialects.postgresql import UUID, BIT
+from app.db.models.base import Base
+import datetime
+import uuid
+
+
+class TeacherAvailabilityMask(Base):
+    """
+    Compact copy of a teacher's rows in teacher_availability: bit i is
+    set if the teacher is available in the timeslot with codec ordinal i.
+
+    `codec_key` fingerprints the ordinal order the mask was built for
+    (see TimeslotCodec.key); a mask with another key is stale and ignored.
+    """
+    __tablename__ = "teacher_availability_masks"
+
+    teacher_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("teachers.teacher_id", onupdate="CASCADE", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    mask: Mapped[str] = mapped_column(BIT(varying=True), nullable=False)
+    codec_key: Mapped[str] = mapped_column(String(32), nullable=False)
+    updated_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
+
+
+class GroupUnavailabilityMask(Base):
+    """
+    Compact copy of a group's rows in group_unavailability: bit i is set if
+    the group is UNAVAILABLE in the timeslot with codec ordinal i.
+    """
+    __tablename__ = "group_unavailability_masks"
+
+    group_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("groups.group_id", onupdate="CASCADE", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    mask: Mapped[str] = mapped_column(BIT(varying=True), nullable=False)
+    codec_key: Mapped[str] = mapped_column(String(32), nullable=False)
+    updated_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
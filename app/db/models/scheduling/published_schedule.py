@@ -0,0 +1,22 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, DateTime, ForeignKey, func
+from sqlalchemy.dialects.postgresql import UUID
+from app.db.models.base import Base
+import uuid
+
+
+class PublishedSchedule(Base):
+    """
+    The schedule students and teachers should see, one per scope
+    (e.g. a faculty or a semester; "default" when there is only one).
+    """
+    __tablename__ = "published_schedules"
+
+    scope: Mapped[str] = mapped_column(String(100), primary_key=True)
+    schedule_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("schedules.schedule_id", onupdate="CASCADE", ondelete="RESTRICT"),
+        nullable=False,
+        index=True,
+    )
+    published_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
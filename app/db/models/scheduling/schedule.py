@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import String, DateTime, func
+from sqlalchemy import String, DateTime, Boolean, ForeignKey, false, func, true
 from sqlalchemy.dialects.postgresql import UUID
 from app.db.models.base import Base
 import uuid
@@ -11,3 +11,15 @@ class Schedule(Base):
     schedule_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     label: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    # Revisions store only their changes against the parent (assignment_deltas)
+    # until they are materialized into `assignments` on first heavy read
+    parent_schedule_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("schedules.schedule_id", onupdate="CASCADE", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
+    materialized: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True, server_default=true())
+    # Set once timetable_entries hold the schedule's read model, lessons or not
+    entries_built: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, server_default=false())
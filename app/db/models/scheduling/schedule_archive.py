@@ -0,0 +1,22 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, Integer, DateTime, LargeBinary, func
+from sqlalchemy.dialects.postgresql import UUID
+from app.db.models.base import Base
+import uuid
+
+
+class ScheduleArchive(Base):
+    """
+    A purged schedule kept in compressed form.
+
+    `payload` is zlib-compressed JSON with the schedule's assignments and
+    subgroup constraints; it is enough to restore the schedule as it was.
+    """
+    __tablename__ = "schedule_archives"
+
+    schedule_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    label: Mapped[str] = mapped_column(String(255), nullable=False)
+    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False)
+    archived_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    assignments_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
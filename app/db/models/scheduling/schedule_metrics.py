@@ -0,0 +1,25 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import DateTime, ForeignKey, func
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from app.db.models.base import Base
+from typing import Any, Dict
+import uuid
+
+
+class ScheduleMetrics(Base):
+    """
+    Quality metrics of a schedule (windows, preference violations, room slack).
+
+    `snapshot_built_at` is the `built_at` of the schedule snapshot the
+    metrics were computed from; once the snapshot is rebuilt they are stale.
+    """
+    __tablename__ = "schedule_metrics"
+
+    schedule_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("schedules.schedule_id", onupdate="CASCADE", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    snapshot_built_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False)
+    computed_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    metrics: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False)
@@ -0,0 +1,25 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Integer, SmallInteger, DateTime, LargeBinary, ForeignKey, func
+from sqlalchemy.dialects.postgresql import UUID
+from app.db.models.base import Base
+import uuid
+
+
+class ScheduleSnapshot(Base):
+    """
+    Packed columnar copy of a schedule's assignments for whole-schedule loads.
+
+    `payload` is produced by app.services.schedule_snapshot.pack_snapshot;
+    it is rebuilt whenever the schedule's assignments are saved or edited.
+    """
+    __tablename__ = "schedule_snapshots"
+
+    schedule_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("schedules.schedule_id", onupdate="CASCADE", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    format: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    assignments_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    built_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
@@ -0,0 +1,33 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, Date, DateTime, CheckConstraint, func, text
+from sqlalchemy.dialects.postgresql import UUID, ARRAY
+from app.db.models.base import Base
+from typing import List
+import datetime
+import uuid
+
+
+class SemesterCalendar(Base):
+    """
+    Dates a weekly schedule is taught on.
+
+    Weeks are numbered from the week (Monday to Sunday) containing
+    `parity_anchor`, which is an ODD week; lessons are not held on `holidays`.
+    `updated_at` versions the calendar for cached expansions.
+    """
+    __tablename__ = "semester_calendars"
+    __table_args__ = (
+        CheckConstraint("end_date >= start_date", name="ck_semester_calendars_dates"),
+    )
+
+    calendar_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    name: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
+    start_date: Mapped[datetime.date] = mapped_column(Date, nullable=False)
+    end_date: Mapped[datetime.date] = mapped_column(Date, nullable=False)
+    parity_anchor: Mapped[datetime.date] = mapped_column(Date, nullable=False)
+    holidays: Mapped[List[datetime.date]] = mapped_column(
+        ARRAY(Date), nullable=False, server_default=text("'{}'::date[]")
+    )
+    updated_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from app.db.models.base import Base
 from typing import Dict, Any
@@ -11,6 +11,13 @@ class TeacherPreference(Base):
     Stores teacher preferences (e.g., preferred days, avoid slots) as a JSON blob
     """
     __tablename__ = "teacher_preferences"
+    __table_args__ = (
+        # Serves containment (@>) queries such as "who avoids mon.all.1"
+        Index(
+            "ix_teacher_preferences_gin", "preferences",
+            postgresql_using="gin", postgresql_ops={"preferences": "jsonb_path_ops"},
+        ),
+    )
 
     teacher_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -0,0 +1,49 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Integer, SmallInteger, String, Text, Time, Index, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from app.db.models.base import Base
+from app.db.models.common_enums import TimeslotFrequency, TimeslotFrequencyEnum
+from app.db.models.scheduling.assignment import CourseTypeEnum
+import uuid
+
+
+class TimetableEntry(Base):
+    """
+    Read model: one display-ready row per assignment, with the timeslot,
+    lesson times and catalog names copied in so timetable reads need no joins.
+
+    Rebuilt per schedule when it is saved or published, patched on manual
+    edits and catalog renames (see TimetableEntryRepository).
+    """
+    __tablename__ = "timetable_entries"
+    __table_args__ = (
+        Index("ix_tte_group", "schedule_id", "group_id", "day", "lesson_id"),
+        Index("ix_tte_teacher", "schedule_id", "teacher_id", "day", "lesson_id"),
+        Index("ix_tte_room", "schedule_id", "room_id", "day", "lesson_id"),
+        Index("ix_tte_day", "schedule_id", "day", "lesson_id"),
+    )
+
+    schedule_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("schedules.schedule_id", onupdate="CASCADE", ondelete="RESTRICT"),
+        primary_key=True,
+    )
+    assignment_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+
+    timeslot_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    day: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    lesson_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    frequency: Mapped[TimeslotFrequency] = mapped_column(TimeslotFrequencyEnum, nullable=False)
+    start_time: Mapped[Time] = mapped_column(Time, nullable=False)
+    end_time: Mapped[Time] = mapped_column(Time, nullable=False)
+
+    group_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    group_name: Mapped[str] = mapped_column(String(100), nullable=False)
+    subgroup_no: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    course_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    course_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    course_type: Mapped[str] = mapped_column(CourseTypeEnum, nullable=False)
+    teacher_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    teacher_name: Mapped[str] = mapped_column(Text, nullable=False)
+    room_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    room_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
@@ -0,0 +1,19 @@
+from sqlalchemy import Index, literal_column
+
+# Searched expressions. Queries must use exactly these for the planner to
+# match them with the trigram indexes below.
+FULL_NAME = "(last_name || ' ' || first_name || ' ' || coalesce(patronymic, ''))"
+EMAIL = "(email::text)"
+
+
+def trigram_index(name: str, expression: str) -> Index:
+    """
+    GIN index with gin_trgm_ops (pg_trgm) on a column or expression,
+    serving ILIKE '%...%' and word similarity (<%) lookups.
+    """
+    return Index(
+        name,
+        literal_column(expression).label(name),
+        postgresql_using="gin",
+        postgresql_ops={name: "gin_trgm_ops"},
+    )
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Архівація та відновлення розкладів з командного рядка.
+
+Приклади:
+    python -m app.db.schedule_retention retention --prefix "Generated" --keep 5
+    python -m app.db.schedule_retention retention --prefix "Generated" --keep 5 --apply
+    python -m app.db.schedule_retention archive <schedule_id>
+    python -m app.db.schedule_retention restore <schedule_id>
+    python -m app.db.schedule_retention list
+"""
+
+import argparse
+import asyncio
+import uuid
+
+from app.services.schedule_archive_service import ScheduleArchiveService
+
+
+async def run(args: argparse.Namespace) -> None:
+    service = ScheduleArchiveService()
+
+    if args.command == "retention":
+        report = await service.apply_retention(
+            label_prefixes=args.prefix,
+            keep_last=args.keep,
+            batch_size=args.batch_size,
+            dry_run=not args.apply,
+        )
+        print(f"Лишаємо: {len(report.kept)}, до архівації: {len(report.to_archive)}")
+        for schedule_id in report.to_archive:
+            print(f"  - {schedule_id}")
+        for result in report.archived:
+            print(f"✓ {result.schedule_id} ('{result.label}'): {result.assignments} призначень, "
+                  f"{result.batches} пакетів, {result.elapsed_ms:.0f} мс")
+        if report.dry_run:
+            print("Пробний запуск: нічого не змінено (додайте --apply)")
+
+    elif args.command == "archive":
+        result = await service.archive_schedule(uuid.UUID(args.schedule_id), args.batch_size)
+        print(f"✓ Заархівовано {result.schedule_id}: {result.assignments} призначень, {result.compressed_bytes} байт")
+
+    elif args.command == "restore":
+        result = await service.restore_schedule(uuid.UUID(args.schedule_id))
+        print(f"✓ Відновлено {result.schedule_id} ('{result.label}'): {result.assignments} призначень")
+
+    elif args.command == "list":
+        archives = await service.list_archives()
+        for a in archives.archives:
+            print(f"{a.schedule_id}  {a.archived_at:%Y-%m-%d %H:%M}  {a.assignments_count:>7}  {a.label}")
+        print(f"Всього: {archives.total}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Архівація розкладів")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    retention = sub.add_parser("retention", help="Застосувати політику зберігання")
+    retention.add_argument("--prefix", action="append", required=True, help="Префікс мітки (можна кілька)")
+    retention.add_argument("--keep", type=int, required=True, help="Скільки останніх розкладів лишати на префікс")
+    retention.add_argument("--batch-size", type=int, default=5000)
+    retention.add_argument("--apply", action="store_true", help="Виконати (без прапорця - пробний запуск)")
+
+    archive = sub.add_parser("archive", help="Заархівувати один розклад")
+    archive.add_argument("schedule_id")
+    archive.add_argument("--batch-size", type=int, default=5000)
+
+    restore = sub.add_parser("restore", help="Відновити розклад з архіву")
+    restore.add_argument("schedule_id")
+
+    sub.add_parser("list", help="Список архівів")
+
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
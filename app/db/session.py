@@ -1,5 +1,7 @@
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from typing import AsyncGenerator
+from sqlalchemy.orm import Session
+from typing import AsyncGenerator, Callable, Union
 from app.core.config import settings
 import os
 
@@ -43,3 +45,35 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+
+
+_AFTER_COMMIT = "after_commit"
+
+
+def after_commit(session: Union[AsyncSession, Session], callback: Callable[[], None]) -> None:
+    """
+    Runs `callback` once the session's transaction commits, so process-local
+    state (schedule versions, in-memory caches) never runs ahead of the
+    database; the callback is dropped if the transaction rolls back. Runs
+    at once when no transaction is open.
+    """
+    sync_session = getattr(session, "sync_session", session)
+    if not sync_session.in_transaction():
+        callback()
+        return
+    sync_session.info.setdefault(_AFTER_COMMIT, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit(session: Session) -> None:
+    # Also dispatched when a savepoint is released; wait for the outer commit
+    if session.in_nested_transaction():
+        return
+    for callback in session.info.pop(_AFTER_COMMIT, ()):
+        callback()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_after_commit(session: Session, previous_transaction) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(_AFTER_COMMIT, None)
@@ -10,6 +10,9 @@ from app.middleware import LoggingMiddleware, ErrorHandlingMiddleware
 from app.core.logging import setup_logging
 from app.core.config import settings
 from app.api import schedules
+from app.api import me
+from app.api import schedule_archives
+from app.api import calendars
 import os
 
 @asynccontextmanager
@@ -27,6 +30,7 @@ async def lifespan(application: FastAPI) -> AsyncIterator[None]:
     # Database initialization
     async with engine.begin() as conn:
         await conn.execute(text('CREATE EXTENSION IF NOT EXISTS "citext";'))
+        await conn.execute(text('CREATE EXTENSION IF NOT EXISTS "pg_trgm";'))
         await conn.run_sync(Base.metadata.create_all)
 
     # Initialize schedule data
@@ -74,12 +78,23 @@ app.include_router(health.router, prefix="/health", tags=["health"])
 app.include_router(auth.router, prefix="/api", tags=["auth"])
 from app.api import admin_registrations
 from app.api import admin_people
+from app.api import catalog_import
+from app.api import availability
+from app.api import search
+from app.api import cohorts
 app.include_router(admin_registrations.router, prefix="/api", tags=["admin-registrations"])
 app.include_router(admin_people.router, prefix="/api", tags=["admin-people"])
+app.include_router(catalog_import.router, prefix="/api", tags=["admin-catalog"])
+app.include_router(cohorts.router, prefix="/api", tags=["admin-cohorts"])
 app.include_router(teachers.router, prefix="/api/teachers", tags=["teachers"])
 app.include_router(groups.router, prefix="/api/groups", tags=["groups"])
 app.include_router(users.router, prefix="/api/users", tags=["users"])
 app.include_router(schedules.router, prefix="/api", tags=["schedules"])
+app.include_router(schedule_archives.router, prefix="/api", tags=["schedule-archives"])
+app.include_router(calendars.router, prefix="/api", tags=["calendars"])
+app.include_router(availability.router, prefix="/api", tags=["availability"])
+app.include_router(search.router, prefix="/api", tags=["search"])
+app.include_router(me.router, prefix="/api", tags=["me"])
 app.include_router(courses.router, prefix="/api/courses", tags=["courses"])
 
 # Simple test endpoint to demo custom exceptions
@@ -0,0 +1,123 @@
+import logging
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import text, insert, table, column
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+# Set once per process: whether `assignments` is a partitioned table
+_partitioned: Optional[bool] = None
+
+_COLUMNS = (
+    "assignment_id", "schedule_id", "timeslot_id", "group_id",
+    "subgroup_no", "course_id", "teacher_id", "room_id", "course_type",
+)
+# Partition DDL gives up rather than queue behind long transactions
+_DDL_LOCK_TIMEOUT = "2s"
+# Rows per multi-row INSERT into a partition (9 binds each)
+_LOAD_CHUNK = 3000
+
+
+def partition_name(schedule_id: UUID) -> str:
+    return f"assignments_p_{schedule_id.hex}"
+
+
+class AssignmentPartitionRepository:
+    """
+    DDL helpers for the list-partitioned `assignments` table (one partition
+    per schedule). Every method is a no-op returning False on databases
+    where the table has not been partitioned yet, so callers can fall back
+    to plain row-level statements.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def is_partitioned(self) -> bool:
+        global _partitioned
+        if _partitioned is None:
+            result = await self._session.execute(
+                text("SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'assignments'::regclass)")
+            )
+            _partitioned = bool(result.scalar())
+        return _partitioned
+
+    async def _run_ddl(self, *statements: str) -> None:
+        """
+        Runs partition DDL in its own short transaction under the lock
+        timeout. Raises DBAPIError when the lock is not granted in time.
+        """
+        async with self._session.bind.begin() as conn:
+            await conn.execute(text(f"SET LOCAL lock_timeout = '{_DDL_LOCK_TIMEOUT}'"))
+            for statement in statements:
+                await conn.execute(text(statement))
+
+    async def partition_exists(self, schedule_id: UUID) -> bool:
+        result = await self._session.execute(
+            text("SELECT to_regclass(:name) IS NOT NULL"), {"name": partition_name(schedule_id)}
+        )
+        return bool(result.scalar())
+
+    async def create_partition(self, schedule_id: UUID) -> bool:
+        """
+        Creates an empty partition for a new schedule in its own short
+        transaction, so the ACCESS EXCLUSIVE lock it takes on `assignments`
+        is held for milliseconds instead of until the request commits. Call
+        it before the request inserts the schedule or touches `assignments`:
+        a lock held by the request itself would only run into the lock
+        timeout. Returns False when the partition could not be created (the
+        schedule's rows then go to assignments_default). A partition whose
+        schedule is never committed just stays empty.
+        """
+        if not await self.is_partitioned():
+            return False
+        name = partition_name(schedule_id)
+        try:
+            await self._run_ddl(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF assignments FOR VALUES IN ('{schedule_id}')"
+            )
+        except DBAPIError as e:
+            logger.warning(f"Партицію {name} не створено, рядки підуть у assignments_default: {e}")
+            return False
+        return True
+
+    async def bulk_load(self, schedule_id: UUID, rows: List[Dict[str, Any]]) -> bool:
+        """
+        Inserts a new schedule's assignments straight into its partition
+        (created with the schedule by `create_partition`) with multi-row
+        INSERTs, skipping tuple routing through the parent. Returns False
+        (nothing loaded) if the schedule has no partition of its own.
+        """
+        if not await self.is_partitioned() or not await self.partition_exists(schedule_id):
+            return False
+
+        name = partition_name(schedule_id)
+        partition = table(name, *(column(c) for c in _COLUMNS))
+        for i in range(0, len(rows), _LOAD_CHUNK):
+            chunk = [dict(row, schedule_id=schedule_id) for row in rows[i:i + _LOAD_CHUNK]]
+            await self._session.execute(insert(partition).values(chunk))
+
+        logger.info(f"Партицію {name} заповнено: {len(rows)} рядків")
+        return True
+
+    async def drop_partition(self, schedule_id: UUID) -> bool:
+        """
+        Detaches and drops the schedule's partition in its own short
+        transaction, giving up after the lock timeout rather than queueing
+        every assignment query behind it. Returns False when the table is
+        not partitioned, the schedule has no own partition or the lock was
+        not granted; its rows then have to be deleted in batches.
+        """
+        if not await self.is_partitioned() or not await self.partition_exists(schedule_id):
+            return False
+        name = partition_name(schedule_id)
+        try:
+            await self._run_ddl(f"ALTER TABLE assignments DETACH PARTITION {name}", f"DROP TABLE {name}")
+        except DBAPIError as e:
+            logger.warning(f"Партицію {name} не видалено, призначення буде видалено пакетами: {e}")
+            return False
+        logger.info(f"Партицію {name} від'єднано та видалено")
+        return True
@@ -1,13 +1,27 @@
 from uuid import UUID
-from typing import List, Optional, Union
-from sqlalchemy import select, delete, update
+from typing import Any, AsyncIterator, Callable, Collection, Dict, List, Optional, Set, Tuple, Union
+from sqlalchemy import select, delete, update, values, column, cast, Integer, and_, distinct, exists, func, literal, case, tuple_
+from sqlalchemy.orm import aliased
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.models.catalog.group import Group, GroupType
+from app.db.models.catalog.room import Room
+from app.db.models.common_enums import TimeslotFrequency
+from app.db.models.people.teacher import Teacher
 from app.db.models.scheduling.assignment import Assignment
+from app.db.models.scheduling.timeslot import Timeslot
+from app.db.session import after_commit
+from app.repositories.group_repository import group_subtree_cte
 from app.schemas.assignment import AssignmentCreate
 from app.utils.unset import UNSET
 
+# GROUPING(day, lesson_id, teacher_id, group_id) of each grouping set in find_utilization
+UTILIZATION_BY_SLOT = 0b0011      # (day, lesson_id)
+UTILIZATION_BY_TEACHER = 0b1101   # (teacher_id)
+UTILIZATION_BY_GROUP_DAY = 0b0110  # (group_id, day)
+
 
 class AssignmentRepository:
     """Repository for managing schedule assignments."""
@@ -15,15 +29,21 @@ class AssignmentRepository:
     def __init__(self, session: AsyncSession):
         self._session = session
 
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Runs `callback` once the current transaction commits."""
+        after_commit(self._session, callback)
+
     async def find_all(self) -> List[Assignment]:
         """Finds all assignments, ordered by schedule and time."""
         stmt = select(Assignment).order_by(Assignment.schedule_id, Assignment.timeslot_id)
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
-    async def find_by_id(self, assignment_id: UUID) -> Optional[Assignment]:
-        """Finds a single assignment by its primary key."""
-        stmt = select(Assignment).where(Assignment.assignment_id == assignment_id)
+    async def find_by_id(self, schedule_id: UUID, assignment_id: UUID) -> Optional[Assignment]:
+        """Finds a single assignment by its primary key (the schedule prunes to one partition)."""
+        stmt = select(Assignment).where(
+            Assignment.schedule_id == schedule_id, Assignment.assignment_id == assignment_id
+        )
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -37,6 +57,28 @@ class AssignmentRepository:
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
+    async def find_rows_by_schedule_id(self, schedule_id: UUID) -> List[Tuple]:
+        """
+        Plain column tuples (assignment_id, timeslot_id, group_id, subgroup_no,
+        course_id, teacher_id, room_id, course_type) without building ORM objects.
+        """
+        stmt = (
+            select(
+                Assignment.assignment_id,
+                Assignment.timeslot_id,
+                Assignment.group_id,
+                Assignment.subgroup_no,
+                Assignment.course_id,
+                Assignment.teacher_id,
+                Assignment.room_id,
+                Assignment.course_type,
+            )
+            .where(Assignment.schedule_id == schedule_id)
+            .order_by(Assignment.timeslot_id)
+        )
+        result = await self._session.execute(stmt)
+        return [tuple(row) for row in result.all()]
+
     async def find_by_schedule_and_group(
             self,
             schedule_id: UUID,
@@ -91,6 +133,168 @@ class AssignmentRepository:
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
+    async def find_room_placements(self, schedule_id: UUID) -> List[Tuple[UUID, int]]:
+        """Returns (room_id, timeslot_id) for every assignment with a room in a schedule."""
+        stmt = (
+            select(Assignment.room_id, Assignment.timeslot_id)
+            .where(
+                Assignment.schedule_id == schedule_id,
+                Assignment.room_id.is_not(None)
+            )
+        )
+        result = await self._session.execute(stmt)
+        return [(row.room_id, row.timeslot_id) for row in result.all()]
+
+    async def find_utilization(
+            self,
+            schedule_id: UUID,
+            min_capacity: Optional[int] = None,
+            max_capacity: Optional[int] = None,
+            group_type: Optional[str] = None,
+            group_course: Optional[int] = None,
+            teacher_id: Optional[UUID] = None
+    ) -> List[Any]:
+        """
+        Lesson counts per (day, lesson), per teacher and per (group, day) in one
+        scan with GROUPING SETS; `grouping_set` tells the sets apart (UTILIZATION_*).
+        Every row has odd- and even-week lesson counts (ALL lessons count in
+        both) and the number of distinct rooms in use in each week. A
+        capacity band limits the rows to lessons in matching rooms.
+        """
+        odd = Timeslot.frequency != TimeslotFrequency.EVEN
+        even = Timeslot.frequency != TimeslotFrequency.ODD
+        stmt = (
+            select(
+                func.grouping(Timeslot.day, Timeslot.lesson_id, Assignment.teacher_id, Assignment.group_id)
+                .label("grouping_set"),
+                Timeslot.day,
+                Timeslot.lesson_id,
+                Assignment.teacher_id,
+                Assignment.group_id,
+                func.count().filter(odd).label("lessons_odd"),
+                func.count().filter(even).label("lessons_even"),
+                func.count(distinct(Assignment.room_id)).filter(odd).label("rooms_odd"),
+                func.count(distinct(Assignment.room_id)).filter(even).label("rooms_even"),
+            )
+            .join(Timeslot, Timeslot.timeslot_id == Assignment.timeslot_id)
+            .where(Assignment.schedule_id == schedule_id)
+            .group_by(func.grouping_sets(
+                tuple_(Timeslot.day, Timeslot.lesson_id),
+                tuple_(Assignment.teacher_id),
+                tuple_(Assignment.group_id, Timeslot.day),
+            ))
+        )
+        if min_capacity is not None or max_capacity is not None:
+            stmt = stmt.join(Room, Room.room_id == Assignment.room_id)
+            if min_capacity is not None:
+                stmt = stmt.where(Room.capacity >= min_capacity)
+            if max_capacity is not None:
+                stmt = stmt.where(Room.capacity <= max_capacity)
+        if group_type is not None or group_course is not None:
+            stmt = stmt.join(Group, Group.group_id == Assignment.group_id)
+            if group_type is not None:
+                stmt = stmt.where(Group.type == GroupType(group_type))
+            if group_course is not None:
+                stmt = stmt.where(Group.course == group_course)
+        if teacher_id is not None:
+            stmt = stmt.where(Assignment.teacher_id == teacher_id)
+        result = await self._session.execute(stmt)
+        return list(result.all())
+
+    async def find_diff(self, base_schedule_id: UUID, target_schedule_id: UUID) -> List[Any]:
+        """Rows of the set-based diff of two schedules (see _diff_statement)."""
+        result = await self._session.execute(self._diff_statement(base_schedule_id, target_schedule_id))
+        return list(result.all())
+
+    async def stream_diff(self, base_schedule_id: UUID, target_schedule_id: UUID) -> AsyncIterator[Any]:
+        """Rows of find_diff, fetched from a server-side cursor as they are consumed."""
+        result = await self._session.stream(self._diff_statement(base_schedule_id, target_schedule_id))
+        async for row in result:
+            yield row
+
+    @staticmethod
+    def _diff_statement(base_schedule_id: UUID, target_schedule_id: UUID):
+        """
+        Set-based diff of two schedules in one statement.
+
+        Assignments that exist unchanged in both schedules are dropped with
+        NOT EXISTS; the rest are numbered per (group, course, subgroup,
+        course_type) and paired with a FULL OUTER JOIN. Rows carry `change`
+        ('added' / 'removed' / 'moved') plus old_* and new_* placement columns.
+        """
+        def changed_side(schedule_id: UUID, other_schedule_id: UUID, name: str):
+            other = aliased(Assignment)
+            same_in_other = exists().where(
+                other.schedule_id == other_schedule_id,
+                other.group_id == Assignment.group_id,
+                other.course_id == Assignment.course_id,
+                other.subgroup_no == Assignment.subgroup_no,
+                other.course_type == Assignment.course_type,
+                other.timeslot_id == Assignment.timeslot_id,
+                other.teacher_id == Assignment.teacher_id,
+                other.room_id.is_not_distinct_from(Assignment.room_id),
+            )
+            return (
+                select(
+                    Assignment.assignment_id,
+                    Assignment.group_id,
+                    Assignment.course_id,
+                    Assignment.subgroup_no,
+                    Assignment.course_type,
+                    Assignment.timeslot_id,
+                    Assignment.teacher_id,
+                    Assignment.room_id,
+                    func.row_number().over(
+                        partition_by=(
+                            Assignment.group_id, Assignment.course_id,
+                            Assignment.subgroup_no, Assignment.course_type,
+                        ),
+                        order_by=(Assignment.timeslot_id, Assignment.teacher_id, Assignment.room_id),
+                    ).label("rn"),
+                )
+                .where(Assignment.schedule_id == schedule_id, ~same_in_other)
+                .cte(name)
+            )
+
+        old = changed_side(base_schedule_id, target_schedule_id, "old_side")
+        new = changed_side(target_schedule_id, base_schedule_id, "new_side")
+
+        return (
+            select(
+                case(
+                    (old.c.assignment_id.is_(None), literal("added")),
+                    (new.c.assignment_id.is_(None), literal("removed")),
+                    else_=literal("moved"),
+                ).label("change"),
+                func.coalesce(old.c.group_id, new.c.group_id).label("group_id"),
+                func.coalesce(old.c.course_id, new.c.course_id).label("course_id"),
+                func.coalesce(old.c.subgroup_no, new.c.subgroup_no).label("subgroup_no"),
+                func.coalesce(old.c.course_type, new.c.course_type).label("course_type"),
+                old.c.assignment_id.label("old_assignment_id"),
+                old.c.timeslot_id.label("old_timeslot_id"),
+                old.c.teacher_id.label("old_teacher_id"),
+                old.c.room_id.label("old_room_id"),
+                new.c.assignment_id.label("new_assignment_id"),
+                new.c.timeslot_id.label("new_timeslot_id"),
+                new.c.teacher_id.label("new_teacher_id"),
+                new.c.room_id.label("new_room_id"),
+            )
+            .select_from(
+                old.join(
+                    new,
+                    and_(
+                        old.c.group_id == new.c.group_id,
+                        old.c.course_id == new.c.course_id,
+                        old.c.subgroup_no == new.c.subgroup_no,
+                        old.c.course_type == new.c.course_type,
+                        old.c.rn == new.c.rn,
+                    ),
+                    full=True,
+                )
+            )
+            .order_by("group_id", "course_id", "subgroup_no", "course_type")
+        )
+
     async def create(
         self,
         *,
@@ -136,11 +340,51 @@ class AssignmentRepository:
 
         return list(result.scalars().all())
 
+    async def copy_to_schedule(
+            self,
+            source_schedule_id: UUID,
+            target_schedule_id: UUID,
+            group_ids: Optional[List[UUID]] = None,
+            include_subgroups: bool = True
+    ) -> int:
+        """
+        Copies assignments into another schedule with a single
+        INSERT ... SELECT, so no rows travel to the application.
+        Optionally limited to the given groups (and their subgroups).
+        Returns the number of copied rows.
+        """
+        copied_columns = (
+            Assignment.timeslot_id,
+            Assignment.group_id,
+            Assignment.subgroup_no,
+            Assignment.course_id,
+            Assignment.teacher_id,
+            Assignment.room_id,
+            Assignment.course_type,
+        )
+        source = (
+            select(func.gen_random_uuid(), literal(target_schedule_id, PG_UUID(as_uuid=True)), *copied_columns)
+            .where(Assignment.schedule_id == source_schedule_id)
+        )
+        if group_ids is not None:
+            if include_subgroups:
+                tree = group_subtree_cte(group_ids)
+                source = source.where(Assignment.group_id.in_(select(tree.c.group_id)))
+            else:
+                source = source.where(Assignment.group_id.in_(group_ids))
+
+        stmt = insert(Assignment).from_select(
+            ["assignment_id", "schedule_id", *(c.key for c in copied_columns)],
+            source,
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount or 0
+
     async def update(
             self,
+            schedule_id: UUID,
             assignment_id: UUID,
             *,
-            schedule_id: Union[UUID, None, object] = UNSET,
             timeslot_id: Union[int, None, object] = UNSET,
             group_id: Union[UUID, None, object] = UNSET,
             subgroup_no: Union[int, None, object] = UNSET,
@@ -149,10 +393,8 @@ class AssignmentRepository:
             room_id: Union[UUID, None, object] = UNSET,
             course_type: Union[str, None, object] = UNSET,
     ) -> Optional[Assignment]:
-        """Updates an existing assignment using the UNSET pattern."""
+        """Updates an existing assignment of a schedule using the UNSET pattern."""
         update_data = {}
-        if schedule_id is not UNSET:
-            update_data["schedule_id"] = schedule_id
         if timeslot_id is not UNSET:
             update_data["timeslot_id"] = timeslot_id
         if group_id is not UNSET:
@@ -169,11 +411,11 @@ class AssignmentRepository:
             update_data["course_type"] = course_type
 
         if not update_data:
-            return await self.find_by_id(assignment_id)
+            return await self.find_by_id(schedule_id, assignment_id)
 
         stmt = (
             update(Assignment)
-            .where(Assignment.assignment_id == assignment_id)
+            .where(Assignment.schedule_id == schedule_id, Assignment.assignment_id == assignment_id)
             .values(**update_data)
             .returning(Assignment)
         )
@@ -185,13 +427,96 @@ class AssignmentRepository:
 
         return updated_assignment
 
-    async def delete(self, assignment_id: UUID) -> bool:
-        """Deletes a single assignment by its ID."""
-        stmt = delete(Assignment).where(Assignment.assignment_id == assignment_id).returning(Assignment.assignment_id)
+    async def find_missing_resources(
+            self, teacher_ids: Collection[UUID], room_ids: Collection[UUID]
+    ) -> Tuple[Set[UUID], Set[UUID]]:
+        """Returns the teacher IDs and room IDs among the given ones that do not exist."""
+        missing_teachers, missing_rooms = set(teacher_ids), set(room_ids)
+        if missing_teachers:
+            stmt = select(Teacher.teacher_id).where(Teacher.teacher_id.in_(missing_teachers))
+            missing_teachers -= set((await self._session.execute(stmt)).scalars().all())
+        if missing_rooms:
+            stmt = select(Room.room_id).where(Room.room_id.in_(missing_rooms))
+            missing_rooms -= set((await self._session.execute(stmt)).scalars().all())
+        return missing_teachers, missing_rooms
+
+    async def bulk_update_placements(
+            self,
+            schedule_id: UUID,
+            placements: List[Dict[str, Any]]
+    ) -> List[Assignment]:
+        """
+        Updates timeslot/teacher/room of many assignments with a single
+        UPDATE ... FROM (VALUES ...) statement. Each placement dict holds
+        assignment_id, timeslot_id, teacher_id and room_id.
+        """
+        if not placements:
+            return []
+
+        rows = values(
+            column("assignment_id", PG_UUID(as_uuid=True)),
+            column("timeslot_id", Integer),
+            column("teacher_id", PG_UUID(as_uuid=True)),
+            column("room_id", PG_UUID(as_uuid=True)),
+            name="placements",
+        ).data([
+            (p["assignment_id"], p["timeslot_id"], p["teacher_id"], p["room_id"])
+            for p in placements
+        ])
+        stmt = (
+            update(Assignment)
+            .where(
+                Assignment.assignment_id == rows.c.assignment_id,
+                Assignment.schedule_id == schedule_id
+            )
+            .values(
+                timeslot_id=cast(rows.c.timeslot_id, Integer),
+                teacher_id=cast(rows.c.teacher_id, PG_UUID(as_uuid=True)),
+                room_id=cast(rows.c.room_id, PG_UUID(as_uuid=True)),
+            )
+            .returning(Assignment)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def delete(self, schedule_id: UUID, assignment_id: UUID) -> bool:
+        """Deletes a single assignment of a schedule by its ID."""
+        stmt = (
+            delete(Assignment)
+            .where(Assignment.schedule_id == schedule_id, Assignment.assignment_id == assignment_id)
+            .returning(Assignment.assignment_id)
+        )
         result = await self._session.execute(stmt)
         deleted_id = result.scalar_one_or_none()
         return deleted_id is not None
 
+    async def delete_batch_by_schedule_id(self, schedule_id: UUID, batch_size: int) -> int:
+        """
+        Deletes at most `batch_size` assignments of a schedule. Returns the
+        number of deleted rows (0 once the schedule is empty).
+        """
+        batch = (
+            select(Assignment.assignment_id)
+            .where(Assignment.schedule_id == schedule_id)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        stmt = delete(Assignment).where(Assignment.schedule_id == schedule_id, Assignment.assignment_id.in_(batch))
+        result = await self._session.execute(stmt)
+        return result.rowcount or 0
+
+    async def insert_many(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Inserts raw assignment rows (with their original IDs), skipping
+        IDs that already exist. Returns the number of inserted rows.
+        """
+        if not rows:
+            return 0
+        stmt = insert(Assignment).values(rows).on_conflict_do_nothing(index_elements=["assignment_id", "schedule_id"])
+        result = await self._session.execute(stmt)
+        return result.rowcount or 0
+
     async def delete_by_schedule_id(self, schedule_id: UUID) -> int:
         """Deletes all assignments for a specific schedule. Returns count of deleted assignments."""
         stmt = delete(Assignment).where(Assignment.schedule_id == schedule_id).returning(Assignment.assignment_id)
@@ -199,8 +524,10 @@ class AssignmentRepository:
         deleted_ids = list(result.scalars().all())
         return len(deleted_ids)
 
-    async def exists(self, assignment_id: UUID) -> bool:
-        """Checks if an assignment exists by its ID."""
-        stmt = select(Assignment.assignment_id).where(Assignment.assignment_id == assignment_id)
+    async def exists(self, schedule_id: UUID, assignment_id: UUID) -> bool:
+        """Checks if an assignment exists in a schedule by its ID."""
+        stmt = select(Assignment.assignment_id).where(
+            Assignment.schedule_id == schedule_id, Assignment.assignment_id == assignment_id
+        )
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none() is not None
@@ -1,13 +1,48 @@
-from sqlalchemy import select, delete, insert
+from sqlalchemy import Text, and_, cast, or_, select, func, text
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from typing import List, Dict, Any
+from typing import Iterable, List, Dict, Any, Mapping, Optional, Sequence, Set, Tuple
 
+from app.db.models.catalog.group import Group
+from app.db.models.people.teacher import Teacher
+from app.db.models.scheduling.availability_mask import GroupUnavailabilityMask, TeacherAvailabilityMask
 from app.db.models.scheduling.teacher_availability import TeacherAvailability
 from app.db.models.scheduling.group_availability import GroupUnavailability
 from app.db.models.scheduling.teacher_preference import TeacherPreference
 
+# Replaces the cells of the listed owners with the desired ones in one
+# statement: only cells that disappear are deleted and only new ones are
+# inserted, so unchanged cells are never written
+_APPLY_CELLS = """
+    WITH desired (owner_id, timeslot_id) AS (
+        SELECT * FROM unnest(CAST(:cell_owners AS uuid[]), CAST(:cell_timeslots AS int[]))
+    ), removed AS (
+        DELETE FROM {table} t
+        USING unnest(CAST(:owners AS uuid[])) AS o (owner_id)
+        WHERE t.{owner} = o.owner_id
+          AND NOT EXISTS (
+              SELECT 1 FROM desired d WHERE d.owner_id = t.{owner} AND d.timeslot_id = t.timeslot_id
+          )
+        RETURNING 1
+    ), added AS (
+        INSERT INTO {table} ({owner}, timeslot_id)
+        SELECT owner_id, timeslot_id FROM desired
+        ON CONFLICT ({owner}, timeslot_id) DO NOTHING
+        RETURNING 1
+    )
+    SELECT (SELECT count(*) FROM added), (SELECT count(*) FROM removed)
+"""
+
+# Upserts the bitmasks (as '0101' bit strings) of several owners
+_SAVE_MASKS = """
+    INSERT INTO {table} ({owner}, mask, codec_key)
+    SELECT owner_id, CAST(bits AS varbit), :codec_key
+    FROM unnest(CAST(:owners AS uuid[]), CAST(:bits AS text[])) AS m (owner_id, bits)
+    ON CONFLICT ({owner}) DO UPDATE
+    SET mask = EXCLUDED.mask, codec_key = EXCLUDED.codec_key, updated_at = now()
+"""
+
 
 class AvailabilityRepository:
     """
@@ -29,22 +64,61 @@ class AvailabilityRepository:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_teachers_availability(self, teacher_ids: Iterable[UUID]) -> Dict[UUID, Set[int]]:
+        """
+        Retrieves available timeslot IDs for several teachers in one query.
+        Teachers without any entries are absent from the result.
+        """
+        teacher_ids = list(teacher_ids)
+        if not teacher_ids:
+            return {}
+        stmt = select(TeacherAvailability.teacher_id, TeacherAvailability.timeslot_id).where(
+            TeacherAvailability.teacher_id.in_(teacher_ids)
+        )
+        result = await self.session.execute(stmt)
+        availability: Dict[UUID, Set[int]] = {}
+        for teacher_id, timeslot_id in result.all():
+            availability.setdefault(teacher_id, set()).add(timeslot_id)
+        return availability
+
     async def set_teacher_availability(self, teacher_id: UUID, timeslot_ids: List[int]):
         """
         Sets a teacher's availability by replacing all existing entries
         with the new list of timeslot IDs.
         """
-        # 1. Clear existing entries for this teacher
-        await self.session.execute(
-            delete(TeacherAvailability).where(TeacherAvailability.teacher_id == teacher_id)
-        )
+        await self.apply_teacher_availability({teacher_id: timeslot_ids})
 
-        if not timeslot_ids:
-            return
+    async def apply_teacher_availability(self, cells: Mapping[UUID, Iterable[int]]) -> Tuple[int, int]:
+        """
+        Replaces the available timeslots of every teacher in `cells`.
+        Returns the number of cells (added, removed).
+        """
+        return await self._apply_cells("teacher_availability", "teacher_id", cells)
+
+    async def get_teacher_availability_matrix(
+            self, teacher_ids: Optional[Iterable[UUID]] = None
+    ) -> Dict[UUID, List[int]]:
+        """
+        Available timeslot IDs of the given teachers (all teachers if None),
+        including those without any, in one query.
+        """
+        return await self._matrix(Teacher.teacher_id, TeacherAvailability, TeacherAvailability.teacher_id, teacher_ids)
 
-        # 2. Bulk insert new entries
-        values = [{"teacher_id": teacher_id, "timeslot_id": tid} for tid in timeslot_ids]
-        await self.session.execute(insert(TeacherAvailability), values)
+    async def get_teacher_availability_bits(
+            self, teacher_ids: Optional[Iterable[UUID]], codec_key: str
+    ) -> Dict[UUID, Optional[str]]:
+        """
+        Availability bitmasks of the given teachers (all teachers if None) as
+        bit strings, ordinal 0 first. Teachers without a mask built for
+        `codec_key` map to None.
+        """
+        return await self._bits(
+            Teacher.teacher_id, TeacherAvailabilityMask, TeacherAvailabilityMask.teacher_id, teacher_ids, codec_key
+        )
+
+    async def save_teacher_availability_bits(self, bits: Mapping[UUID, str], codec_key: str):
+        """Stores the availability bitmasks of several teachers, built for `codec_key`."""
+        await self._save_bits("teacher_availability_masks", "teacher_id", bits, codec_key)
 
     # --- Group Availability ---
 
@@ -58,6 +132,86 @@ class AvailabilityRepository:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_group_unavailability_matrix(
+            self, group_ids: Optional[Iterable[UUID]] = None
+    ) -> Dict[UUID, List[int]]:
+        """
+        Unavailable timeslot IDs of the given groups (all groups if None),
+        including those without any, in one query.
+        """
+        return await self._matrix(Group.group_id, GroupUnavailability, GroupUnavailability.group_id, group_ids)
+
+    async def apply_group_unavailability(self, cells: Mapping[UUID, Iterable[int]]) -> Tuple[int, int]:
+        """
+        Replaces the unavailable timeslots of every group in `cells`.
+        Returns the number of cells (added, removed).
+        """
+        return await self._apply_cells("group_unavailability", "group_id", cells)
+
+    async def get_group_unavailability_bits(
+            self, group_ids: Optional[Iterable[UUID]], codec_key: str
+    ) -> Dict[UUID, Optional[str]]:
+        """
+        Unavailability bitmasks of the given groups (all groups if None) as
+        bit strings, ordinal 0 first. Groups without a mask built for
+        `codec_key` map to None.
+        """
+        return await self._bits(
+            Group.group_id, GroupUnavailabilityMask, GroupUnavailabilityMask.group_id, group_ids, codec_key
+        )
+
+    async def save_group_unavailability_bits(self, bits: Mapping[UUID, str], codec_key: str):
+        """Stores the unavailability bitmasks of several groups, built for `codec_key`."""
+        await self._save_bits("group_unavailability_masks", "group_id", bits, codec_key)
+
+    # --- Matrices ---
+
+    async def _matrix(self, owner_key, model, cell_key, owner_ids: Optional[Iterable[UUID]]) -> Dict[UUID, List[int]]:
+        stmt = (
+            select(owner_key, func.array_remove(func.array_agg(model.timeslot_id), None))
+            .outerjoin(model, cell_key == owner_key)
+            .group_by(owner_key)
+        )
+        if owner_ids is not None:
+            stmt = stmt.where(owner_key.in_(list(owner_ids)))
+        result = await self.session.execute(stmt)
+        return {owner_id: sorted(timeslot_ids) for owner_id, timeslot_ids in result.all()}
+
+    async def _apply_cells(self, table: str, owner: str, cells: Mapping[UUID, Iterable[int]]) -> Tuple[int, int]:
+        cell_owners: List[UUID] = []
+        cell_timeslots: List[int] = []
+        for owner_id, timeslot_ids in cells.items():
+            for timeslot_id in set(timeslot_ids):
+                cell_owners.append(owner_id)
+                cell_timeslots.append(timeslot_id)
+        result = await self.session.execute(
+            text(_APPLY_CELLS.format(table=table, owner=owner)),
+            {"owners": list(cells), "cell_owners": cell_owners, "cell_timeslots": cell_timeslots},
+        )
+        added, removed = result.one()
+        return added, removed
+
+    # --- Bitmasks ---
+
+    async def _bits(
+            self, owner_key, model, mask_key, owner_ids: Optional[Iterable[UUID]], codec_key: str
+    ) -> Dict[UUID, Optional[str]]:
+        stmt = select(owner_key, cast(model.mask, Text)).outerjoin(
+            model, and_(mask_key == owner_key, model.codec_key == codec_key)
+        )
+        if owner_ids is not None:
+            stmt = stmt.where(owner_key.in_(list(owner_ids)))
+        result = await self.session.execute(stmt)
+        return dict(result.all())
+
+    async def _save_bits(self, table: str, owner: str, bits: Mapping[UUID, str], codec_key: str):
+        if not bits:
+            return
+        await self.session.execute(
+            text(_SAVE_MASKS.format(table=table, owner=owner)),
+            {"owners": list(bits), "bits": list(bits.values()), "codec_key": codec_key},
+        )
+
     # --- Teacher Preferences ---
 
     async def get_teacher_preferences(self, teacher_id: UUID) -> Dict[str, Any]:
@@ -71,6 +225,42 @@ class AvailabilityRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none() or {}
 
+    async def get_teachers_preferences(self, teacher_ids: Iterable[UUID]) -> Dict[UUID, Dict[str, Any]]:
+        """
+        Retrieves preference JSON objects for several teachers in one query.
+        Teachers without a record are absent from the result.
+        """
+        teacher_ids = list(teacher_ids)
+        if not teacher_ids:
+            return {}
+        stmt = select(TeacherPreference.teacher_id, TeacherPreference.preferences).where(
+            TeacherPreference.teacher_id.in_(teacher_ids)
+        )
+        result = await self.session.execute(stmt)
+        return {row.teacher_id: row.preferences for row in result.all()}
+
+    async def find_teachers_by_preferences(
+            self, avoid_any: Sequence[str] = (), preferred_day: Optional[str] = None
+    ) -> List[Teacher]:
+        """
+        Teachers whose preferences avoid any of the given slots and/or
+        prefer the given day, ordered by name. Each condition is a JSONB
+        containment test, answered from the GIN index on preferences.
+        """
+        stmt = (
+            select(Teacher)
+            .join(TeacherPreference, TeacherPreference.teacher_id == Teacher.teacher_id)
+            .order_by(Teacher.last_name, Teacher.first_name, Teacher.teacher_id)
+        )
+        if avoid_any:
+            stmt = stmt.where(or_(*(
+                TeacherPreference.preferences.contains({"avoid_slots": [slot]}) for slot in avoid_any
+            )))
+        if preferred_day is not None:
+            stmt = stmt.where(TeacherPreference.preferences.contains({"preferred_days": [preferred_day]}))
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     async def upsert_teacher_preferences(self, teacher_id: UUID, prefs: Dict[str, Any]):
         """
         Inserts or updates the preference JSON for a teacher.
@@ -0,0 +1,278 @@
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import after_commit
+
+# section -> (staging table, column definitions); row_no is the 1-based
+# position of the row in its bundle section
+STAGING_TABLES: Dict[str, Tuple[str, Tuple[Tuple[str, str], ...]]] = {
+    "rooms": ("import_rooms", (("name", "text"), ("capacity", "int"))),
+    "courses": ("import_courses", (("name", "text"), ("code", "text"), ("duration", "int"))),
+    "teachers": ("import_teachers", (
+        ("first_name", "text"), ("last_name", "text"), ("patronymic", "text"), ("status", "text"),
+    )),
+    "groups": ("import_groups", (
+        ("name", "text"), ("size", "int"), ("type", "text"), ("course", "int"), ("parent", "text"),
+    )),
+    "group_courses": ("import_group_courses", (
+        ("group_name", "text"), ("course_name", "text"), ("count_per_week", "int"), ("frequency", "text"),
+    )),
+    "teacher_courses": ("import_teacher_courses", (
+        ("first_name", "text"), ("last_name", "text"), ("patronymic", "text"), ("course_name", "text"),
+    )),
+}
+
+# Every check yields (section, row_no, field, message); together they are one
+# UNION ALL, so the whole bundle is validated in a single statement
+_CHECKS = (
+    # Duplicates inside the bundle: every occurrence after the first
+    """
+    SELECT 'rooms', row_no, 'name', 'Duplicate room name in the bundle'
+    FROM (SELECT row_no, row_number() OVER (PARTITION BY name ORDER BY row_no) AS n FROM import_rooms) d
+    WHERE n > 1
+    """,
+    """
+    SELECT 'courses', row_no, 'name', 'Duplicate course name in the bundle'
+    FROM (SELECT row_no, row_number() OVER (PARTITION BY name ORDER BY row_no) AS n FROM import_courses) d
+    WHERE n > 1
+    """,
+    """
+    SELECT 'courses', row_no, 'code', 'Duplicate course code in the bundle'
+    FROM (
+        SELECT row_no, row_number() OVER (PARTITION BY code ORDER BY row_no) AS n
+        FROM import_courses WHERE code IS NOT NULL
+    ) d
+    WHERE n > 1
+    """,
+    """
+    SELECT 'teachers', row_no, 'last_name', 'Duplicate teacher in the bundle'
+    FROM (
+        SELECT row_no, row_number() OVER (PARTITION BY first_name, last_name, patronymic ORDER BY row_no) AS n
+        FROM import_teachers
+    ) d
+    WHERE n > 1
+    """,
+    """
+    SELECT 'groups', row_no, 'name', 'Duplicate group name in the bundle'
+    FROM (SELECT row_no, row_number() OVER (PARTITION BY name ORDER BY row_no) AS n FROM import_groups) d
+    WHERE n > 1
+    """,
+    """
+    SELECT 'group_courses', row_no, 'course', 'Duplicate group/course link in the bundle'
+    FROM (
+        SELECT row_no, row_number() OVER (PARTITION BY group_name, course_name ORDER BY row_no) AS n
+        FROM import_group_courses
+    ) d
+    WHERE n > 1
+    """,
+    """
+    SELECT 'teacher_courses', row_no, 'course', 'Duplicate teacher/course link in the bundle'
+    FROM (
+        SELECT row_no, row_number() OVER (
+            PARTITION BY first_name, last_name, patronymic, course_name ORDER BY row_no
+        ) AS n
+        FROM import_teacher_courses
+    ) d
+    WHERE n > 1
+    """,
+    # Uniqueness against the database: a code held by another course
+    """
+    SELECT 'courses', s.row_no, 'code', 'Course code is already used by course ''' || c.name || ''''
+    FROM import_courses s JOIN courses c ON c.code = s.code AND c.name <> s.name
+    """,
+    # References, resolved in the bundle first and in the database second
+    """
+    SELECT 'groups', s.row_no, 'parent', 'Unknown parent group ''' || s.parent || ''''
+    FROM import_groups s
+    WHERE s.parent IS NOT NULL
+      AND NOT EXISTS (SELECT 1 FROM import_groups p WHERE p.name = s.parent)
+      AND NOT EXISTS (SELECT 1 FROM groups p WHERE p.name = s.parent)
+    """,
+    """
+    SELECT DISTINCT 'groups', row_no, 'parent', 'Group hierarchy would contain a cycle'
+    FROM (
+        WITH RECURSIVE chain (row_no, name, path) AS (
+            SELECT row_no, parent, ARRAY[name] FROM import_groups WHERE parent IS NOT NULL
+            UNION ALL
+            SELECT c.row_no, COALESCE(ig.parent, dp.name), c.path || c.name
+            FROM chain c
+            LEFT JOIN import_groups ig ON ig.name = c.name
+            LEFT JOIN groups dg ON ig.name IS NULL AND dg.name = c.name
+            LEFT JOIN groups dp ON dp.group_id = dg.parent_group_id
+            WHERE c.name IS NOT NULL AND NOT c.name = ANY(c.path)
+        )
+        SELECT row_no FROM chain WHERE name = ANY(path)
+    ) cycles
+    """,
+    """
+    SELECT 'group_courses', s.row_no, 'group', 'Unknown group ''' || s.group_name || ''''
+    FROM import_group_courses s
+    WHERE NOT EXISTS (SELECT 1 FROM import_groups g WHERE g.name = s.group_name)
+      AND NOT EXISTS (SELECT 1 FROM groups g WHERE g.name = s.group_name)
+    """,
+    """
+    SELECT 'group_courses', s.row_no, 'course', 'Unknown course ''' || s.course_name || ''''
+    FROM import_group_courses s
+    WHERE NOT EXISTS (SELECT 1 FROM import_courses c WHERE c.name = s.course_name)
+      AND NOT EXISTS (SELECT 1 FROM courses c WHERE c.name = s.course_name)
+    """,
+    """
+    SELECT 'teacher_courses', s.row_no, 'last_name', 'Unknown teacher'
+    FROM import_teacher_courses s
+    WHERE NOT EXISTS (
+            SELECT 1 FROM import_teachers t
+            WHERE (t.first_name, t.last_name, t.patronymic) = (s.first_name, s.last_name, s.patronymic)
+        )
+      AND NOT EXISTS (
+            SELECT 1 FROM teachers t
+            WHERE (t.first_name, t.last_name, t.patronymic) = (s.first_name, s.last_name, s.patronymic)
+        )
+    """,
+    """
+    SELECT 'teacher_courses', s.row_no, 'course', 'Unknown course ''' || s.course_name || ''''
+    FROM import_teacher_courses s
+    WHERE NOT EXISTS (SELECT 1 FROM import_courses c WHERE c.name = s.course_name)
+      AND NOT EXISTS (SELECT 1 FROM courses c WHERE c.name = s.course_name)
+    """,
+)
+
+# Upserts in dependency order, each reporting (inserted, updated); xmax = 0
+# marks a row version created by this INSERT rather than by ON CONFLICT UPDATE
+_UPSERTS = (
+    ("rooms", """
+    WITH up AS (
+        INSERT INTO rooms (room_id, name, capacity)
+        SELECT gen_random_uuid(), name, capacity FROM import_rooms
+        ON CONFLICT (name) DO UPDATE SET capacity = EXCLUDED.capacity
+        RETURNING xmax = 0 AS inserted
+    )
+    SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted) FROM up
+    """),
+    ("courses", """
+    WITH up AS (
+        INSERT INTO courses (course_id, name, code, duration)
+        SELECT gen_random_uuid(), name, code, duration FROM import_courses
+        ON CONFLICT (name) DO UPDATE SET code = COALESCE(EXCLUDED.code, courses.code), duration = EXCLUDED.duration
+        RETURNING xmax = 0 AS inserted
+    )
+    SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted) FROM up
+    """),
+    # Existing teachers only change status when the bundle gives one; the enum
+    # labels are the TeacherStatus names, so the lower-case values are upper-cased
+    ("teachers", """
+    WITH updated AS (
+        UPDATE teachers t SET status = upper(s.status)::teacher_status_enum
+        FROM import_teachers s
+        WHERE (t.first_name, t.last_name, t.patronymic) = (s.first_name, s.last_name, s.patronymic)
+          AND s.status IS NOT NULL
+        RETURNING 1
+    ), inserted AS (
+        INSERT INTO teachers (teacher_id, first_name, last_name, patronymic, status)
+        SELECT gen_random_uuid(), first_name, last_name, patronymic,
+               COALESCE(upper(status), 'PENDING')::teacher_status_enum
+        FROM import_teachers
+        ON CONFLICT ON CONSTRAINT uq_teachers_name DO NOTHING
+        RETURNING 1
+    )
+    SELECT (SELECT count(*) FROM inserted), (SELECT count(*) FROM updated)
+    """),
+    ("groups", """
+    WITH up AS (
+        INSERT INTO groups (group_id, name, size, type, course)
+        SELECT gen_random_uuid(), name, size, type::group_type_enum, course FROM import_groups
+        ON CONFLICT (name) DO UPDATE SET size = EXCLUDED.size, type = EXCLUDED.type, course = EXCLUDED.course
+        RETURNING xmax = 0 AS inserted
+    )
+    SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted) FROM up
+    """),
+    ("group_courses", """
+    WITH up AS (
+        INSERT INTO group_course (group_id, course_id, count_per_week, frequency)
+        SELECT g.group_id, c.course_id, s.count_per_week, s.frequency::course_frequency_enum
+        FROM import_group_courses s
+        JOIN groups g ON g.name = s.group_name
+        JOIN courses c ON c.name = s.course_name
+        ON CONFLICT (group_id, course_id) DO UPDATE
+            SET count_per_week = EXCLUDED.count_per_week, frequency = EXCLUDED.frequency
+        RETURNING xmax = 0 AS inserted
+    )
+    SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted) FROM up
+    """),
+    ("teacher_courses", """
+    WITH up AS (
+        INSERT INTO teacher_course (teacher_id, course_id)
+        SELECT t.teacher_id, c.course_id
+        FROM import_teacher_courses s
+        JOIN teachers t ON (t.first_name, t.last_name, t.patronymic) = (s.first_name, s.last_name, s.patronymic)
+        JOIN courses c ON c.name = s.course_name
+        ON CONFLICT (teacher_id, course_id) DO NOTHING
+        RETURNING 1
+    )
+    SELECT count(*), 0 FROM up
+    """),
+)
+
+# Parents are set once every group of the bundle exists; the bundle is
+# authoritative, so a group imported without a parent becomes top-level
+_SET_PARENTS = """
+    UPDATE groups g SET parent_group_id = p.group_id
+    FROM import_groups s LEFT JOIN groups p ON p.name = s.parent
+    WHERE g.name = s.name AND g.parent_group_id IS DISTINCT FROM p.group_id
+"""
+
+
+class CatalogImportRepository:
+    """
+    Set-based catalog import: the bundle is copied into temporary staging
+    tables (dropped at commit), validated with one query and upserted with
+    one statement per table, all in the session's transaction.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Runs `callback` once the current transaction commits."""
+        after_commit(self._session, callback)
+
+    async def stage(self, records: Dict[str, List[Sequence[Any]]]) -> None:
+        """
+        Creates the staging tables and loads `records` (section -> rows in
+        STAGING_TABLES column order, without row_no) with COPY.
+        """
+        connection = await self._session.connection()
+        driver = (await connection.get_raw_connection()).driver_connection
+        for section, (name, columns) in STAGING_TABLES.items():
+            definition = ", ".join(f"{column} {sql_type}" for column, sql_type in columns)
+            await self._session.execute(text(f"CREATE TEMP TABLE {name} (row_no int, {definition}) ON COMMIT DROP"))
+            rows = records.get(section) or []
+            if rows:
+                await driver.copy_records_to_table(
+                    name,
+                    records=[(i, *row) for i, row in enumerate(rows, start=1)],
+                    columns=["row_no", *(column for column, _ in columns)],
+                )
+                # Temp tables are never auto-analyzed; the checks join on them
+                await self._session.execute(text(f"ANALYZE {name}"))
+
+    async def validate(self) -> List[Any]:
+        """Rows (section, row_no, field, message) of every failed check, by section and row."""
+        union = " UNION ALL ".join(f"({check.strip()})" for check in _CHECKS)
+        result = await self._session.execute(text(
+            f"SELECT section, row_no, field, message FROM ({union}) AS e (section, row_no, field, message) "
+            f"ORDER BY section, row_no, field"
+        ))
+        return list(result.all())
+
+    async def upsert(self) -> Dict[str, Tuple[int, int]]:
+        """Writes the staged bundle; returns section -> (inserted, updated)."""
+        counts: Dict[str, Tuple[int, int]] = {}
+        for section, statement in _UPSERTS:
+            result = await self._session.execute(text(statement))
+            inserted, updated = result.one()
+            counts[section] = (inserted, updated)
+            if section == "groups":
+                await self._session.execute(text(_SET_PARENTS))
+        return counts
@@ -0,0 +1,156 @@
+from contextlib import asynccontextmanager
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.catalog.group import Group, GroupType
+from app.db.models.common_enums import StudentStatus
+from app.db.models.joins.student_group import StudentGroup
+from app.db.models.people.student import Student
+from app.db.session import after_commit
+
+# Gives every (group, template) pair's group a copy of the template's
+# course links, count_per_week and frequency included: links the template
+# lacks are deleted, the rest inserted or updated where they differ.
+# Templates are read as of before the statement, so chains (A takes B's
+# links while B takes C's) see the old links.
+_CLONE_LINKS = """
+    WITH pairs (group_id, template_id) AS (
+        SELECT * FROM unnest(CAST(:groups AS uuid[]), CAST(:templates AS uuid[]))
+    ), desired AS (
+        SELECT p.group_id, gc.course_id, gc.count_per_week, gc.frequency
+        FROM pairs p JOIN group_course gc ON gc.group_id = p.template_id
+    ), removed AS (
+        DELETE FROM group_course t
+        USING pairs p
+        WHERE t.group_id = p.group_id
+          AND NOT EXISTS (SELECT 1 FROM desired d WHERE d.group_id = t.group_id AND d.course_id = t.course_id)
+        RETURNING 1
+    ), written AS (
+        INSERT INTO group_course (group_id, course_id, count_per_week, frequency)
+        SELECT group_id, course_id, count_per_week, frequency FROM desired
+        ON CONFLICT (group_id, course_id) DO UPDATE
+        SET count_per_week = EXCLUDED.count_per_week, frequency = EXCLUDED.frequency
+        WHERE (group_course.count_per_week, group_course.frequency)
+              IS DISTINCT FROM (EXCLUDED.count_per_week, EXCLUDED.frequency)
+        RETURNING xmax = 0 AS inserted
+    )
+    SELECT (SELECT count(*) FROM written WHERE inserted),
+           (SELECT count(*) FROM written WHERE NOT inserted),
+           (SELECT count(*) FROM removed)
+"""
+
+
+class CohortRepository:
+    """Set-based operations on whole cohorts of students and groups."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Runs `callback` once the current transaction commits."""
+        after_commit(self._session, callback)
+
+    @asynccontextmanager
+    async def preview(self, dry_run: bool):
+        """
+        Runs the enclosed statements in a savepoint that is rolled back if
+        `dry_run`, so a preview reports exactly what the real run would do.
+        """
+        savepoint = await self._session.begin_nested()
+        try:
+            yield
+        except BaseException:
+            await savepoint.rollback()
+            raise
+        if dry_run:
+            await savepoint.rollback()
+        else:
+            await savepoint.commit()
+
+    async def find_missing_groups(self, group_ids: Sequence[UUID]) -> List[UUID]:
+        stmt = select(Group.group_id).where(Group.group_id.in_(group_ids))
+        found = set((await self._session.execute(stmt)).scalars().all())
+        return [group_id for group_id in dict.fromkeys(group_ids) if group_id not in found]
+
+    async def find_missing_students(self, student_ids: Sequence[UUID]) -> List[UUID]:
+        stmt = select(Student.student_id).where(Student.student_id.in_(student_ids))
+        found = set((await self._session.execute(stmt)).scalars().all())
+        return [student_id for student_id in dict.fromkeys(student_ids) if student_id not in found]
+
+    async def transfer_students(
+            self,
+            target_group_id: UUID,
+            student_ids: Optional[Sequence[UUID]] = None,
+            from_group_id: Optional[UUID] = None,
+            status: Optional[StudentStatus] = None,
+    ) -> Tuple[int, int]:
+        """
+        Moves the selected students (by ID or by current group and status)
+        into the target group in one statement, keeping the legacy
+        student_group rows in step. Students already there are skipped.
+        Returns (students moved, student_group rows updated).
+        """
+        stmt = update(Student).where(Student.group_id.is_distinct_from(target_group_id))
+        if student_ids is not None:
+            stmt = stmt.where(Student.student_id.in_(student_ids))
+        if from_group_id is not None:
+            stmt = stmt.where(Student.group_id == from_group_id)
+        if status is not None:
+            stmt = stmt.where(Student.status == status)
+        moved = stmt.values(group_id=target_group_id).returning(Student.student_id).cte("moved")
+        synced = (
+            update(StudentGroup)
+            .where(StudentGroup.student_id == moved.c.student_id)
+            .values(group_id=target_group_id)
+            .returning(StudentGroup.student_id)
+            .cte("synced")
+        )
+        result = await self._session.execute(select(
+            select(func.count()).select_from(moved).scalar_subquery(),
+            select(func.count()).select_from(synced).scalar_subquery(),
+        ))
+        students, memberships = result.one()
+        return students, memberships
+
+    async def advance_groups(
+            self, group_type: Optional[str], courses: Optional[Sequence[int]], max_course: int
+    ) -> Tuple[int, int]:
+        """
+        Moves the selected groups (and subgroups) one course year up in one
+        statement. Groups already in `max_course` stay. Returns (advanced,
+        left at max_course).
+        """
+        selected = []
+        if group_type is not None:
+            selected.append(Group.type == GroupType(group_type))
+        if courses is not None:
+            selected.append(Group.course.in_(courses))
+        advanced = (
+            update(Group)
+            .where(*selected, Group.course < max_course)
+            .values(course=Group.course + 1)
+            .returning(Group.group_id)
+            .cte("advanced")
+        )
+        result = await self._session.execute(select(
+            select(func.count()).select_from(advanced).scalar_subquery(),
+            select(func.count(Group.group_id)).where(*selected, Group.course >= max_course).scalar_subquery(),
+        ))
+        advanced_count, kept = result.one()
+        return advanced_count, kept
+
+    async def clone_group_course_links(self, templates: Dict[UUID, UUID]) -> Tuple[int, int, int]:
+        """
+        Replaces the course links of every group in `templates` with a copy
+        of its template group's links. Returns (inserted, updated, removed).
+        """
+        if not templates:
+            return 0, 0, 0
+        result = await self._session.execute(
+            text(_CLONE_LINKS), {"groups": list(templates), "templates": list(templates.values())}
+        )
+        inserted, updated, removed = result.one()
+        return inserted, updated, removed
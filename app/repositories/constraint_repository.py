@@ -1,11 +1,14 @@
-from sqlalchemy import select
+from sqlalchemy import select, insert, literal, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from typing import List
+from typing import Any, Dict, List, Optional
 
 from app.db.models.joins.group_course import GroupCourse
 from app.db.models.joins.teacher_course import TeacherCourse
 from app.db.models.scheduling.subgroup_constraints import SubgroupConstraints
+from app.repositories.group_repository import group_subtree_cte
 
 class ConstraintRepository:
     """
@@ -40,3 +43,47 @@ class ConstraintRepository:
         )
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
+
+    async def copy_subgroup_constraints(
+            self,
+            source_schedule_id: UUID,
+            target_schedule_id: UUID,
+            group_ids: Optional[List[UUID]] = None,
+            include_subgroups: bool = True
+    ) -> int:
+        """
+        Copies subgroup constraints to another schedule with INSERT ... SELECT.
+        Returns the number of copied rows.
+        """
+        source = select(
+            literal(target_schedule_id, PG_UUID(as_uuid=True)),
+            SubgroupConstraints.group_id,
+            SubgroupConstraints.course_id,
+            SubgroupConstraints.subgroups_count,
+        ).where(SubgroupConstraints.schedule_id == source_schedule_id)
+        if group_ids is not None:
+            if include_subgroups:
+                tree = group_subtree_cte(group_ids)
+                source = source.where(SubgroupConstraints.group_id.in_(select(tree.c.group_id)))
+            else:
+                source = source.where(SubgroupConstraints.group_id.in_(group_ids))
+
+        stmt = insert(SubgroupConstraints).from_select(
+            ["schedule_id", "group_id", "course_id", "subgroups_count"], source
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount or 0
+
+    async def delete_subgroup_constraints(self, schedule_id: UUID) -> int:
+        """Deletes all subgroup constraints of a schedule."""
+        stmt = delete(SubgroupConstraints).where(SubgroupConstraints.schedule_id == schedule_id)
+        result = await self.session.execute(stmt)
+        return result.rowcount or 0
+
+    async def insert_subgroup_constraints(self, rows: List[Dict[str, Any]]) -> int:
+        """Inserts raw subgroup constraint rows, skipping existing ones."""
+        if not rows:
+            return 0
+        stmt = pg_insert(SubgroupConstraints).values(rows).on_conflict_do_nothing()
+        result = await self.session.execute(stmt)
+        return result.rowcount or 0
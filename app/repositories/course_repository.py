@@ -1,14 +1,57 @@
-from typing import List, Optional, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 from uuid import UUID
 
-from sqlalchemy import select, delete, update, func
+from sqlalchemy import select, delete, update, func, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.catalog.course import Course
 from app.db.models.joins.teacher_course import TeacherCourse
 from app.db.models.joins.group_course import GroupCourse
+from app.repositories.pagination import Page, TotalMode, paginate, sort_columns
 from app.utils.unset import UNSET
 
+# Named sorts for keyset pagination; course names are unique
+COURSE_SORTS = {
+    "name": (Course.name,),
+}
+
+# Replaces the links of the listed courses with the desired ones in one
+# statement: only links that disappear are deleted and only new ones are
+# inserted (with the column defaults), so kept rows and their values are
+# never written
+_APPLY_LINKS = """
+    WITH desired (course_id, member_id) AS (
+        SELECT * FROM unnest(CAST(:link_courses AS uuid[]), CAST(:link_members AS uuid[]))
+    ), removed AS (
+        DELETE FROM {table} t
+        USING unnest(CAST(:courses AS uuid[])) AS c (course_id)
+        WHERE t.course_id = c.course_id
+          AND NOT EXISTS (
+              SELECT 1 FROM desired d WHERE d.course_id = t.course_id AND d.member_id = t.{member}
+          )
+        RETURNING 1
+    ), added AS (
+        INSERT INTO {table} ({member}, course_id)
+        SELECT member_id, course_id FROM desired
+        ON CONFLICT ({member}, course_id) DO NOTHING
+        RETURNING 1
+    )
+    SELECT (SELECT count(*) FROM added), (SELECT count(*) FROM removed)
+"""
+
+# IDs among the given ones that do not exist, as (kind, id)
+_MISSING_REFERENCES = """
+    SELECT 'course', id FROM unnest(CAST(:courses AS uuid[])) AS id
+    WHERE NOT EXISTS (SELECT 1 FROM courses WHERE course_id = id)
+    UNION ALL
+    SELECT 'group', id FROM unnest(CAST(:groups AS uuid[])) AS id
+    WHERE NOT EXISTS (SELECT 1 FROM groups WHERE group_id = id)
+    UNION ALL
+    SELECT 'teacher', id FROM unnest(CAST(:teachers AS uuid[])) AS id
+    WHERE NOT EXISTS (SELECT 1 FROM teachers WHERE teacher_id = id)
+"""
+
 
 class CourseRepository:
     def __init__(self, session: AsyncSession):
@@ -19,6 +62,61 @@ class CourseRepository:
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
+    @staticmethod
+    def _link_ids(column, course_column) -> Any:
+        """ARRAY(SELECT <column> ... WHERE course_id = courses.course_id): a course's links in one value."""
+        subquery = (
+            select(column)
+            .where(course_column == Course.course_id)
+            .order_by(column)
+            .scalar_subquery()
+        )
+        return func.array(subquery, type_=ARRAY(PG_UUID(as_uuid=True)))
+
+    def _with_links(self):
+        return select(
+            Course.course_id,
+            Course.name,
+            Course.duration,
+            Course.code,
+            self._link_ids(GroupCourse.group_id, GroupCourse.course_id).label("group_ids"),
+            self._link_ids(TeacherCourse.teacher_id, TeacherCourse.course_id).label("teacher_ids"),
+        )
+
+    async def find_with_links(
+            self, course_id: Optional[UUID] = None, teacher_id: Optional[UUID] = None
+    ) -> List[Any]:
+        """
+        Courses ordered by name with their group and teacher IDs in a single
+        statement, filtered to one course or to the courses of a teacher.
+        """
+        stmt = self._with_links()
+        if course_id is not None:
+            stmt = stmt.where(Course.course_id == course_id)
+        if teacher_id is not None:
+            stmt = stmt.where(
+                Course.course_id.in_(select(TeacherCourse.course_id).where(TeacherCourse.teacher_id == teacher_id))
+            )
+        result = await self._session.execute(stmt.order_by(Course.name))
+        return list(result.all())
+
+    async def find_page(
+            self,
+            limit: Optional[int] = None,
+            cursor: Optional[str] = None,
+            sort: str = "name",
+            total: TotalMode = "exact"
+    ) -> Page:
+        """
+        A keyset page of courses with their links; the first page carries
+        the total too, so it is a single statement. Raises ValueError on a
+        bad sort or cursor.
+        """
+        return await paginate(
+            self._session, self._with_links(), sort_columns(COURSE_SORTS, sort), sort, "courses",
+            limit, cursor, total
+        )
+
     async def find_by_id(self, course_id: UUID) -> Optional[Course]:
         stmt = select(Course).where(Course.course_id == course_id)
         result = await self._session.execute(stmt)
@@ -102,54 +200,57 @@ class CourseRepository:
         return list(result.scalars().all())
     
     async def create_group_course_links(self, course_id: UUID, group_ids: List[UUID]):
-        """Create GroupCourse links for a course."""
-        # Ensure course_id is a UUID object
-        if isinstance(course_id, str):
-            course_id = UUID(course_id)
-        
-        # Delete existing links first and flush to ensure they're removed
-        await self.delete_group_course_links(course_id)
-        
-        # If no groups to add, return early
-        if not group_ids:
-            return
-        
-        # Create new links - ensure all IDs are UUID objects
-        links_to_add = []
-        for group_id in group_ids:
-            # Convert to UUID if it's a string
-            if isinstance(group_id, str):
-                group_id = UUID(group_id)
-            links_to_add.append(GroupCourse(group_id=group_id, course_id=course_id))
-        
-        # Add all links at once
-        self._session.add_all(links_to_add)
-        await self._session.flush()
-    
+        """
+        Sets the GroupCourse links of a course; links that are kept keep
+        their count_per_week and frequency.
+        """
+        await self.apply_group_course_links({UUID(str(course_id)): [UUID(str(g)) for g in group_ids]})
+
     async def create_teacher_course_links(self, course_id: UUID, teacher_ids: List[UUID]):
-        """Create TeacherCourse links for a course."""
-        # Ensure course_id is a UUID object
-        if isinstance(course_id, str):
-            course_id = UUID(course_id)
-        
-        # Delete existing links first and flush to ensure they're removed
-        await self.delete_teacher_course_links(course_id)
-        
-        # If no teachers to add, return early
-        if not teacher_ids:
-            return
-        
-        # Create new links - ensure all IDs are UUID objects
-        links_to_add = []
-        for teacher_id in teacher_ids:
-            # Convert to UUID if it's a string
-            if isinstance(teacher_id, str):
-                teacher_id = UUID(teacher_id)
-            links_to_add.append(TeacherCourse(teacher_id=teacher_id, course_id=course_id))
-        
-        # Add all links at once
-        self._session.add_all(links_to_add)
-        await self._session.flush()
+        """Sets the TeacherCourse links of a course."""
+        await self.apply_teacher_course_links({UUID(str(course_id)): [UUID(str(t)) for t in teacher_ids]})
+
+    async def apply_group_course_links(self, links: Mapping[UUID, Iterable[UUID]]) -> Tuple[int, int]:
+        """
+        Replaces the groups of every course in `links`. Returns the number
+        of links (added, removed).
+        """
+        return await self._apply_links("group_course", "group_id", links)
+
+    async def apply_teacher_course_links(self, links: Mapping[UUID, Iterable[UUID]]) -> Tuple[int, int]:
+        """
+        Replaces the teachers of every course in `links`. Returns the number
+        of links (added, removed).
+        """
+        return await self._apply_links("teacher_course", "teacher_id", links)
+
+    async def _apply_links(self, table: str, member: str, links: Mapping[UUID, Iterable[UUID]]) -> Tuple[int, int]:
+        if not links:
+            return 0, 0
+        link_courses: List[UUID] = []
+        link_members: List[UUID] = []
+        for course_id, member_ids in links.items():
+            for member_id in set(member_ids):
+                link_courses.append(course_id)
+                link_members.append(member_id)
+        result = await self._session.execute(
+            text(_APPLY_LINKS.format(table=table, member=member)),
+            {"courses": list(links), "link_courses": link_courses, "link_members": link_members},
+        )
+        added, removed = result.one()
+        return added, removed
+
+    async def find_missing_references(
+            self, course_ids: Iterable[UUID], group_ids: Iterable[UUID], teacher_ids: Iterable[UUID]
+    ) -> Dict[str, List[UUID]]:
+        """The given course, group and teacher IDs that do not exist, by kind, in one query."""
+        result = await self._session.execute(text(_MISSING_REFERENCES), {
+            "courses": list(course_ids), "groups": list(group_ids), "teachers": list(teacher_ids),
+        })
+        missing: Dict[str, List[UUID]] = {}
+        for kind, missing_id in result.all():
+            missing.setdefault(kind, []).append(missing_id)
+        return missing
     
     async def delete_group_course_links(self, course_id: UUID):
         """Delete all GroupCourse links for a course."""
@@ -1,14 +1,38 @@
-from typing import List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 from uuid import UUID
 
-from sqlalchemy import select, delete, update
+from sqlalchemy import select, delete, update, func
+from sqlalchemy.orm import aliased
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.catalog.group import Group
 from app.db.models.joins.group_course import GroupCourse
 from app.db.models.joins.teacher_course import TeacherCourse
+from app.repositories.pagination import Page, TotalMode, paginate, sort_columns
 from app.utils.unset import UNSET
 
+# Named sorts for keyset pagination; group names are unique
+GROUP_SORTS = {
+    "name": (Group.name,),
+    "course": (Group.course, Group.name),
+}
+
+
+def group_subtree_cte(group_ids: List[UUID], name: str = "group_tree"):
+    """
+    Recursive CTE with the given groups and all their descendants
+    (subgroups linked through parent_group_id), as a single `group_id` column.
+    """
+    tree = (
+        select(Group.group_id)
+        .where(Group.group_id.in_(group_ids))
+        .cte(name, recursive=True)
+    )
+    child = aliased(Group)
+    return tree.union(
+        select(child.group_id).join(tree, child.parent_group_id == tree.c.group_id)
+    )
+
 
 class GroupRepository:
     def __init__(self, session: AsyncSession):
@@ -19,6 +43,25 @@ class GroupRepository:
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
+    async def find_page(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sort: str = "name",
+        type: Optional[str] = None,
+        course: Optional[int] = None,
+        total: TotalMode = "exact",
+    ) -> Page:
+        """A keyset page of groups (rows carry `Group`). Raises ValueError on a bad sort or cursor."""
+        stmt = select(Group)
+        if type is not None:
+            stmt = stmt.where(Group.type == type)
+        if course is not None:
+            stmt = stmt.where(Group.course == course)
+        return await paginate(
+            self._session, stmt, sort_columns(GROUP_SORTS, sort), sort, "groups", limit, cursor, total
+        )
+
     async def find_by_id(self, group_id: UUID) -> Optional[Group]:
         stmt = select(Group).where(Group.group_id == group_id)
         result = await self._session.execute(stmt)
@@ -41,6 +84,21 @@ class GroupRepository:
         result = await self._session.execute(stmt)
         return list(result.scalars().unique().all())
 
+    async def find_parent_links(self) -> List[Tuple[UUID, Optional[UUID]]]:
+        """Returns (group_id, parent_group_id) for every group."""
+        stmt = select(Group.group_id, Group.parent_group_id)
+        result = await self._session.execute(stmt)
+        return [(row.group_id, row.parent_group_id) for row in result.all()]
+
+    async def find_sizes(self, group_ids: Iterable[UUID]) -> Dict[UUID, int]:
+        """Returns group_id -> size for the given groups in one query."""
+        group_ids = list(group_ids)
+        if not group_ids:
+            return {}
+        stmt = select(Group.group_id, Group.size).where(Group.group_id.in_(group_ids))
+        result = await self._session.execute(stmt)
+        return {row.group_id: row.size for row in result.all()}
+
     async def create(self, name: str, size: int, type: str = "bachelor", course: int = 1) -> Group:
         from app.db.models.catalog.group import GroupType
         group_type = GroupType.BACHELOR if type == "bachelor" else GroupType.MASTER
@@ -93,6 +151,6 @@ class GroupRepository:
         return result.scalar_one_or_none() is not None
 
     async def count(self) -> int:
-        stmt = select(Group)
+        stmt = select(func.count(Group.group_id))
         result = await self._session.execute(stmt)
-        return len(list(result.scalars().all()))
+        return result.scalar_one()
@@ -0,0 +1,147 @@
+import base64
+import datetime
+import json
+import uuid
+from typing import Any, Dict, List, Literal, NamedTuple, Optional, Sequence
+
+from sqlalchemy import Select, func, select, text, tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+TotalMode = Literal["exact", "estimated", "none"]
+
+# Pages larger than this are rejected by the API; keeps one page a bounded read
+MAX_PAGE_SIZE = 500
+
+
+class Page(NamedTuple):
+    """One page of rows, the cursor of the next page (None on the last) and the total if requested."""
+    rows: List[Any]
+    next_cursor: Optional[str]
+    total: Optional[int]
+
+
+def encode_cursor(sort: str, values: Sequence[Any]) -> str:
+    payload = json.dumps({"s": sort, "k": [_jsonable(v) for v in values]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str, columns: Sequence[Any]) -> List[Any]:
+    """Sort key values of a cursor, typed like `columns`. Raises ValueError if it is malformed or for another sort."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        values = payload["k"]
+        if payload["s"] != sort or len(values) != len(columns):
+            raise ValueError
+        return [_typed(column, value) for column, value in zip(columns, values)]
+    except (ValueError, KeyError, TypeError):
+        raise ValueError("Invalid cursor")
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, (uuid.UUID, datetime.date, datetime.datetime)):
+        return value.isoformat() if not isinstance(value, uuid.UUID) else str(value)
+    return getattr(value, "value", value)
+
+
+def _typed(column: Any, value: Any) -> Any:
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type is uuid.UUID:
+        return uuid.UUID(value)
+    if python_type is datetime.datetime:
+        return datetime.datetime.fromisoformat(value)
+    if python_type is datetime.date:
+        return datetime.date.fromisoformat(value)
+    return value
+
+
+async def estimate_count(session: AsyncSession, stmt: Select, table: str) -> int:
+    """
+    Planner estimate of the rows `stmt` returns: pg_class.reltuples for an
+    unfiltered table, the EXPLAIN row estimate otherwise. Falls back to an
+    exact count when the table has never been analyzed.
+    """
+    if stmt.whereclause is None:
+        result = await session.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"), {"table": table}
+        )
+        estimate = result.scalar()
+    else:
+        sql = stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+        result = await session.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+        plan = result.scalar()
+        plan = json.loads(plan) if isinstance(plan, str) else plan
+        estimate = plan[0]["Plan"]["Plan Rows"]
+    if estimate is None or estimate < 0:
+        return await count_rows(session, stmt)
+    return int(estimate)
+
+
+async def count_rows(session: AsyncSession, stmt: Select) -> int:
+    result = await session.execute(select(func.count()).select_from(stmt.order_by(None).subquery()))
+    return result.scalar_one()
+
+
+async def paginate(
+        session: AsyncSession,
+        stmt: Select,
+        order_by: Sequence[Any],
+        sort: str,
+        table: str,
+        limit: Optional[int],
+        cursor: Optional[str] = None,
+        total: TotalMode = "exact"
+) -> Page:
+    """
+    Keyset pagination of `stmt`: rows ordered by the `order_by` columns
+    (ascending, ending in a unique column) after the cursor's position, so
+    any page costs an index range scan of `limit` rows however deep it is.
+
+    Rows carry the selected entities and columns of `stmt` as usual; with
+    no limit every remaining row is returned in one page. An exact total is
+    taken with count(*) OVER () on the first page and with a separate COUNT
+    on later ones; an estimated one comes from the planner, unless the first
+    page already holds every row. Raises ValueError on a bad cursor.
+    """
+    filtered = stmt
+    keys = [column.label(f"_key{i}") for i, column in enumerate(order_by)]
+    page_stmt = stmt.add_columns(*keys)
+    if cursor is not None:
+        page_stmt = page_stmt.where(tuple_(*order_by) > tuple_(*decode_cursor(cursor, sort, order_by)))
+    counted = total == "exact" and cursor is None
+    if counted:
+        page_stmt = page_stmt.add_columns(func.count().over().label("_total"))
+
+    page_stmt = page_stmt.order_by(*order_by)
+    if limit is not None:
+        page_stmt = page_stmt.limit(limit + 1)
+    result = await session.execute(page_stmt)
+    rows = list(result.all())
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]._mapping
+        next_cursor = encode_cursor(sort, [last[key.name] for key in keys])
+
+    count: Optional[int] = None
+    if counted:
+        count = rows[0]._mapping["_total"] if rows else 0
+    elif total == "exact":
+        count = await count_rows(session, filtered)
+    elif total == "estimated" and cursor is None and next_cursor is None:
+        count = len(rows)
+    elif total == "estimated":
+        count = await estimate_count(session, filtered, table)
+    return Page(rows, next_cursor, count)
+
+
+def sort_columns(sorts: Dict[str, Sequence[Any]], sort: str) -> Sequence[Any]:
+    """The columns of a named sort. Raises ValueError for an unknown one."""
+    if sort not in sorts:
+        raise ValueError(f"Unknown sort '{sort}', expected one of: {', '.join(sorts)}")
+    return sorts[sort]
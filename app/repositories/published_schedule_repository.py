@@ -0,0 +1,42 @@
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import select, delete, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.scheduling.published_schedule import PublishedSchedule
+
+
+class PublishedScheduleRepository:
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def find_all(self) -> List[PublishedSchedule]:
+        stmt = select(PublishedSchedule).order_by(PublishedSchedule.scope)
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def find_by_scope(self, scope: str) -> Optional[PublishedSchedule]:
+        stmt = select(PublishedSchedule).where(PublishedSchedule.scope == scope)
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def upsert(self, scope: str, schedule_id: UUID) -> PublishedSchedule:
+        """Points the scope at a schedule in a single atomic statement."""
+        stmt = (
+            insert(PublishedSchedule)
+            .values(scope=scope, schedule_id=schedule_id)
+            .on_conflict_do_update(
+                index_elements=[PublishedSchedule.scope],
+                set_={"schedule_id": schedule_id, "published_at": func.now()},
+            )
+            .returning(PublishedSchedule)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one()
+
+    async def delete(self, scope: str) -> bool:
+        stmt = delete(PublishedSchedule).where(PublishedSchedule.scope == scope).returning(PublishedSchedule.scope)
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none() is not None
@@ -0,0 +1,187 @@
+import re
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import bindparam, column, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import TextClause
+
+from app.db.models.common_enums import StudentStatus, StudentStatusEnum, TeacherStatus, TeacherStatusEnum
+from app.db.models.people.registration_request import RegistrationRequest, RegistrationStatus
+from app.db.models.people.user import User, UserRole
+from app.db.session import after_commit
+
+# Enum values the statements compare with or write. The columns store the
+# member names, so they are bound through the column types rather than
+# written as literals
+_STATUS = RegistrationRequest.status.type
+_ROLE = User.role.type
+_ENUM_PARAMS = (
+    bindparam("pending", RegistrationStatus.PENDING, type_=_STATUS),
+    bindparam("approved", RegistrationStatus.APPROVED, type_=_STATUS),
+    bindparam("rejected", RegistrationStatus.REJECTED, type_=_STATUS),
+    bindparam("teacher", UserRole.TEACHER, type_=_ROLE),
+    bindparam("student", UserRole.STUDENT, type_=_ROLE),
+    bindparam("teacher_active", TeacherStatus.ACTIVE, type_=TeacherStatusEnum),
+    bindparam("student_active", StudentStatus.ACTIVE, type_=StudentStatusEnum),
+    bindparam("role", type_=_ROLE),
+)
+
+# Locks the requests in a fixed order, so concurrent batches cannot deadlock
+_LOCK_REQUESTS = """
+    SELECT request_id, status
+    FROM registration_requests
+    WHERE request_id = ANY(CAST(:ids AS uuid[]))
+    ORDER BY request_id
+    FOR UPDATE
+"""
+
+# Pending requests that approval would trip on: a Google account already
+# linked to another user, a teacher name taken by another teacher (also
+# one without an account) and the second and later requests for the same
+# email or teacher name within the batch. Names are those of the existing
+# user, as approval keeps them.
+_APPROVAL_CONFLICTS = """
+    WITH reqs AS (
+        SELECT r.request_id, r.email, r.created_at, u.user_id,
+               COALESCE(r.google_sub, 'pending:' || r.email) AS google_sub,
+               COALESCE(CAST(:role AS user_role_enum), r.requested_role) AS role,
+               COALESCE(u.first_name, r.first_name) AS first_name,
+               COALESCE(u.last_name, r.last_name) AS last_name,
+               COALESCE(CASE WHEN u.user_id IS NULL THEN r.patronymic ELSE u.patronymic END, '') AS patronymic
+        FROM registration_requests r
+        LEFT JOIN users u ON u.email = r.email
+        WHERE r.request_id = ANY(CAST(:ids AS uuid[])) AND r.status = CAST(:pending AS registration_status_enum)
+    ), ranked AS (
+        SELECT *,
+               row_number() OVER (PARTITION BY email ORDER BY created_at, request_id) AS email_rank,
+               row_number() OVER (
+                   PARTITION BY role, first_name, last_name, patronymic ORDER BY created_at, request_id
+               ) AS name_rank
+        FROM reqs
+    )
+    SELECT request_id, 'Another request in the batch has the same email' FROM ranked WHERE email_rank > 1
+    UNION ALL
+    SELECT request_id, 'The Google account is linked to another user'
+    FROM ranked r
+    WHERE r.user_id IS NULL AND EXISTS (SELECT 1 FROM users u WHERE u.google_sub = r.google_sub)
+    UNION ALL
+    SELECT request_id, 'A teacher with this name already exists'
+    FROM ranked r
+    WHERE r.role = CAST(:teacher AS user_role_enum) AND (r.name_rank > 1 OR EXISTS (
+        SELECT 1 FROM teachers t
+        WHERE (t.first_name, t.last_name, t.patronymic) = (r.first_name, r.last_name, r.patronymic)
+          AND NOT COALESCE(t.user_id = r.user_id, false)
+    ))
+"""
+
+# Approves the given pending requests in one statement: users are matched
+# by email (created, or given the final role), teacher and student
+# profiles are created or re-activated, and the requests are closed. A
+# student's group only changes when the request names one. The profile
+# upserts are not read by the final SELECT; PostgreSQL runs them anyway.
+_APPROVE = """
+    WITH reqs AS (
+        SELECT request_id, google_sub, email, first_name, last_name, patronymic, group_id,
+               COALESCE(CAST(:role AS user_role_enum), requested_role) AS role
+        FROM registration_requests
+        WHERE request_id = ANY(CAST(:ids AS uuid[])) AND status = CAST(:pending AS registration_status_enum)
+    ), users_written AS (
+        INSERT INTO users (user_id, google_sub, email, first_name, last_name, patronymic, role, is_active)
+        SELECT gen_random_uuid(), COALESCE(google_sub, 'pending:' || email), email,
+               first_name, last_name, patronymic, role, true
+        FROM reqs
+        ON CONFLICT (email) DO UPDATE SET role = EXCLUDED.role, updated_at = now()
+        RETURNING user_id, email, first_name, last_name, patronymic, role
+    ), teachers_written AS (
+        INSERT INTO teachers (teacher_id, user_id, first_name, last_name, patronymic, status)
+        SELECT gen_random_uuid(), user_id, first_name, last_name, COALESCE(patronymic, ''),
+               CAST(:teacher_active AS teacher_status_enum)
+        FROM users_written
+        WHERE role = CAST(:teacher AS user_role_enum)
+        ON CONFLICT (user_id) DO UPDATE SET status = EXCLUDED.status
+    ), students_written AS (
+        INSERT INTO students (student_id, user_id, group_id, first_name, last_name, patronymic, status)
+        SELECT gen_random_uuid(), u.user_id, r.group_id, u.first_name, u.last_name, u.patronymic,
+               CAST(:student_active AS student_status_enum)
+        FROM users_written u JOIN reqs r ON r.email = u.email
+        WHERE u.role = CAST(:student AS user_role_enum)
+        ON CONFLICT (user_id) DO UPDATE
+        SET group_id = COALESCE(EXCLUDED.group_id, students.group_id), status = EXCLUDED.status
+    ), decided AS (
+        UPDATE registration_requests r
+        SET status = CAST(:approved AS registration_status_enum), admin_note = :admin_note, decided_at = now(), updated_at = now()
+        FROM users_written u
+        WHERE r.request_id = ANY(CAST(:ids AS uuid[])) AND r.email = u.email
+        RETURNING r.request_id, u.user_id, u.role
+    )
+    SELECT request_id, user_id, role FROM decided
+"""
+
+_REJECT = """
+    UPDATE registration_requests
+    SET status = CAST(:rejected AS registration_status_enum), admin_note = :reason, decided_at = now(),
+        updated_at = now()
+    WHERE request_id = ANY(CAST(:ids AS uuid[])) AND status = CAST(:pending AS registration_status_enum)
+    RETURNING request_id
+"""
+
+
+def _statement(sql: str) -> TextClause:
+    """`sql` with the enum values it uses bound through their column types."""
+    return text(sql).bindparams(*(param for param in _ENUM_PARAMS if re.search(rf":{param.key}\b", sql)))
+
+
+class RegistrationRepository:
+    """
+    Bulk decisions on registration requests. Every method is one
+    statement, however many requests it covers.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Runs `callback` once the current transaction commits."""
+        after_commit(self._session, callback)
+
+    async def lock_requests(self, request_ids: Sequence[UUID]) -> Dict[UUID, RegistrationStatus]:
+        """Locks the existing requests until commit; returns their statuses."""
+        stmt = _statement(_LOCK_REQUESTS).columns(column("request_id"), column("status", _STATUS))
+        result = await self._session.execute(stmt, {"ids": list(request_ids)})
+        return {request_id: status for request_id, status in result.all()}
+
+    async def find_approval_conflicts(
+            self, request_ids: Sequence[UUID], role: Optional[UserRole]
+    ) -> Dict[UUID, str]:
+        """Pending requests among `request_ids` that cannot be approved, with the reason."""
+        result = await self._session.execute(
+            _statement(_APPROVAL_CONFLICTS), {"ids": list(request_ids), "role": role}
+        )
+        conflicts: Dict[UUID, str] = {}
+        for request_id, reason in result.all():
+            conflicts.setdefault(request_id, reason)
+        return conflicts
+
+    async def approve(
+            self, request_ids: Sequence[UUID], role: Optional[UserRole], admin_note: Optional[str]
+    ) -> List[Tuple[UUID, UUID, UserRole]]:
+        """
+        Approves the pending requests among `request_ids`, which must be
+        free of approval conflicts. Returns (request ID, user ID, role) of
+        every approved request.
+        """
+        if not request_ids:
+            return []
+        stmt = _statement(_APPROVE).columns(column("request_id"), column("user_id"), column("role", _ROLE))
+        result = await self._session.execute(
+            stmt, {"ids": list(request_ids), "role": role, "admin_note": admin_note}
+        )
+        return [(request_id, user_id, user_role) for request_id, user_id, user_role in result.all()]
+
+    async def reject(self, request_ids: Sequence[UUID], reason: Optional[str]) -> List[UUID]:
+        """Rejects the pending requests among `request_ids`; returns those rejected."""
+        if not request_ids:
+            return []
+        result = await self._session.execute(_statement(_REJECT), {"ids": list(request_ids), "reason": reason})
+        return list(result.scalars().all())
@@ -1,10 +1,11 @@
-from typing import List, Optional, Union
+from typing import Callable, Dict, Iterable, List, Optional, Union
 from uuid import UUID
 
 from sqlalchemy import select, delete, update, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.catalog.room import Room
+from app.db.session import after_commit
 from app.utils.unset import UNSET
 
 
@@ -12,6 +13,10 @@ class RoomRepository:
     def __init__(self, session: AsyncSession):
         self._session = session
 
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Runs `callback` once the current transaction commits."""
+        after_commit(self._session, callback)
+
     async def find_all(self) -> List[Room]:
         stmt = select(Room).order_by(Room.name)
         result = await self._session.execute(stmt)
@@ -27,6 +32,15 @@ class RoomRepository:
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def find_capacities(self, room_ids: Iterable[UUID]) -> Dict[UUID, int]:
+        """Returns room_id -> capacity for the given rooms in one query."""
+        room_ids = list(room_ids)
+        if not room_ids:
+            return {}
+        stmt = select(Room.room_id, Room.capacity).where(Room.room_id.in_(room_ids))
+        result = await self._session.execute(stmt)
+        return {row.room_id: row.capacity for row in result.all()}
+
     async def create(self, name: str, capacity: int) -> Room:
         obj = Room(name=name, capacity=capacity)
         self._session.add(obj)
@@ -74,8 +88,12 @@ class RoomRepository:
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none() is not None
 
-    async def count(self) -> int:
-        """Counts the total number of rooms."""
+    async def count(self, min_capacity: Optional[int] = None, max_capacity: Optional[int] = None) -> int:
+        """Counts the total number of rooms, optionally within a capacity band."""
         stmt = select(func.count(Room.room_id))
+        if min_capacity is not None:
+            stmt = stmt.where(Room.capacity >= min_capacity)
+        if max_capacity is not None:
+            stmt = stmt.where(Room.capacity <= max_capacity)
         result = await self._session.execute(stmt)
         return result.scalar_one() or 0
@@ -0,0 +1,62 @@
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
+
+from app.db.models.scheduling.schedule_archive import ScheduleArchive
+
+
+class ScheduleArchiveRepository:
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def find_all(self) -> List[ScheduleArchive]:
+        """Lists archives without loading their payloads."""
+        stmt = (
+            select(ScheduleArchive)
+            .options(defer(ScheduleArchive.payload))
+            .order_by(ScheduleArchive.archived_at.desc())
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def find_by_id(self, schedule_id: UUID) -> Optional[ScheduleArchive]:
+        stmt = select(ScheduleArchive).where(ScheduleArchive.schedule_id == schedule_id)
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def exists(self, schedule_id: UUID) -> bool:
+        stmt = select(ScheduleArchive.schedule_id).where(ScheduleArchive.schedule_id == schedule_id)
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
+    async def create(
+            self,
+            schedule_id: UUID,
+            label: str,
+            created_at,
+            assignments_count: int,
+            payload: bytes
+    ) -> ScheduleArchive:
+        obj = ScheduleArchive(
+            schedule_id=schedule_id,
+            label=label,
+            created_at=created_at,
+            assignments_count=assignments_count,
+            payload=payload,
+        )
+        self._session.add(obj)
+        await self._session.flush()
+        await self._session.refresh(obj)
+        return obj
+
+    async def delete(self, schedule_id: UUID) -> bool:
+        stmt = (
+            delete(ScheduleArchive)
+            .where(ScheduleArchive.schedule_id == schedule_id)
+            .returning(ScheduleArchive.schedule_id)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none() is not None
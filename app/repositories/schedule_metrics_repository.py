@@ -0,0 +1,47 @@
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.scheduling.schedule_metrics import ScheduleMetrics
+from app.db.models.scheduling.schedule_snapshot import ScheduleSnapshot
+
+
+class ScheduleMetricsRepository:
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    @staticmethod
+    def _snapshot_built_at(schedule_id: UUID):
+        return (
+            select(ScheduleSnapshot.built_at)
+            .where(ScheduleSnapshot.schedule_id == schedule_id)
+            .scalar_subquery()
+        )
+
+    async def find_current(self, schedule_id: UUID) -> Optional[ScheduleMetrics]:
+        """Stored metrics, or None if missing or computed from an older snapshot."""
+        stmt = select(ScheduleMetrics).where(
+            ScheduleMetrics.schedule_id == schedule_id,
+            ScheduleMetrics.snapshot_built_at == self._snapshot_built_at(schedule_id),
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def upsert(self, schedule_id: UUID, metrics: dict) -> ScheduleMetrics:
+        """Stores metrics computed from the schedule's current snapshot."""
+        values = {
+            "snapshot_built_at": self._snapshot_built_at(schedule_id),
+            "computed_at": func.now(),
+            "metrics": metrics,
+        }
+        stmt = (
+            insert(ScheduleMetrics)
+            .values(schedule_id=schedule_id, **values)
+            .on_conflict_do_update(index_elements=[ScheduleMetrics.schedule_id], set_=values)
+            .returning(ScheduleMetrics)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one()
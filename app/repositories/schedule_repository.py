@@ -1,10 +1,12 @@
-from typing import List, Optional, Union
+import uuid
+from typing import Callable, List, Optional, Union
 from uuid import UUID
 
 from sqlalchemy import select, delete, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.scheduling.schedule import Schedule
+from app.db.session import after_commit
 from app.utils.unset import UNSET
 
 
@@ -12,6 +14,10 @@ class ScheduleRepository:
     def __init__(self, session: AsyncSession):
         self._session = session
 
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Runs `callback` once the current transaction commits."""
+        after_commit(self._session, callback)
+
     async def find_all(self) -> List[Schedule]:
         stmt = select(Schedule).order_by(Schedule.created_at.desc())
         result = await self._session.execute(stmt)
@@ -27,8 +33,28 @@ class ScheduleRepository:
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def create(self, label: str) -> Schedule:
-        obj = Schedule(label=label)
+    async def create(
+            self,
+            label: str,
+            parent_schedule_id: Optional[UUID] = None,
+            materialized: bool = True,
+            schedule_id: Optional[UUID] = None,
+    ) -> Schedule:
+        """Creates a schedule; `schedule_id` lets callers prepare its partition first."""
+        obj = Schedule(
+            schedule_id=schedule_id or uuid.uuid4(),
+            label=label,
+            parent_schedule_id=parent_schedule_id,
+            materialized=materialized,
+        )
+        self._session.add(obj)
+        await self._session.flush()
+        await self._session.refresh(obj)
+        return obj
+
+    async def create_with_id(self, schedule_id: UUID, label: str, created_at) -> Schedule:
+        """Recreates a schedule with its original ID and timestamp (used by restore)."""
+        obj = Schedule(schedule_id=schedule_id, label=label, created_at=created_at)
         self._session.add(obj)
         await self._session.flush()
         await self._session.refresh(obj)
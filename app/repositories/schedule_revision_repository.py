@@ -0,0 +1,193 @@
+from typing import Any, Callable, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import select, insert, update, union_all, literal, case, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.db.models.scheduling.assignment import Assignment
+from app.db.models.scheduling.assignment_delta import AssignmentDelta
+from app.db.models.scheduling.schedule import Schedule
+from app.db.session import after_commit
+
+_ASSIGNMENT_COLUMNS = (
+    "timeslot_id", "group_id", "subgroup_no", "course_id", "teacher_id", "room_id", "course_type",
+)
+
+
+class ScheduleRevisionRepository:
+    """
+    Reads and writes schedule revisions: schedules that store only their
+    changes (assignment_deltas) against a parent schedule.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Runs `callback` once the current transaction commits."""
+        after_commit(self._session, callback)
+
+    async def find_chain(self, schedule_id: UUID) -> List[Any]:
+        """
+        Returns (schedule_id, parent_schedule_id, materialized, depth) from the
+        schedule up to its nearest materialized ancestor, nearest first.
+        Empty if the schedule does not exist.
+        """
+        chain = (
+            select(
+                Schedule.schedule_id,
+                Schedule.parent_schedule_id,
+                Schedule.materialized,
+                literal(0).label("depth"),
+            )
+            .where(Schedule.schedule_id == schedule_id)
+            .cte("chain", recursive=True)
+        )
+        parent = aliased(Schedule)
+        chain = chain.union_all(
+            select(
+                parent.schedule_id,
+                parent.parent_schedule_id,
+                parent.materialized,
+                (chain.c.depth + 1).label("depth"),
+            )
+            .join(chain, chain.c.parent_schedule_id == parent.schedule_id)
+            .where(chain.c.materialized.is_(False))
+        )
+        result = await self._session.execute(select(chain).order_by(chain.c.depth))
+        return list(result.all())
+
+    @staticmethod
+    def _resolved(chain: List[Any]):
+        """
+        Merge of the chain as a subquery: the base schedule's assignments plus
+        every delta, keeping per assignment_id only the entry closest to the
+        revision (DISTINCT ON ... ORDER BY depth), then dropping removals.
+        """
+        base = chain[-1] if chain[-1].materialized else None
+        delta_depths = {row.schedule_id: row.depth for row in chain if not row.materialized}
+
+        parts = []
+        if delta_depths:
+            parts.append(
+                select(
+                    AssignmentDelta.assignment_id,
+                    AssignmentDelta.op,
+                    *(getattr(AssignmentDelta, c) for c in _ASSIGNMENT_COLUMNS),
+                    case(delta_depths, value=AssignmentDelta.schedule_id).label("depth"),
+                ).where(AssignmentDelta.schedule_id.in_(list(delta_depths)))
+            )
+        if base is not None:
+            parts.append(
+                select(
+                    Assignment.assignment_id,
+                    literal("add").label("op"),
+                    *(getattr(Assignment, c) for c in _ASSIGNMENT_COLUMNS),
+                    literal(base.depth).label("depth"),
+                ).where(Assignment.schedule_id == base.schedule_id)
+            )
+        merged = (union_all(*parts) if len(parts) > 1 else parts[0]).subquery("merged")
+        nearest = (
+            select(merged)
+            .distinct(merged.c.assignment_id)
+            .order_by(merged.c.assignment_id, merged.c.depth)
+            .subquery("nearest")
+        )
+        return (
+            select(nearest.c.assignment_id, *(nearest.c[c] for c in _ASSIGNMENT_COLUMNS))
+            .where(nearest.c.op == "add")
+            .subquery("resolved")
+        )
+
+    async def find_resolved(
+            self,
+            chain: List[Any],
+            group_id: Optional[UUID] = None,
+            teacher_id: Optional[UUID] = None
+    ) -> List[Any]:
+        """Assignments of the revision at the head of `chain`, optionally for one group or teacher."""
+        resolved = self._resolved(chain)
+        stmt = select(
+            literal(chain[0].schedule_id, PG_UUID(as_uuid=True)).label("schedule_id"), resolved
+        )
+        if group_id is not None:
+            stmt = stmt.where(resolved.c.group_id == group_id)
+        if teacher_id is not None:
+            stmt = stmt.where(resolved.c.teacher_id == teacher_id)
+        stmt = stmt.order_by(resolved.c.timeslot_id, resolved.c.group_id, resolved.c.subgroup_no)
+        result = await self._session.execute(stmt)
+        return list(result.all())
+
+    async def materialize(self, chain: List[Any]) -> int:
+        """
+        Writes the resolved assignments of the revision at the head of `chain`
+        into `assignments` and marks it materialized. Returns the row count.
+        """
+        schedule_id = chain[0].schedule_id
+        resolved = self._resolved(chain)
+        stmt = insert(Assignment).from_select(
+            ["schedule_id", "assignment_id", *_ASSIGNMENT_COLUMNS],
+            select(literal(schedule_id, PG_UUID(as_uuid=True)), resolved),
+        )
+        result = await self._session.execute(stmt)
+        await self._session.execute(
+            update(Schedule).where(Schedule.schedule_id == schedule_id).values(materialized=True)
+        )
+        return result.rowcount or 0
+
+    async def upsert_deltas(self, schedule_id: UUID, rows: List[Dict[str, Any]]) -> int:
+        """
+        Records changes of a revision. Each row has assignment_id and op plus,
+        for 'add', the assignment columns; a later change of the same
+        assignment replaces the earlier one.
+        """
+        if not rows:
+            return 0
+        values = [
+            {"schedule_id": schedule_id, "op": row["op"], "assignment_id": row["assignment_id"],
+             **{c: row.get(c) for c in _ASSIGNMENT_COLUMNS}}
+            for row in rows
+        ]
+        stmt = pg_insert(AssignmentDelta).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AssignmentDelta.schedule_id, AssignmentDelta.assignment_id],
+            set_={c: stmt.excluded[c] for c in ("op", *_ASSIGNMENT_COLUMNS)},
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount or 0
+
+    async def count_deltas(self, schedule_id: UUID) -> Dict[str, int]:
+        stmt = (
+            select(AssignmentDelta.op, func.count())
+            .where(AssignmentDelta.schedule_id == schedule_id)
+            .group_by(AssignmentDelta.op)
+        )
+        result = await self._session.execute(stmt)
+        return {op: count for op, count in result.all()}
+
+    async def lock_unmaterialized_children(self, schedule_id: UUID) -> List[UUID]:
+        """
+        Locks the schedule's row until commit, so no revision of it can be
+        created meanwhile, and returns its revisions that still read through it.
+        """
+        await self._session.execute(
+            select(Schedule.schedule_id).where(Schedule.schedule_id == schedule_id).with_for_update()
+        )
+        stmt = select(Schedule.schedule_id).where(
+            Schedule.parent_schedule_id == schedule_id, Schedule.materialized.is_(False)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def find_unmaterialized_parent_ids(self) -> List[UUID]:
+        """Schedules that unmaterialized revisions still read through."""
+        stmt = (
+            select(Schedule.parent_schedule_id)
+            .where(Schedule.materialized.is_(False), Schedule.parent_schedule_id.is_not(None))
+            .distinct()
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
@@ -0,0 +1,48 @@
+from typing import Callable, Optional
+from uuid import UUID
+
+from sqlalchemy import select, delete, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.scheduling.schedule_snapshot import ScheduleSnapshot
+from app.db.session import after_commit
+
+
+class ScheduleSnapshotRepository:
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Runs `callback` once the current transaction commits."""
+        after_commit(self._session, callback)
+
+    async def find_payload(self, schedule_id: UUID, format: int) -> Optional[bytes]:
+        """Payload of the schedule's snapshot, or None if missing or in another format."""
+        stmt = select(ScheduleSnapshot.payload).where(
+            ScheduleSnapshot.schedule_id == schedule_id,
+            ScheduleSnapshot.format == format,
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def upsert(self, schedule_id: UUID, format: int, assignments_count: int, payload: bytes) -> None:
+        values = {"format": format, "assignments_count": assignments_count, "payload": payload}
+        stmt = (
+            insert(ScheduleSnapshot)
+            .values(schedule_id=schedule_id, **values)
+            .on_conflict_do_update(
+                index_elements=[ScheduleSnapshot.schedule_id],
+                set_={**values, "built_at": func.now()},
+            )
+        )
+        await self._session.execute(stmt)
+
+    async def delete(self, schedule_id: UUID) -> bool:
+        stmt = (
+            delete(ScheduleSnapshot)
+            .where(ScheduleSnapshot.schedule_id == schedule_id)
+            .returning(ScheduleSnapshot.schedule_id)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none() is not None
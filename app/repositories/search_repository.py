@@ -0,0 +1,62 @@
+from typing import Iterable, List
+
+from sqlalchemy import text
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.trigram import EMAIL, FULL_NAME
+
+# type: (table, id column, label, detail, searched expressions); every
+# searched expression has a trigram index (see app.db.models.trigram)
+SEARCH_SOURCES = {
+    "teacher": ("teachers", "teacher_id", FULL_NAME, "CAST(NULL AS text)", (FULL_NAME,)),
+    "student": ("students", "student_id", FULL_NAME, "CAST(NULL AS text)", (FULL_NAME,)),
+    "user": ("users", "user_id", FULL_NAME, EMAIL, (FULL_NAME, EMAIL)),
+    "registration": ("registration_requests", "request_id", FULL_NAME, EMAIL, (FULL_NAME, EMAIL)),
+    "group": ("groups", "group_id", "name", "CAST(NULL AS text)", ("name",)),
+    "course": ("courses", "course_id", "name", "CAST(code AS text)", ("name", "code")),
+}
+
+# Top :limit rows of one type. A row matches if an expression contains the
+# query as a substring or has a word similar to it; substring matches rank
+# first, then by word similarity
+_BRANCH = """
+    (SELECT '{type}' AS type, {id} AS id, {label} AS label, {detail} AS detail, {score} AS score
+     FROM {table}
+     WHERE {match}
+     ORDER BY score DESC
+     LIMIT :limit)
+"""
+
+
+def _branch(search_type: str) -> str:
+    table, id_column, label, detail, expressions = SEARCH_SOURCES[search_type]
+    match = " OR ".join(f"{e} ILIKE :pattern OR :q <% {e}" for e in expressions)
+    score = "GREATEST({})".format(", ".join(
+        f"CASE WHEN {e} ILIKE :pattern THEN 1 ELSE 0 END + word_similarity(:q, {e})" for e in expressions
+    ))
+    return _BRANCH.format(
+        type=search_type, id=id_column, label=label, detail=detail, score=score, table=table, match=match
+    )
+
+
+def like_pattern(q: str) -> str:
+    """ILIKE pattern matching `q` anywhere, with LIKE wildcards in `q` escaped."""
+    return "%" + q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+class SearchRepository:
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def search(self, q: str, types: Iterable[str], limit: int) -> List[Row]:
+        """
+        Top `limit` matches of each type in one statement, merged and
+        ordered by score. Rows have type, id, label, detail and score.
+        """
+        branches = [_branch(search_type) for search_type in types]
+        if not branches:
+            return []
+        stmt = text(f"SELECT * FROM ({' UNION ALL '.join(branches)}) AS hits ORDER BY score DESC, label")
+        result = await self._session.execute(stmt, {"q": q, "pattern": like_pattern(q), "limit": limit})
+        return list(result.all())
@@ -0,0 +1,75 @@
+import datetime
+from typing import Any, Callable, List, Optional
+from uuid import UUID
+
+from sqlalchemy import select, delete, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.scheduling.semester_calendar import SemesterCalendar
+from app.db.session import after_commit
+
+
+class SemesterCalendarRepository:
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Runs `callback` once the current transaction commits."""
+        after_commit(self._session, callback)
+
+    async def find_all(self) -> List[SemesterCalendar]:
+        stmt = select(SemesterCalendar).order_by(SemesterCalendar.start_date.desc())
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def find_by_id(self, calendar_id: UUID) -> Optional[SemesterCalendar]:
+        stmt = select(SemesterCalendar).where(SemesterCalendar.calendar_id == calendar_id)
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def find_by_name(self, name: str) -> Optional[SemesterCalendar]:
+        stmt = select(SemesterCalendar).where(SemesterCalendar.name == name)
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def find_by_date(self, day: datetime.date) -> Optional[SemesterCalendar]:
+        """The calendar whose semester contains `day` (the latest starting one if several do)."""
+        stmt = (
+            select(SemesterCalendar)
+            .where(SemesterCalendar.start_date <= day, SemesterCalendar.end_date >= day)
+            .order_by(SemesterCalendar.start_date.desc())
+            .limit(1)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def create(self, **values: Any) -> SemesterCalendar:
+        obj = SemesterCalendar(**values)
+        self._session.add(obj)
+        await self._session.flush()
+        await self._session.refresh(obj)
+        return obj
+
+    async def update(self, calendar_id: UUID, **values: Any) -> Optional[SemesterCalendar]:
+        if not values:
+            return await self.find_by_id(calendar_id)
+        stmt = (
+            update(SemesterCalendar)
+            .where(SemesterCalendar.calendar_id == calendar_id)
+            .values(**values)
+            .returning(SemesterCalendar)
+        )
+        result = await self._session.execute(stmt)
+        calendar = result.scalar_one_or_none()
+        if calendar:
+            await self._session.refresh(calendar)
+        return calendar
+
+    async def delete(self, calendar_id: UUID) -> bool:
+        stmt = (
+            delete(SemesterCalendar)
+            .where(SemesterCalendar.calendar_id == calendar_id)
+            .returning(SemesterCalendar.calendar_id)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none() is not None
@@ -4,8 +4,16 @@ from uuid import UUID
 from sqlalchemy import select, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.models.common_enums import StudentStatus
 from app.db.models.people.student import Student
+from app.db.models.people.user import User
 from app.db.models.joins.student_group import StudentGroup
+from app.repositories.pagination import Page, TotalMode, paginate, sort_columns
+
+# Named sorts for keyset pagination, each backed by an index ending in the primary key
+STUDENT_SORTS = {
+    "name": (Student.last_name, Student.first_name, Student.student_id),
+}
 
 
 class StudentRepository:
@@ -17,6 +25,31 @@ class StudentRepository:
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
+    async def find_page(
+            self,
+            limit: Optional[int] = None,
+            cursor: Optional[str] = None,
+            sort: str = "name",
+            status: Optional[StudentStatus] = None,
+            group_id: Optional[UUID] = None,
+            total: TotalMode = "exact",
+    ) -> Page:
+        """
+        A keyset page of students; rows carry `Student` and the linked
+        user's `email`. Raises ValueError on a bad sort or cursor.
+        """
+        stmt = (
+            select(Student, User.email)
+            .outerjoin(User, User.user_id == Student.user_id)
+        )
+        if status is not None:
+            stmt = stmt.where(Student.status == status)
+        if group_id is not None:
+            stmt = stmt.where(Student.group_id == group_id)
+        return await paginate(
+            self._session, stmt, sort_columns(STUDENT_SORTS, sort), sort, "students", limit, cursor, total
+        )
+
     async def find_by_id(self, student_id: UUID) -> Optional[Student]:
         stmt = select(Student).where(Student.student_id == student_id)
         result = await self._session.execute(stmt)
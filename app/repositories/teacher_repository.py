@@ -4,9 +4,17 @@ import uuid
 from sqlalchemy import select, delete, update, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.models.common_enums import TeacherStatus
 from app.db.models.people.teacher import Teacher
+from app.db.models.people.user import User
+from app.repositories.pagination import Page, TotalMode, paginate, sort_columns
 from app.utils.unset import UNSET
 
+# Named sorts for keyset pagination, each backed by an index ending in the primary key
+TEACHER_SORTS = {
+    "name": (Teacher.last_name, Teacher.first_name, Teacher.teacher_id),
+}
+
 
 class TeacherRepository:
     def __init__(self, session: AsyncSession):
@@ -17,6 +25,28 @@ class TeacherRepository:
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
+    async def find_page(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sort: str = "name",
+        status: Optional[TeacherStatus] = None,
+        total: TotalMode = "exact",
+        with_email: bool = False,
+    ) -> Page:
+        """
+        A keyset page of teachers; rows carry `Teacher` (and the linked
+        user's `email` with with_email). Raises ValueError on a bad sort or cursor.
+        """
+        stmt = select(Teacher)
+        if with_email:
+            stmt = stmt.add_columns(User.email).outerjoin(User, User.user_id == Teacher.user_id)
+        if status is not None:
+            stmt = stmt.where(Teacher.status == status)
+        return await paginate(
+            self._session, stmt, sort_columns(TEACHER_SORTS, sort), sort, "teachers", limit, cursor, total
+        )
+
     async def find_by_id(self, teacher_id: uuid.UUID) -> Optional[Teacher]:
         stmt = select(Teacher).where(Teacher.teacher_id == teacher_id)
         result = await self._session.execute(stmt)
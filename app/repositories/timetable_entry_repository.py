@@ -0,0 +1,205 @@
+from typing import Callable, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import select, insert, update, delete, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.catalog.course import Course
+from app.db.models.catalog.group import Group
+from app.db.models.catalog.lesson import Lesson
+from app.db.models.catalog.room import Room
+from app.db.models.people.teacher import Teacher
+from app.db.models.scheduling.assignment import Assignment
+from app.db.models.scheduling.schedule import Schedule
+from app.db.models.scheduling.timeslot import Timeslot
+from app.db.models.scheduling.timetable_entry import TimetableEntry
+from app.db.session import after_commit
+
+_ENTRY_COLUMNS = (
+    "schedule_id", "assignment_id", "timeslot_id", "day", "lesson_id", "frequency",
+    "start_time", "end_time", "group_id", "group_name", "subgroup_no", "course_id",
+    "course_name", "course_type", "teacher_id", "teacher_name", "room_id", "room_name",
+)
+
+
+class TimetableEntryRepository:
+    """
+    Maintains and reads `timetable_entries`, the flattened timetable read model.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Runs `callback` once the current transaction commits."""
+        after_commit(self._session, callback)
+
+    @staticmethod
+    def _source(schedule_id: UUID, assignment_ids: Optional[Sequence[UUID]] = None):
+        """The joins every entry is built from, in _ENTRY_COLUMNS order."""
+        stmt = (
+            select(
+                Assignment.schedule_id,
+                Assignment.assignment_id,
+                Assignment.timeslot_id,
+                Timeslot.day,
+                Timeslot.lesson_id,
+                Timeslot.frequency,
+                Lesson.start_time,
+                Lesson.end_time,
+                Assignment.group_id,
+                Group.name,
+                Assignment.subgroup_no,
+                Assignment.course_id,
+                Course.name,
+                Assignment.course_type,
+                Assignment.teacher_id,
+                func.concat_ws(" ", Teacher.last_name, Teacher.first_name, Teacher.patronymic),
+                Assignment.room_id,
+                Room.name,
+            )
+            .join(Timeslot, Timeslot.timeslot_id == Assignment.timeslot_id)
+            .outerjoin(Lesson, Lesson.lesson_id == Timeslot.lesson_id)
+            .join(Group, Group.group_id == Assignment.group_id)
+            .join(Course, Course.course_id == Assignment.course_id)
+            .join(Teacher, Teacher.teacher_id == Assignment.teacher_id)
+            .outerjoin(Room, Room.room_id == Assignment.room_id)
+            .where(Assignment.schedule_id == schedule_id)
+        )
+        if assignment_ids is not None:
+            stmt = stmt.where(Assignment.assignment_id.in_(assignment_ids))
+        return stmt
+
+    async def is_built(self, schedule_id: UUID) -> bool:
+        stmt = select(Schedule.entries_built).where(Schedule.schedule_id == schedule_id)
+        result = await self._session.execute(stmt)
+        return bool(result.scalar())
+
+    async def _lock_built(self, schedule_id: UUID) -> Optional[bool]:
+        """
+        Locks the schedule's row until commit, so builds of one schedule run
+        one at a time, and returns its entries_built (None if it does not
+        exist). The lock leaves inserts referencing the schedule alone.
+        """
+        stmt = (
+            select(Schedule.entries_built)
+            .where(Schedule.schedule_id == schedule_id)
+            .with_for_update(key_share=True)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def _insert(self, schedule_id: UUID) -> int:
+        stmt = (
+            pg_insert(TimetableEntry)
+            .from_select(list(_ENTRY_COLUMNS), self._source(schedule_id))
+            .on_conflict_do_nothing()
+        )
+        result = await self._session.execute(stmt)
+        await self._session.execute(
+            update(Schedule).where(Schedule.schedule_id == schedule_id).values(entries_built=True)
+        )
+        return result.rowcount or 0
+
+    async def rebuild(self, schedule_id: UUID) -> int:
+        """Replaces all entries of a schedule with one DELETE and one INSERT ... SELECT."""
+        await self._lock_built(schedule_id)
+        await self._session.execute(delete(TimetableEntry).where(TimetableEntry.schedule_id == schedule_id))
+        return await self._insert(schedule_id)
+
+    async def build_missing(self, schedule_id: UUID) -> Optional[int]:
+        """
+        Builds the entries of a schedule that has none yet; returns the row
+        count, or None if another transaction built them first (or the
+        schedule does not exist).
+        """
+        if await self._lock_built(schedule_id) is not False:
+            return None
+        return await self._insert(schedule_id)
+
+    async def delete_batch_by_schedule_id(self, schedule_id: UUID, batch_size: int) -> int:
+        """
+        Deletes at most `batch_size` entries of a schedule. Returns the
+        number of deleted rows (0 once the schedule has none left).
+        """
+        batch = (
+            select(TimetableEntry.assignment_id)
+            .where(TimetableEntry.schedule_id == schedule_id)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        stmt = delete(TimetableEntry).where(
+            TimetableEntry.schedule_id == schedule_id, TimetableEntry.assignment_id.in_(batch)
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount or 0
+
+    async def patch(self, schedule_id: UUID, assignment_ids: Sequence[UUID]) -> int:
+        """Rebuilds the entries of the given assignments only (after manual edits)."""
+        if not assignment_ids:
+            return 0
+        await self._session.execute(
+            delete(TimetableEntry).where(
+                TimetableEntry.schedule_id == schedule_id,
+                TimetableEntry.assignment_id.in_(assignment_ids),
+            )
+        )
+        result = await self._session.execute(
+            insert(TimetableEntry).from_select(list(_ENTRY_COLUMNS), self._source(schedule_id, assignment_ids))
+        )
+        return result.rowcount or 0
+
+    async def rename_group(self, group_id: UUID, name: str) -> int:
+        return await self._rename(TimetableEntry.group_id == group_id, TimetableEntry.group_name, name)
+
+    async def rename_course(self, course_id: UUID, name: str) -> int:
+        return await self._rename(TimetableEntry.course_id == course_id, TimetableEntry.course_name, name)
+
+    async def rename_room(self, room_id: UUID, name: str) -> int:
+        return await self._rename(TimetableEntry.room_id == room_id, TimetableEntry.room_name, name)
+
+    async def rename_teacher(self, teacher_id: UUID) -> int:
+        """Recomputes the teacher's display name from `teachers`."""
+        name = (
+            select(func.concat_ws(" ", Teacher.last_name, Teacher.first_name, Teacher.patronymic))
+            .where(Teacher.teacher_id == teacher_id)
+            .scalar_subquery()
+        )
+        return await self._rename(TimetableEntry.teacher_id == teacher_id, TimetableEntry.teacher_name, name)
+
+    async def _rename(self, condition, column, name) -> int:
+        stmt = (
+            update(TimetableEntry)
+            .where(condition, column.is_distinct_from(name))
+            .values({column: name})
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount or 0
+
+    async def find_entries(
+            self,
+            schedule_id: UUID,
+            group_ids: Optional[Sequence[UUID]] = None,
+            teacher_id: Optional[UUID] = None,
+            room_id: Optional[UUID] = None,
+            day: Optional[int] = None
+    ) -> List[TimetableEntry]:
+        """
+        Entries of a schedule for groups, a teacher or a room (optionally one
+        day), each served by its own (schedule_id, <entity>, day, lesson_id) index.
+        """
+        stmt = select(TimetableEntry).where(TimetableEntry.schedule_id == schedule_id)
+        if group_ids is not None:
+            stmt = stmt.where(TimetableEntry.group_id.in_(group_ids))
+        if teacher_id is not None:
+            stmt = stmt.where(TimetableEntry.teacher_id == teacher_id)
+        if room_id is not None:
+            stmt = stmt.where(TimetableEntry.room_id == room_id)
+        if day is not None:
+            stmt = stmt.where(TimetableEntry.day == day)
+        stmt = stmt.order_by(
+            TimetableEntry.day, TimetableEntry.lesson_id, TimetableEntry.frequency, TimetableEntry.subgroup_no
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
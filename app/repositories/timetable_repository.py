@@ -0,0 +1,141 @@
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, and_, or_, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql.expression import CTE
+
+from app.db.models.catalog.group import Group
+from app.db.models.people.student import Student
+from app.db.models.people.teacher import Teacher
+from app.db.models.people.user import User
+from app.db.models.scheduling.schedule import Schedule
+from app.db.models.scheduling.timetable_entry import TimetableEntry
+
+
+class TimetableRepository:
+    """Read-side queries that assemble personal timetables."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    @staticmethod
+    def _user_ctes(user_id: UUID) -> Tuple[CTE, CTE]:
+        """`me` (role, student group_id, teacher_id of an active user) and the student's `group_chain`."""
+        me = (
+            select(
+                User.user_id.label("user_id"),
+                User.role.label("role"),
+                Student.group_id.label("group_id"),
+                Teacher.teacher_id.label("teacher_id"),
+            )
+            .select_from(User)
+            .outerjoin(Student, Student.user_id == User.user_id)
+            .outerjoin(Teacher, Teacher.user_id == User.user_id)
+            .where(User.user_id == user_id, User.is_active.is_(True))
+            .cte("me")
+        )
+
+        # The student's own group plus every ancestor reachable through parent_group_id
+        chain = (
+            select(Group.group_id, Group.parent_group_id)
+            .join(me, me.c.group_id == Group.group_id)
+            .cte("group_chain", recursive=True)
+        )
+        parent = aliased(Group)
+        chain = chain.union(
+            select(parent.group_id, parent.parent_group_id)
+            .join(chain, chain.c.parent_group_id == parent.group_id)
+        )
+        return me, chain
+
+    async def find_latest_schedule_id(self) -> Optional[UUID]:
+        """The newest materialized schedule (delta-only revisions are drafts)."""
+        stmt = (
+            select(Schedule.schedule_id)
+            .where(Schedule.materialized.is_(True))
+            .order_by(Schedule.created_at.desc())
+            .limit(1)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def find_for_user(self, user_id: UUID, schedule_id: Optional[UUID]) -> List[Any]:
+        """
+        Resolves user -> student group (with its parent chain) or teacher ->
+        schedule -> timetable entries in a single statement. Entries come
+        from the `timetable_entries` read model, so no catalog joins are needed.
+        The schedule is resolved by the caller (the published one, else the
+        latest); None, when there are no schedules, yields no lessons.
+
+        Every returned row carries the resolved user context (role, group_id,
+        teacher_id, schedule); assignment columns are NULL when the user has
+        no lessons. An empty result means the user does not exist or is inactive.
+        """
+        me, chain = self._user_ctes(user_id)
+
+        sched = (
+            select(Schedule.schedule_id, Schedule.label)
+            .where(Schedule.schedule_id == schedule_id)
+            .cte("sched")
+        )
+
+        stmt = (
+            select(
+                me.c.role,
+                me.c.group_id.label("user_group_id"),
+                me.c.teacher_id.label("user_teacher_id"),
+                sched.c.schedule_id,
+                sched.c.label.label("schedule_label"),
+                TimetableEntry.assignment_id,
+                TimetableEntry.timeslot_id,
+                TimetableEntry.day,
+                TimetableEntry.lesson_id,
+                TimetableEntry.frequency,
+                TimetableEntry.start_time,
+                TimetableEntry.end_time,
+                TimetableEntry.group_id,
+                TimetableEntry.group_name,
+                TimetableEntry.subgroup_no,
+                TimetableEntry.course_id,
+                TimetableEntry.course_name,
+                TimetableEntry.course_type,
+                TimetableEntry.teacher_id,
+                TimetableEntry.teacher_name,
+                TimetableEntry.room_id,
+                TimetableEntry.room_name,
+            )
+            .select_from(me)
+            .outerjoin(sched, true())
+            .outerjoin(
+                TimetableEntry,
+                and_(
+                    TimetableEntry.schedule_id == sched.c.schedule_id,
+                    or_(
+                        TimetableEntry.group_id.in_(select(chain.c.group_id)),
+                        TimetableEntry.teacher_id == me.c.teacher_id,
+                    ),
+                ),
+            )
+            .order_by(
+                TimetableEntry.day, TimetableEntry.lesson_id, TimetableEntry.frequency, TimetableEntry.subgroup_no
+            )
+        )
+        result = await self._session.execute(stmt)
+        return list(result.all())
+
+    async def find_user_context(self, user_id: UUID) -> List[Any]:
+        """
+        (role, teacher_id, group_id) rows of an active user: one per group
+        of the student's parent chain, a single row with NULL group_id for
+        everyone else. Empty if the user does not exist or is inactive.
+        """
+        me, chain = self._user_ctes(user_id)
+        stmt = (
+            select(me.c.role, me.c.teacher_id, chain.c.group_id)
+            .select_from(me)
+            .outerjoin(chain, true())
+        )
+        result = await self._session.execute(stmt)
+        return list(result.all())
@@ -5,8 +5,15 @@ from sqlalchemy import select, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.people.user import User, UserRole
+from app.repositories.pagination import Page, TotalMode, paginate, sort_columns
 from app.utils.unset import UNSET
 
+# Named sorts for keyset pagination, each backed by an index ending in the primary key
+USER_SORTS = {
+    "name": (User.last_name, User.first_name, User.user_id),
+    "created": (User.created_at, User.user_id),
+}
+
 
 class UserRepository:
     def __init__(self, session: AsyncSession):
@@ -17,6 +24,25 @@ class UserRepository:
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
+    async def find_page(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sort: str = "name",
+        role: Optional[UserRole] = None,
+        is_active: Optional[bool] = None,
+        total: TotalMode = "exact",
+    ) -> Page:
+        """A keyset page of users (rows carry `User`). Raises ValueError on a bad sort or cursor."""
+        stmt = select(User)
+        if role is not None:
+            stmt = stmt.where(User.role == role)
+        if is_active is not None:
+            stmt = stmt.where(User.is_active.is_(is_active))
+        return await paginate(
+            self._session, stmt, sort_columns(USER_SORTS, sort), sort, "users", limit, cursor, total
+        )
+
     async def find_by_id(self, user_id: UUID) -> Optional[User]:
         stmt = select(User).where(User.user_id == user_id)
         result = await self._session.execute(stmt)
@@ -2,6 +2,8 @@ import uuid
 from typing import Optional
 from pydantic import BaseModel, EmailStr, Field, computed_field
 
+from app.schemas.pagination import PageInfo
+
 
 class AdminStats(BaseModel):
     students_total: int = Field(..., alias="studentsTotal", description="Total number of students")
@@ -58,11 +60,9 @@ class AdminTeacher(BaseModel):
         populate_by_name = True
 
 
-class AdminStudentListResponse(BaseModel):
+class AdminStudentListResponse(PageInfo):
     students: list[AdminStudent]
-    total: int
 
 
-class AdminTeacherListResponse(BaseModel):
+class AdminTeacherListResponse(PageInfo):
     teachers: list[AdminTeacher]
-    total: int
@@ -1,6 +1,6 @@
 import uuid
-from typing import Optional, Literal
-from pydantic import BaseModel, Field, ConfigDict
+from typing import List, Optional, Literal
+from pydantic import BaseModel, Field, ConfigDict, model_validator
 
 
 class MicroserviceAssignment(BaseModel):
@@ -30,3 +30,70 @@ class AssignmentResponse(AssignmentCreate):
     assignment_id: uuid.UUID = Field(..., alias="assignmentId", description="Assignment ID")
 
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+
+AssignmentEditOp = Literal["move", "swap", "reassign_room", "reassign_teacher"]
+
+
+class AssignmentEditOperation(BaseModel):
+    """
+    A single manual edit of a schedule.
+
+    - move: put the assignment into `timeslotId`
+    - swap: exchange timeslot and room with `otherAssignmentId`
+    - reassign_room: set `roomId` (null for remote)
+    - reassign_teacher: set `teacherId`
+    """
+    op: AssignmentEditOp = Field(..., description="Operation type")
+    assignment_id: uuid.UUID = Field(..., alias="assignmentId", description="Assignment to edit")
+    timeslot_id: Optional[int] = Field(None, alias="timeslotId", description="Target timeslot (move)")
+    other_assignment_id: Optional[uuid.UUID] = Field(
+        None, alias="otherAssignmentId", description="Assignment to swap with (swap)"
+    )
+    room_id: Optional[uuid.UUID] = Field(None, alias="roomId", description="New room (reassign_room)")
+    teacher_id: Optional[uuid.UUID] = Field(None, alias="teacherId", description="New teacher (reassign_teacher)")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    @model_validator(mode="after")
+    def check_operation_fields(self):
+        if self.op == "move" and self.timeslot_id is None:
+            raise ValueError("move requires timeslotId")
+        if self.op == "swap" and self.other_assignment_id is None:
+            raise ValueError("swap requires otherAssignmentId")
+        if self.op == "reassign_room" and "room_id" not in self.model_fields_set:
+            raise ValueError("reassign_room requires roomId (null for remote)")
+        if self.op == "reassign_teacher" and self.teacher_id is None:
+            raise ValueError("reassign_teacher requires teacherId")
+        return self
+
+
+class AssignmentBatchRequest(BaseModel):
+    """Schema for a batch of manual edits applied atomically."""
+    operations: List[AssignmentEditOperation] = Field(..., min_length=1, description="Edits, applied in order")
+
+
+class AssignmentConflict(BaseModel):
+    """A single conflict found while validating a batch of edits."""
+    kind: Literal[
+        "not_found", "unknown_timeslot", "unknown_teacher", "unknown_room",
+        "teacher", "room", "group", "teacher_availability",
+    ] = Field(..., description="Conflict type")
+    operation_index: Optional[int] = Field(None, alias="operationIndex", description="Index of the offending operation")
+    assignment_id: uuid.UUID = Field(..., alias="assignmentId", description="Edited assignment")
+    conflicting_assignment_id: Optional[uuid.UUID] = Field(
+        None, alias="conflictingAssignmentId", description="Assignment it clashes with"
+    )
+    timeslot_id: Optional[int] = Field(None, alias="timeslotId", description="Timeslot of the edited assignment")
+    resource_id: Optional[uuid.UUID] = Field(
+        None, alias="resourceId", description="Teacher, room or group the conflict is about"
+    )
+    message: str = Field(..., description="Human readable description")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class AssignmentBatchResponse(BaseModel):
+    """Schema for the result of an applied batch of edits."""
+    updated: List[AssignmentResponse] = Field(..., description="Assignments changed by the batch")
+    total: int = Field(..., description="Number of changed assignments")
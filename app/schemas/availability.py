@@ -0,0 +1,51 @@
+from typing import Literal, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field, model_validator
+
+MatrixEncoding = Literal["bitmask", "rle"]
+
+
+class AvailabilityRow(BaseModel):
+    """
+    One teacher's or group's timeslots, as a bitmask or as runs over the
+    timeslot ordinals of the matrix (the positions in its `timeslots` list).
+    """
+    id: UUID = Field(..., description="Teacher or group ID")
+    mask: Optional[str] = Field(
+        None, pattern=r"^[0-9a-fA-F]+$", description="Hex bitmask; bit i (from the least significant) is ordinal i"
+    )
+    runs: Optional[list[tuple[int, int]]] = Field(
+        None, description="[start ordinal, length] of every run of consecutive set ordinals"
+    )
+
+
+class AvailabilityMatrix(BaseModel):
+    encoding: MatrixEncoding
+    timeslots: list[int] = Field(..., description="Timeslot IDs in ordinal order")
+    rows: list[AvailabilityRow]
+
+
+class AvailabilityMatrixUpdate(BaseModel):
+    """
+    New cells of the listed teachers or groups; others are left alone. Each
+    row carries either `mask` or `runs`. If `timeslots` is given it must
+    equal the current ordinal order, guarding against a catalog change since
+    the matrix was read.
+    """
+    timeslots: Optional[list[int]] = None
+    rows: list[AvailabilityRow] = Field(..., min_length=1)
+
+    @model_validator(mode="after")
+    def one_encoding_per_row(self):
+        for row in self.rows:
+            if (row.mask is None) == (row.runs is None):
+                raise ValueError(f"Row {row.id}: exactly one of mask and runs is required")
+        if len({row.id for row in self.rows}) != len(self.rows):
+            raise ValueError("Each ID may appear only once")
+        return self
+
+
+class AvailabilityMatrixUpdateResult(BaseModel):
+    added: int = Field(..., description="Cells inserted")
+    removed: int = Field(..., description="Cells deleted")
@@ -0,0 +1,71 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from app.schemas.course import CourseBase
+from app.schemas.group import GroupCreate
+from app.schemas.room import RoomBase
+
+# Bundle sections in the order they are imported
+SECTIONS = ("rooms", "courses", "teachers", "groups", "group_courses", "teacher_courses")
+
+
+class TeacherImportRow(BaseModel):
+    first_name: str = Field(..., min_length=1, max_length=100)
+    last_name: str = Field(..., min_length=1, max_length=100)
+    patronymic: str = Field(..., min_length=1, max_length=100)
+    status: Optional[Literal["pending", "active", "inactive"]] = Field(
+        None, description="Status of a new teacher (pending if omitted); existing teachers keep theirs unless given"
+    )
+
+
+class GroupImportRow(GroupCreate):
+    parent: Optional[str] = Field(
+        None, max_length=100, description="Name of the parent group, from the bundle or the database"
+    )
+
+
+class GroupCourseImportRow(BaseModel):
+    group: str = Field(..., min_length=1, max_length=100, description="Group name")
+    course: str = Field(..., min_length=1, max_length=255, description="Course name")
+    count_per_week: int = Field(1, gt=0)
+    frequency: Literal["WEEKLY", "ODD", "EVEN"] = "WEEKLY"
+
+
+class TeacherCourseImportRow(BaseModel):
+    first_name: str = Field(..., min_length=1, max_length=100)
+    last_name: str = Field(..., min_length=1, max_length=100)
+    patronymic: str = Field(..., min_length=1, max_length=100)
+    course: str = Field(..., min_length=1, max_length=255, description="Course name")
+
+
+class CatalogImportBundle(BaseModel):
+    """
+    Catalog rows keyed by natural keys: rooms, courses and groups by name,
+    teachers by full name. Links reference groups, courses and teachers
+    either in the bundle or already in the database.
+    """
+    rooms: list[RoomBase] = Field(default_factory=list)
+    courses: list[CourseBase] = Field(default_factory=list)
+    teachers: list[TeacherImportRow] = Field(default_factory=list)
+    groups: list[GroupImportRow] = Field(default_factory=list)
+    group_courses: list[GroupCourseImportRow] = Field(default_factory=list)
+    teacher_courses: list[TeacherCourseImportRow] = Field(default_factory=list)
+
+
+class ImportRowError(BaseModel):
+    section: str = Field(..., description="Bundle section of the row")
+    row: int = Field(..., description="1-based position of the row in its section")
+    field: str = Field(..., description="Offending field")
+    message: str
+
+
+class ImportSectionResult(BaseModel):
+    inserted: int = 0
+    updated: int = 0
+
+
+class CatalogImportResponse(BaseModel):
+    imported: bool = Field(..., description="False if any row failed validation; nothing is written then")
+    sections: dict[str, ImportSectionResult] = Field(default_factory=dict)
+    errors: list[ImportRowError] = Field(default_factory=list)
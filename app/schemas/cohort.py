@@ -0,0 +1,74 @@
+from typing import Literal, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field, model_validator
+
+from app.db.models.common_enums import StudentStatus
+
+
+class StudentTransferRequest(BaseModel):
+    """
+    Students to move into `target_group_id`: either `student_ids`, or every
+    student of `from_group_id` (optionally only those with `status`).
+    """
+    target_group_id: UUID
+    student_ids: Optional[list[UUID]] = Field(None, min_length=1)
+    from_group_id: Optional[UUID] = None
+    status: Optional[StudentStatus] = Field(None, description="Only students with this status")
+    dry_run: bool = Field(False, description="Report the counts without changing anything")
+
+    @model_validator(mode="after")
+    def one_selection(self):
+        if (self.student_ids is None) == (self.from_group_id is None):
+            raise ValueError("Exactly one of student_ids and from_group_id is required")
+        return self
+
+
+class StudentTransferResult(BaseModel):
+    dry_run: bool
+    students: int = Field(..., description="Students moved (already in the target group are not counted)")
+    memberships: int = Field(..., description="Legacy student_group rows updated")
+
+
+class GroupLinkTemplate(BaseModel):
+    group_id: UUID = Field(..., description="Group whose course links are replaced")
+    template_group_id: UUID = Field(..., description="Group whose course links are copied")
+
+
+class SemesterRolloverRequest(BaseModel):
+    """
+    Moves the selected groups one course year up and, for the listed groups,
+    copies the course links of a template group as the new term's plan.
+    Without a type or courses filter, `all` must be set to advance every group.
+    """
+    type: Optional[Literal["bachelor", "master"]] = Field(None, description="Only groups of this type")
+    courses: Optional[list[int]] = Field(None, min_length=1, description="Only groups in these course years")
+    max_course: int = Field(6, ge=1, le=6, description="Groups already in this year are not advanced")
+    all: bool = Field(False, description="Advance every group; required when neither type nor courses is given")
+    link_templates: list[GroupLinkTemplate] = Field(default_factory=list)
+    dry_run: bool = Field(False, description="Report the counts without changing anything")
+
+    @model_validator(mode="after")
+    def explicit_scope(self):
+        if self.type is None and self.courses is None and not self.all:
+            raise ValueError("Select groups with type or courses, or set all to advance every group")
+        return self
+
+    @model_validator(mode="after")
+    def unique_targets(self):
+        if len({t.group_id for t in self.link_templates}) != len(self.link_templates):
+            raise ValueError("Each group may have only one link template")
+        return self
+
+
+class LinkCloneResult(BaseModel):
+    inserted: int
+    updated: int = Field(..., description="Kept links whose count_per_week or frequency changed")
+    removed: int
+
+
+class SemesterRolloverResult(BaseModel):
+    dry_run: bool
+    advanced: int = Field(..., description="Groups moved one course year up")
+    kept: int = Field(..., description="Selected groups left in max_course")
+    links: LinkCloneResult
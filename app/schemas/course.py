@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from typing import Optional, Union
 from uuid import UUID
+from app.schemas.pagination import PageInfo
 from app.utils.unset import UNSET
 
 
@@ -33,6 +34,32 @@ class CourseResponse(CourseBase):
         populate_by_name = True
 
 
-class CourseListResponse(BaseModel):
+class CourseListResponse(PageInfo):
     courses: list[CourseResponse] = Field(..., description="List of courses")
-    total: int = Field(..., description="Total number of courses")
+
+
+class CourseLinks(BaseModel):
+    """Desired links of one course; a list that is omitted is left as is, an empty one clears it."""
+    course_id: UUID = Field(..., description="Course ID")
+    group_ids: Optional[list[UUID]] = Field(None, description="All groups of the course")
+    teacher_ids: Optional[list[UUID]] = Field(None, description="All teachers of the course")
+
+
+class CourseLinksBulkUpdate(BaseModel):
+    courses: list[CourseLinks] = Field(..., min_length=1)
+
+    @model_validator(mode="after")
+    def unique_courses(self):
+        if len({c.course_id for c in self.courses}) != len(self.courses):
+            raise ValueError("Each course may appear only once")
+        return self
+
+
+class LinkDiff(BaseModel):
+    added: int = Field(..., description="Links inserted")
+    removed: int = Field(..., description="Links deleted")
+
+
+class CourseLinksBulkResult(BaseModel):
+    groups: LinkDiff
+    teachers: LinkDiff
@@ -1,6 +1,7 @@
 from typing import Optional, Union, Literal
 from uuid import UUID
 from pydantic import BaseModel, Field
+from app.schemas.pagination import PageInfo
 from app.utils.unset import UNSET
 
 
@@ -31,6 +32,5 @@ class GroupResponse(GroupBase):
         populate_by_name = True
 
 
-class GroupListResponse(BaseModel):
+class GroupListResponse(PageInfo):
     groups: list[GroupResponse]
-    total: int
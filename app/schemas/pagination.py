@@ -0,0 +1,15 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field, ConfigDict
+
+
+class PageInfo(BaseModel):
+    """Keyset pagination fields shared by list responses."""
+    total: Optional[int] = Field(
+        None, description="Matching rows, exact or a planner estimate as requested; null if not requested"
+    )
+    next_cursor: Optional[str] = Field(
+        None, alias="nextCursor", description="Pass as `cursor` to get the next page; null on the last page"
+    )
+
+    model_config = ConfigDict(populate_by_name=True)
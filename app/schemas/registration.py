@@ -61,3 +61,31 @@ class RejectRegistrationRequest(BaseModel):
 class RegistrationPendingResponse(BaseModel):
     pending: bool = True
     message: str = Field(default="Your registration request was submitted and is awaiting admin approval.")
+
+
+RegistrationOutcome = Literal["approved", "rejected", "not_found", "already_processed", "conflict"]
+
+
+class BulkApproveRegistrations(BaseModel):
+    request_ids: list[uuid.UUID] = Field(..., min_length=1, max_length=1000)
+    role: Optional[UserRole] = Field(None, description="Override the requested role of every request")
+    admin_note: Optional[str] = None
+
+
+class BulkRejectRegistrations(BaseModel):
+    request_ids: list[uuid.UUID] = Field(..., min_length=1, max_length=1000)
+    reason: Optional[str] = None
+
+
+class RegistrationDecision(BaseModel):
+    request_id: uuid.UUID
+    outcome: RegistrationOutcome
+    user_id: Optional[uuid.UUID] = Field(None, description="Created or updated user, for approved requests")
+    role: Optional[UserRole] = None
+    detail: Optional[str] = Field(None, description="Why a conflicting request was left pending")
+
+
+class BulkRegistrationResult(BaseModel):
+    """One item per distinct request ID, in request order."""
+    processed: int = Field(..., description="Requests approved or rejected")
+    items: list[RegistrationDecision]
@@ -1,5 +1,5 @@
 import uuid
-from typing import List, Union
+from typing import List, Optional, Union
 
 from pydantic import BaseModel, Field
 
@@ -36,4 +36,37 @@ class RoomResponse(RoomBase):
 class RoomListResponse(BaseModel):
     """Schema for returning a paginated list of rooms."""
     rooms: List[RoomResponse] = Field(..., description="List of rooms")
-    total: int = Field(..., description="Total number of rooms")
\ No newline at end of file
+    total: int = Field(..., description="Total number of rooms")
+
+class FreeRoomsResponse(BaseModel):
+    """Schema for rooms that are free in a single timeslot of a schedule."""
+    schedule_id: uuid.UUID = Field(..., alias="scheduleId", description="Schedule ID")
+    timeslot_id: int = Field(..., alias="timeslotId", description="Timeslot ID")
+    min_capacity: int = Field(..., alias="minCapacity", description="Minimum room capacity")
+    rooms: List[RoomResponse] = Field(..., description="Free rooms, smallest capacity first")
+
+    class Config:
+        populate_by_name = True
+
+
+class FreeRoomsSlot(BaseModel):
+    """Free rooms of one timeslot in a range query."""
+    timeslot_id: int = Field(..., alias="timeslotId", description="Timeslot ID")
+    day: int = Field(..., description="Day of week (1-7)")
+    lesson_id: int = Field(..., alias="lessonId", description="Lesson number")
+    frequency: str = Field(..., description="Week frequency (ALL/ODD/EVEN)")
+    rooms: List[RoomResponse] = Field(..., description="Free rooms, smallest capacity first")
+
+    class Config:
+        populate_by_name = True
+
+
+class FreeRoomsRangeResponse(BaseModel):
+    """Schema for free rooms across every timeslot of a day or the whole week."""
+    schedule_id: uuid.UUID = Field(..., alias="scheduleId", description="Schedule ID")
+    day: Optional[int] = Field(None, description="Day of week, or null for the whole week")
+    min_capacity: int = Field(..., alias="minCapacity", description="Minimum room capacity")
+    slots: List[FreeRoomsSlot] = Field(..., description="Free rooms per timeslot")
+
+    class Config:
+        populate_by_name = True
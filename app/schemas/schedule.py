@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
-from typing import List, Union
-from pydantic import BaseModel, Field
+from typing import List, Literal, Optional, Union
+from pydantic import BaseModel, Field, ConfigDict
 
 from app.schemas.assignment import AssignmentResponse
 from app.utils.unset import UNSET 
@@ -26,6 +26,10 @@ class ScheduleResponse(ScheduleBase):
     """Schema for returning schedule data from the API."""
     schedule_id: uuid.UUID = Field(..., alias="scheduleId", description="Schedule ID")
     created_at: datetime = Field(..., alias="createdAt", description="Creation timestamp")
+    parent_schedule_id: Optional[uuid.UUID] = Field(
+        None, alias="parentScheduleId", description="Schedule this one is a revision of"
+    )
+    materialized: bool = Field(True, description="False while the revision stores only its changes")
 
     class Config:
         """Pydantic config to allow ORM model mapping."""
@@ -39,7 +43,100 @@ class ScheduleListResponse(BaseModel):
     total: int = Field(..., description="Total number of schedules")
 
 
+class PublishedScheduleResponse(BaseModel):
+    """Schema for the schedule published in a scope."""
+    scope: str = Field(..., description="Faculty, semester or 'default'")
+    schedule_id: uuid.UUID = Field(..., alias="scheduleId", description="Published schedule ID")
+    published_at: datetime = Field(..., alias="publishedAt", description="When it was published")
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+
+class PublishedScheduleListResponse(BaseModel):
+    """Schema for returning every published schedule."""
+    published: List[PublishedScheduleResponse] = Field(..., description="Published schedules per scope")
+    total: int = Field(..., description="Number of scopes")
+
+
+class ScheduleCloneRequest(BaseModel):
+    """Schema for cloning a schedule into a new draft."""
+    label: str = Field(..., min_length=1, max_length=255, description="Label of the new schedule")
+    group_ids: Optional[List[uuid.UUID]] = Field(
+        None, alias="groupIds", description="Copy only these groups (all groups if omitted)"
+    )
+    include_subgroups: bool = Field(
+        True, alias="includeSubgroups", description="With groupIds, also copy their subgroups"
+    )
+    as_revision: bool = Field(
+        False, alias="asRevision",
+        description="Store only changes against the source instead of a full copy (full copies only)"
+    )
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class ScheduleCloneResponse(BaseModel):
+    """Result of a server-side schedule copy."""
+    schedule: ScheduleResponse = Field(..., description="The new schedule")
+    source_schedule_id: uuid.UUID = Field(..., alias="sourceScheduleId", description="Copied schedule")
+    assignments_copied: int = Field(..., alias="assignmentsCopied", description="Copied assignments")
+    constraints_copied: int = Field(..., alias="constraintsCopied", description="Copied subgroup constraints")
+    elapsed_ms: float = Field(..., alias="elapsedMs", description="Time spent copying, in milliseconds")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class ScheduleDiffEntry(BaseModel):
+    """A single changed lesson between two schedules."""
+    change: Literal["added", "removed", "moved"] = Field(..., description="Change type")
+    group_id: uuid.UUID = Field(..., alias="groupId", description="Group ID")
+    course_id: uuid.UUID = Field(..., alias="courseId", description="Course ID")
+    subgroup_no: int = Field(..., alias="subgroupNo", description="Subgroup number")
+    course_type: str = Field(..., alias="courseType", description="Type of class (lec, prac, lab)")
+    old_assignment_id: Optional[uuid.UUID] = Field(None, alias="oldAssignmentId")
+    old_timeslot_id: Optional[int] = Field(None, alias="oldTimeslotId")
+    old_teacher_id: Optional[uuid.UUID] = Field(None, alias="oldTeacherId")
+    old_room_id: Optional[uuid.UUID] = Field(None, alias="oldRoomId")
+    new_assignment_id: Optional[uuid.UUID] = Field(None, alias="newAssignmentId")
+    new_timeslot_id: Optional[int] = Field(None, alias="newTimeslotId")
+    new_teacher_id: Optional[uuid.UUID] = Field(None, alias="newTeacherId")
+    new_room_id: Optional[uuid.UUID] = Field(None, alias="newRoomId")
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+
+class ScheduleDiffEntityChanges(BaseModel):
+    """Change counts for one group or teacher."""
+    entity_id: uuid.UUID = Field(..., alias="entityId", description="Group or teacher ID")
+    added: int = Field(0, description="Lessons added")
+    removed: int = Field(0, description="Lessons removed")
+    moved: int = Field(0, description="Lessons moved (timeslot, teacher or room changed)")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class ScheduleDiffSummary(BaseModel):
+    """Totals and per-entity counts of a schedule diff."""
+    base_schedule_id: uuid.UUID = Field(..., alias="baseScheduleId", description="Schedule compared from")
+    target_schedule_id: uuid.UUID = Field(..., alias="targetScheduleId", description="Schedule compared to")
+    added: int = Field(..., description="Total added lessons")
+    removed: int = Field(..., description="Total removed lessons")
+    moved: int = Field(..., description="Total moved lessons")
+    groups: List[ScheduleDiffEntityChanges] = Field(..., description="Changes per group")
+    teachers: List[ScheduleDiffEntityChanges] = Field(..., description="Changes per teacher")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class ScheduleDiffResponse(ScheduleDiffSummary):
+    """Full schedule diff: summary plus every change."""
+    changes: List[ScheduleDiffEntry] = Field(..., description="Changed lessons")
+
+
 class ScheduleGenerationResponse(BaseModel):
     """Response model for the schedule generation endpoint."""
     message: str = Field(..., description="Summary message")
     schedule: List[AssignmentResponse] = Field(..., description="List of generated assignments")
+    diff: Optional[ScheduleDiffSummary] = Field(
+        None, description="Changes compared to the previously latest schedule"
+    )
@@ -0,0 +1,56 @@
+import uuid
+from datetime import datetime
+from typing import List
+
+from pydantic import BaseModel, Field, ConfigDict
+
+
+class ScheduleRetentionRequest(BaseModel):
+    """Retention policy: keep the newest `keepLast` schedules per label prefix."""
+    label_prefixes: List[str] = Field(
+        ..., alias="labelPrefixes", min_length=1, description="Label prefixes the policy applies to"
+    )
+    keep_last: int = Field(..., alias="keepLast", ge=1, description="Schedules to keep per prefix")
+    batch_size: int = Field(5000, alias="batchSize", ge=100, le=50000, description="Assignments deleted per transaction")
+    dry_run: bool = Field(True, alias="dryRun", description="Only report what would be archived")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class ScheduleArchiveResponse(BaseModel):
+    """Schema for an archived schedule (without its payload)."""
+    schedule_id: uuid.UUID = Field(..., alias="scheduleId", description="Schedule ID")
+    label: str = Field(..., description="Schedule label")
+    created_at: datetime = Field(..., alias="createdAt", description="When the schedule was created")
+    archived_at: datetime = Field(..., alias="archivedAt", description="When the schedule was archived")
+    assignments_count: int = Field(..., alias="assignmentsCount", description="Archived assignments")
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+
+class ScheduleArchiveListResponse(BaseModel):
+    """Schema for returning a list of archived schedules."""
+    archives: List[ScheduleArchiveResponse] = Field(..., description="Archived schedules")
+    total: int = Field(..., description="Total number of archives")
+
+
+class SchedulePurgeResult(BaseModel):
+    """Outcome of archiving or restoring one schedule."""
+    schedule_id: uuid.UUID = Field(..., alias="scheduleId", description="Schedule ID")
+    label: str = Field(..., description="Schedule label")
+    assignments: int = Field(..., description="Assignments archived/deleted or restored")
+    batches: int = Field(0, description="Delete transactions used")
+    compressed_bytes: int = Field(0, alias="compressedBytes", description="Size of the archive payload")
+    elapsed_ms: float = Field(..., alias="elapsedMs", description="Time spent, in milliseconds")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class ScheduleRetentionReport(BaseModel):
+    """What a retention run kept and archived."""
+    dry_run: bool = Field(..., alias="dryRun")
+    kept: List[uuid.UUID] = Field(..., description="Schedules kept by the policy")
+    to_archive: List[uuid.UUID] = Field(..., alias="toArchive", description="Schedules selected for archival")
+    archived: List[SchedulePurgeResult] = Field(..., description="Schedules actually archived and purged")
+
+    model_config = ConfigDict(populate_by_name=True)
@@ -0,0 +1,68 @@
+import uuid
+from datetime import datetime
+from typing import List
+
+from pydantic import BaseModel, Field, ConfigDict
+
+
+class EntityDayMetrics(BaseModel):
+    """Day profile of a group or teacher."""
+    id: uuid.UUID = Field(..., description="Group or teacher ID")
+    windows: float = Field(..., description="Idle lessons between classes per week (mean of odd and even weeks)")
+    max_daily_windows: int = Field(..., alias="maxDailyWindows", description="Most idle lessons on a single day")
+    days_used: int = Field(..., alias="daysUsed", description="Days of the week with classes")
+    first_lesson_spread: int = Field(
+        ..., alias="firstLessonSpread", description="Difference between the earliest and latest first lesson"
+    )
+    last_lesson_spread: int = Field(
+        ..., alias="lastLessonSpread", description="Difference between the earliest and latest last lesson"
+    )
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class TeacherMetrics(EntityDayMetrics):
+    """Day profile of a teacher with preference violations."""
+    preferred_day_violations: int = Field(
+        ..., alias="preferredDayViolations", description="Lessons outside the teacher's preferred days"
+    )
+    avoid_slot_violations: int = Field(
+        ..., alias="avoidSlotViolations", description="Lessons in timeslots the teacher avoids"
+    )
+
+
+class RoomMetrics(BaseModel):
+    """Capacity slack of a room: capacity minus the students in it."""
+    id: uuid.UUID = Field(..., description="Room ID")
+    capacity: int = Field(..., description="Room capacity")
+    lessons: int = Field(..., description="Occupied week cells (ALL lessons count in both weeks)")
+    min_slack: float = Field(..., alias="minSlack", description="Smallest slack; negative when overfilled")
+    mean_slack: float = Field(..., alias="meanSlack", description="Mean slack over occupied cells")
+    overflows: int = Field(..., description="Occupied cells with more students than seats")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class ScheduleMetricsSummary(BaseModel):
+    """Schedule-wide totals."""
+    group_windows: float = Field(..., alias="groupWindows", description="Windows per week over all groups")
+    teacher_windows: float = Field(..., alias="teacherWindows", description="Windows per week over all teachers")
+    preferred_day_violations: int = Field(..., alias="preferredDayViolations")
+    avoid_slot_violations: int = Field(..., alias="avoidSlotViolations")
+    room_overflows: int = Field(..., alias="roomOverflows", description="Overfilled room cells")
+    mean_room_slack: float = Field(..., alias="meanRoomSlack", description="Mean slack over occupied room cells")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class ScheduleMetricsResponse(BaseModel):
+    """Quality metrics of a schedule."""
+    schedule_id: uuid.UUID = Field(..., alias="scheduleId", description="Schedule ID")
+    computed_at: datetime = Field(..., alias="computedAt", description="When the metrics were computed")
+    assignments: int = Field(..., description="Assignments evaluated")
+    summary: ScheduleMetricsSummary
+    groups: List[EntityDayMetrics] = Field(..., description="Per group")
+    teachers: List[TeacherMetrics] = Field(..., description="Per teacher")
+    rooms: List[RoomMetrics] = Field(..., description="Per room")
+
+    model_config = ConfigDict(populate_by_name=True)
@@ -0,0 +1,47 @@
+import uuid
+from typing import List
+
+from pydantic import BaseModel, Field, ConfigDict
+
+
+class SlotUtilization(BaseModel):
+    """Room occupancy of one (day, lesson) cell of the heat map."""
+    day: int = Field(..., ge=1, le=7, description="Day of week (1 = Monday)")
+    lesson_id: int = Field(..., alias="lessonId", description="Lesson number within the day")
+    lessons_odd: int = Field(..., alias="lessonsOdd", description="Lessons in odd weeks")
+    lessons_even: int = Field(..., alias="lessonsEven", description="Lessons in even weeks")
+    rooms_odd: int = Field(..., alias="roomsOdd", description="Occupied rooms in odd weeks")
+    rooms_even: int = Field(..., alias="roomsEven", description="Occupied rooms in even weeks")
+    occupancy: float = Field(..., description="Share of rooms occupied, mean of odd and even weeks")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class TeacherLoad(BaseModel):
+    """Lessons of a teacher per week parity."""
+    teacher_id: uuid.UUID = Field(..., alias="teacherId", description="Teacher ID")
+    odd: int = Field(..., description="Lessons in odd weeks")
+    even: int = Field(..., description="Lessons in even weeks")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class GroupDayLoad(BaseModel):
+    """Lessons of a group on one day."""
+    group_id: uuid.UUID = Field(..., alias="groupId", description="Group ID")
+    day: int = Field(..., ge=1, le=7, description="Day of week (1 = Monday)")
+    odd: int = Field(..., description="Lessons in odd weeks")
+    even: int = Field(..., description="Lessons in even weeks")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class ScheduleUtilizationResponse(BaseModel):
+    """Heat maps of room, teacher and group utilization of a schedule."""
+    schedule_id: uuid.UUID = Field(..., alias="scheduleId", description="Schedule ID")
+    rooms_total: int = Field(..., alias="roomsTotal", description="Rooms within the capacity band")
+    slots: List[SlotUtilization] = Field(..., description="Room occupancy per day and lesson")
+    teachers: List[TeacherLoad] = Field(..., description="Teacher load by week parity")
+    groups: List[GroupDayLoad] = Field(..., description="Group lessons per day")
+
+    model_config = ConfigDict(populate_by_name=True)
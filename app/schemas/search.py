@@ -0,0 +1,19 @@
+from typing import Literal, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+SearchType = Literal["teacher", "student", "user", "registration", "group", "course"]
+
+
+class SearchHit(BaseModel):
+    type: SearchType
+    id: UUID
+    label: str = Field(..., description="Full name, or the group/course name")
+    detail: Optional[str] = Field(None, description="Email of users and registration requests, course code")
+    score: float = Field(..., description="1 + similarity for substring matches, similarity otherwise")
+
+
+class SearchResponse(BaseModel):
+    query: str
+    results: list[SearchHit] = Field(..., description="All types merged, best first")
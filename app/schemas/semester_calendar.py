@@ -0,0 +1,87 @@
+import uuid
+import datetime
+from typing import List, Optional, Union
+
+from pydantic import BaseModel, Field, ConfigDict, model_validator
+
+from app.db.models.people.user import UserRole
+from app.schemas.timetable import TimetableEntry
+from app.utils.unset import UNSET
+
+
+class SemesterCalendarBase(BaseModel):
+    """Base schema for semester calendar properties."""
+    name: str = Field(..., min_length=1, max_length=100, description="Calendar name, e.g. 'Осінь 2026'")
+    start_date: datetime.date = Field(..., alias="startDate", description="First day of the semester")
+    end_date: datetime.date = Field(..., alias="endDate", description="Last day of the semester")
+    holidays: List[datetime.date] = Field(default_factory=list, description="Days without lessons")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class SemesterCalendarCreate(SemesterCalendarBase):
+    """Schema for creating a semester calendar."""
+    parity_anchor: Optional[datetime.date] = Field(
+        None, alias="parityAnchor", description="A day of the first ODD week; the start date if omitted"
+    )
+
+    @model_validator(mode="after")
+    def check_dates(self) -> "SemesterCalendarCreate":
+        if self.end_date < self.start_date:
+            raise ValueError("endDate must not be before startDate")
+        return self
+
+
+class SemesterCalendarUpdate(BaseModel):
+    """Schema for updating a semester calendar (PATCH) using the UNSET pattern."""
+    name: Union[str, None, object] = Field(UNSET, min_length=1, max_length=100, description="New calendar name")
+    start_date: Union[datetime.date, None, object] = Field(UNSET, alias="startDate", description="New first day")
+    end_date: Union[datetime.date, None, object] = Field(UNSET, alias="endDate", description="New last day")
+    parity_anchor: Union[datetime.date, None, object] = Field(UNSET, alias="parityAnchor", description="New parity anchor")
+    holidays: Union[List[datetime.date], None, object] = Field(UNSET, description="New list of days without lessons")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class SemesterCalendarResponse(SemesterCalendarBase):
+    """Schema for returning a semester calendar."""
+    calendar_id: uuid.UUID = Field(..., alias="calendarId", description="Calendar ID")
+    parity_anchor: datetime.date = Field(..., alias="parityAnchor", description="A day of an ODD week")
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+
+class SemesterCalendarListResponse(BaseModel):
+    """Schema for returning all semester calendars."""
+    calendars: List[SemesterCalendarResponse] = Field(..., description="Calendars, latest semester first")
+    total: int = Field(..., description="Total number of calendars")
+
+
+class LessonOccurrence(TimetableEntry):
+    """A timetable entry on a concrete date."""
+    date: datetime.date = Field(..., description="Date the lesson is held on")
+
+
+class OccurrencesResponse(BaseModel):
+    """Dated lessons of a schedule in a date range."""
+    schedule_id: uuid.UUID = Field(..., alias="scheduleId", description="Schedule ID")
+    calendar_id: uuid.UUID = Field(..., alias="calendarId", description="Calendar the dates come from")
+    date_from: datetime.date = Field(..., alias="dateFrom", description="First date of the range")
+    date_to: datetime.date = Field(..., alias="dateTo", description="Last date of the range")
+    occurrences: List[LessonOccurrence] = Field(..., description="Lessons ordered by date and lesson")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class NextLessonsResponse(BaseModel):
+    """Lessons of the authenticated user in progress now and starting next."""
+    role: UserRole = Field(..., description="Role the lessons were resolved for")
+    schedule_id: uuid.UUID = Field(..., alias="scheduleId", description="Resolved schedule ID")
+    calendar_id: uuid.UUID = Field(..., alias="calendarId", description="Calendar the dates come from")
+    at: datetime.datetime = Field(..., description="Server time the lookup was made for")
+    current: List[LessonOccurrence] = Field(..., description="Lessons in progress")
+    upcoming: List[LessonOccurrence] = Field(
+        ..., alias="next", description="Lessons with the earliest later start (parallel subgroups included)"
+    )
+
+    model_config = ConfigDict(populate_by_name=True)
@@ -1,6 +1,7 @@
 from typing import Optional, Union
 import uuid
 from pydantic import BaseModel, Field, computed_field
+from app.schemas.pagination import PageInfo
 from app.utils.unset import UNSET
 
 
@@ -42,6 +43,5 @@ class TeacherResponse(TeacherBase):
         populate_by_name = True
 
 
-class TeacherListResponse(BaseModel):
+class TeacherListResponse(PageInfo):
     teachers: list[TeacherResponse] = Field(..., description="List of teachers")
-    total: int = Field(..., description="Total number of teachers")
@@ -0,0 +1,56 @@
+import re
+from typing import Any, Dict, Literal, Mapping
+
+from pydantic import BaseModel, Field, field_validator
+
+DayName = Literal["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+DAY_NAMES = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+# Solver timeslot identifier: day.frequency.lesson, e.g. 'mon.all.1'
+SLOT_PATTERN = r"^(mon|tue|wed|thu|fri|sat|sun)\.(all|odd|even)\.[1-9][0-9]*$"
+_SLOT_RE = re.compile(SLOT_PATTERN)
+
+
+class TeacherPreferences(BaseModel):
+    """
+    Typed projection of a teacher's preference blob. Entries are
+    lower-cased and de-duplicated in order, so the stored JSON is already
+    in the shape the solver and the preference queries expect.
+    """
+    preferred_days: list[DayName] = Field(default_factory=list, description="Days the teacher prefers to teach")
+    avoid_slots: list[str] = Field(
+        default_factory=list, description="Timeslots to avoid, e.g. 'mon.all.1'"
+    )
+
+    @field_validator("preferred_days", "avoid_slots", mode="before")
+    @classmethod
+    def normalize(cls, value):
+        if isinstance(value, list):
+            return list(dict.fromkeys(v.strip().lower() if isinstance(v, str) else v for v in value))
+        return value
+
+    @field_validator("avoid_slots")
+    @classmethod
+    def slot_format(cls, value: list[str]) -> list[str]:
+        for slot in value:
+            if not _SLOT_RE.match(slot):
+                raise ValueError(f"Invalid timeslot '{slot}', expected e.g. 'mon.all.1'")
+        return value
+
+    @classmethod
+    def project(cls, blob: Mapping[str, Any]) -> "TeacherPreferences":
+        """
+        Projection of a stored blob. Blobs written before validation may
+        hold other keys or malformed entries; those are dropped rather
+        than rejected.
+        """
+        days = blob.get("preferred_days") or []
+        slots = blob.get("avoid_slots") or []
+        return cls.model_construct(
+            preferred_days=list(dict.fromkeys(d for d in days if d in DAY_NAMES)),
+            avoid_slots=list(dict.fromkeys(s for s in slots if isinstance(s, str) and _SLOT_RE.match(s))),
+        )
+
+    def solver_payload(self) -> Dict[str, list]:
+        """The non-empty preferences, as sent to the scheduler."""
+        return {key: value for key, value in self.model_dump().items() if value}
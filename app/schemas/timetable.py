@@ -0,0 +1,41 @@
+import uuid
+from datetime import time
+from typing import List, Optional
+from pydantic import BaseModel, Field, ConfigDict
+
+from app.db.models.people.user import UserRole
+
+
+class TimetableEntry(BaseModel):
+    """A single display-ready lesson of a timetable."""
+    assignment_id: uuid.UUID = Field(..., alias="assignmentId", description="Assignment ID")
+    timeslot_id: int = Field(..., alias="timeslotId", description="Timeslot ID")
+    day: int = Field(..., ge=1, le=7, description="Day of week (1 = Monday)")
+    lesson_id: int = Field(..., alias="lessonId", description="Lesson number within the day")
+    frequency: str = Field(..., description="Week frequency: ALL, ODD or EVEN")
+    start_time: Optional[time] = Field(None, alias="startTime", description="Lesson start time")
+    end_time: Optional[time] = Field(None, alias="endTime", description="Lesson end time")
+    group_id: uuid.UUID = Field(..., alias="groupId", description="Group ID")
+    group_name: str = Field(..., alias="groupName", description="Group name")
+    subgroup_no: int = Field(..., alias="subgroupNo", description="Subgroup number")
+    course_id: uuid.UUID = Field(..., alias="courseId", description="Course ID")
+    course_name: str = Field(..., alias="courseName", description="Course name")
+    course_type: str = Field(..., alias="courseType", description="Type of class (lec, prac, lab)")
+    teacher_id: uuid.UUID = Field(..., alias="teacherId", description="Teacher ID")
+    teacher_name: str = Field(..., alias="teacherName", description="Teacher full name")
+    room_id: Optional[uuid.UUID] = Field(None, alias="roomId", description="Room ID (null for remote)")
+    room_name: Optional[str] = Field(None, alias="roomName", description="Room name")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class TimetableResponse(BaseModel):
+    """Timetable of the authenticated user for one schedule."""
+    role: UserRole = Field(..., description="Role the timetable was resolved for")
+    schedule_id: Optional[uuid.UUID] = Field(None, alias="scheduleId", description="Resolved schedule ID")
+    schedule_label: Optional[str] = Field(None, alias="scheduleLabel", description="Resolved schedule label")
+    group_id: Optional[uuid.UUID] = Field(None, alias="groupId", description="Student's group ID")
+    teacher_id: Optional[uuid.UUID] = Field(None, alias="teacherId", description="Teacher ID")
+    entries: List[TimetableEntry] = Field(default_factory=list, description="Lessons ordered by day and lesson")
+
+    model_config = ConfigDict(populate_by_name=True)
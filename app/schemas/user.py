@@ -3,6 +3,7 @@ import uuid
 from datetime import datetime
 from pydantic import BaseModel, Field, computed_field
 from app.db.models.people.user import UserRole
+from app.schemas.pagination import PageInfo
 
 
 class UserBase(BaseModel):
@@ -39,7 +40,6 @@ class UserResponse(UserBase):
         populate_by_name = True
 
 
-class UserListResponse(BaseModel):
+class UserListResponse(PageInfo):
     users: list[UserResponse] = Field(..., description="List of users")
-    total: int = Field(..., description="Total number of users")
 
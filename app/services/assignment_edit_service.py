@@ -0,0 +1,341 @@
+import logging
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from app.repositories.assignment_repository import AssignmentRepository
+from app.repositories.availability_repository import AvailabilityRepository
+from app.repositories.group_repository import GroupRepository
+from app.repositories.schedule_revision_repository import ScheduleRevisionRepository
+from app.repositories.timetable_entry_repository import TimetableEntryRepository
+from app.schemas.assignment import (
+    AssignmentBatchResponse,
+    AssignmentConflict,
+    AssignmentEditOperation,
+    AssignmentResponse,
+)
+from app.services.room_occupancy_service import RoomOccupancyService
+from app.services.schedule_snapshot_service import ScheduleSnapshotService
+from app.services.teacher_availability_service import TeacherAvailabilityService
+from app.services.timeslot_codec import TimeslotCodec
+from app.services.timeslot_service import TimeslotService
+from app.utils.cache import schedule_versions
+
+logger = logging.getLogger(__name__)
+
+# Fields a manual edit may change
+_PLACEMENT_FIELDS = ("timeslot_id", "teacher_id", "room_id")
+
+
+class AssignmentConflictError(ValueError):
+    """Raised when a batch of edits would produce conflicts; carries all of them."""
+
+    def __init__(self, conflicts: List[AssignmentConflict]):
+        super().__init__(f"Batch has {len(conflicts)} conflict(s)")
+        self.conflicts = conflicts
+
+
+class GroupHierarchy:
+    """Ancestor/descendant lookups over parent_group_id links."""
+
+    def __init__(self, links: Iterable[Tuple[UUID, Optional[UUID]]]):
+        self.parents: Dict[UUID, Optional[UUID]] = dict(links)
+        self.children: Dict[UUID, List[UUID]] = defaultdict(list)
+        for group_id, parent_id in self.parents.items():
+            if parent_id is not None:
+                self.children[parent_id].append(group_id)
+
+    def related(self, group_id: UUID) -> Set[UUID]:
+        """All ancestors and descendants of the group (excluding itself)."""
+        related: Set[UUID] = set()
+        parent = self.parents.get(group_id)
+        while parent is not None and parent not in related:
+            related.add(parent)
+            parent = self.parents.get(parent)
+        stack = list(self.children.get(group_id, ()))
+        while stack:
+            child = stack.pop()
+            if child not in related:
+                related.add(child)
+                stack.extend(self.children.get(child, ()))
+        related.discard(group_id)
+        return related
+
+
+class ScheduleConflictChecker:
+    """
+    In-memory occupancy of a schedule used to validate manual edits.
+
+    `state` maps assignment_id to a dict with timeslot_id, teacher_id,
+    room_id, group_id and subgroup_no. Occupancy is tracked per week cell
+    (see TimeslotCodec), so ODD and EVEN lessons in the same slot don't clash.
+    `teacher_availability` holds availability bitsets over the codec's
+    ordinals; a teacher without one (or with 0) is available everywhere.
+    """
+
+    def __init__(
+            self,
+            codec: TimeslotCodec,
+            state: Dict[UUID, dict],
+            hierarchy: GroupHierarchy,
+            teacher_availability: Dict[UUID, int],
+    ):
+        self.codec = codec
+        self.state = state
+        self.hierarchy = hierarchy
+        self.teacher_availability = teacher_availability
+
+        self.teachers: Dict[tuple, List[UUID]] = defaultdict(list)
+        self.rooms: Dict[tuple, List[UUID]] = defaultdict(list)
+        self.groups: Dict[tuple, List[UUID]] = defaultdict(list)
+        for assignment_id, placement in state.items():
+            if placement["timeslot_id"] not in codec:
+                continue
+            for cell in codec.cells(placement["timeslot_id"]):
+                self.teachers[(placement["teacher_id"], cell)].append(assignment_id)
+                if placement["room_id"] is not None:
+                    self.rooms[(placement["room_id"], cell)].append(assignment_id)
+                self.groups[(placement["group_id"], cell)].append(assignment_id)
+
+    def check(self, changed: Iterable[UUID], op_index: Dict[UUID, int]) -> List[AssignmentConflict]:
+        """Returns every conflict that involves at least one changed assignment."""
+        conflicts: List[AssignmentConflict] = []
+        seen: Set[tuple] = set()
+
+        def report(kind: str, assignment_id: UUID, other_id: Optional[UUID], resource_id, message: str):
+            key = (kind, frozenset((assignment_id, other_id)))
+            if key in seen:
+                return
+            seen.add(key)
+            conflicts.append(AssignmentConflict(
+                kind=kind,
+                operation_index=op_index.get(assignment_id),
+                assignment_id=assignment_id,
+                conflicting_assignment_id=other_id,
+                timeslot_id=self.state[assignment_id]["timeslot_id"],
+                resource_id=resource_id,
+                message=message,
+            ))
+
+        for assignment_id in changed:
+            placement = self.state[assignment_id]
+            timeslot_id = placement["timeslot_id"]
+            if timeslot_id not in self.codec:
+                report("unknown_timeslot", assignment_id, None, None, f"Timeslot {timeslot_id} does not exist")
+                continue
+
+            teacher_id = placement["teacher_id"]
+            available = self.teacher_availability.get(teacher_id)
+            if available and not (available >> self.codec.ordinal(timeslot_id)) & 1:
+                report("teacher_availability", assignment_id, None, teacher_id,
+                       f"Teacher is not available in timeslot {timeslot_id}")
+
+            related_groups = self.hierarchy.related(placement["group_id"])
+            for cell in self.codec.cells(timeslot_id):
+                for other_id in self.teachers[(teacher_id, cell)]:
+                    if other_id != assignment_id:
+                        report("teacher", assignment_id, other_id, teacher_id,
+                               "Teacher already has a lesson at this time")
+
+                if placement["room_id"] is not None:
+                    for other_id in self.rooms[(placement["room_id"], cell)]:
+                        if other_id != assignment_id:
+                            report("room", assignment_id, other_id, placement["room_id"],
+                                   "Room is already occupied at this time")
+
+                for other_id in self.groups[(placement["group_id"], cell)]:
+                    if other_id != assignment_id and self.state[other_id]["subgroup_no"] == placement["subgroup_no"]:
+                        report("group", assignment_id, other_id, placement["group_id"],
+                               "Group (subgroup) already has a lesson at this time")
+                for group_id in related_groups:
+                    for other_id in self.groups.get((group_id, cell), ()):
+                        report("group", assignment_id, other_id, group_id,
+                               "Parent or child group already has a lesson at this time")
+
+        return conflicts
+
+
+class AssignmentEditService:
+    """
+    Validates and applies batches of manual schedule edits.
+    """
+
+    def __init__(
+            self,
+            repo: AssignmentRepository,
+            group_repo: GroupRepository,
+            availability_repo: AvailabilityRepository,
+            timeslot_service: TimeslotService,
+            revision_repo: Optional[ScheduleRevisionRepository] = None,
+            snapshot_service: Optional[ScheduleSnapshotService] = None,
+            entries_repo: Optional[TimetableEntryRepository] = None
+    ):
+        self.repo = repo
+        self.group_repo = group_repo
+        self.availability_repo = availability_repo
+        self.timeslot_service = timeslot_service
+        self.revision_repo = revision_repo
+        self.snapshot_service = snapshot_service
+        self.entries_repo = entries_repo
+
+    @staticmethod
+    def _apply_operations(
+            state: Dict[UUID, dict],
+            operations: List[AssignmentEditOperation],
+    ) -> Tuple[Dict[UUID, int], List[AssignmentConflict]]:
+        """
+        Applies operations to the in-memory state in order. Returns the index
+        of the last operation touching each assignment and "not found" errors.
+        """
+        touched: Dict[UUID, int] = {}
+        errors: List[AssignmentConflict] = []
+
+        for index, operation in enumerate(operations):
+            ids = [operation.assignment_id]
+            if operation.op == "swap":
+                ids.append(operation.other_assignment_id)
+            missing = [a for a in ids if a not in state]
+            for assignment_id in missing:
+                errors.append(AssignmentConflict(
+                    kind="not_found",
+                    operation_index=index,
+                    assignment_id=assignment_id,
+                    message="Assignment not found in this schedule",
+                ))
+            if missing:
+                continue
+
+            placement = state[operation.assignment_id]
+            if operation.op == "move":
+                placement["timeslot_id"] = operation.timeslot_id
+            elif operation.op == "swap":
+                other = state[operation.other_assignment_id]
+                for field in ("timeslot_id", "room_id"):
+                    placement[field], other[field] = other[field], placement[field]
+            elif operation.op == "reassign_room":
+                placement["room_id"] = operation.room_id
+            elif operation.op == "reassign_teacher":
+                placement["teacher_id"] = operation.teacher_id
+
+            for assignment_id in ids:
+                touched[assignment_id] = index
+
+        return touched, errors
+
+    async def _check_resources(
+            self,
+            state: Dict[UUID, dict],
+            original: Dict[UUID, dict],
+            changed: List[UUID],
+            touched: Dict[UUID, int],
+    ) -> List[AssignmentConflict]:
+        """Reports changed assignments given a teacher or room that does not exist."""
+        teacher_ids = {state[a]["teacher_id"] for a in changed if state[a]["teacher_id"] != original[a]["teacher_id"]}
+        room_ids = {
+            state[a]["room_id"] for a in changed
+            if state[a]["room_id"] is not None and state[a]["room_id"] != original[a]["room_id"]
+        }
+        missing_teachers, missing_rooms = await self.repo.find_missing_resources(teacher_ids, room_ids)
+        conflicts = []
+        for assignment_id in changed:
+            placement = state[assignment_id]
+            for kind, resource_id, missing, name in (
+                    ("unknown_teacher", placement["teacher_id"], missing_teachers, "Teacher"),
+                    ("unknown_room", placement["room_id"], missing_rooms, "Room"),
+            ):
+                if resource_id in missing:
+                    conflicts.append(AssignmentConflict(
+                        kind=kind,
+                        operation_index=touched.get(assignment_id),
+                        assignment_id=assignment_id,
+                        timeslot_id=placement["timeslot_id"],
+                        resource_id=resource_id,
+                        message=f"{name} {resource_id} does not exist",
+                    ))
+        return conflicts
+
+    async def apply_batch(
+            self, schedule_id: UUID, operations: List[AssignmentEditOperation]
+    ) -> AssignmentBatchResponse:
+        """
+        Validates the whole batch against the schedule's occupancy and, if
+        there are no conflicts, writes all changes in a single UPDATE (or,
+        for a not yet materialized revision, as 'add' deltas replacing the
+        parent's assignments). Revisions still reading through the schedule
+        are materialized first (into assignments_default, as partition DDL
+        cannot run here), so edits never leak into them. Raises
+        AssignmentConflictError with every conflict otherwise.
+        """
+        chain = await self.revision_repo.find_chain(schedule_id) if self.revision_repo else []
+        delta_only = bool(chain) and not chain[0].materialized
+        if delta_only:
+            assignments = await self.revision_repo.find_resolved(chain)
+        else:
+            assignments = await self.repo.find_by_schedule_id(schedule_id)
+        by_id = {a.assignment_id: a for a in assignments}
+        original = {
+            a.assignment_id: {
+                "timeslot_id": a.timeslot_id,
+                "teacher_id": a.teacher_id,
+                "room_id": a.room_id,
+                "group_id": a.group_id,
+                "subgroup_no": a.subgroup_no,
+            }
+            for a in assignments
+        }
+        state = {assignment_id: dict(p) for assignment_id, p in original.items()}
+
+        touched, conflicts = self._apply_operations(state, operations)
+        changed = [
+            assignment_id for assignment_id in touched
+            if any(state[assignment_id][f] != original[assignment_id][f] for f in _PLACEMENT_FIELDS)
+        ]
+
+        if changed:
+            conflicts.extend(await self._check_resources(state, original, changed, touched))
+            codec = await self.timeslot_service.get_codec()
+            hierarchy = GroupHierarchy(await self.group_repo.find_parent_links())
+            teacher_availability = TeacherAvailabilityService(self.availability_repo, self.timeslot_service)
+            availability = await teacher_availability.get_bitsets({state[a]["teacher_id"] for a in changed})
+            checker = ScheduleConflictChecker(codec, state, hierarchy, availability)
+            conflicts.extend(checker.check(changed, touched))
+
+        if conflicts:
+            logger.info(f"Пакет змін для schedule_id={schedule_id} відхилено: {len(conflicts)} конфліктів")
+            raise AssignmentConflictError(conflicts)
+        if not changed:
+            return AssignmentBatchResponse(updated=[], total=0)
+
+        placements = [{"assignment_id": a, **{f: state[a][f] for f in _PLACEMENT_FIELDS}} for a in changed]
+        if self.revision_repo:
+            # Copy-on-write: revisions reading through this schedule keep the assignments they saw
+            for revision_id in await self.revision_repo.lock_unmaterialized_children(schedule_id):
+                await self.revision_repo.materialize(await self.revision_repo.find_chain(revision_id))
+        if delta_only:
+            updated = [
+                {**by_id[p["assignment_id"]]._asdict(), **p, "schedule_id": schedule_id}
+                for p in placements
+            ]
+            await self.revision_repo.upsert_deltas(schedule_id, [dict(row, op="add") for row in updated])
+        else:
+            updated = await self.repo.bulk_update_placements(schedule_id, placements)
+
+        added = [(state[a]["room_id"], state[a]["timeslot_id"]) for a in changed if state[a]["room_id"]]
+        removed = [(original[a]["room_id"], original[a]["timeslot_id"]) for a in changed if original[a]["room_id"]]
+
+        def publish():
+            previous = schedule_versions.current(schedule_id)
+            schedule_versions.bump(schedule_id)
+            RoomOccupancyService.apply_changes(schedule_id, previous, added, removed)
+
+        self.repo.after_commit(publish)
+        if not delta_only:
+            if self.snapshot_service:
+                await self.snapshot_service.refresh(schedule_id)
+            if self.entries_repo and await self.entries_repo.is_built(schedule_id):
+                # Unbuilt read models are built in full on first read
+                await self.entries_repo.patch(schedule_id, changed)
+        logger.info(f"Застосовано пакет змін для schedule_id={schedule_id}: змінено {len(updated)} призначень")
+
+        responses = [AssignmentResponse.model_validate(a) for a in updated]
+        return AssignmentBatchResponse(updated=responses, total=len(responses))
@@ -1,10 +1,15 @@
 import logging
 import json
+import uuid
 from app.repositories.assignment_repository import AssignmentRepository
+from app.repositories.assignment_partition_repository import AssignmentPartitionRepository
+from app.repositories.timetable_entry_repository import TimetableEntryRepository
+from app.services.schedule_snapshot_service import ScheduleSnapshotService
 from app.db.models.scheduling.assignment import Assignment
 from app.schemas.assignment import AssignmentCreate
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from uuid import UUID
+from app.utils.cache import schedule_versions
 
 logger = logging.getLogger(__name__)
 
@@ -14,8 +19,17 @@ class AssignmentService:
     Service for saving the schedule results ('assignments') to the DB.
     """
 
-    def __init__(self, repo: AssignmentRepository):
+    def __init__(
+            self,
+            repo: AssignmentRepository,
+            partition_repo: Optional[AssignmentPartitionRepository] = None,
+            snapshot_service: Optional[ScheduleSnapshotService] = None,
+            entries_repo: Optional[TimetableEntryRepository] = None
+    ):
         self.repo = repo
+        self.partition_repo = partition_repo
+        self.snapshot_service = snapshot_service
+        self.entries_repo = entries_repo
 
     async def create_assignments(
             self, schedule_id: UUID, assignments_data: List[Dict[str, Any]]
@@ -45,9 +59,19 @@ class AssignmentService:
 
         logger.debug(f"Дані призначень для запису в БД: {json.dumps([a.model_dump() for a in assignments_to_create], ensure_ascii=False, indent=2, default=str)}")
         
-        saved_assignments = await self.repo.bulk_create(
-            assignments=assignments_to_create
-        )
+        rows = [{**a.model_dump(), "assignment_id": uuid.uuid4()} for a in assignments_to_create]
+        if self.partition_repo and await self.partition_repo.bulk_load(schedule_id, rows):
+            # Loaded into a fresh partition; read the rows back for the response
+            saved_assignments = await self.repo.find_by_schedule_id(schedule_id)
+        else:
+            saved_assignments = await self.repo.bulk_create(
+                assignments=assignments_to_create
+            )
+        self.repo.after_commit(lambda: schedule_versions.bump(schedule_id))
+        if self.snapshot_service:
+            await self.snapshot_service.store(schedule_id, saved_assignments)
+        if self.entries_repo:
+            await self.entries_repo.rebuild(schedule_id)
         
         logger.info(f"Успішно збережено в БД призначень: {len(saved_assignments)}")
         logger.debug(f"Деталі збережених призначень: {[{'assignment_id': str(a.assignment_id), 'schedule_id': str(a.schedule_id), 'group_id': str(a.group_id), 'course_id': str(a.course_id), 'teacher_id': str(a.teacher_id)} for a in saved_assignments]}")
@@ -0,0 +1,69 @@
+from typing import Awaitable, Callable, Dict, Iterable, List, Mapping, Optional
+from uuid import UUID
+
+from app.core.config import settings
+from app.schemas.availability import AvailabilityMatrix, AvailabilityMatrixUpdate, AvailabilityRow, MatrixEncoding
+from app.services.timeslot_codec import TimeslotCodec, mask_to_runs, runs_to_mask
+
+
+def cells_to_bitsets(codec: TimeslotCodec, cells: Mapping[UUID, Iterable[int]]) -> Dict[UUID, int]:
+    """Bitset of every owner's timeslot IDs; IDs missing from the codec are dropped."""
+    return {owner_id: codec.mask(t for t in timeslot_ids if t in codec) for owner_id, timeslot_ids in cells.items()}
+
+
+async def load_bitsets(
+        codec: TimeslotCodec,
+        owner_ids: Optional[Iterable[UUID]],
+        read_bits: Callable[..., Awaitable[Dict[UUID, Optional[str]]]],
+        read_cells: Callable[..., Awaitable[Dict[UUID, List[int]]]],
+        save_bits: Callable[..., Awaitable[None]],
+) -> Dict[UUID, int]:
+    """
+    Bitsets of the given owners (all if None), read from the stored masks.
+    Owners whose mask is missing or was built for another timeslot order
+    fall back to their per-timeslot rows, and the rebuilt masks are written
+    back. With AVAILABILITY_MASK_READS off only the rows are read.
+    """
+    if not settings.AVAILABILITY_MASK_READS:
+        return cells_to_bitsets(codec, await read_cells(owner_ids))
+
+    bitsets: Dict[UUID, int] = {}
+    stale: List[UUID] = []
+    for owner_id, bits in (await read_bits(owner_ids, codec.key)).items():
+        if bits is None:
+            stale.append(owner_id)
+        else:
+            bitsets[owner_id] = codec.from_bits(bits)
+    if stale:
+        rebuilt = cells_to_bitsets(codec, await read_cells(stale))
+        await save_bits({owner_id: codec.to_bits(mask) for owner_id, mask in rebuilt.items()}, codec.key)
+        bitsets.update(rebuilt)
+    return bitsets
+
+
+def encode_matrix(codec: TimeslotCodec, bitsets: Dict[UUID, int], encoding: MatrixEncoding) -> AvailabilityMatrix:
+    """Teacher or group bitsets as one compact row per owner, over the codec's ordinals."""
+    rows = []
+    for owner_id, mask in bitsets.items():
+        if encoding == "rle":
+            rows.append(AvailabilityRow(id=owner_id, runs=mask_to_runs(mask)))
+        else:
+            rows.append(AvailabilityRow(id=owner_id, mask=format(mask, "x")))
+    return AvailabilityMatrix(encoding=encoding, timeslots=codec.ids.tolist(), rows=rows)
+
+
+def decode_update(codec: TimeslotCodec, update: AvailabilityMatrixUpdate) -> Dict[UUID, List[int]]:
+    """
+    Timeslot IDs of every row of the update. Raises ValueError if the
+    timeslot order is stale or a row has bits past the catalog.
+    """
+    if update.timeslots is not None and update.timeslots != codec.ids.tolist():
+        raise ValueError("The timeslot catalog has changed; re-read the matrix")
+    cells = {}
+    for row in update.rows:
+        try:
+            mask = int(row.mask, 16) if row.mask is not None else runs_to_mask(row.runs, len(codec))
+            cells[row.id] = codec.timeslot_ids(mask)
+        except ValueError as e:
+            raise ValueError(f"Row {row.id}: {e}")
+    return cells
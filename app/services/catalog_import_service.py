@@ -0,0 +1,90 @@
+import csv
+import io
+import logging
+import time
+from typing import Any, Dict, List, Sequence
+
+from app.repositories.catalog_import_repository import CatalogImportRepository
+from app.schemas.catalog_import import (
+    SECTIONS,
+    CatalogImportBundle,
+    CatalogImportResponse,
+    ImportRowError,
+    ImportSectionResult,
+)
+from app.services.timetable_service import TimetableService
+
+logger = logging.getLogger(__name__)
+
+
+def bundle_records(bundle: CatalogImportBundle) -> Dict[str, List[Sequence[Any]]]:
+    """The bundle as staging rows, in the column order of the staging tables."""
+    return {
+        "rooms": [(r.name, r.capacity) for r in bundle.rooms],
+        "courses": [(c.name, c.code, c.duration) for c in bundle.courses],
+        "teachers": [(t.first_name, t.last_name, t.patronymic, t.status) for t in bundle.teachers],
+        "groups": [(g.name, g.size, g.type, g.course, g.parent) for g in bundle.groups],
+        "group_courses": [
+            (link.group, link.course, link.count_per_week, link.frequency) for link in bundle.group_courses
+        ],
+        "teacher_courses": [
+            (link.first_name, link.last_name, link.patronymic, link.course) for link in bundle.teacher_courses
+        ],
+    }
+
+
+def bundle_from_csv(files: Dict[str, str]) -> CatalogImportBundle:
+    """
+    Builds a bundle from CSV texts by section name, each with a header row
+    of field names. Empty cells count as omitted. Raises pydantic's
+    ValidationError, located by section and row index, on invalid rows.
+    """
+    sections: Dict[str, List[Dict[str, str]]] = {}
+    for section, content in files.items():
+        reader = csv.DictReader(io.StringIO(content.lstrip("\ufeff")))
+        sections[section] = [
+            {field.strip(): value.strip() for field, value in row.items() if field and value and value.strip()}
+            for row in reader
+        ]
+    return CatalogImportBundle.model_validate(sections)
+
+
+class CatalogImportService:
+    """
+    Bulk catalog import. A bundle is validated as a whole and written in the
+    caller's transaction only if every row passes, so an import either
+    lands completely or not at all; links are added or updated, never removed.
+    """
+
+    def __init__(self, repo: CatalogImportRepository):
+        self.repo = repo
+
+    async def import_bundle(self, bundle: CatalogImportBundle) -> CatalogImportResponse:
+        started = time.perf_counter()
+        records = bundle_records(bundle)
+        await self.repo.stage(records)
+        errors = await self.repo.validate()
+        rows = sum(len(section) for section in records.values())
+        if errors:
+            logger.info(f"Імпорт каталогу відхилено: {len(errors)} помилок у {rows} рядках")
+            return CatalogImportResponse(
+                imported=False,
+                errors=[
+                    ImportRowError(section=section, row=row_no, field=field, message=message)
+                    for section, row_no, field, message in errors
+                ],
+            )
+
+        counts = await self.repo.upsert()
+        # Group parents decide whose lessons a cached user timetable holds
+        self.repo.after_commit(TimetableService.invalidate_all)
+        logger.info(
+            f"Імпорт каталогу: {rows} рядків за {(time.perf_counter() - started) * 1000:.0f} мс"
+        )
+        return CatalogImportResponse(
+            imported=True,
+            sections={
+                section: ImportSectionResult(inserted=counts[section][0], updated=counts[section][1])
+                for section in SECTIONS
+            },
+        )
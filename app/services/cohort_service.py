@@ -0,0 +1,73 @@
+import logging
+
+from sqlalchemy.exc import NoResultFound
+
+from app.repositories.cohort_repository import CohortRepository
+from app.schemas.cohort import (
+    LinkCloneResult,
+    SemesterRolloverRequest,
+    SemesterRolloverResult,
+    StudentTransferRequest,
+    StudentTransferResult,
+)
+from app.services.timetable_service import TimetableService
+
+logger = logging.getLogger(__name__)
+
+
+class CohortService:
+    """
+    Bulk student transfers and semester rollover. Each operation is a few
+    set-based statements in one transaction; with dry_run they run in a
+    savepoint that is rolled back, so the preview counts are exact.
+    """
+
+    def __init__(self, repo: CohortRepository):
+        self.repo = repo
+
+    async def transfer_students(self, request: StudentTransferRequest) -> StudentTransferResult:
+        """Raises NoResultFound for an unknown group or student."""
+        groups = [request.target_group_id] + ([request.from_group_id] if request.from_group_id else [])
+        missing = await self.repo.find_missing_groups(groups)
+        if missing:
+            raise NoResultFound(f"Groups not found: {', '.join(map(str, missing))}")
+        if request.student_ids is not None:
+            missing = await self.repo.find_missing_students(request.student_ids)
+            if missing:
+                raise NoResultFound(f"Students not found: {', '.join(map(str, missing))}")
+
+        async with self.repo.preview(request.dry_run):
+            students, memberships = await self.repo.transfer_students(
+                request.target_group_id, request.student_ids, request.from_group_id, request.status
+            )
+
+        if students and not request.dry_run:
+            self.repo.after_commit(TimetableService.invalidate_all)
+            self.repo.after_commit(TimetableService.invalidate_user_contexts)
+        logger.info(
+            f"Переведення студентів до групи {request.target_group_id}"
+            f"{' (попередній перегляд)' if request.dry_run else ''}: {students}"
+        )
+        return StudentTransferResult(dry_run=request.dry_run, students=students, memberships=memberships)
+
+    async def rollover(self, request: SemesterRolloverRequest) -> SemesterRolloverResult:
+        """Raises NoResultFound for an unknown group in link_templates."""
+        templates = {t.group_id: t.template_group_id for t in request.link_templates}
+        missing = await self.repo.find_missing_groups([*templates, *templates.values()])
+        if missing:
+            raise NoResultFound(f"Groups not found: {', '.join(map(str, missing))}")
+
+        async with self.repo.preview(request.dry_run):
+            advanced, kept = await self.repo.advance_groups(request.type, request.courses, request.max_course)
+            inserted, updated, removed = await self.repo.clone_group_course_links(templates)
+
+        logger.info(
+            f"Перехід на новий семестр{' (попередній перегляд)' if request.dry_run else ''}: "
+            f"груп переведено {advanced}, залишено {kept}, зв'язків з курсами +{inserted}/~{updated}/-{removed}"
+        )
+        return SemesterRolloverResult(
+            dry_run=request.dry_run,
+            advanced=advanced,
+            kept=kept,
+            links=LinkCloneResult(inserted=inserted, updated=updated, removed=removed),
+        )
@@ -1,75 +1,67 @@
 from typing import List, Optional
 from uuid import UUID
 
+from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.course_repository import CourseRepository
-from app.schemas.course import CourseCreate, CourseUpdate, CourseResponse, CourseListResponse
+from app.repositories.pagination import TotalMode
+from app.repositories.timetable_entry_repository import TimetableEntryRepository
+from app.schemas.course import (
+    CourseCreate,
+    CourseUpdate,
+    CourseResponse,
+    CourseListResponse,
+    CourseLinksBulkUpdate,
+    CourseLinksBulkResult,
+    LinkDiff,
+)
+from app.services.timetable_service import TimetableService
 from app.utils.unset import UNSET
 
 
 class CourseService:
-    def __init__(self, repo: CourseRepository):
+    def __init__(self, repo: CourseRepository, entries_repo: Optional[TimetableEntryRepository] = None):
         self.repo = repo
+        self.entries_repo = entries_repo
 
-    async def get_all_courses(self) -> CourseListResponse:
-        courses = await self.repo.find_all()
-        total = await self.repo.count()
-        
-        # Build course responses with relationships
-        course_responses = []
-        for course in courses:
-            group_ids = await self.repo.get_group_ids_for_course(course.course_id)
-            teacher_ids = await self.repo.get_teacher_ids_for_course(course.course_id)
-            
-            course_dict = {
-                "course_id": course.course_id,
-                "name": course.name,
-                "duration": course.duration,
-                "code": course.code,
-                "group_ids": group_ids,
-                "teacher_ids": teacher_ids
-            }
-            course_responses.append(CourseResponse.model_validate(course_dict))
-        
-        return CourseListResponse(courses=course_responses, total=total)
+    @staticmethod
+    def _response(row) -> CourseResponse:
+        return CourseResponse(
+            course_id=row.course_id,
+            name=row.name,
+            duration=row.duration,
+            code=row.code,
+            group_ids=row.group_ids or [],
+            teacher_ids=row.teacher_ids or [],
+        )
+
+    async def get_all_courses(
+            self,
+            limit: Optional[int] = None,
+            cursor: Optional[str] = None,
+            sort: str = "name",
+            total: TotalMode = "exact"
+    ) -> CourseListResponse:
+        """
+        A page of courses with their links (all of them without a limit);
+        the first page and its total are one query. Raises ValueError on a
+        bad sort or cursor.
+        """
+        page = await self.repo.find_page(limit, cursor, sort, total=total)
+        return CourseListResponse(
+            courses=[self._response(row) for row in page.rows],
+            total=page.total,
+            next_cursor=page.next_cursor,
+        )
 
     async def get_course_by_id(self, course_id: UUID) -> Optional[CourseResponse]:
-        course = await self.repo.find_by_id(course_id)
-        if course:
-            group_ids = await self.repo.get_group_ids_for_course(course.course_id)
-            teacher_ids = await self.repo.get_teacher_ids_for_course(course.course_id)
-            
-            course_dict = {
-                "course_id": course.course_id,
-                "name": course.name,
-                "duration": course.duration,
-                "code": course.code,
-                "group_ids": group_ids,
-                "teacher_ids": teacher_ids
-            }
-            return CourseResponse.model_validate(course_dict)
-        return None
+        rows = await self.repo.find_with_links(course_id=course_id)
+        return self._response(rows[0]) if rows else None
 
     async def get_courses_by_teacher_id(self, teacher_id: UUID) -> List[CourseResponse]:
-        courses = await self.repo.find_by_teacher_id(teacher_id)
-        
-        course_responses = []
-        for course in courses:
-            group_ids = await self.repo.get_group_ids_for_course(course.course_id)
-            teacher_ids = await self.repo.get_teacher_ids_for_course(course.course_id)
-            
-            course_dict = {
-                "course_id": course.course_id,
-                "name": course.name,
-                "duration": course.duration,
-                "code": course.code,
-                "group_ids": group_ids,
-                "teacher_ids": teacher_ids
-            }
-            course_responses.append(CourseResponse.model_validate(course_dict))
-        
-        return course_responses
+        rows = await self.repo.find_with_links(teacher_id=teacher_id)
+        return [self._response(row) for row in rows]
 
     async def create_course(self, course_data: CourseCreate) -> CourseResponse:
         existing_course = await self.repo.find_by_name(course_data.name)
@@ -88,18 +80,7 @@ class CourseService:
         if course_data.teacher_ids:
             await self.repo.create_teacher_course_links(course.course_id, course_data.teacher_ids)
         
-        # Get relationships
-        group_ids = await self.repo.get_group_ids_for_course(course.course_id)
-        teacher_ids = await self.repo.get_teacher_ids_for_course(course.course_id)
-        
-        course_dict = {
-            "course_id": course.course_id,
-            "name": course.name,
-            "duration": course.duration,
-            "group_ids": group_ids,
-            "teacher_ids": teacher_ids
-        }
-        return CourseResponse.model_validate(course_dict)
+        return await self.get_course_by_id(course.course_id)
 
     async def update_course(self, course_id: UUID, course_data: CourseUpdate) -> Optional[CourseResponse]:
         if not await self.repo.exists(course_id):
@@ -118,6 +99,10 @@ class CourseService:
         )
         
         if updated_course:
+            if self.entries_repo and course_data.name is not UNSET and course_data.name is not None:
+                if await self.entries_repo.rename_course(course_id, updated_course.name):
+                    self.entries_repo.after_commit(TimetableService.invalidate_all)
+
             # Update relationships if provided
             if course_data.group_ids is not UNSET:
                 if course_data.group_ids:
@@ -131,20 +116,35 @@ class CourseService:
                 else:
                     await self.repo.delete_teacher_course_links(updated_course.course_id)
             
-            # Get relationships
-            group_ids = await self.repo.get_group_ids_for_course(updated_course.course_id)
-            teacher_ids = await self.repo.get_teacher_ids_for_course(updated_course.course_id)
-            
-            course_dict = {
-                "course_id": updated_course.course_id,
-                "name": updated_course.name,
-                "duration": updated_course.duration,
-                "group_ids": group_ids,
-                "teacher_ids": teacher_ids
-            }
-            return CourseResponse.model_validate(course_dict)
+            return await self.get_course_by_id(updated_course.course_id)
         return None
 
+    async def apply_links(self, update: CourseLinksBulkUpdate) -> CourseLinksBulkResult:
+        """
+        Sets the group and teacher links of many courses at once, touching
+        only the links that change; kept group links keep their
+        count_per_week and frequency. Raises NoResultFound if any course,
+        group or teacher does not exist.
+        """
+        group_links = {c.course_id: c.group_ids for c in update.courses if c.group_ids is not None}
+        teacher_links = {c.course_id: c.teacher_ids for c in update.courses if c.teacher_ids is not None}
+        missing = await self.repo.find_missing_references(
+            [c.course_id for c in update.courses],
+            {g for group_ids in group_links.values() for g in group_ids},
+            {t for teacher_ids in teacher_links.values() for t in teacher_ids},
+        )
+        if missing:
+            raise NoResultFound("Not found: " + "; ".join(
+                f"{kind}s {', '.join(str(i) for i in ids)}" for kind, ids in missing.items()
+            ))
+
+        groups_added, groups_removed = await self.repo.apply_group_course_links(group_links)
+        teachers_added, teachers_removed = await self.repo.apply_teacher_course_links(teacher_links)
+        return CourseLinksBulkResult(
+            groups=LinkDiff(added=groups_added, removed=groups_removed),
+            teachers=LinkDiff(added=teachers_added, removed=teachers_removed),
+        )
+
     async def delete_course(self, course_id: UUID) -> bool:
         return await self.repo.delete(course_id)
 
@@ -4,22 +4,34 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.group_repository import GroupRepository
+from app.repositories.pagination import TotalMode
+from app.repositories.timetable_entry_repository import TimetableEntryRepository
 from app.schemas.group import GroupCreate, GroupUpdate, GroupResponse, GroupListResponse
 from app.db.models.catalog.group import Group
+from app.services.timetable_service import TimetableService
 from app.utils.unset import UNSET
 
 
 class GroupService:
-    def __init__(self, repo: GroupRepository):
+    def __init__(self, repo: GroupRepository, entries_repo: Optional[TimetableEntryRepository] = None):
         self.repo = repo
+        self.entries_repo = entries_repo
 
-    async def get_all_groups(self) -> GroupListResponse:
-        groups = await self.repo.find_all()
-        total = await self.repo.count()
-        
+    async def get_all_groups(
+            self,
+            limit: Optional[int] = None,
+            cursor: Optional[str] = None,
+            sort: str = "name",
+            type: Optional[str] = None,
+            course: Optional[int] = None,
+            total: TotalMode = "exact"
+    ) -> GroupListResponse:
+        """A page of groups (all of them without a limit). Raises ValueError on a bad sort or cursor."""
+        page = await self.repo.find_page(limit, cursor, sort, type=type, course=course, total=total)
         return GroupListResponse(
-            groups=[GroupResponse.model_validate(group) for group in groups],
-            total=total
+            groups=[GroupResponse.model_validate(row.Group) for row in page.rows],
+            total=page.total,
+            next_cursor=page.next_cursor,
         )
 
     async def get_group_by_id(self, group_id: UUID) -> Optional[GroupResponse]:
@@ -49,6 +61,7 @@ class GroupService:
         existing_group = await self.repo.find_by_id(group_id)
         if not existing_group:
             return None
+        existing_group_name = existing_group.name
         
         if group_data.name is not UNSET and group_data.name is not None and group_data.name != existing_group.name:
             name_conflict = await self.repo.find_by_name(group_data.name)
@@ -65,7 +78,11 @@ class GroupService:
         
         if not updated_group:
             return None
-        
+
+        if self.entries_repo and updated_group.name != existing_group_name:
+            await self.entries_repo.rename_group(group_id, updated_group.name)
+            self.entries_repo.after_commit(TimetableService.invalidate_all)
+
         return GroupResponse.model_validate(updated_group)
 
     async def delete_group(self, group_id: UUID) -> bool:
@@ -1,7 +1,16 @@
 from uuid import UUID
-from typing import List
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy.exc import NoResultFound
 
 from app.repositories.availability_repository import AvailabilityRepository
+from app.schemas.availability import (
+    AvailabilityMatrix,
+    AvailabilityMatrixUpdate,
+    AvailabilityMatrixUpdateResult,
+    MatrixEncoding,
+)
+from app.services.availability_matrix import decode_update, encode_matrix, load_bitsets
 from app.services.timeslot_service import TimeslotService
 
 class GroupUnavailabilityService:
@@ -21,6 +30,44 @@ class GroupUnavailabilityService:
         Returns a list of formatted timeslot strings that the group
         is UNAVAILABLE for.
         """
-        db_ids = await self.repo.get_group_unavailability(group_id)
-        id_map = await self.timeslot_service.get_id_map()
-        return [id_map[tid] for tid in db_ids if tid in id_map]
+        codec = await self.timeslot_service.get_codec()
+        bitsets = await self.get_bitsets([group_id])
+        return codec.strings(bitsets.get(group_id, 0))
+
+    async def get_bitsets(self, group_ids: Optional[Iterable[UUID]] = None) -> Dict[UUID, int]:
+        """
+        Blocked slots of the given groups (all if None) as bitsets over the
+        timeslot codec's ordinals.
+        """
+        return await load_bitsets(
+            await self.timeslot_service.get_codec(),
+            group_ids,
+            self.repo.get_group_unavailability_bits,
+            self.repo.get_group_unavailability_matrix,
+            self.repo.save_group_unavailability_bits,
+        )
+
+    async def get_matrix(
+            self, group_ids: Optional[List[UUID]] = None, encoding: MatrixEncoding = "bitmask"
+    ) -> AvailabilityMatrix:
+        """Blocked slots of the given groups (all if None) as a group x timeslot matrix."""
+        bitsets = await self.get_bitsets(group_ids)
+        return encode_matrix(await self.timeslot_service.get_codec(), bitsets, encoding)
+
+    async def apply_matrix(self, update: AvailabilityMatrixUpdate) -> AvailabilityMatrixUpdateResult:
+        """
+        Replaces the blocked slots of the groups in the update, touching
+        only the cells that change. Raises ValueError on a stale or
+        malformed matrix and NoResultFound for unknown groups.
+        """
+        codec = await self.timeslot_service.get_codec()
+        cells = decode_update(codec, update)
+        known = await self.repo.get_group_unavailability_bits(cells, codec.key)
+        missing = [str(group_id) for group_id in cells if group_id not in known]
+        if missing:
+            raise NoResultFound(f"Groups not found: {', '.join(missing)}")
+        added, removed = await self.repo.apply_group_unavailability(cells)
+        await self.repo.save_group_unavailability_bits(
+            {group_id: codec.to_bits(codec.mask(ids)) for group_id, ids in cells.items()}, codec.key
+        )
+        return AvailabilityMatrixUpdateResult(added=added, removed=removed)
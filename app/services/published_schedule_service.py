@@ -0,0 +1,84 @@
+import logging
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy.exc import NoResultFound
+
+from app.repositories.published_schedule_repository import PublishedScheduleRepository
+from app.repositories.schedule_repository import ScheduleRepository
+from app.repositories.timetable_entry_repository import TimetableEntryRepository
+from app.schemas.schedule import PublishedScheduleResponse
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCOPE = "default"
+
+# The whole scope -> published schedule mapping (a handful of rows), loaded at once.
+# Cleared once a publish commits; the TTL bounds staleness for publishes made by other workers.
+_published_cache = TTLCache(maxsize=1, ttl=30.0)
+_MAPPING_KEY = "published"
+
+
+class PublishedScheduleService:
+    """
+    Which schedule is published (shown to students and teachers) per scope.
+    Reads are answered from a process-local copy of `published_schedules`,
+    so resolving the published schedule does not touch the database.
+    """
+
+    def __init__(
+            self,
+            repo: PublishedScheduleRepository,
+            schedule_repo: ScheduleRepository,
+            entries_repo: Optional[TimetableEntryRepository] = None
+    ):
+        self.repo = repo
+        self.schedule_repo = schedule_repo
+        self.entries_repo = entries_repo
+
+    async def _mapping(self) -> Dict[str, PublishedScheduleResponse]:
+        mapping = _published_cache.get(_MAPPING_KEY)
+        if mapping is None:
+            mapping = {
+                row.scope: PublishedScheduleResponse.model_validate(row)
+                for row in await self.repo.find_all()
+            }
+            _published_cache.set(_MAPPING_KEY, mapping)
+        return mapping
+
+    @staticmethod
+    def invalidate() -> None:
+        _published_cache.invalidate()
+
+    async def list_published(self) -> List[PublishedScheduleResponse]:
+        return sorted((await self._mapping()).values(), key=lambda p: p.scope)
+
+    async def get_published(self, scope: str = DEFAULT_SCOPE) -> PublishedScheduleResponse:
+        published = (await self._mapping()).get(scope)
+        if published is None:
+            raise NoResultFound(f"No schedule published for scope '{scope}'")
+        return published
+
+    async def resolve(self, scope: str = DEFAULT_SCOPE) -> Optional[UUID]:
+        """Published schedule ID for the scope, or None if nothing is published there."""
+        published = (await self._mapping()).get(scope)
+        return published.schedule_id if published is not None else None
+
+    async def publish(self, schedule_id: UUID, scope: str = DEFAULT_SCOPE) -> PublishedScheduleResponse:
+        """
+        Points the scope at the schedule with a single upsert, so readers see
+        either the previous or the new schedule, never neither.
+        Raises NoResultFound if the schedule does not exist.
+        """
+        if not await self.schedule_repo.exists(schedule_id):
+            raise NoResultFound("Schedule not found")
+        if self.entries_repo:
+            # Everyone is about to read it: start from a fresh read model
+            await self.entries_repo.rebuild(schedule_id)
+        row = await self.repo.upsert(scope, schedule_id)
+        published = PublishedScheduleResponse.model_validate(row)
+
+        self.schedule_repo.after_commit(self.invalidate)
+        logger.info(f"Розклад {schedule_id} опубліковано для '{scope}'")
+        return published
@@ -0,0 +1,75 @@
+import logging
+from typing import Dict, List
+from uuid import UUID
+
+from app.db.models.people.registration_request import RegistrationStatus
+from app.repositories.registration_repository import RegistrationRepository
+from app.schemas.registration import (
+    BulkApproveRegistrations,
+    BulkRegistrationResult,
+    BulkRejectRegistrations,
+    RegistrationDecision,
+)
+from app.services.timetable_service import TimetableService
+
+logger = logging.getLogger(__name__)
+
+
+class RegistrationService:
+    """
+    Bulk approval and rejection of registration requests. A batch takes a
+    fixed number of statements whatever its size: the requests are locked,
+    then decided together; each request gets its own outcome instead of one
+    bad request failing the batch.
+    """
+
+    def __init__(self, repo: RegistrationRepository):
+        self.repo = repo
+
+    async def _pending(self, request_ids: List[UUID], items: Dict[UUID, RegistrationDecision]) -> List[UUID]:
+        """Locks the requests; records the missing and decided ones and returns the pending."""
+        statuses = await self.repo.lock_requests(request_ids)
+        pending = []
+        for request_id in request_ids:
+            status = statuses.get(request_id)
+            if status is None:
+                items[request_id] = RegistrationDecision(request_id=request_id, outcome="not_found")
+            elif status != RegistrationStatus.PENDING:
+                items[request_id] = RegistrationDecision(request_id=request_id, outcome="already_processed")
+            else:
+                pending.append(request_id)
+        return pending
+
+    async def approve(self, request: BulkApproveRegistrations) -> BulkRegistrationResult:
+        request_ids = list(dict.fromkeys(request.request_ids))
+        items: Dict[UUID, RegistrationDecision] = {}
+        pending = await self._pending(request_ids, items)
+
+        conflicts = await self.repo.find_approval_conflicts(pending, request.role) if pending else {}
+        for request_id, reason in conflicts.items():
+            items[request_id] = RegistrationDecision(request_id=request_id, outcome="conflict", detail=reason)
+
+        approved = await self.repo.approve(
+            [request_id for request_id in pending if request_id not in conflicts], request.role, request.admin_note
+        )
+        for request_id, user_id, role in approved:
+            items[request_id] = RegistrationDecision(
+                request_id=request_id, outcome="approved", user_id=user_id, role=role
+            )
+
+        if approved:
+            self.repo.after_commit(TimetableService.invalidate_user_contexts)
+        logger.info(f"Масове схвалення заявок на реєстрацію: {len(approved)} з {len(request_ids)}")
+        return BulkRegistrationResult(processed=len(approved), items=[items[r] for r in request_ids])
+
+    async def reject(self, request: BulkRejectRegistrations) -> BulkRegistrationResult:
+        request_ids = list(dict.fromkeys(request.request_ids))
+        items: Dict[UUID, RegistrationDecision] = {}
+        pending = await self._pending(request_ids, items)
+
+        rejected = await self.repo.reject(pending, request.reason)
+        for request_id in rejected:
+            items[request_id] = RegistrationDecision(request_id=request_id, outcome="rejected")
+
+        logger.info(f"Масове відхилення заявок на реєстрацію: {len(rejected)} з {len(request_ids)}")
+        return BulkRegistrationResult(processed=len(rejected), items=[items[r] for r in request_ids])
@@ -0,0 +1,196 @@
+import logging
+from typing import Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from app.repositories.assignment_repository import AssignmentRepository
+from app.repositories.room_repository import RoomRepository
+from app.schemas.room import FreeRoomsRangeResponse, FreeRoomsResponse, FreeRoomsSlot, RoomResponse
+from app.services.timeslot_codec import TimeslotCodec
+from app.services.timeslot_service import TimeslotService
+from app.utils.cache import TTLCache, schedule_versions
+
+logger = logging.getLogger(__name__)
+
+# (room_id, timeslot_id) pairs taken from assignments
+Placement = Tuple[UUID, int]
+
+
+class RoomOccupancyIndex:
+    """
+    Occupancy matrix of one schedule: rooms x week cells (see TimeslotCodec).
+
+    Rooms are sorted by capacity, so "capacity >= N" is a contiguous suffix
+    found with a binary search. Cells hold small occupancy counters instead
+    of single bits so that removing one of two overlapping placements
+    (e.g. an ALL and an ODD lesson) keeps the cell busy.
+    """
+
+    def __init__(self, codec: TimeslotCodec, rooms: Iterable, placements: Iterable[Placement] = ()):
+        ordered = sorted(rooms, key=lambda r: (r.capacity, r.name))
+        self.codec = codec
+        self.rooms = ordered
+        self.capacities = np.array([r.capacity for r in ordered], dtype=np.int32)
+        self._rows = {r.room_id: i for i, r in enumerate(ordered)}
+        self.occupancy = np.zeros((len(ordered), codec.n_cells), dtype=np.uint8)
+        self.version = 0
+        self.add(placements)
+
+    def _coords(self, placements: Iterable[Placement]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        rows, ordinals = [], []
+        for room_id, timeslot_id in placements:
+            row = self._rows.get(room_id)
+            if row is None or timeslot_id not in self.codec:
+                continue
+            rows.append(row)
+            ordinals.append(self.codec.ordinal(timeslot_id))
+        rows = np.array(rows, dtype=np.int64)
+        ordinals = np.array(ordinals, dtype=np.int64)
+        return rows, self.codec.cell_a[ordinals], self.codec.cell_b[ordinals]
+
+    def _update(self, placements: Iterable[Placement], delta: int) -> None:
+        """Adds `delta` to the touched cells only, in place."""
+        rows, cell_a, cell_b = self._coords(placements)
+        if rows.size == 0:
+            return
+        split = cell_a != cell_b
+        flat = np.concatenate((rows * self.codec.n_cells + cell_a, rows[split] * self.codec.n_cells + cell_b[split]))
+        cells, hits = np.unique(flat, return_counts=True)
+        occupancy = self.occupancy.reshape(-1)
+        occupancy[cells] = np.clip(occupancy[cells].astype(np.int32) + delta * hits, 0, 255)
+
+    def add(self, placements: Iterable[Placement]) -> None:
+        self._update(placements, 1)
+
+    def remove(self, placements: Iterable[Placement]) -> None:
+        self._update(placements, -1)
+
+    def _first_row(self, min_capacity: int) -> int:
+        return int(np.searchsorted(self.capacities, min_capacity, side="left"))
+
+    def free_rooms(self, timeslot_id: int, min_capacity: int = 0) -> List:
+        """Rooms with capacity >= min_capacity that are free in the timeslot, smallest first."""
+        i = self.codec.ordinal(timeslot_id)
+        start = self._first_row(min_capacity)
+        busy = self.occupancy[start:, self.codec.cell_a[i]] | self.occupancy[start:, self.codec.cell_b[i]]
+        return [self.rooms[start + j] for j in np.flatnonzero(busy == 0)]
+
+    def free_matrix(self, ordinals: Sequence[int], min_capacity: int = 0) -> Tuple[int, np.ndarray]:
+        """
+        Boolean matrix (rooms with capacity >= min_capacity) x ordinals, True
+        where the room is free. Returns the first room row and the matrix.
+        """
+        ordinals = np.asarray(ordinals, dtype=np.int64)
+        start = self._first_row(min_capacity)
+        occ = self.occupancy[start:]
+        busy = occ[:, self.codec.cell_a[ordinals]] | occ[:, self.codec.cell_b[ordinals]]
+        return start, busy == 0
+
+
+# schedule_id -> RoomOccupancyIndex; rebuilt when the schedule version moves on
+_occupancy_indexes = TTLCache(maxsize=32, ttl=600.0)
+
+
+class RoomOccupancyService:
+    """
+    Answers "which rooms are free" queries from per-schedule in-memory indexes.
+    """
+
+    def __init__(
+            self,
+            assignment_repo: AssignmentRepository,
+            room_repo: RoomRepository,
+            timeslot_service: TimeslotService
+    ):
+        self.assignment_repo = assignment_repo
+        self.room_repo = room_repo
+        self.timeslot_service = timeslot_service
+
+    async def get_index(self, schedule_id: UUID) -> RoomOccupancyIndex:
+        index = _occupancy_indexes.get(schedule_id)
+        version = schedule_versions.current(schedule_id)
+        if index is not None and index.version == version:
+            return index
+
+        codec = await self.timeslot_service.get_codec()
+        rooms = await self.room_repo.find_all()
+        placements = await self.assignment_repo.find_room_placements(schedule_id)
+        index = RoomOccupancyIndex(codec, rooms, placements)
+        index.version = version
+        _occupancy_indexes.set(schedule_id, index)
+        logger.info(f"Побудовано індекс зайнятості аудиторій: schedule_id={schedule_id}, rooms={len(rooms)}, placements={len(placements)}")
+        return index
+
+    async def find_free_rooms(
+            self, schedule_id: UUID, timeslot_id: int, min_capacity: int = 0
+    ) -> FreeRoomsResponse:
+        index = await self.get_index(schedule_id)
+        if timeslot_id not in index.codec:
+            raise ValueError(f"Timeslot {timeslot_id} not found")
+        rooms = index.free_rooms(timeslot_id, min_capacity)
+        return FreeRoomsResponse(
+            schedule_id=schedule_id,
+            timeslot_id=timeslot_id,
+            min_capacity=min_capacity,
+            rooms=[RoomResponse.model_validate(room) for room in rooms],
+        )
+
+    async def find_free_rooms_in_range(
+            self, schedule_id: UUID, day: Optional[int] = None, min_capacity: int = 0
+    ) -> FreeRoomsRangeResponse:
+        """
+        Free rooms for every timeslot of a day, or of the whole week when
+        `day` is omitted, in timeslot order.
+        """
+        index = await self.get_index(schedule_id)
+        codec = index.codec
+        ordinals = codec.ordinals_for_day(day) if day is not None else np.arange(len(codec))
+        start, free = index.free_matrix(ordinals, min_capacity)
+
+        responses = [RoomResponse.model_validate(room) for room in index.rooms[start:]]
+        slots = [
+            FreeRoomsSlot(
+                timeslot_id=int(codec.ids[ordinal]),
+                day=int(codec.days[ordinal]),
+                lesson_id=int(codec.lessons[ordinal]),
+                frequency=codec.frequencies[ordinal],
+                rooms=[responses[j] for j in np.flatnonzero(free[:, k])],
+            )
+            for k, ordinal in enumerate(ordinals)
+        ]
+        return FreeRoomsRangeResponse(
+            schedule_id=schedule_id,
+            day=day,
+            min_capacity=min_capacity,
+            slots=slots,
+        )
+
+    @staticmethod
+    def apply_changes(
+            schedule_id: UUID,
+            expected_version: int,
+            added: Iterable[Placement] = (),
+            removed: Iterable[Placement] = ()
+    ) -> None:
+        """
+        Patches a cached index in place after assignments were edited, so
+        the next query does not need a full rebuild. Call once the edit has
+        committed and the schedule version was bumped from
+        `expected_version`. An index built at any other version misses
+        other changes and is dropped instead.
+        """
+        index = _occupancy_indexes.get(schedule_id)
+        if index is None:
+            return
+        if index.version != expected_version:
+            _occupancy_indexes.invalidate(lambda key: key == schedule_id)
+            return
+        index.remove(removed)
+        index.add(added)
+        index.version = schedule_versions.current(schedule_id)
+
+    @staticmethod
+    def invalidate_all() -> None:
+        """Drops every cached index (e.g. after the room catalog changed)."""
+        _occupancy_indexes.invalidate()
@@ -4,13 +4,17 @@ from typing import Optional
 from fastapi import HTTPException, status
 
 from app.repositories.room_repository import RoomRepository
+from app.repositories.timetable_entry_repository import TimetableEntryRepository
 from app.schemas.room import RoomCreate, RoomUpdate, RoomResponse, RoomListResponse
+from app.services.room_occupancy_service import RoomOccupancyService
+from app.services.timetable_service import TimetableService
 from app.utils.unset import UNSET
 
 
 class RoomService:
-    def __init__(self, repo: RoomRepository):
+    def __init__(self, repo: RoomRepository, entries_repo: Optional[TimetableEntryRepository] = None):
         self.repo = repo
+        self.entries_repo = entries_repo
 
     async def get_all_rooms(self) -> RoomListResponse:
         """Gets all rooms with pagination/total count."""
@@ -45,6 +49,7 @@ class RoomService:
             name=room_data.name,
             capacity=room_data.capacity
         )
+        self.repo.after_commit(RoomOccupancyService.invalidate_all)
 
         return RoomResponse.model_validate(room)
 
@@ -65,8 +70,15 @@ class RoomService:
         )
 
         if room:
+            self.repo.after_commit(RoomOccupancyService.invalidate_all)
+            if self.entries_repo and room_data.name is not UNSET and room_data.name is not None:
+                if await self.entries_repo.rename_room(room_id, room.name):
+                    self.entries_repo.after_commit(TimetableService.invalidate_all)
             return RoomResponse.model_validate(room)
         return None  # Room with room_id not found
 
     async def delete_room(self, room_id: uuid.UUID) -> bool:
-        return await self.repo.delete(room_id)
+        deleted = await self.repo.delete(room_id)
+        if deleted:
+            self.repo.after_commit(RoomOccupancyService.invalidate_all)
+        return deleted
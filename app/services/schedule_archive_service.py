@@ -0,0 +1,280 @@
+import json
+import logging
+import time
+import zlib
+from typing import Callable, Iterable, List, Sequence, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy.exc import NoResultFound
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import async_session_maker
+from app.repositories.assignment_partition_repository import AssignmentPartitionRepository
+from app.repositories.assignment_repository import AssignmentRepository
+from app.repositories.constraint_repository import ConstraintRepository
+from app.repositories.published_schedule_repository import PublishedScheduleRepository
+from app.repositories.schedule_archive_repository import ScheduleArchiveRepository
+from app.repositories.schedule_repository import ScheduleRepository
+from app.repositories.schedule_revision_repository import ScheduleRevisionRepository
+from app.repositories.timetable_entry_repository import TimetableEntryRepository
+from app.schemas.schedule_archive import (
+    ScheduleArchiveListResponse,
+    ScheduleArchiveResponse,
+    SchedulePurgeResult,
+    ScheduleRetentionReport,
+)
+from app.utils.cache import schedule_versions
+
+logger = logging.getLogger(__name__)
+
+PAYLOAD_FORMAT = 1
+_ASSIGNMENT_COLUMNS = (
+    "assignment_id", "timeslot_id", "group_id", "subgroup_no",
+    "course_id", "teacher_id", "room_id", "course_type",
+)
+_CONSTRAINT_COLUMNS = ("group_id", "course_id", "subgroups_count")
+_UUID_COLUMNS = {"assignment_id", "group_id", "course_id", "teacher_id", "room_id"}
+# Multi-row INSERTs stay well below the driver's bind parameter limit
+_RESTORE_CHUNK = 2000
+
+
+def _encode(value):
+    return str(value) if isinstance(value, UUID) else value
+
+
+def _decode(column: str, value):
+    return UUID(value) if column in _UUID_COLUMNS and value is not None else value
+
+
+def pack_payload(assignments: Sequence, constraints: Sequence) -> bytes:
+    """Serializes assignments and subgroup constraints as column-headed rows, zlib-compressed."""
+    document = {
+        "format": PAYLOAD_FORMAT,
+        "assignments": {
+            "columns": list(_ASSIGNMENT_COLUMNS),
+            "rows": [[_encode(getattr(a, c)) for c in _ASSIGNMENT_COLUMNS] for a in assignments],
+        },
+        "subgroup_constraints": {
+            "columns": list(_CONSTRAINT_COLUMNS),
+            "rows": [[_encode(getattr(sc, c)) for c in _CONSTRAINT_COLUMNS] for sc in constraints],
+        },
+    }
+    return zlib.compress(json.dumps(document, separators=(",", ":")).encode("utf-8"), level=6)
+
+
+def unpack_payload(payload: bytes) -> Tuple[List[dict], List[dict]]:
+    """Inverse of pack_payload: (assignment rows, subgroup constraint rows)."""
+    document = json.loads(zlib.decompress(payload).decode("utf-8"))
+    if document.get("format") != PAYLOAD_FORMAT:
+        raise ValueError(f"Unsupported archive format {document.get('format')}")
+
+    def rows(section: dict) -> List[dict]:
+        columns = section["columns"]
+        return [{c: _decode(c, v) for c, v in zip(columns, row)} for row in section["rows"]]
+
+    return rows(document["assignments"]), rows(document["subgroup_constraints"])
+
+
+def select_for_archival(
+        schedules: Sequence,
+        label_prefixes: Sequence[str],
+        keep_last: int,
+        protected: Iterable[UUID] = ()
+) -> Tuple[List, List]:
+    """
+    Applies the retention policy to schedules ordered newest first.
+    Returns (kept, to_archive). Schedules that match no prefix are left
+    alone; the newest schedule overall and `protected` ones (published)
+    are always kept.
+    """
+    keep: Set[UUID] = set(protected)
+    if schedules:
+        keep.add(schedules[0].schedule_id)
+    matched: Set[UUID] = set()
+    for prefix in label_prefixes:
+        same_prefix = [s for s in schedules if s.label.startswith(prefix)]
+        matched.update(s.schedule_id for s in same_prefix)
+        keep.update(s.schedule_id for s in same_prefix[:keep_last])
+
+    kept = [s for s in schedules if s.schedule_id in keep]
+    to_archive = [s for s in schedules if s.schedule_id in matched and s.schedule_id not in keep]
+    return kept, to_archive
+
+
+class ScheduleArchiveService:
+    """
+    Retention, archival and restore of schedules.
+
+    Unlike request-scoped services this one opens its own sessions: the
+    archive is committed first, then the schedule's partition is dropped
+    or, without one, assignments are deleted in bounded batches, each in
+    its own short transaction, and so are its timetable entries, so locks
+    and WAL bursts stay small. An
+    interrupted purge can simply be run again.
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncSession] = async_session_maker):
+        self.session_factory = session_factory
+
+    async def list_archives(self) -> ScheduleArchiveListResponse:
+        async with self.session_factory() as session:
+            archives = await ScheduleArchiveRepository(session).find_all()
+        items = [ScheduleArchiveResponse.model_validate(a) for a in archives]
+        return ScheduleArchiveListResponse(archives=items, total=len(items))
+
+    async def apply_retention(
+            self,
+            label_prefixes: List[str],
+            keep_last: int,
+            batch_size: int = 5000,
+            dry_run: bool = True
+    ) -> ScheduleRetentionReport:
+        async with self.session_factory() as session:
+            schedules = await ScheduleRepository(session).find_all()
+            published = await PublishedScheduleRepository(session).find_all()
+            # Revisions that still read through their parent need it
+            parents = await ScheduleRevisionRepository(session).find_unmaterialized_parent_ids()
+        kept, to_archive = select_for_archival(
+            schedules, label_prefixes, keep_last, protected=[p.schedule_id for p in published] + parents
+        )
+
+        archived = []
+        if not dry_run:
+            for schedule in to_archive:
+                archived.append(await self.archive_schedule(schedule.schedule_id, batch_size))
+
+        return ScheduleRetentionReport(
+            dry_run=dry_run,
+            kept=[s.schedule_id for s in kept],
+            to_archive=[s.schedule_id for s in to_archive],
+            archived=archived,
+        )
+
+    async def archive_schedule(self, schedule_id: UUID, batch_size: int = 5000) -> SchedulePurgeResult:
+        """
+        Stores the schedule in `schedule_archives` and removes it from the
+        hot tables. Raises NoResultFound if the schedule does not exist and
+        ValueError if it is published or unmaterialized revisions depend on it.
+        """
+        started = time.perf_counter()
+
+        # 1. Archive (skipped when resuming an interrupted purge)
+        async with self.session_factory() as session:
+            schedule = await ScheduleRepository(session).find_by_id(schedule_id)
+            if schedule is None:
+                raise NoResultFound("Schedule not found")
+            published = await PublishedScheduleRepository(session).find_all()
+            scopes = [p.scope for p in published if p.schedule_id == schedule_id]
+            if scopes:
+                raise ValueError(f"Schedule is published for {', '.join(scopes)} and cannot be archived")
+            revision_repo = ScheduleRevisionRepository(session)
+            if schedule_id in await revision_repo.find_unmaterialized_parent_ids():
+                raise ValueError("Schedule has unmaterialized revisions and cannot be archived")
+            archive_repo = ScheduleArchiveRepository(session)
+            archive = await archive_repo.find_by_id(schedule_id)
+            if archive is None:
+                if schedule.materialized:
+                    assignments = await AssignmentRepository(session).find_by_schedule_id(schedule_id)
+                else:
+                    assignments = await revision_repo.find_resolved(await revision_repo.find_chain(schedule_id))
+                constraints = await ConstraintRepository(session).get_subgroup_constraints(schedule_id)
+                archive = await archive_repo.create(
+                    schedule_id=schedule_id,
+                    label=schedule.label,
+                    created_at=schedule.created_at,
+                    assignments_count=len(assignments),
+                    payload=pack_payload(assignments, constraints),
+                )
+                await session.commit()
+            label, compressed_bytes = schedule.label, len(archive.payload)
+
+        # 2. Drop the schedule's partition if it has one and its lock is granted
+        #    in time, otherwise delete assignments in bounded batches, one
+        #    transaction each
+        deleted, batches = 0, 0
+        async with self.session_factory() as session:
+            dropped = await AssignmentPartitionRepository(session).drop_partition(schedule_id)
+            await session.commit()
+        if dropped:
+            deleted = archive.assignments_count
+        while not dropped:
+            async with self.session_factory() as session:
+                count = await AssignmentRepository(session).delete_batch_by_schedule_id(schedule_id, batch_size)
+                await session.commit()
+            if count == 0:
+                break
+            deleted += count
+            batches += 1
+        # The timetable read model is never partitioned: always in batches
+        while True:
+            async with self.session_factory() as session:
+                count = await TimetableEntryRepository(session).delete_batch_by_schedule_id(schedule_id, batch_size)
+                await session.commit()
+            if count == 0:
+                break
+
+        # 3. Drop the schedule itself
+        async with self.session_factory() as session:
+            await ConstraintRepository(session).delete_subgroup_constraints(schedule_id)
+            await ScheduleRepository(session).delete(schedule_id)
+            await session.commit()
+
+        schedule_versions.bump(schedule_id)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.info(
+            f"Розклад {schedule_id} ('{label}') заархівовано: {deleted} призначень, "
+            f"{batches} пакетів, {compressed_bytes} байт, {elapsed_ms:.1f} мс"
+        )
+        return SchedulePurgeResult(
+            schedule_id=schedule_id,
+            label=label,
+            assignments=deleted,
+            batches=batches,
+            compressed_bytes=compressed_bytes,
+            elapsed_ms=round(elapsed_ms, 2),
+        )
+
+    async def restore_schedule(self, schedule_id: UUID) -> SchedulePurgeResult:
+        """
+        Recreates an archived schedule with its original IDs and removes the
+        archive, in one transaction. Raises NoResultFound if there is no
+        archive and ValueError if the label is taken by another schedule.
+        """
+        started = time.perf_counter()
+        async with self.session_factory() as session:
+            archive = await ScheduleArchiveRepository(session).find_by_id(schedule_id)
+            if archive is None:
+                raise NoResultFound("Archive not found")
+
+            schedule_repo = ScheduleRepository(session)
+            exists = await schedule_repo.exists(schedule_id)
+            if not exists and await schedule_repo.find_by_label(archive.label) is not None:
+                raise ValueError(f"Schedule with label '{archive.label}' already exists")
+            # Before the schedule row: the partition is created in its own transaction
+            await AssignmentPartitionRepository(session).create_partition(schedule_id)
+            if not exists:
+                await schedule_repo.create_with_id(schedule_id, archive.label, archive.created_at)
+
+            assignments, constraints = unpack_payload(archive.payload)
+            assignment_repo = AssignmentRepository(session)
+            restored = 0
+            for i in range(0, len(assignments), _RESTORE_CHUNK):
+                chunk = [dict(row, schedule_id=schedule_id) for row in assignments[i:i + _RESTORE_CHUNK]]
+                restored += await assignment_repo.insert_many(chunk)
+            await ConstraintRepository(session).insert_subgroup_constraints(
+                [dict(row, schedule_id=schedule_id) for row in constraints]
+            )
+            await ScheduleArchiveRepository(session).delete(schedule_id)
+            await session.commit()
+            label, compressed_bytes = archive.label, len(archive.payload)
+
+        schedule_versions.bump(schedule_id)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.info(f"Розклад {schedule_id} ('{label}') відновлено з архіву: {restored} призначень")
+        return SchedulePurgeResult(
+            schedule_id=schedule_id,
+            label=label,
+            assignments=restored,
+            compressed_bytes=compressed_bytes,
+            elapsed_ms=round(elapsed_ms, 2),
+        )
@@ -0,0 +1,207 @@
+import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from app.db.models.common_enums import TimeslotFrequency
+from app.services.timeslot_codec import EVEN_WEEK, ODD_WEEK
+
+# 1970-01-01 (day 0 of datetime64[D]) was a Thursday
+_EPOCH_WEEKDAY = 3
+
+
+def weekdays(dates: np.ndarray) -> np.ndarray:
+    """ISO weekday (1 = Monday) of datetime64[D] dates."""
+    return (dates.astype(np.int64) + _EPOCH_WEEKDAY) % 7 + 1
+
+
+def semester_days(
+        start: datetime.date,
+        end: datetime.date,
+        parity_anchor: datetime.date,
+        holidays: Iterable[datetime.date] = ()
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Teaching days of a semester as (dates, weekday, week), holidays removed.
+    `week` is ODD_WEEK for the week containing `parity_anchor` and every
+    second week from it (in both directions), EVEN_WEEK otherwise.
+    """
+    dates = np.arange(np.datetime64(start, "D"), np.datetime64(end, "D") + 1)
+    holidays = np.array(list(holidays), dtype="datetime64[D]")
+    if holidays.size:
+        dates = dates[~np.isin(dates, holidays)]
+    weekday = weekdays(dates)
+    anchor = np.datetime64(parity_anchor, "D")
+    anchor_monday = anchor - (weekdays(anchor) - 1)
+    weeks_from_anchor = ((dates - (weekday - 1)) - anchor_monday).astype(np.int64) // 7
+    week = np.where(weeks_from_anchor % 2 == 0, ODD_WEEK, EVEN_WEEK)
+    return dates, weekday, week
+
+
+class OccurrenceIndex:
+    """
+    Dated occurrences of a schedule's lessons over a semester.
+
+    Built from timetable entries (anything with day, lesson_id, frequency,
+    start_time, end_time, group_id, teacher_id and room_id) in one
+    vectorized pass: every entry is repeated over the teaching days with
+    its weekday and week parity.
+    Occurrences are sorted by date and lesson, so a date range is a
+    binary-searched slice.
+    """
+
+    def __init__(self, entries: Sequence, dates: np.ndarray, weekday: np.ndarray, week: np.ndarray):
+        self.entries = list(entries)
+        day = np.array([e.day for e in self.entries], dtype=np.int64)
+        lesson = np.array([e.lesson_id for e in self.entries], dtype=np.int64)
+        frequency = [getattr(e.frequency, "value", e.frequency) for e in self.entries]
+        odd = np.array([f != TimeslotFrequency.EVEN.value for f in frequency], dtype=bool)
+        even = np.array([f != TimeslotFrequency.ODD.value for f in frequency], dtype=bool)
+
+        # (weekday, week) key of every teaching day, and the days sorted by it
+        date_key = (weekday.astype(np.int64) - 1) * 2 + week
+        by_key = np.argsort(date_key, kind="stable")
+        counts = np.bincount(date_key, minlength=14)
+        starts = np.cumsum(counts) - counts
+
+        # Entries expanded to the weeks they are held in
+        rows = np.concatenate([np.flatnonzero(odd), np.flatnonzero(even)])
+        row_week = np.concatenate([np.full(odd.sum(), ODD_WEEK), np.full(even.sum(), EVEN_WEEK)])
+        row_key = (day[rows] - 1) * 2 + row_week
+        n = counts[row_key]
+        offsets = np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n)
+        entry = np.repeat(rows, n)
+        date = dates[by_key[np.repeat(starts[row_key], n) + offsets]]
+
+        order = np.lexsort((entry, lesson[entry], date))
+        self.date = date[order]
+        self.entry = entry[order].astype(np.int32)
+        self._groups, self.group = self._encode([e.group_id for e in self.entries])
+        self._teachers, self.teacher = self._encode([e.teacher_id for e in self.entries])
+        self._rooms, self.room = self._encode([e.room_id for e in self.entries])
+        # Lesson times as minutes from midnight, -1 when unknown
+        self.start_minute = self._minutes([e.start_time for e in self.entries])
+        self.end_minute = self._minutes([e.end_time for e in self.entries])
+        self._by_code: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._timelines: Dict[tuple, Timeline] = {}
+
+    @staticmethod
+    def _minutes(times: List[Optional[datetime.time]]) -> np.ndarray:
+        return np.array([t.hour * 60 + t.minute if t is not None else -1 for t in times], dtype=np.int64)
+
+    @staticmethod
+    def _encode(ids: List[Optional[UUID]]) -> Tuple[dict, np.ndarray]:
+        """Dictionary-encodes IDs: (id -> code, int32 code per entry)."""
+        codes: dict = {}
+        return codes, np.array([codes.setdefault(v, len(codes)) for v in ids], dtype=np.int32)
+
+    def _mask(
+            self,
+            group_ids: Optional[Iterable[UUID]],
+            teacher_id: Optional[UUID],
+            room_id: Optional[UUID]
+    ) -> np.ndarray:
+        """Entries of any of the groups and of the teacher and room given."""
+        keep = np.ones(len(self.entries), dtype=bool)
+        if group_ids is not None:
+            keep &= np.isin(self.group, [self._groups[g] for g in group_ids if g in self._groups])
+        if teacher_id is not None:
+            keep &= self.teacher == self._teachers.get(teacher_id, -1)
+        if room_id is not None:
+            keep &= self.room == self._rooms.get(room_id, -1)
+        return keep
+
+    def __len__(self) -> int:
+        return len(self.date)
+
+    def between(
+            self,
+            date_from: datetime.date,
+            date_to: datetime.date,
+            group_ids: Optional[Iterable[UUID]] = None,
+            teacher_id: Optional[UUID] = None,
+            room_id: Optional[UUID] = None
+    ) -> List[Tuple[datetime.date, object]]:
+        """(date, entry) pairs from date_from to date_to inclusive, in date and lesson order."""
+        lo = np.searchsorted(self.date, np.datetime64(date_from, "D"), side="left")
+        hi = np.searchsorted(self.date, np.datetime64(date_to, "D"), side="right")
+        dates, entries = self.date[lo:hi], self.entry[lo:hi]
+
+        selected = self._mask(group_ids, teacher_id, room_id)[entries]
+        return [
+            (d, self.entries[i])
+            for d, i in zip(dates[selected].astype(object), entries[selected].tolist())
+        ]
+
+    def _rows_of(self, dimension: str, ids: Iterable[UUID]) -> np.ndarray:
+        """
+        Occurrence rows of the entries whose `dimension` ("group" or
+        "teacher") is one of `ids`. The occurrences are grouped by code once
+        per dimension, so each lookup only touches the entity's own rows.
+        """
+        codes_of = {"group": self._groups, "teacher": self._teachers}[dimension]
+        grouped = self._by_code.get(dimension)
+        if grouped is None:
+            codes = getattr(self, dimension)[self.entry]
+            order = np.argsort(codes, kind="stable")
+            grouped = order, np.searchsorted(codes[order], np.arange(len(codes_of) + 1))
+            self._by_code[dimension] = grouped
+        order, bounds = grouped
+        parts = [order[bounds[c]:bounds[c + 1]] for c in (codes_of[i] for i in ids if i in codes_of)]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+    def timeline(self, group_ids: Optional[Iterable[UUID]] = None, teacher_id: Optional[UUID] = None) -> "Timeline":
+        """
+        Occurrences of a teacher or of a group chain (everything if neither
+        is given) with concrete start and end times, sorted by start. Built
+        on first use and kept with the index.
+        """
+        key = (frozenset(group_ids) if group_ids is not None else None, teacher_id)
+        timeline = self._timelines.get(key)
+        if timeline is None:
+            if teacher_id is not None:
+                rows = self._rows_of("teacher", [teacher_id])
+            elif group_ids is not None:
+                rows = self._rows_of("group", key[0])
+            else:
+                rows = np.arange(len(self))
+            rows = rows[self.start_minute[self.entry[rows]] >= 0]
+            entry = self.entry[rows]
+            day = self.date[rows].astype("datetime64[m]")
+            start = day + self.start_minute[entry].astype("timedelta64[m]")
+            end = day + np.maximum(self.end_minute[entry], self.start_minute[entry]).astype("timedelta64[m]")
+            order = np.argsort(start, kind="stable")
+            timeline = Timeline(self.entries, start[order], end[order], entry[order])
+            self._timelines[key] = timeline
+        return timeline
+
+
+class Timeline:
+    """Occurrences of one entity sorted by start time, for "now" and "next" lookups."""
+
+    def __init__(self, entries: List, start: np.ndarray, end: np.ndarray, entry: np.ndarray):
+        self.entries = entries
+        self.start = start
+        self.end = end
+        self.entry = entry
+        self._longest = (end - start).max() if len(start) else np.timedelta64(0, "m")
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def at(self, moment: datetime.datetime) -> Tuple[List[Tuple[datetime.datetime, object]], List[Tuple[datetime.datetime, object]]]:
+        """
+        Lessons in progress at `moment` and the lessons starting next (all
+        that share the earliest later start), as (start, entry) pairs.
+        """
+        now = np.datetime64(moment.replace(tzinfo=None), "m")
+        # Started at most one lesson length ago and not yet over
+        hi = np.searchsorted(self.start, now, side="right")
+        lo = np.searchsorted(self.start, now - self._longest, side="left")
+        current = lo + np.flatnonzero(self.end[lo:hi] > now)
+        upcoming = np.arange(hi, np.searchsorted(self.start, self.start[hi], side="right")) if hi < len(self) else ()
+        return self._pairs(current), self._pairs(upcoming)
+
+    def _pairs(self, rows) -> List[Tuple[datetime.datetime, object]]:
+        return [(self.start[i].astype(datetime.datetime), self.entries[self.entry[i]]) for i in rows]
@@ -0,0 +1,93 @@
+import logging
+import time
+import uuid
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy.exc import NoResultFound
+
+from app.repositories.assignment_partition_repository import AssignmentPartitionRepository
+from app.repositories.assignment_repository import AssignmentRepository
+from app.repositories.constraint_repository import ConstraintRepository
+from app.repositories.schedule_repository import ScheduleRepository
+from app.schemas.schedule import ScheduleCloneResponse, ScheduleResponse
+from app.services.schedule_revision_service import ScheduleRevisionService
+from app.utils.cache import schedule_versions
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduleCloneService:
+    """
+    Copies schedules (e.g. into drafts for manual tweaks) entirely on the database side.
+    """
+
+    def __init__(
+            self,
+            repo: ScheduleRepository,
+            assignment_repo: AssignmentRepository,
+            constraint_repo: ConstraintRepository,
+            partition_repo: Optional[AssignmentPartitionRepository] = None,
+            revision_service: Optional[ScheduleRevisionService] = None
+    ):
+        self.repo = repo
+        self.assignment_repo = assignment_repo
+        self.constraint_repo = constraint_repo
+        self.partition_repo = partition_repo
+        self.revision_service = revision_service
+
+    async def clone_schedule(
+            self,
+            source_schedule_id: UUID,
+            label: str,
+            group_ids: Optional[List[UUID]] = None,
+            include_subgroups: bool = True,
+            as_revision: bool = False
+    ) -> ScheduleCloneResponse:
+        """
+        Creates a new schedule and copies the source's assignments and
+        subgroup constraints into it with INSERT ... SELECT statements.
+        With `as_revision` no assignments are copied: the new schedule is a
+        revision that reads through the source until it is materialized.
+        """
+        if not await self.repo.exists(source_schedule_id):
+            raise NoResultFound("Schedule not found")
+        if await self.repo.find_by_label(label):
+            raise ValueError(f"Schedule with label '{label}' already exists")
+        if as_revision and (group_ids is not None or self.revision_service is None):
+            raise ValueError("Only full copies can be created as revisions")
+
+        started = time.perf_counter()
+        if as_revision:
+            schedule = await self.revision_service.create_revision(source_schedule_id, label)
+            assignments_copied = 0
+        else:
+            # The partition comes first: its DDL runs in its own transaction and
+            # would wait on the locks this one takes on `schedules` and `assignments`
+            schedule_id = uuid.uuid4()
+            if self.partition_repo:
+                await self.partition_repo.create_partition(schedule_id)
+            if self.revision_service:
+                # A revision source has to be in `assignments` to be copied from
+                await self.revision_service.ensure_materialized(source_schedule_id)
+            schedule = await self.repo.create(label=label, schedule_id=schedule_id)
+            assignments_copied = await self.assignment_repo.copy_to_schedule(
+                source_schedule_id, schedule.schedule_id, group_ids, include_subgroups
+            )
+        constraints_copied = await self.constraint_repo.copy_subgroup_constraints(
+            source_schedule_id, schedule.schedule_id, group_ids, include_subgroups
+        )
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.repo.after_commit(lambda: schedule_versions.bump(schedule.schedule_id))
+
+        logger.info(
+            f"Розклад {source_schedule_id} скопійовано в {schedule.schedule_id} ('{label}'): "
+            f"{assignments_copied} призначень, {constraints_copied} обмежень за {elapsed_ms:.1f} мс"
+        )
+        return ScheduleCloneResponse(
+            schedule=ScheduleResponse.model_validate(schedule),
+            source_schedule_id=source_schedule_id,
+            assignments_copied=assignments_copied,
+            constraints_copied=constraints_copied,
+            elapsed_ms=round(elapsed_ms, 2),
+        )
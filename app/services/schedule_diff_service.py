@@ -0,0 +1,175 @@
+import logging
+from collections import Counter, defaultdict
+from typing import AsyncIterator, Dict, Iterable, List, Optional
+from uuid import UUID
+
+from app.repositories.assignment_repository import AssignmentRepository
+from app.schemas.schedule import (
+    ScheduleDiffEntityChanges,
+    ScheduleDiffEntry,
+    ScheduleDiffResponse,
+    ScheduleDiffSummary,
+)
+from app.utils.cache import TTLCache, schedule_versions
+
+logger = logging.getLogger(__name__)
+
+# Lessons are matched on this key; placement is what may differ between schedules
+_LESSON_KEY = ("group_id", "course_id", "subgroup_no", "course_type")
+_PLACEMENT = ("timeslot_id", "teacher_id", "room_id")
+
+# (schedule_id, version) -> list of assignment dicts, filled once a generated
+# schedule is committed so that later diffs against it do not read it back
+_assignment_snapshots = TTLCache(maxsize=8, ttl=600.0)
+
+
+def _as_dict(assignment) -> dict:
+    return {f: getattr(assignment, f) for f in ("assignment_id",) + _LESSON_KEY + _PLACEMENT}
+
+
+def _placement_order(row: dict) -> tuple:
+    # Same ordering as the SQL row_number(): timeslot, teacher, room (NULLs last)
+    return row["timeslot_id"], str(row["teacher_id"]), row["room_id"] is None, str(row["room_id"])
+
+
+def diff_rows(base: Iterable[dict], target: Iterable[dict]) -> List[dict]:
+    """
+    In-memory equivalent of AssignmentRepository.find_diff: drops lessons
+    placed identically in both schedules, then pairs the remaining ones per
+    lesson key by rank with a hash join.
+    """
+    base, target = list(base), list(target)
+    signature = lambda r: tuple(r[f] for f in _LESSON_KEY + _PLACEMENT)
+    base_sigs = Counter(signature(r) for r in base)
+    target_sigs = Counter(signature(r) for r in target)
+
+    old_side: Dict[tuple, List[dict]] = defaultdict(list)
+    new_side: Dict[tuple, List[dict]] = defaultdict(list)
+    for row in base:
+        if not target_sigs[signature(row)]:
+            old_side[tuple(row[f] for f in _LESSON_KEY)].append(row)
+    for row in target:
+        if not base_sigs[signature(row)]:
+            new_side[tuple(row[f] for f in _LESSON_KEY)].append(row)
+
+    changes = []
+    for key in old_side.keys() | new_side.keys():
+        olds = sorted(old_side.get(key, ()), key=_placement_order)
+        news = sorted(new_side.get(key, ()), key=_placement_order)
+        for i in range(max(len(olds), len(news))):
+            old = olds[i] if i < len(olds) else None
+            new = news[i] if i < len(news) else None
+            change = "added" if old is None else "removed" if new is None else "moved"
+            row = dict(zip(_LESSON_KEY, key), change=change)
+            for prefix, side in (("old", old), ("new", new)):
+                row[f"{prefix}_assignment_id"] = side["assignment_id"] if side else None
+                for f in _PLACEMENT:
+                    row[f"{prefix}_{f}"] = side[f] if side else None
+            changes.append(row)
+    changes.sort(key=lambda r: tuple(str(r[f]) for f in _LESSON_KEY))
+    return changes
+
+
+class DiffTotals:
+    """Totals plus per-group and per-teacher change counts, accumulated change by change."""
+
+    def __init__(self):
+        self.totals = Counter()
+        self.groups: Dict[UUID, Counter] = defaultdict(Counter)
+        self.teachers: Dict[UUID, Counter] = defaultdict(Counter)
+
+    def add(self, entry: ScheduleDiffEntry) -> None:
+        self.totals[entry.change] += 1
+        self.groups[entry.group_id][entry.change] += 1
+        for teacher_id in {entry.old_teacher_id, entry.new_teacher_id} - {None}:
+            self.teachers[teacher_id][entry.change] += 1
+
+    def summary(self, base_schedule_id: UUID, target_schedule_id: UUID) -> ScheduleDiffSummary:
+        def per_entity(counters: Dict[UUID, Counter]) -> List[ScheduleDiffEntityChanges]:
+            return [
+                ScheduleDiffEntityChanges(entity_id=entity_id, **counts)
+                for entity_id, counts in sorted(counters.items(), key=lambda kv: -sum(kv[1].values()))
+            ]
+
+        return ScheduleDiffSummary(
+            base_schedule_id=base_schedule_id,
+            target_schedule_id=target_schedule_id,
+            added=self.totals["added"],
+            removed=self.totals["removed"],
+            moved=self.totals["moved"],
+            groups=per_entity(self.groups),
+            teachers=per_entity(self.teachers),
+        )
+
+
+def summarize_changes(
+        base_schedule_id: UUID, target_schedule_id: UUID, changes: Iterable[ScheduleDiffEntry]
+) -> ScheduleDiffSummary:
+    """Totals plus per-group and per-teacher change counts."""
+    totals = DiffTotals()
+    for entry in changes:
+        totals.add(entry)
+    return totals.summary(base_schedule_id, target_schedule_id)
+
+
+class ScheduleDiffService:
+    """
+    Computes what changed between two schedules.
+    """
+
+    def __init__(self, repo: AssignmentRepository):
+        self.repo = repo
+
+    def remember(self, schedule_id: UUID, assignments: Iterable) -> None:
+        """
+        Keeps freshly saved assignments in memory for an in-memory diff. They
+        are stored after commit, under the version the commit bumped to, and
+        dropped with a rollback.
+        """
+        rows = [_as_dict(a) for a in assignments]
+        self.repo.after_commit(
+            lambda: _assignment_snapshots.set((schedule_id, schedule_versions.current(schedule_id)), rows)
+        )
+
+    @staticmethod
+    def _snapshot(schedule_id: UUID) -> Optional[List[dict]]:
+        return _assignment_snapshots.get((schedule_id, schedule_versions.current(schedule_id)))
+
+    async def get_changes(self, base_schedule_id: UUID, target_schedule_id: UUID) -> List[ScheduleDiffEntry]:
+        """
+        Hash join in memory when both schedules are cached, otherwise a
+        single set-based SQL statement.
+        """
+        base = self._snapshot(base_schedule_id)
+        target = self._snapshot(target_schedule_id)
+        if base is not None and target is not None:
+            return [ScheduleDiffEntry.model_validate(r) for r in diff_rows(base, target)]
+
+        rows = await self.repo.find_diff(base_schedule_id, target_schedule_id)
+        return [ScheduleDiffEntry.model_validate(r) for r in rows]
+
+    async def stream_changes(self, base_schedule_id: UUID, target_schedule_id: UUID) -> AsyncIterator[ScheduleDiffEntry]:
+        """Like get_changes, but yields the changes as the database returns them."""
+        base = self._snapshot(base_schedule_id)
+        target = self._snapshot(target_schedule_id)
+        if base is not None and target is not None:
+            for row in diff_rows(base, target):
+                yield ScheduleDiffEntry.model_validate(row)
+            return
+
+        async for row in self.repo.stream_diff(base_schedule_id, target_schedule_id):
+            yield ScheduleDiffEntry.model_validate(row)
+
+    async def diff(self, base_schedule_id: UUID, target_schedule_id: UUID) -> ScheduleDiffResponse:
+        changes = await self.get_changes(base_schedule_id, target_schedule_id)
+        summary = summarize_changes(base_schedule_id, target_schedule_id, changes)
+        return ScheduleDiffResponse(**summary.model_dump(), changes=changes)
+
+    async def summarize(self, base_schedule_id: UUID, target_schedule_id: UUID) -> ScheduleDiffSummary:
+        changes = await self.get_changes(base_schedule_id, target_schedule_id)
+        summary = summarize_changes(base_schedule_id, target_schedule_id, changes)
+        logger.info(
+            f"Різниця розкладів {base_schedule_id} -> {target_schedule_id}: "
+            f"+{summary.added} -{summary.removed} ~{summary.moved}"
+        )
+        return summary
@@ -3,7 +3,7 @@ import os
 import asyncio
 import json
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 # Services for 'catalog' data
 from .group_service import GroupService
@@ -25,9 +25,11 @@ from .group_unavailability_service import GroupUnavailabilityService
 # Services for 'saving' the result
 from .schedule_service import ScheduleService
 from .assignment_service import AssignmentService
+from .schedule_diff_service import ScheduleDiffService
 
 # Import response schemas
 from app.schemas.assignment import AssignmentResponse
+from app.schemas.schedule import ScheduleDiffSummary
 
 SCHEDULER_URL = os.getenv("SCHEDULER_URL", "http://localhost:8000")
 
@@ -61,7 +63,8 @@ class ScheduleGenerationService:
             group_unavailability_service: GroupUnavailabilityService,
             # Saving services
             schedule_service: ScheduleService,
-            assignment_service: AssignmentService
+            assignment_service: AssignmentService,
+            schedule_diff_service: Optional[ScheduleDiffService] = None
     ):
         # Catalog
         self.group_service = group_service
@@ -80,6 +83,9 @@ class ScheduleGenerationService:
         # Saving
         self.schedule_service = schedule_service
         self.assignment_service = assignment_service
+        self.schedule_diff_service = schedule_diff_service
+        # Diff against the previously latest schedule, set by generate_and_save_schedule
+        self.last_diff: Optional[ScheduleDiffSummary] = None
 
         self.scheduler_url = SCHEDULER_URL
 
@@ -125,28 +131,30 @@ class ScheduleGenerationService:
             ]
             logger.info(f"Використано fallback слотів: {len(timeslots_all)}")
         
+        # Availability (as bitsets) and preferences of all teachers and groups, one batch each
+        codec = await self.timeslot_service.get_codec()
+        teacher_availability = await self.teacher_availability_service.get_bitsets(
+            [t.teacher_id for t in teachers_resp.teachers]
+        )
+        teacher_preferences = await self.teacher_preference_service.get_preferences_map(
+            [t.teacher_id for t in teachers_resp.teachers]
+        )
+
         teachers_payload = []
         for t in teachers_resp.teachers:
-            available_slots = await self.teacher_availability_service.get_teacher_availability_ids(t.teacher_id)
+            available_slots = codec.strings(teacher_availability.get(t.teacher_id, 0))
   
             if not available_slots:
                 available_slots = timeslots_all.copy()
                 logger.warning(f"⚠️  Викладач {t.last_name} {t.first_name} не має налаштованої доступності - вважаємо доступним у всіх {len(available_slots)} слотах")
             
-            prefs_dict = await self.teacher_preference_service.get_preferences(t.teacher_id)
-            
-            prefs_formatted = {}
-            if prefs_dict:
-                if "preferred_days" in prefs_dict and prefs_dict["preferred_days"]:
-                    prefs_formatted["preferred_days"] = prefs_dict["preferred_days"]
-                if "avoid_slots" in prefs_dict and prefs_dict["avoid_slots"]:
-                    prefs_formatted["avoid_slots"] = prefs_dict["avoid_slots"]
-            
+            prefs = teacher_preferences.get(t.teacher_id)
+
             teacher_entry = {
                 "id": str(t.teacher_id),
                 "name": f"{t.last_name} {t.first_name}",
                 "available": available_slots,
-                "prefs": prefs_formatted if prefs_formatted else {}
+                "prefs": prefs.solver_payload() if prefs else {}
             }
             teachers_payload.append(teacher_entry)
             
@@ -160,9 +168,11 @@ class ScheduleGenerationService:
         else:
             logger.warning("З БД не отримано жодної групи!")
 
+        group_unavailability = await self.group_unavailability_service.get_bitsets([g.group_id for g in groups_models])
+
         groups_payload = []
         for g in groups_models:
-            unavailable_slots = await self.group_unavailability_service.get_group_unavailability_ids(g.group_id)
+            unavailable_slots = codec.strings(group_unavailability.get(g.group_id, 0))
             
             group_entry = {
                 "id": str(g.group_id),
@@ -613,6 +623,7 @@ class ScheduleGenerationService:
                         logger.info("\n" + "=" * 80)
                         logger.info("=== ЗБЕРЕЖЕННЯ РЕЗУЛЬТАТУ В БД ===")
                         logger.info("=" * 80)
+                        previous_schedule = await self.schedule_service.find_latest_schedule()
                         new_schedule = await self.schedule_service.create_schedule(
                             label=schedule_label
                         )
@@ -632,6 +643,13 @@ class ScheduleGenerationService:
                         else:
                             logger.warning("  Немає призначень для збереження")
                             saved_assignments = []
+
+                        if self.schedule_diff_service:
+                            self.schedule_diff_service.remember(new_schedule.schedule_id, saved_assignments)
+                        if self.schedule_diff_service and previous_schedule:
+                            self.last_diff = await self.schedule_diff_service.summarize(
+                                previous_schedule.schedule_id, new_schedule.schedule_id
+                            )
                         
                         logger.info("\n" + "=" * 80)
                         logger.info("=== ГЕНЕРАЦІЯ РОЗКЛАДУ ЗАВЕРШЕНА ===")
@@ -0,0 +1,203 @@
+from typing import Dict, Mapping, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from app.schemas.teacher_preference import TeacherPreferences
+from app.services.schedule_snapshot import NO_ROOM, ScheduleSnapshot
+from app.services.timeslot_codec import DAY_NUMBERS, EVEN_WEEK, ODD_WEEK, TimeslotCodec
+
+_WEEKS = {"all": (ODD_WEEK, EVEN_WEEK), "odd": (ODD_WEEK,), "even": (EVEN_WEEK,)}
+
+
+def _cells_by_timeslot_id(codec: TimeslotCodec) -> Tuple[np.ndarray, np.ndarray]:
+    """The codec's cell_a/cell_b indexed by timeslot_id instead of ordinal."""
+    size = int(codec.ids.max()) + 1 if len(codec) else 1
+    cell_a = np.zeros(size, dtype=np.int64)
+    cell_b = np.zeros(size, dtype=np.int64)
+    cell_a[codec.ids] = codec.cell_a
+    cell_b[codec.ids] = codec.cell_b
+    return cell_a, cell_b
+
+
+def preference_masks(
+        teachers: Sequence[UUID],
+        preferences: Mapping[UUID, TeacherPreferences],
+        codec: TimeslotCodec
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Teacher preferences as boolean matrices aligned with `teachers`:
+    allowed days (n, 8), indexed by day, all True without `preferred_days`,
+    and avoided week cells (n, codec.n_cells). A lesson violates
+    `avoid_slots` when its cells intersect the avoided ones. The
+    preferences are typed projections, so every slot is well-formed.
+    """
+    allowed_days = np.ones((len(teachers), 8), dtype=bool)
+    avoided = np.zeros((len(teachers), codec.n_cells), dtype=bool)
+    for i, teacher_id in enumerate(teachers):
+        prefs = preferences.get(teacher_id)
+        if prefs is None:
+            continue
+        if prefs.preferred_days:
+            allowed_days[i] = False
+            allowed_days[i, [DAY_NUMBERS[d] for d in prefs.preferred_days]] = True
+        for slot in prefs.avoid_slots:
+            day, frequency, lesson = slot.split(".")
+            day, lesson, weeks = DAY_NUMBERS[day], int(lesson), _WEEKS[frequency]
+            if lesson <= codec.max_lesson:
+                base = ((day - 1) * codec.max_lesson + (lesson - 1)) * 2
+                avoided[i, [base + w for w in weeks]] = True
+    return allowed_days, avoided
+
+
+def _week_rows(cell_a: np.ndarray, cell_b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Expands lessons into week cells: (row index, cell). ALL lessons cover
+    two cells, ODD and EVEN lessons one.
+    """
+    split = np.flatnonzero(cell_a != cell_b)
+    rows = np.concatenate([np.arange(len(cell_a)), split])
+    return rows, np.concatenate([cell_a, cell_b[split]])
+
+
+def _day_profiles(entity: np.ndarray, n_entities: int, cell: np.ndarray, max_lesson: int) -> Dict[str, np.ndarray]:
+    """
+    Per entity: windows per week (mean of odd and even weeks), the most
+    windows on one day, days used and the spread of first and last lessons.
+    """
+    week, lesson = cell % 2, cell // 2 % max_lesson
+    day = cell // (2 * max_lesson)
+    # (entity, week, day) runs of sorted lessons, duplicates (parallel
+    # subgroups) dropped; the key space is small, so a dense mask is
+    # cheaper than sorting
+    present = np.zeros(n_entities * 14 * max_lesson, dtype=bool)
+    present[((entity.astype(np.int64) * 2 + week) * 7 + day) * max_lesson + lesson] = True
+    pairs = np.flatnonzero(present)
+    days, lessons = pairs // max_lesson, pairs % max_lesson
+    starts = np.flatnonzero(np.diff(days, prepend=-1))
+    ends = np.r_[starts[1:], len(days)][:len(starts)]
+    first, last = lessons[starts], lessons[ends - 1]
+    gaps = last - first + 1 - (ends - starts)
+    owner = days[starts] // 14
+    weekday = days[starts] % 7
+
+    windows = np.bincount(owner, weights=gaps, minlength=n_entities) / 2
+    day_used = np.zeros(n_entities * 7, dtype=bool)
+    day_used[owner * 7 + weekday] = True
+    days_used = day_used.reshape(n_entities, 7).sum(axis=1)
+
+    # Days are sorted by owner: reduce each owner's run of days
+    runs = np.flatnonzero(np.diff(owner, prepend=-1))
+    ids = owner[runs]
+    max_daily = np.zeros(n_entities, dtype=np.int64)
+    first_spread = np.zeros(n_entities, dtype=np.int64)
+    last_spread = np.zeros(n_entities, dtype=np.int64)
+    if len(runs):
+        max_daily[ids] = np.maximum.reduceat(gaps, runs)
+        first_spread[ids] = np.maximum.reduceat(first, runs) - np.minimum.reduceat(first, runs)
+        last_spread[ids] = np.maximum.reduceat(last, runs) - np.minimum.reduceat(last, runs)
+    return {
+        "windows": windows,
+        "max_daily_windows": max_daily,
+        "days_used": days_used,
+        "first_lesson_spread": first_spread,
+        "last_lesson_spread": last_spread,
+    }
+
+
+def _room_slack(
+        snapshot: ScheduleSnapshot,
+        rows: np.ndarray,
+        cell: np.ndarray,
+        n_cells: int,
+        group_size: np.ndarray,
+        room_capacity: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    Per room: week cells used, and capacity minus the summed size of the
+    groups in it (a split group counts with its share), min and mean, plus
+    cells where the room overflows.
+    """
+    n_rooms = len(snapshot.rooms)
+    # Subgroups per (group, course): the highest subgroup number scheduled
+    pair = snapshot.group.astype(np.int64) * max(len(snapshot.courses), 1) + snapshot.course
+    pairs, pair_index = np.unique(pair, return_inverse=True)
+    subgroups = np.ones(len(pairs), dtype=np.int64)
+    np.maximum.at(subgroups, pair_index, snapshot.subgroup_no)
+    attendees = -(-group_size[snapshot.group].astype(np.int64) // subgroups[pair_index])
+
+    in_room = snapshot.room[rows] != NO_ROOM
+    rows, cell = rows[in_room], cell[in_room]
+    key = snapshot.room[rows].astype(np.int64) * n_cells + cell
+    load = np.bincount(key, weights=attendees[rows], minlength=n_rooms * n_cells)
+    cells = np.flatnonzero(np.bincount(key, minlength=n_rooms * n_cells))
+    load = load[cells]
+    cell_room = cells // n_cells
+    slack = room_capacity[cell_room] - load
+
+    lessons = np.bincount(cell_room, minlength=n_rooms)
+    min_slack = np.zeros(n_rooms)
+    runs = np.flatnonzero(np.diff(cell_room, prepend=-1))
+    if len(runs):
+        min_slack[cell_room[runs]] = np.minimum.reduceat(slack, runs)
+    total_slack = np.bincount(cell_room, weights=slack, minlength=n_rooms)
+    return {
+        "lessons": lessons,
+        "min_slack": min_slack,
+        "mean_slack": np.divide(total_slack, lessons, out=np.zeros(n_rooms), where=lessons > 0),
+        "overflows": np.bincount(cell_room[slack < 0], minlength=n_rooms),
+    }
+
+
+def compute_metrics(
+        snapshot: ScheduleSnapshot,
+        codec: TimeslotCodec,
+        group_size: np.ndarray,
+        room_capacity: np.ndarray,
+        allowed_days: np.ndarray,
+        avoided_cells: np.ndarray
+) -> dict:
+    """
+    Quality metrics of a schedule in one vectorized pass over its snapshot.
+
+    `group_size`, `room_capacity` and the preference masks are aligned with
+    the snapshot's group, room and teacher dictionaries. Windows are idle
+    lessons between the first and the last lesson of a day, counted per
+    week cell so that odd/even lessons do not hide each other.
+    """
+    cell_a, cell_b = _cells_by_timeslot_id(codec)
+    cell_a, cell_b = cell_a[snapshot.timeslot], cell_b[snapshot.timeslot]
+    rows, cell = _week_rows(cell_a, cell_b)
+
+    groups = _day_profiles(snapshot.group[rows], len(snapshot.groups), cell, codec.max_lesson)
+    teachers = _day_profiles(snapshot.teacher[rows], len(snapshot.teachers), cell, codec.max_lesson)
+    teacher, day = snapshot.teacher, cell_a // (2 * codec.max_lesson) + 1
+    avoided = avoided_cells[teacher, cell_a] | avoided_cells[teacher, cell_b]
+    teachers["preferred_day_violations"] = np.bincount(
+        teacher[~allowed_days[teacher, day]], minlength=len(snapshot.teachers)
+    )
+    teachers["avoid_slot_violations"] = np.bincount(teacher[avoided], minlength=len(snapshot.teachers))
+    rooms = _room_slack(snapshot, rows, cell, codec.n_cells, group_size, room_capacity)
+    rooms["capacity"] = room_capacity
+
+    def entities(ids: np.ndarray, columns: Dict[str, np.ndarray]) -> list:
+        names = list(columns)
+        values = zip(*(columns[n].tolist() for n in names))
+        return [dict(zip(names, v), id=UUID(bytes=i.tobytes())) for i, v in zip(ids, values)]
+
+    return {
+        "assignments": len(snapshot),
+        "summary": {
+            "group_windows": float(groups["windows"].sum()),
+            "teacher_windows": float(teachers["windows"].sum()),
+            "preferred_day_violations": int(teachers["preferred_day_violations"].sum()),
+            "avoid_slot_violations": int(teachers["avoid_slot_violations"].sum()),
+            "room_overflows": int(rooms["overflows"].sum()),
+            "mean_room_slack": float(
+                (rooms["mean_slack"] * rooms["lessons"]).sum() / max(int(rooms["lessons"].sum()), 1)
+            ),
+        },
+        "groups": entities(snapshot.groups, groups),
+        "teachers": entities(snapshot.teachers, teachers),
+        "rooms": entities(snapshot.rooms, rooms),
+    }
@@ -0,0 +1,93 @@
+import logging
+import time
+from uuid import UUID
+
+import numpy as np
+from fastapi.encoders import jsonable_encoder
+
+from app.repositories.group_repository import GroupRepository
+from app.repositories.room_repository import RoomRepository
+from app.repositories.schedule_metrics_repository import ScheduleMetricsRepository
+from app.schemas.schedule_metrics import ScheduleMetricsResponse
+from app.services.schedule_metrics import compute_metrics, preference_masks
+from app.services.schedule_snapshot_service import ScheduleSnapshotService
+from app.services.teacher_preference_service import TeacherPreferenceService
+from app.services.timeslot_service import TimeslotService
+from app.utils.cache import TTLCache, schedule_versions
+
+logger = logging.getLogger(__name__)
+
+# (schedule_id, version) -> ScheduleMetricsResponse
+_metrics_cache = TTLCache(maxsize=64, ttl=600.0)
+
+
+def _uuids(values: np.ndarray) -> list:
+    return [UUID(bytes=v.tobytes()) for v in values]
+
+
+class ScheduleMetricsService:
+    """
+    Quality metrics of a schedule, computed with NumPy from its snapshot and
+    stored in `schedule_metrics` until the snapshot is rebuilt. Catalog
+    changes (group sizes, room capacities, preferences) do not invalidate
+    them; pass refresh=True to recompute.
+    """
+
+    def __init__(
+            self,
+            repo: ScheduleMetricsRepository,
+            snapshot_service: ScheduleSnapshotService,
+            timeslot_service: TimeslotService,
+            group_repo: GroupRepository,
+            room_repo: RoomRepository,
+            preference_service: TeacherPreferenceService
+    ):
+        self.repo = repo
+        self.snapshot_service = snapshot_service
+        self.timeslot_service = timeslot_service
+        self.group_repo = group_repo
+        self.room_repo = room_repo
+        self.preference_service = preference_service
+
+    async def get_metrics(self, schedule_id: UUID, refresh: bool = False) -> ScheduleMetricsResponse:
+        """Raises NoResultFound if the schedule does not exist."""
+        key = (schedule_id, schedule_versions.current(schedule_id))
+        if not refresh:
+            cached = _metrics_cache.get(key)
+            if cached is not None:
+                return cached
+            stored = await self.repo.find_current(schedule_id)
+            if stored is not None:
+                response = ScheduleMetricsResponse(
+                    schedule_id=schedule_id, computed_at=stored.computed_at, **stored.metrics
+                )
+                _metrics_cache.set(key, response)
+                return response
+
+        snapshot = await self.snapshot_service.load(schedule_id)
+        started = time.perf_counter()
+        groups, teachers, rooms = _uuids(snapshot.groups), _uuids(snapshot.teachers), _uuids(snapshot.rooms)
+        codec = await self.timeslot_service.get_codec()
+        sizes = await self.group_repo.find_sizes(groups)
+        capacities = await self.room_repo.find_capacities(rooms)
+        preferences = await self.preference_service.get_preferences_map(teachers)
+        allowed_days, avoided_cells = preference_masks(teachers, preferences, codec)
+        loaded = time.perf_counter()
+
+        metrics = compute_metrics(
+            snapshot,
+            codec,
+            group_size=np.array([sizes.get(g, 0) for g in groups], dtype=np.int64),
+            room_capacity=np.array([capacities.get(r, 0) for r in rooms], dtype=np.int64),
+            allowed_days=allowed_days,
+            avoided_cells=avoided_cells,
+        )
+        computed = time.perf_counter()
+        stored = await self.repo.upsert(schedule_id, jsonable_encoder(metrics))
+        logger.info(
+            f"Метрики розкладу {schedule_id}: {len(snapshot)} призначень, довідники "
+            f"{(loaded - started) * 1000:.1f} мс, обчислення {(computed - loaded) * 1000:.1f} мс"
+        )
+        response = ScheduleMetricsResponse(schedule_id=schedule_id, computed_at=stored.computed_at, **metrics)
+        _metrics_cache.set(key, response)
+        return response
@@ -0,0 +1,96 @@
+import logging
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy.exc import NoResultFound
+
+from app.db.models.scheduling.schedule import Schedule
+from app.repositories.assignment_partition_repository import AssignmentPartitionRepository
+from app.repositories.schedule_repository import ScheduleRepository
+from app.repositories.schedule_revision_repository import ScheduleRevisionRepository
+from app.schemas.assignment import AssignmentResponse
+from app.utils.cache import TTLCache, schedule_versions
+
+logger = logging.getLogger(__name__)
+
+# Schedules known to be materialized. A schedule never goes back to being a
+# delta-only revision, so entries cannot become wrong, only evicted.
+_materialized = TTLCache(maxsize=4096, ttl=3600.0)
+
+
+class ScheduleRevisionService:
+    """
+    Copy-on-write schedule revisions.
+
+    A revision starts as a pointer to its parent plus the assignments it
+    added, replaced or removed. Light reads (one group or teacher) merge
+    the chain on the fly; the first heavy read (whole-schedule views,
+    publishing, diffs) materializes the revision into `assignments`.
+    """
+
+    def __init__(
+            self,
+            repo: ScheduleRevisionRepository,
+            schedule_repo: ScheduleRepository,
+            partition_repo: Optional[AssignmentPartitionRepository] = None
+    ):
+        self.repo = repo
+        self.schedule_repo = schedule_repo
+        self.partition_repo = partition_repo
+
+    async def create_revision(self, parent_schedule_id: UUID, label: str) -> Schedule:
+        """
+        Creates an empty revision of the parent. Raises NoResultFound if the
+        parent does not exist and ValueError if the label is taken.
+        """
+        if not await self.schedule_repo.exists(parent_schedule_id):
+            raise NoResultFound("Schedule not found")
+        if await self.schedule_repo.find_by_label(label):
+            raise ValueError(f"Schedule with label '{label}' already exists")
+        schedule = await self.schedule_repo.create(
+            label=label, parent_schedule_id=parent_schedule_id, materialized=False
+        )
+        self.schedule_repo.after_commit(lambda: schedule_versions.bump(schedule.schedule_id))
+        logger.info(f"Створено ревізію {schedule.schedule_id} ('{label}') розкладу {parent_schedule_id}")
+        return schedule
+
+    async def get_chain(self, schedule_id: UUID) -> List:
+        chain = await self.repo.find_chain(schedule_id)
+        if not chain:
+            raise NoResultFound("Schedule not found")
+        return chain
+
+    async def get_assignments(
+            self,
+            schedule_id: UUID,
+            group_id: Optional[UUID] = None,
+            teacher_id: Optional[UUID] = None
+    ) -> List[AssignmentResponse]:
+        """Assignments of any schedule, merged through its revision chain if needed."""
+        rows = await self.repo.find_resolved(await self.get_chain(schedule_id), group_id, teacher_id)
+        return [AssignmentResponse.model_validate(row) for row in rows]
+
+    async def ensure_materialized(self, schedule_id: UUID) -> bool:
+        """
+        Makes sure the schedule's assignments are in `assignments`. Returns
+        True if it had to be materialized now. Raises NoResultFound if the
+        schedule does not exist.
+        """
+        if _materialized.get(schedule_id):
+            return False
+        chain = await self.get_chain(schedule_id)
+        # The flag may be this transaction's own write, so it is cached on commit
+        self.repo.after_commit(lambda: _materialized.set(schedule_id, True))
+        if chain[0].materialized:
+            return False
+
+        if self.partition_repo:
+            await self.partition_repo.create_partition(schedule_id)
+        count = await self.repo.materialize(chain)
+        self.repo.after_commit(lambda: schedule_versions.bump(schedule_id))
+        logger.info(f"Ревізію {schedule_id} матеріалізовано: {count} призначень (глибина {len(chain) - 1})")
+        return True
+
+    @staticmethod
+    def is_delta_only(chain: List) -> bool:
+        return bool(chain) and not chain[0].materialized
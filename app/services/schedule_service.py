@@ -1,8 +1,12 @@
 import logging
+import uuid
+from app.repositories.assignment_partition_repository import AssignmentPartitionRepository
 from app.repositories.schedule_repository import ScheduleRepository
 from app.db.models.scheduling.schedule import Schedule
+from typing import Optional
 from uuid import UUID
 from sqlalchemy.exc import NoResultFound
+from app.utils.cache import schedule_versions
 
 logger = logging.getLogger(__name__)
 
@@ -10,12 +14,18 @@ class ScheduleService:
     """
     Service for simple CRUD operations on the 'schedules' (parent) table.
     """
-    def __init__(self, repo: ScheduleRepository):
+    def __init__(self, repo: ScheduleRepository, partition_repo: Optional[AssignmentPartitionRepository] = None):
         self.repo = repo
+        self.partition_repo = partition_repo
 
     async def create_schedule(self, label: str) -> Schedule:
         logger.info(f"Створення розкладу в БД: label='{label}'")
-        schedule = await self.repo.create(label=label)
+        schedule_id = uuid.uuid4()
+        if self.partition_repo:
+            # Before the insert: the partition's foreign key locks `schedules`
+            await self.partition_repo.create_partition(schedule_id)
+        schedule = await self.repo.create(label=label, schedule_id=schedule_id)
+        self.repo.after_commit(lambda: schedule_versions.bump(schedule.schedule_id))
         logger.info(f"Розклад створено в БД: schedule_id={schedule.schedule_id}, label='{schedule.label}', created_at={schedule.created_at}")
         return schedule
 
@@ -31,3 +41,7 @@ class ScheduleService:
         if not schedule:
             raise NoResultFound("No schedules found")
         return schedule
+
+    async def find_latest_schedule(self) -> Optional[Schedule]:
+        """Like get_latest_schedule, but returns None when there are no schedules."""
+        return await self.repo.find_latest()
@@ -0,0 +1,198 @@
+import struct
+import zlib
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+
+SNAPSHOT_FORMAT = 1
+COURSE_TYPES = ("lec", "prac", "lab")
+NO_ROOM = -1
+
+_MAGIC = b"SSNP"
+# magic, format, rows, dictionary sizes (groups, courses, teachers, rooms)
+_HEADER = struct.Struct("<4sHxxIIIII")
+_ALIGN = 8
+
+# (assignment_id, timeslot_id, group_id, subgroup_no, course_id, teacher_id, room_id, course_type)
+AssignmentRow = Tuple[UUID, int, UUID, int, UUID, UUID, Optional[UUID], str]
+
+
+def _uuid_array(values: Sequence[UUID]) -> np.ndarray:
+    """UUIDs as an (n,) array of 16-byte void scalars, sortable and comparable."""
+    return np.frombuffer(b"".join(u.bytes for u in values), dtype="V16")
+
+
+def _encode(values: Sequence[UUID]) -> Tuple[np.ndarray, np.ndarray]:
+    """Dictionary-encodes UUIDs: (sorted unique values, int32 index per value)."""
+    if not values:
+        return np.empty(0, dtype="V16"), np.empty(0, dtype=np.int32)
+    uniques, inverse = np.unique(_uuid_array(values), return_inverse=True)
+    return uniques, inverse.astype(np.int32)
+
+
+def _pad(length: int) -> int:
+    return -length % _ALIGN
+
+
+class ScheduleSnapshot:
+    """
+    A schedule's assignments as parallel NumPy columns.
+
+    Group, course, teacher and room columns hold int32 indices into the
+    matching dictionary of UUIDs (rooms use NO_ROOM for remote lessons),
+    course types index COURSE_TYPES. Arrays unpacked from a payload are
+    read-only views into the decompressed buffer.
+    """
+
+    def __init__(
+            self,
+            assignment_ids: np.ndarray,
+            timeslot: np.ndarray,
+            group: np.ndarray,
+            subgroup_no: np.ndarray,
+            course: np.ndarray,
+            teacher: np.ndarray,
+            room: np.ndarray,
+            course_type: np.ndarray,
+            groups: np.ndarray,
+            courses: np.ndarray,
+            teachers: np.ndarray,
+            rooms: np.ndarray,
+    ):
+        self.assignment_ids = assignment_ids
+        self.timeslot = timeslot
+        self.group = group
+        self.subgroup_no = subgroup_no
+        self.course = course
+        self.teacher = teacher
+        self.room = room
+        self.course_type = course_type
+        self.groups = groups
+        self.courses = courses
+        self.teachers = teachers
+        self.rooms = rooms
+
+    def __len__(self) -> int:
+        return len(self.timeslot)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[AssignmentRow]) -> "ScheduleSnapshot":
+        rows = list(rows)
+        columns = list(zip(*rows)) if rows else [()] * 8
+        assignment_ids, timeslots, group_ids, subgroups, course_ids, teacher_ids, room_ids, types = columns
+
+        groups, group = _encode(group_ids)
+        courses, course = _encode(course_ids)
+        teachers, teacher = _encode(teacher_ids)
+        with_room = [i for i, r in enumerate(room_ids) if r is not None]
+        rooms, room_index = _encode([room_ids[i] for i in with_room])
+        room = np.full(len(rows), NO_ROOM, dtype=np.int32)
+        room[with_room] = room_index
+
+        type_codes = {t: i for i, t in enumerate(COURSE_TYPES)}
+        return cls(
+            assignment_ids=_uuid_array(assignment_ids) if rows else np.empty(0, dtype="V16"),
+            timeslot=np.array(timeslots, dtype=np.int32),
+            group=group,
+            subgroup_no=np.array(subgroups, dtype=np.int16),
+            course=course,
+            teacher=teacher,
+            room=room,
+            course_type=np.array([type_codes[t] for t in types], dtype=np.uint8),
+            groups=groups,
+            courses=courses,
+            teachers=teachers,
+            rooms=rooms,
+        )
+
+    @classmethod
+    def from_assignments(cls, assignments: Iterable) -> "ScheduleSnapshot":
+        return cls.from_rows(
+            (a.assignment_id, a.timeslot_id, a.group_id, a.subgroup_no,
+             a.course_id, a.teacher_id, a.room_id, a.course_type)
+            for a in assignments
+        )
+
+    def _sections(self) -> List[np.ndarray]:
+        # Order matters: unpack_snapshot reads them back in the same order
+        return [
+            self.groups, self.courses, self.teachers, self.rooms, self.assignment_ids,
+            self.timeslot, self.group, self.course, self.teacher, self.room,
+            self.subgroup_no, self.course_type,
+        ]
+
+    def rows(self) -> Iterator[AssignmentRow]:
+        """Decodes the columns back into assignment tuples."""
+        def uuids(values: np.ndarray) -> List[UUID]:
+            return [UUID(bytes=v.tobytes()) for v in values]
+
+        groups, courses, teachers, rooms = (uuids(d) for d in (self.groups, self.courses, self.teachers, self.rooms))
+        for i, assignment_id in enumerate(uuids(self.assignment_ids)):
+            room = int(self.room[i])
+            yield (
+                assignment_id,
+                int(self.timeslot[i]),
+                groups[self.group[i]],
+                int(self.subgroup_no[i]),
+                courses[self.course[i]],
+                teachers[self.teacher[i]],
+                rooms[room] if room != NO_ROOM else None,
+                COURSE_TYPES[self.course_type[i]],
+            )
+
+
+def pack_snapshot(snapshot: ScheduleSnapshot, level: int = 1) -> bytes:
+    """
+    Header plus 8-byte aligned raw column buffers, zlib-compressed. A low
+    level is enough: random UUIDs barely compress and the index columns
+    compress well at any level, while the snapshot is rebuilt on every edit.
+    """
+    header = _HEADER.pack(
+        _MAGIC, SNAPSHOT_FORMAT, len(snapshot),
+        len(snapshot.groups), len(snapshot.courses), len(snapshot.teachers), len(snapshot.rooms),
+    )
+    parts = [header + b"\0" * _pad(len(header))]
+    for array in snapshot._sections():
+        data = np.ascontiguousarray(array).tobytes()
+        parts.append(data + b"\0" * _pad(len(data)))
+    return zlib.compress(b"".join(parts), level)
+
+
+def unpack_snapshot(payload: bytes) -> ScheduleSnapshot:
+    """
+    Inverse of pack_snapshot. After decompression no data is copied: every
+    column is an np.frombuffer view at its offset in the buffer.
+    """
+    buffer = zlib.decompress(payload)
+    magic, format, n, n_groups, n_courses, n_teachers, n_rooms = _HEADER.unpack_from(buffer)
+    if magic != _MAGIC or format != SNAPSHOT_FORMAT:
+        raise ValueError(f"Unsupported snapshot format {format}")
+
+    offset = _HEADER.size + _pad(_HEADER.size)
+    layout = [
+        ("V16", n_groups), ("V16", n_courses), ("V16", n_teachers), ("V16", n_rooms), ("V16", n),
+        (np.int32, n), (np.int32, n), (np.int32, n), (np.int32, n), (np.int32, n),
+        (np.int16, n), (np.uint8, n),
+    ]
+    arrays = []
+    for dtype, count in layout:
+        array = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+        arrays.append(array)
+        offset += array.nbytes + _pad(array.nbytes)
+
+    groups, courses, teachers, rooms, assignment_ids, timeslot, group, course, teacher, room, subgroup_no, course_type = arrays
+    return ScheduleSnapshot(
+        assignment_ids=assignment_ids,
+        timeslot=timeslot,
+        group=group,
+        subgroup_no=subgroup_no,
+        course=course,
+        teacher=teacher,
+        room=room,
+        course_type=course_type,
+        groups=groups,
+        courses=courses,
+        teachers=teachers,
+        rooms=rooms,
+    )
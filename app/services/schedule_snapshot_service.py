@@ -0,0 +1,85 @@
+import logging
+import time
+from typing import Iterable, Optional
+from uuid import UUID
+
+from app.repositories.assignment_repository import AssignmentRepository
+from app.repositories.schedule_snapshot_repository import ScheduleSnapshotRepository
+from app.services.schedule_revision_service import ScheduleRevisionService
+from app.services.schedule_snapshot import SNAPSHOT_FORMAT, ScheduleSnapshot, pack_snapshot, unpack_snapshot
+from app.utils.cache import TTLCache, schedule_versions
+
+logger = logging.getLogger(__name__)
+
+# (schedule_id, version) -> ScheduleSnapshot; decompressed columns are small
+# (~50 bytes per assignment), so a handful of schedules fit comfortably
+_snapshots = TTLCache(maxsize=16, ttl=300.0)
+# schedule_id -> version at which this process last wrote the stored snapshot
+_stored_versions = TTLCache(maxsize=4096, ttl=3600.0)
+
+
+class ScheduleSnapshotService:
+    """
+    Whole-schedule loads for in-process computations (analytics, metrics,
+    exports) from the packed columnar snapshot stored with each schedule.
+    """
+
+    def __init__(
+            self,
+            repo: ScheduleSnapshotRepository,
+            assignment_repo: AssignmentRepository,
+            revision_service: Optional[ScheduleRevisionService] = None
+    ):
+        self.repo = repo
+        self.assignment_repo = assignment_repo
+        self.revision_service = revision_service
+
+    async def store(self, schedule_id: UUID, assignments: Iterable) -> ScheduleSnapshot:
+        """Packs already loaded assignments (e.g. right after saving them)."""
+        return await self._store(schedule_id, ScheduleSnapshot.from_assignments(assignments))
+
+    async def refresh(self, schedule_id: UUID) -> ScheduleSnapshot:
+        """Rebuilds the snapshot from `assignments` (after edits)."""
+        rows = await self.assignment_repo.find_rows_by_schedule_id(schedule_id)
+        return await self._store(schedule_id, ScheduleSnapshot.from_rows(rows))
+
+    async def _store(self, schedule_id: UUID, snapshot: ScheduleSnapshot) -> ScheduleSnapshot:
+        started = time.perf_counter()
+        payload = pack_snapshot(snapshot)
+        await self.repo.upsert(schedule_id, SNAPSHOT_FORMAT, len(snapshot), payload)
+
+        def publish():
+            # Registered after the writer's version bump, so this is the new version
+            version = schedule_versions.current(schedule_id)
+            _snapshots.set((schedule_id, version), snapshot)
+            _stored_versions.set(schedule_id, version)
+
+        self.repo.after_commit(publish)
+        logger.debug(
+            f"Snapshot for schedule {schedule_id}: {len(snapshot)} assignments, "
+            f"{len(payload)} bytes in {(time.perf_counter() - started) * 1000:.1f} ms"
+        )
+        return snapshot
+
+    async def load(self, schedule_id: UUID) -> ScheduleSnapshot:
+        """
+        The schedule's assignments as NumPy columns: from memory, then from
+        the stored snapshot, building it when missing. Once this process has
+        seen the schedule change, the stored snapshot is only trusted if it
+        was rewritten at the current version.
+        Raises NoResultFound if the schedule does not exist.
+        """
+        if self.revision_service:
+            await self.revision_service.ensure_materialized(schedule_id)
+        version = schedule_versions.current(schedule_id)
+        key = (schedule_id, version)
+        snapshot = _snapshots.get(key)
+        if snapshot is not None:
+            return snapshot
+
+        payload = await self.repo.find_payload(schedule_id, SNAPSHOT_FORMAT)
+        if payload is None or (version and _stored_versions.get(schedule_id) != version):
+            return await self.refresh(schedule_id)
+        snapshot = unpack_snapshot(payload)
+        _snapshots.set(key, snapshot)
+        return snapshot
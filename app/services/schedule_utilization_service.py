@@ -0,0 +1,89 @@
+import logging
+from typing import Optional
+from uuid import UUID
+
+from app.repositories.assignment_repository import (
+    UTILIZATION_BY_GROUP_DAY,
+    UTILIZATION_BY_SLOT,
+    UTILIZATION_BY_TEACHER,
+    AssignmentRepository,
+)
+from app.repositories.room_repository import RoomRepository
+from app.schemas.schedule_utilization import (
+    GroupDayLoad,
+    ScheduleUtilizationResponse,
+    SlotUtilization,
+    TeacherLoad,
+)
+from app.services.schedule_revision_service import ScheduleRevisionService
+from app.utils.cache import TTLCache, schedule_versions
+
+logger = logging.getLogger(__name__)
+
+# (schedule_id, version, filters) -> ScheduleUtilizationResponse
+_utilization_cache = TTLCache(maxsize=256, ttl=300.0)
+
+
+class ScheduleUtilizationService:
+    """
+    Utilization heat maps of a schedule: room occupancy per day and lesson,
+    teacher load by week parity and group lessons per day, aggregated in
+    the database with one GROUPING SETS query per filter combination.
+    """
+
+    def __init__(
+            self,
+            assignment_repo: AssignmentRepository,
+            room_repo: RoomRepository,
+            revision_service: Optional[ScheduleRevisionService] = None
+    ):
+        self.assignment_repo = assignment_repo
+        self.room_repo = room_repo
+        self.revision_service = revision_service
+
+    async def get_utilization(
+            self,
+            schedule_id: UUID,
+            min_capacity: Optional[int] = None,
+            max_capacity: Optional[int] = None,
+            group_type: Optional[str] = None,
+            group_course: Optional[int] = None,
+            teacher_id: Optional[UUID] = None
+    ) -> ScheduleUtilizationResponse:
+        """Raises NoResultFound if the schedule does not exist."""
+        if self.revision_service:
+            await self.revision_service.ensure_materialized(schedule_id)
+        filters = (min_capacity, max_capacity, group_type, group_course, teacher_id)
+        key = (schedule_id, schedule_versions.current(schedule_id), filters)
+        cached = _utilization_cache.get(key)
+        if cached is not None:
+            return cached
+
+        rows = await self.assignment_repo.find_utilization(schedule_id, *filters)
+        rooms_total = await self.room_repo.count(min_capacity, max_capacity)
+
+        slots, teachers, groups = [], [], []
+        for row in rows:
+            if row.grouping_set == UTILIZATION_BY_SLOT:
+                occupancy = (row.rooms_odd + row.rooms_even) / (2 * rooms_total) if rooms_total else 0.0
+                slots.append(SlotUtilization(
+                    day=row.day, lesson_id=row.lesson_id,
+                    lessons_odd=row.lessons_odd, lessons_even=row.lessons_even,
+                    rooms_odd=row.rooms_odd, rooms_even=row.rooms_even,
+                    occupancy=round(occupancy, 4),
+                ))
+            elif row.grouping_set == UTILIZATION_BY_TEACHER:
+                teachers.append(TeacherLoad(teacher_id=row.teacher_id, odd=row.lessons_odd, even=row.lessons_even))
+            elif row.grouping_set == UTILIZATION_BY_GROUP_DAY:
+                groups.append(GroupDayLoad(
+                    group_id=row.group_id, day=row.day, odd=row.lessons_odd, even=row.lessons_even
+                ))
+        slots.sort(key=lambda s: (s.day, s.lesson_id))
+        groups.sort(key=lambda g: (str(g.group_id), g.day))
+        teachers.sort(key=lambda t: str(t.teacher_id))
+
+        response = ScheduleUtilizationResponse(
+            schedule_id=schedule_id, rooms_total=rooms_total, slots=slots, teachers=teachers, groups=groups
+        )
+        _utilization_cache.set(key, response)
+        return response
@@ -0,0 +1,32 @@
+import logging
+import time
+from typing import Optional, Sequence
+
+from app.repositories.search_repository import SEARCH_SOURCES, SearchRepository
+from app.schemas.search import SearchHit, SearchResponse, SearchType
+
+logger = logging.getLogger(__name__)
+
+# Shorter queries have no trigram to match on and would scan every source
+MIN_QUERY_LENGTH = 3
+
+
+class SearchService:
+    """Admin lookup of people and catalog entries by partial name or email."""
+
+    def __init__(self, repo: SearchRepository):
+        self.repo = repo
+
+    async def search(self, q: str, types: Optional[Sequence[SearchType]] = None, limit: int = 5) -> SearchResponse:
+        """
+        Top `limit` matches of each requested type (all if None), merged by
+        score. Raises ValueError if `q` is shorter than MIN_QUERY_LENGTH once
+        surrounding whitespace is stripped.
+        """
+        q = q.strip()
+        if len(q) < MIN_QUERY_LENGTH:
+            raise ValueError(f"q must have at least {MIN_QUERY_LENGTH} characters besides surrounding whitespace")
+        started = time.perf_counter()
+        rows = await self.repo.search(q, types or list(SEARCH_SOURCES), limit)
+        logger.debug(f"Пошук '{q}': {len(rows)} результатів за {(time.perf_counter() - started) * 1000:.1f} мс")
+        return SearchResponse(query=q, results=[SearchHit.model_validate(row._mapping) for row in rows])
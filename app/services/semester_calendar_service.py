@@ -0,0 +1,232 @@
+import datetime
+import logging
+import time
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy.exc import NoResultFound
+
+from app.db.models.scheduling.semester_calendar import SemesterCalendar
+from app.repositories.semester_calendar_repository import SemesterCalendarRepository
+from app.schemas.semester_calendar import (
+    LessonOccurrence,
+    NextLessonsResponse,
+    OccurrencesResponse,
+    SemesterCalendarCreate,
+    SemesterCalendarListResponse,
+    SemesterCalendarResponse,
+    SemesterCalendarUpdate,
+)
+from app.services.schedule_calendar import OccurrenceIndex, semester_days
+from app.services.published_schedule_service import DEFAULT_SCOPE
+from app.services.timetable_service import TimetableService
+from app.utils.cache import TTLCache, schedule_versions
+from app.utils.unset import UNSET
+
+logger = logging.getLogger(__name__)
+
+# calendar_id or ("date", day) -> SemesterCalendar; the TTL bounds staleness
+# for changes made by other worker processes
+_calendar_cache = TTLCache(maxsize=256, ttl=60.0)
+# (schedule_id, version, catalog version, calendar_id, calendar updated_at) -> OccurrenceIndex
+_occurrence_cache = TTLCache(maxsize=32, ttl=600.0)
+
+
+class SemesterCalendarService:
+    """
+    Semester calendars and the dated occurrences of a schedule's lessons.
+
+    A schedule is expanded over a calendar once per (schedule version,
+    calendar version) into an OccurrenceIndex; date-range queries are then
+    answered from the cached index without touching the database.
+    """
+
+    def __init__(self, repo: SemesterCalendarRepository, timetable_service: Optional[TimetableService] = None):
+        self.repo = repo
+        self.timetable_service = timetable_service
+
+    async def list_calendars(self) -> SemesterCalendarListResponse:
+        calendars = await self.repo.find_all()
+        return SemesterCalendarListResponse(
+            calendars=[SemesterCalendarResponse.model_validate(c) for c in calendars],
+            total=len(calendars),
+        )
+
+    async def get_calendar(self, calendar_id: UUID) -> Optional[SemesterCalendarResponse]:
+        calendar = await self._find(calendar_id)
+        return SemesterCalendarResponse.model_validate(calendar) if calendar else None
+
+    async def create_calendar(self, data: SemesterCalendarCreate) -> SemesterCalendarResponse:
+        """Raises ValueError if the name is taken."""
+        if await self.repo.find_by_name(data.name):
+            raise ValueError(f"Semester calendar '{data.name}' already exists")
+        calendar = await self.repo.create(
+            name=data.name,
+            start_date=data.start_date,
+            end_date=data.end_date,
+            parity_anchor=data.parity_anchor or data.start_date,
+            holidays=sorted(set(data.holidays)),
+        )
+        self.repo.after_commit(_calendar_cache.invalidate)
+        return SemesterCalendarResponse.model_validate(calendar)
+
+    async def update_calendar(
+            self, calendar_id: UUID, data: SemesterCalendarUpdate
+    ) -> Optional[SemesterCalendarResponse]:
+        """Returns None if the calendar does not exist; raises ValueError on a taken name or bad dates."""
+        existing = await self.repo.find_by_id(calendar_id)
+        if existing is None:
+            return None
+        values = {
+            field: value for field, value in data.model_dump().items()
+            if value is not UNSET and value is not None
+        }
+        if "name" in values and values["name"] != existing.name:
+            if await self.repo.find_by_name(values["name"]):
+                raise ValueError(f"Semester calendar '{values['name']}' already exists")
+        if values.get("end_date", existing.end_date) < values.get("start_date", existing.start_date):
+            raise ValueError("endDate must not be before startDate")
+        if "holidays" in values:
+            values["holidays"] = sorted(set(values["holidays"]))
+
+        calendar = await self.repo.update(calendar_id, **values)
+        self.repo.after_commit(_calendar_cache.invalidate)
+        return SemesterCalendarResponse.model_validate(calendar) if calendar else None
+
+    async def delete_calendar(self, calendar_id: UUID) -> bool:
+        deleted = await self.repo.delete(calendar_id)
+        if deleted:
+            self.repo.after_commit(_calendar_cache.invalidate)
+        return deleted
+
+    async def _find(self, calendar_id: UUID) -> Optional[SemesterCalendar]:
+        calendar = _calendar_cache.get(calendar_id)
+        if calendar is None:
+            calendar = await self.repo.find_by_id(calendar_id)
+            if calendar is not None:
+                _calendar_cache.set(calendar_id, calendar)
+        return calendar
+
+    async def resolve_calendar(self, day: datetime.date, calendar_id: Optional[UUID] = None) -> SemesterCalendar:
+        """
+        The given calendar, or the one whose semester contains `day`.
+        Raises NoResultFound if there is none.
+        """
+        if calendar_id is not None:
+            calendar = await self._find(calendar_id)
+            if calendar is None:
+                raise NoResultFound(f"Semester calendar with id {calendar_id} not found")
+            return calendar
+        key = ("date", day)
+        # A one-element tuple, so that "no calendar" is cached too
+        cached = _calendar_cache.get(key)
+        if cached is None:
+            cached = (await self.repo.find_by_date(day),)
+            _calendar_cache.set(key, cached)
+        if cached[0] is None:
+            raise NoResultFound(f"No semester calendar covers {day.isoformat()}")
+        return cached[0]
+
+    async def get_index(self, schedule_id: UUID, calendar: SemesterCalendar) -> OccurrenceIndex:
+        """
+        The schedule expanded over the calendar, built on first use.
+        Raises NoResultFound if the schedule does not exist.
+        """
+        key = (
+            schedule_id,
+            schedule_versions.current(schedule_id),
+            TimetableService.catalog_version,
+            calendar.calendar_id,
+            calendar.updated_at,
+        )
+        index = _occurrence_cache.get(key)
+        if index is not None:
+            return index
+
+        entries = await self.timetable_service.get_schedule_timetable(schedule_id)
+        started = time.perf_counter()
+        days = semester_days(calendar.start_date, calendar.end_date, calendar.parity_anchor, calendar.holidays)
+        index = OccurrenceIndex(entries, *days)
+        logger.info(
+            f"Розклад {schedule_id} розгорнуто за календарем '{calendar.name}': "
+            f"{len(index)} занять, {(time.perf_counter() - started) * 1000:.1f} мс"
+        )
+        _occurrence_cache.set(key, index)
+        return index
+
+    async def get_occurrences(
+            self,
+            schedule_id: UUID,
+            date_from: datetime.date,
+            date_to: Optional[datetime.date] = None,
+            calendar_id: Optional[UUID] = None,
+            group_id: Optional[UUID] = None,
+            teacher_id: Optional[UUID] = None,
+            room_id: Optional[UUID] = None
+    ) -> OccurrencesResponse:
+        """
+        Lessons held from date_from to date_to (a single day if omitted).
+        Without a calendar the one containing date_from is used. Raises
+        NoResultFound if the schedule or the calendar does not exist.
+        """
+        date_to = date_to or date_from
+        calendar = await self.resolve_calendar(date_from, calendar_id)
+        index = await self.get_index(schedule_id, calendar)
+        pairs = index.between(
+            date_from,
+            date_to,
+            group_ids=[group_id] if group_id is not None else None,
+            teacher_id=teacher_id,
+            room_id=room_id,
+        )
+        return OccurrencesResponse(
+            schedule_id=schedule_id,
+            calendar_id=calendar.calendar_id,
+            date_from=date_from,
+            date_to=date_to,
+            occurrences=[LessonOccurrence(date=day, **entry.model_dump()) for day, entry in pairs],
+        )
+
+    async def get_next_lessons(
+            self, user_id: UUID, at: Optional[datetime.datetime] = None, scope: str = DEFAULT_SCOPE
+    ) -> Optional[NextLessonsResponse]:
+        """
+        The user's lessons in progress at `at` (server time by default) and
+        the next ones, for the student's group chain or the teacher. Returns
+        None if the user does not exist; raises NoResultFound if there is no
+        schedule or no calendar covering the day.
+
+        Once the user, the schedule and its expansion are cached this makes
+        no queries: a warm lookup is two binary searches in the user's
+        timeline.
+        """
+        context = await self.timetable_service.get_user_context(user_id)
+        if context is None:
+            return None
+        schedule_id = await self.timetable_service.resolve_schedule_id(scope)
+        if schedule_id is None:
+            raise NoResultFound(f"No schedule published for scope '{scope}'")
+        await self.timetable_service.ensure_entries(schedule_id)
+
+        at = at or datetime.datetime.now()
+        if at.tzinfo is not None:
+            at = at.astimezone().replace(tzinfo=None)
+        calendar = await self.resolve_calendar(at.date())
+        index = await self.get_index(schedule_id, calendar)
+        if context.teacher_id is not None:
+            timeline = index.timeline(teacher_id=context.teacher_id)
+        else:
+            timeline = index.timeline(group_ids=context.group_ids)
+        current, upcoming = timeline.at(at)
+
+        def occurrences(pairs) -> list:
+            return [LessonOccurrence(date=start.date(), **entry.model_dump()) for start, entry in pairs]
+
+        return NextLessonsResponse(
+            role=context.role,
+            schedule_id=schedule_id,
+            calendar_id=calendar.calendar_id,
+            at=at,
+            current=occurrences(current),
+            upcoming=occurrences(upcoming),
+        )
@@ -1,7 +1,16 @@
 from uuid import UUID
-from typing import List
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy.exc import NoResultFound
 
 from app.repositories.availability_repository import AvailabilityRepository
+from app.schemas.availability import (
+    AvailabilityMatrix,
+    AvailabilityMatrixUpdate,
+    AvailabilityMatrixUpdateResult,
+    MatrixEncoding,
+)
+from app.services.availability_matrix import decode_update, encode_matrix, load_bitsets
 from app.services.timeslot_service import TimeslotService
 
 
@@ -23,17 +32,53 @@ class TeacherAvailabilityService:
         Returns a list of formatted timeslot strings (e.g., 'mon.all.1')
         that the teacher is available for.
         """
-        # 1. Get raw DB IDs
-        db_ids = await self.repo.get_teacher_availability(teacher_id)
-
-        # 2. Get map to convert to strings
-        id_map = await self.timeslot_service.get_id_map()
+        codec = await self.timeslot_service.get_codec()
+        bitsets = await self.get_bitsets([teacher_id])
+        return codec.strings(bitsets.get(teacher_id, 0))
 
-        # 3. Convert
-        return [id_map[tid] for tid in db_ids if tid in id_map]
+    async def get_bitsets(self, teacher_ids: Optional[Iterable[UUID]] = None) -> Dict[UUID, int]:
+        """
+        Availability of the given teachers (all if None) as bitsets over the
+        timeslot codec's ordinals. 0 means no availability is configured.
+        """
+        return await load_bitsets(
+            await self.timeslot_service.get_codec(),
+            teacher_ids,
+            self.repo.get_teacher_availability_bits,
+            self.repo.get_teacher_availability_matrix,
+            self.repo.save_teacher_availability_bits,
+        )
 
     async def set_availability(self, teacher_id: UUID, timeslot_ids: List[int]):
         """
         Updates the availability for a teacher.
         """
+        codec = await self.timeslot_service.get_codec()
         await self.repo.set_teacher_availability(teacher_id, timeslot_ids)
+        mask = codec.mask(t for t in timeslot_ids if t in codec)
+        await self.repo.save_teacher_availability_bits({teacher_id: codec.to_bits(mask)}, codec.key)
+
+    async def get_matrix(
+            self, teacher_ids: Optional[List[UUID]] = None, encoding: MatrixEncoding = "bitmask"
+    ) -> AvailabilityMatrix:
+        """Availability of the given teachers (all if None) as a teacher x timeslot matrix."""
+        bitsets = await self.get_bitsets(teacher_ids)
+        return encode_matrix(await self.timeslot_service.get_codec(), bitsets, encoding)
+
+    async def apply_matrix(self, update: AvailabilityMatrixUpdate) -> AvailabilityMatrixUpdateResult:
+        """
+        Replaces the availability of the teachers in the update, touching
+        only the cells that change. Raises ValueError on a stale or
+        malformed matrix and NoResultFound for unknown teachers.
+        """
+        codec = await self.timeslot_service.get_codec()
+        cells = decode_update(codec, update)
+        known = await self.repo.get_teacher_availability_bits(cells, codec.key)
+        missing = [str(teacher_id) for teacher_id in cells if teacher_id not in known]
+        if missing:
+            raise NoResultFound(f"Teachers not found: {', '.join(missing)}")
+        added, removed = await self.repo.apply_teacher_availability(cells)
+        await self.repo.save_teacher_availability_bits(
+            {teacher_id: codec.to_bits(codec.mask(ids)) for teacher_id, ids in cells.items()}, codec.key
+        )
+        return AvailabilityMatrixUpdateResult(added=added, removed=removed)
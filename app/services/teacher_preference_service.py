@@ -1,7 +1,21 @@
 from uuid import UUID
-from typing import Dict, Any
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy.exc import IntegrityError, NoResultFound
 
 from app.repositories.availability_repository import AvailabilityRepository
+from app.schemas.teacher import TeacherListResponse, TeacherResponse
+from app.schemas.teacher_preference import TeacherPreferences
+
+
+def overlapping_slots(slot: str) -> List[str]:
+    """
+    Slot identifiers that share a week cell with `slot`: an ALL-weeks slot
+    overlaps its ODD and EVEN halves and vice versa.
+    """
+    day, frequency, lesson = slot.split(".")
+    frequencies = ("all", "odd", "even") if frequency == "all" else (frequency, "all")
+    return [f"{day}.{f}.{lesson}" for f in frequencies]
 
 
 class TeacherPreferenceService:
@@ -11,8 +25,34 @@ class TeacherPreferenceService:
     def __init__(self, availability_repo: AvailabilityRepository):
         self.repo = availability_repo
 
-    async def get_preferences(self, teacher_id: UUID) -> Dict[str, Any]:
-        return await self.repo.get_teacher_preferences(teacher_id)
+    async def get_preferences(self, teacher_id: UUID) -> TeacherPreferences:
+        return TeacherPreferences.project(await self.repo.get_teacher_preferences(teacher_id))
+
+    async def get_preferences_map(self, teacher_ids: Iterable[UUID]) -> Dict[UUID, TeacherPreferences]:
+        """
+        Preferences of several teachers in one query. Teachers without a
+        record are absent from the result.
+        """
+        blobs = await self.repo.get_teachers_preferences(teacher_ids)
+        return {teacher_id: TeacherPreferences.project(blob) for teacher_id, blob in blobs.items()}
+
+    async def update_preferences(self, teacher_id: UUID, prefs: TeacherPreferences) -> TeacherPreferences:
+        """
+        Stores validated preferences in their normalized form, replacing
+        the previous blob. Raises NoResultFound for an unknown teacher.
+        """
+        try:
+            await self.repo.upsert_teacher_preferences(teacher_id, prefs.model_dump())
+        except IntegrityError:
+            raise NoResultFound(f"Teacher with id {teacher_id} not found")
+        return prefs
 
-    async def update_preferences(self, teacher_id: UUID, prefs: Dict[str, Any]):
-        await self.repo.upsert_teacher_preferences(teacher_id, prefs)
+    async def find_teachers(
+            self, avoid_slot: Optional[str] = None, preferred_day: Optional[str] = None
+    ) -> TeacherListResponse:
+        """Teachers who avoid a slot overlapping `avoid_slot` and/or prefer `preferred_day`."""
+        avoid_any = overlapping_slots(avoid_slot) if avoid_slot else ()
+        teachers = await self.repo.find_teachers_by_preferences(avoid_any, preferred_day)
+        return TeacherListResponse(
+            teachers=[TeacherResponse.model_validate(t) for t in teachers], total=len(teachers)
+        )
@@ -1,20 +1,33 @@
 from typing import Optional
 import uuid
 
+from app.db.models.common_enums import TeacherStatus
+from app.repositories.pagination import TotalMode
 from app.repositories.teacher_repository import TeacherRepository
+from app.repositories.timetable_entry_repository import TimetableEntryRepository
 from app.schemas.teacher import TeacherCreate, TeacherUpdate, TeacherResponse, TeacherListResponse
+from app.services.timetable_service import TimetableService
 
 
 class TeacherService:
-    def __init__(self, repo: TeacherRepository):
+    def __init__(self, repo: TeacherRepository, entries_repo: Optional[TimetableEntryRepository] = None):
         self._repository = repo
+        self.entries_repo = entries_repo
 
-    async def get_all_teachers(self) -> TeacherListResponse:
-        teachers = await self._repository.find_all()
-        total = await self._repository.count()
+    async def get_all_teachers(
+            self,
+            limit: Optional[int] = None,
+            cursor: Optional[str] = None,
+            sort: str = "name",
+            status: Optional[TeacherStatus] = None,
+            total: TotalMode = "exact"
+    ) -> TeacherListResponse:
+        """A page of teachers (all of them without a limit). Raises ValueError on a bad sort or cursor."""
+        page = await self._repository.find_page(limit, cursor, sort, status=status, total=total)
         return TeacherListResponse(
-            teachers=[TeacherResponse.model_validate(teacher) for teacher in teachers],
-            total=total
+            teachers=[TeacherResponse.model_validate(row.Teacher) for row in page.rows],
+            total=page.total,
+            next_cursor=page.next_cursor,
         )
 
     async def get_teacher_by_id(self, teacher_id: uuid.UUID) -> Optional[TeacherResponse]:
@@ -51,6 +64,8 @@ class TeacherService:
         )
 
         if teacher:
+            if self.entries_repo and await self.entries_repo.rename_teacher(teacher_id):
+                self.entries_repo.after_commit(TimetableService.invalidate_all)
             return TeacherResponse.model_validate(teacher)
         return None
 
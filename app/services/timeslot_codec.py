@@ -0,0 +1,142 @@
+import hashlib
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from app.db.models.common_enums import TimeslotFrequency
+
+DAY_NAMES = {1: "mon", 2: "tue", 3: "wed", 4: "thu", 5: "fri", 6: "sat", 7: "sun"}
+DAY_NUMBERS = {name: day for day, name in DAY_NAMES.items()}
+
+ODD_WEEK = 0
+EVEN_WEEK = 1
+
+
+def _frequency_value(frequency) -> str:
+    return frequency.value if hasattr(frequency, "value") else str(frequency).upper()
+
+
+class TimeslotCodec:
+    """
+    Dense encoding of the timeslot catalog.
+
+    Every timeslot gets an ordinal (sorted by day, lesson and frequency) and
+    is mapped onto "week cells": one cell per (day, lesson, week parity). An
+    ALL-weeks timeslot covers both the odd and the even cell of its
+    (day, lesson), an ODD or EVEN timeslot covers exactly one. Two timeslots
+    overlap in time iff their cells intersect, which lets occupancy and
+    conflict checks run on plain integer arrays.
+    """
+
+    def __init__(self, timeslots: Iterable):
+        rows = sorted(
+            (
+                (ts.day, ts.lesson_id, _frequency_value(ts.frequency), ts.timeslot_id)
+                for ts in timeslots
+            ),
+            key=lambda r: (r[0], r[1], r[2]),
+        )
+        self.max_lesson = max((r[1] for r in rows), default=1)
+        self.n_cells = 7 * self.max_lesson * 2
+
+        self.ids = np.array([r[3] for r in rows], dtype=np.int64)
+        self.days = np.array([r[0] for r in rows], dtype=np.int16)
+        self.lessons = np.array([r[1] for r in rows], dtype=np.int16)
+        self.frequencies: List[str] = [r[2] for r in rows]
+        self._ordinals: Dict[int, int] = {int(tid): i for i, tid in enumerate(self.ids)}
+
+        base = ((self.days.astype(np.int64) - 1) * self.max_lesson + (self.lessons - 1)) * 2
+        is_even = np.array([f == TimeslotFrequency.EVEN.value for f in self.frequencies], dtype=bool)
+        is_odd = np.array([f == TimeslotFrequency.ODD.value for f in self.frequencies], dtype=bool)
+        # cell_a/cell_b: the cells covered by each ordinal (equal for ODD/EVEN slots)
+        self.cell_a = np.where(is_even, base + EVEN_WEEK, base + ODD_WEEK)
+        self.cell_b = np.where(is_odd, base + ODD_WEEK, base + EVEN_WEEK)
+
+        # Fingerprint of the ordinal order; stored bitmasks are only valid for the same key
+        self.key = hashlib.md5(",".join(str(int(t)) for t in self.ids).encode()).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, timeslot_id: int) -> bool:
+        return timeslot_id in self._ordinals
+
+    def ordinal(self, timeslot_id: int) -> int:
+        """Dense index of a timeslot; raises KeyError for unknown IDs."""
+        return self._ordinals[timeslot_id]
+
+    def ordinals(self, timeslot_ids: Sequence[int]) -> np.ndarray:
+        return np.fromiter((self._ordinals[t] for t in timeslot_ids), dtype=np.int64, count=len(timeslot_ids))
+
+    def cells(self, timeslot_id: int) -> Tuple[int, ...]:
+        """Week cells covered by the timeslot (one or two)."""
+        i = self._ordinals[timeslot_id]
+        a, b = int(self.cell_a[i]), int(self.cell_b[i])
+        return (a,) if a == b else (a, b)
+
+    def ordinals_for_day(self, day: int) -> np.ndarray:
+        return np.flatnonzero(self.days == day)
+
+    def to_string(self, timeslot_id: int) -> str:
+        """Solver identifier of the timeslot, e.g. 'mon.all.1'."""
+        i = self._ordinals[timeslot_id]
+        return f"{DAY_NAMES.get(int(self.days[i]), 'unknown')}.{self.frequencies[i].lower()}.{int(self.lessons[i])}"
+
+    def mask(self, timeslot_ids: Iterable[int]) -> int:
+        """Bitmask with bit i set for ordinal i; raises KeyError for unknown IDs."""
+        mask = 0
+        for timeslot_id in timeslot_ids:
+            mask |= 1 << self._ordinals[timeslot_id]
+        return mask
+
+    def timeslot_ids(self, mask: int) -> List[int]:
+        """Timeslot IDs of the set bits, in ordinal order. Raises ValueError for bits past the catalog."""
+        if mask < 0 or mask >> len(self.ids):
+            raise ValueError(f"Mask has bits outside the {len(self.ids)} timeslots")
+        return [int(self.ids[i]) for i in range(mask.bit_length()) if mask >> i & 1]
+
+    def to_bits(self, mask: int) -> str:
+        """Bitmask as a bit string over all ordinals, ordinal 0 first (PostgreSQL bit varying text)."""
+        return format(mask, f"0{len(self.ids)}b")[::-1] if self.ids.size else ""
+
+    def from_bits(self, bits: str) -> int:
+        """Inverse of to_bits; raises ValueError if the length does not match the catalog."""
+        if len(bits) != len(self.ids):
+            raise ValueError(f"Bit string of {len(bits)} bits for {len(self.ids)} timeslots")
+        return int(bits[::-1], 2) if bits else 0
+
+    def strings(self, mask: int) -> List[str]:
+        """Solver identifiers of the set bits, in ordinal order."""
+        return [self.to_string(timeslot_id) for timeslot_id in self.timeslot_ids(mask)]
+
+
+def mask_to_runs(mask: int) -> List[Tuple[int, int]]:
+    """(start ordinal, length) of every run of consecutive set bits."""
+    runs = []
+    i = 0
+    while mask >> i:
+        # Trailing zeros of the rest: the gap before the next run
+        rest = mask >> i
+        i += (rest & -rest).bit_length() - 1
+        # Trailing zeros of the complement: the length of the run
+        rest = ~mask >> i
+        length = (rest & -rest).bit_length() - 1
+        runs.append((i, length))
+        i += length
+    return runs
+
+
+def runs_to_mask(runs: Iterable[Tuple[int, int]], size: int) -> int:
+    """
+    Inverse of mask_to_runs over `size` ordinals; raises ValueError on
+    negative starts or lengths and on runs past the last ordinal, before
+    any bits are shifted.
+    """
+    mask = 0
+    for start, length in runs:
+        if start < 0 or length < 0:
+            raise ValueError("Runs must have non-negative starts and lengths")
+        if start + length > size:
+            raise ValueError(f"Run ({start}, {length}) is outside the {size} timeslots")
+        mask |= ((1 << length) - 1) << start
+    return mask
@@ -1,6 +1,11 @@
 from typing import List, Dict
 
 from app.repositories.timeslot_repository import TimeslotRepository
+from app.services.timeslot_codec import TimeslotCodec
+from app.utils.cache import TTLCache
+
+# The timeslot catalog is tiny and practically static; share the codec across requests.
+_codec_cache = TTLCache(maxsize=1, ttl=600.0)
 
 
 class TimeslotService:
@@ -66,3 +71,13 @@ class TimeslotService:
             mapping[fmt_id] = ts.timeslot_id
 
         return mapping
+
+    async def get_codec(self) -> TimeslotCodec:
+        """
+        Returns the (process-cached) dense codec of the timeslot catalog.
+        """
+        codec = _codec_cache.get("codec")
+        if codec is None:
+            codec = TimeslotCodec(await self.repo.find_all())
+            _codec_cache.set("codec", codec)
+        return codec
@@ -0,0 +1,212 @@
+import logging
+from typing import List, NamedTuple, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.exc import NoResultFound
+
+from app.db.models.people.user import UserRole
+from app.repositories.timetable_entry_repository import TimetableEntryRepository
+from app.repositories.timetable_repository import TimetableRepository
+from app.services.published_schedule_service import DEFAULT_SCOPE, PublishedScheduleService
+from app.services.schedule_revision_service import ScheduleRevisionService
+from app.schemas.timetable import TimetableEntry, TimetableResponse
+from app.utils.cache import TTLCache, schedule_versions
+
+logger = logging.getLogger(__name__)
+
+# Shared across requests: (user_id, schedule_id, version) -> TimetableResponse.
+# The TTL bounds staleness for changes made by other worker processes.
+_timetable_cache = TTLCache(maxsize=4096, ttl=60.0)
+# epoch -> latest materialized schedule ID (the fallback when nothing is published)
+_latest_schedule = TTLCache(maxsize=1, ttl=60.0)
+# (schedule_id, version) -> True once the schedule's timetable_entries are known to be built
+_built_entries = TTLCache(maxsize=1024, ttl=600.0)
+# user_id -> UserContext; the TTL bounds staleness after group or role changes
+_user_contexts = TTLCache(maxsize=16384, ttl=300.0)
+
+
+class UserContext(NamedTuple):
+    """Whose lessons a user sees: the student's group chain or the teacher."""
+    role: UserRole
+    group_ids: Tuple[UUID, ...]
+    teacher_id: Optional[UUID]
+
+
+class TimetableService:
+    """
+    Service for personal ("my") timetables of students and teachers.
+    """
+
+    # Bumped by invalidate_all(), for caches built from entries elsewhere
+    catalog_version = 0
+
+    def __init__(
+            self,
+            repo: TimetableRepository,
+            published_service: Optional[PublishedScheduleService] = None,
+            revision_service: Optional[ScheduleRevisionService] = None,
+            entries_repo: Optional[TimetableEntryRepository] = None
+    ):
+        self.repo = repo
+        self.published_service = published_service
+        self.revision_service = revision_service
+        self.entries_repo = entries_repo
+
+    @staticmethod
+    def _cache_key(user_id: UUID, schedule_id: Optional[UUID]) -> tuple:
+        if schedule_id is None:
+            # "Latest" can change whenever any schedule is written
+            return user_id, None, schedule_versions.epoch
+        return user_id, schedule_id, schedule_versions.current(schedule_id)
+
+    @classmethod
+    def invalidate_all(cls) -> None:
+        """Drops cached timetables (catalog renames do not change schedule versions)."""
+        _timetable_cache.invalidate()
+        cls.catalog_version += 1
+
+    @staticmethod
+    def invalidate_user_contexts() -> None:
+        """Drops cached user contexts, e.g. after students changed groups in bulk."""
+        _user_contexts.invalidate()
+
+    @staticmethod
+    def _entry(row) -> TimetableEntry:
+        return TimetableEntry(
+            assignment_id=row.assignment_id,
+            timeslot_id=row.timeslot_id,
+            day=row.day,
+            lesson_id=row.lesson_id,
+            frequency=row.frequency.value if hasattr(row.frequency, "value") else str(row.frequency),
+            start_time=row.start_time,
+            end_time=row.end_time,
+            group_id=row.group_id,
+            group_name=row.group_name,
+            subgroup_no=row.subgroup_no,
+            course_id=row.course_id,
+            course_name=row.course_name,
+            course_type=row.course_type,
+            teacher_id=row.teacher_id,
+            teacher_name=row.teacher_name,
+            room_id=row.room_id,
+            room_name=row.room_name,
+        )
+
+    async def _latest_schedule_id(self) -> Optional[UUID]:
+        epoch = schedule_versions.epoch
+        cached = _latest_schedule.get(epoch)
+        if cached is None:
+            # A one-element tuple, so that "no schedules" is cached too
+            cached = (await self.repo.find_latest_schedule_id(),)
+            _latest_schedule.invalidate()
+            _latest_schedule.set(epoch, cached)
+        return cached[0]
+
+    async def resolve_schedule_id(self, scope: str = DEFAULT_SCOPE) -> Optional[UUID]:
+        """The schedule published in `scope`, else the latest one; cached, so usually no query."""
+        schedule_id = None
+        if self.published_service is not None:
+            schedule_id = await self.published_service.resolve(scope)
+        if schedule_id is None:
+            schedule_id = await self._latest_schedule_id()
+        return schedule_id
+
+    async def get_user_context(self, user_id: UUID) -> Optional[UserContext]:
+        """The user's role, group chain and teacher ID, or None if the user does not exist or is inactive."""
+        context = _user_contexts.get(user_id)
+        if context is None:
+            rows = await self.repo.find_user_context(user_id)
+            if not rows:
+                return None
+            context = UserContext(
+                role=rows[0].role,
+                group_ids=tuple(row.group_id for row in rows if row.group_id is not None),
+                teacher_id=rows[0].teacher_id,
+            )
+            _user_contexts.set(user_id, context)
+        return context
+
+    async def ensure_entries(self, schedule_id: UUID) -> None:
+        """
+        Makes sure the schedule is materialized and its timetable_entries
+        exist, building them on first read (e.g. for clones and restored
+        schedules). Concurrent first reads wait on the schedule's row and
+        only the first builds; schedules without lessons are marked built
+        too. Raises NoResultFound if the schedule does not exist.
+        """
+        if self.revision_service is not None:
+            await self.revision_service.ensure_materialized(schedule_id)
+        if self.entries_repo is None:
+            return
+        key = (schedule_id, schedule_versions.current(schedule_id))
+        if _built_entries.get(key):
+            return
+        if await self.entries_repo.is_built(schedule_id):
+            _built_entries.set(key, True)
+            return
+        # Not cached until a later call sees the committed marker
+        count = await self.entries_repo.build_missing(schedule_id)
+        if count is not None:
+            logger.info(f"Timetable entries for schedule {schedule_id} built: {count} rows")
+
+    async def get_user_timetable(
+            self, user_id: UUID, schedule_id: Optional[UUID] = None, scope: str = DEFAULT_SCOPE
+    ) -> Optional[TimetableResponse]:
+        """
+        Returns the timetable for the user, or None if the user does not exist.
+        Without an explicit schedule the one published in `scope` is used,
+        falling back to the latest schedule when nothing is published.
+        Results are cached per (user, schedule version).
+        """
+        if schedule_id is None:
+            schedule_id = await self.resolve_schedule_id(scope)
+        if schedule_id is not None:
+            try:
+                await self.ensure_entries(schedule_id)
+            except NoResultFound:
+                return None
+
+        key = self._cache_key(user_id, schedule_id)
+        cached = _timetable_cache.get(key)
+        if cached is not None:
+            return cached
+
+        rows = await self.repo.find_for_user(user_id, schedule_id)
+        if not rows:
+            return None
+
+        first = rows[0]
+        entries = [self._entry(row) for row in rows if row.assignment_id is not None]
+        timetable = TimetableResponse(
+            role=first.role,
+            schedule_id=first.schedule_id,
+            schedule_label=first.schedule_label,
+            group_id=first.user_group_id,
+            teacher_id=first.user_teacher_id,
+            entries=entries,
+        )
+        _timetable_cache.set(key, timetable)
+        logger.debug(f"Timetable for user {user_id} built: {len(entries)} entries")
+        return timetable
+
+    async def get_schedule_timetable(
+            self,
+            schedule_id: UUID,
+            group_id: Optional[UUID] = None,
+            teacher_id: Optional[UUID] = None,
+            room_id: Optional[UUID] = None,
+            day: Optional[int] = None
+    ) -> List[TimetableEntry]:
+        """
+        Timetable of a schedule for a group, teacher or room, read from
+        timetable_entries alone. Raises NoResultFound if the schedule does not exist.
+        """
+        await self.ensure_entries(schedule_id)
+        rows = await self.entries_repo.find_entries(
+            schedule_id,
+            group_ids=[group_id] if group_id is not None else None,
+            teacher_id=teacher_id,
+            room_id=room_id,
+            day=day,
+        )
+        return [self._entry(row) for row in rows]
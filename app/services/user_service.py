@@ -1,6 +1,8 @@
 from typing import Optional
 import uuid
 
+from app.db.models.people.user import UserRole
+from app.repositories.pagination import TotalMode
 from app.repositories.user_repository import UserRepository
 from app.schemas.user import UserResponse, UserListResponse
 
@@ -9,12 +11,21 @@ class UserService:
     def __init__(self, repo: UserRepository):
         self._repository = repo
 
-    async def get_all_users(self) -> UserListResponse:
-        users = await self._repository.find_all()
-        total = len(users)
+    async def get_all_users(
+            self,
+            limit: Optional[int] = None,
+            cursor: Optional[str] = None,
+            sort: str = "name",
+            role: Optional[UserRole] = None,
+            is_active: Optional[bool] = None,
+            total: TotalMode = "exact"
+    ) -> UserListResponse:
+        """A page of users (all of them without a limit). Raises ValueError on a bad sort or cursor."""
+        page = await self._repository.find_page(limit, cursor, sort, role=role, is_active=is_active, total=total)
         return UserListResponse(
-            users=[UserResponse.model_validate(user) for user in users],
-            total=total
+            users=[UserResponse.model_validate(row.User) for row in page.rows],
+            total=page.total,
+            next_cursor=page.next_cursor,
         )
 
     async def get_user_by_id(self, user_id: uuid.UUID) -> Optional[UserResponse]:
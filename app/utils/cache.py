@@ -0,0 +1,73 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+from uuid import UUID
+
+
+class TTLCache:
+    """
+    Small process-local LRU cache with per-entry expiry.
+
+    Entries are evicted when they are older than `ttl` seconds or when the
+    cache grows beyond `maxsize` (least recently used first).
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> None:
+        """Drops every entry whose key matches `predicate` (all entries if omitted)."""
+        if predicate is None:
+            self._data.clear()
+            return
+        for key in [k for k in self._data if predicate(k)]:
+            del self._data[key]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class ScheduleVersions:
+    """
+    Process-local version counters for schedules.
+
+    Every write that changes what a schedule looks like (new schedule,
+    saved or edited assignments) bumps the schedule's own counter and the
+    global `epoch` once its transaction commits (see
+    app.db.session.after_commit). Caches key their entries on these values,
+    so a bump makes stale entries unreachable without explicit invalidation.
+    """
+
+    def __init__(self):
+        self.epoch = 0
+        self._versions: Dict[UUID, int] = {}
+
+    def current(self, schedule_id: UUID) -> int:
+        return self._versions.get(schedule_id, 0)
+
+    def bump(self, schedule_id: Optional[UUID] = None) -> None:
+        self.epoch += 1
+        if schedule_id is not None:
+            self._versions[schedule_id] = self._versions.get(schedule_id, 0) + 1
+
+
+schedule_versions = ScheduleVersions()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Throughput of the bulk catalog import on a synthetic faculty of --rows rows
+(rooms, courses, teachers, groups with subgroups and both kinds of links),
+phase by phase: COPY into staging, set-based validation and the upserts.
+The same bundle is then imported a second time, which exercises the update
+path. For comparison, --baseline rooms, courses, groups and teachers are
+created one by one through the regular services, as the per-entity POST
+endpoints do. Everything runs in one transaction that is rolled back.
+
+    python -m benchmarks.catalog_import --rows 10000 --baseline 500
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+
+from sqlalchemy import text
+
+from app.db.session import async_session_maker
+from app.repositories.catalog_import_repository import STAGING_TABLES, CatalogImportRepository
+from app.repositories.course_repository import CourseRepository
+from app.repositories.group_repository import GroupRepository
+from app.repositories.room_repository import RoomRepository
+from app.repositories.teacher_repository import TeacherRepository
+from app.schemas.catalog_import import CatalogImportBundle
+from app.schemas.course import CourseCreate
+from app.schemas.group import GroupCreate
+from app.schemas.room import RoomCreate
+from app.schemas.teacher import TeacherCreate
+from app.services.catalog_import_service import bundle_records
+from app.services.course_service import CourseService
+from app.services.group_service import GroupService
+from app.services.room_service import RoomService
+from app.services.teacher_service import TeacherService
+
+
+def synthetic_bundle(rows: int, tag: str) -> CatalogImportBundle:
+    """About 5% rooms, 15% courses, 15% teachers, 15% groups and the rest links."""
+    n_rooms, n_courses, n_teachers, n_groups = (max(1, int(rows * share)) for share in (0.05, 0.15, 0.15, 0.15))
+    n_links = max(0, rows - n_rooms - n_courses - n_teachers - n_groups)
+
+    courses = [f"{tag} course {i}" for i in range(n_courses)]
+    teachers = [(f"Name{i}", f"{tag}-Surname{i}", f"Patronymic{i}") for i in range(n_teachers)]
+    # Every third group is a subgroup of the group before it
+    groups = []
+    for i in range(n_groups):
+        parent = groups[-1]["name"] if i % 3 == 2 else None
+        groups.append({
+            "name": f"{tag}-G{i}", "size": 15 if parent else 30,
+            "type": random.choice(["bachelor", "master"]), "course": random.randint(1, 6), "parent": parent,
+        })
+
+    group_courses = {(random.choice(groups)["name"], random.choice(courses)) for _ in range(n_links // 2)}
+    teacher_courses = {(random.choice(teachers), random.choice(courses)) for _ in range(n_links - n_links // 2)}
+    return CatalogImportBundle(
+        rooms=[{"name": f"{tag}-R{i}", "capacity": random.choice([20, 30, 60, 120])} for i in range(n_rooms)],
+        courses=[{"name": name, "duration": 60, "code": f"{tag}-C{i}"} for i, name in enumerate(courses)],
+        teachers=[{"first_name": f, "last_name": l, "patronymic": p} for f, l, p in teachers],
+        groups=groups,
+        group_courses=[{"group": g, "course": c, "count_per_week": 2} for g, c in group_courses],
+        teacher_courses=[
+            {"first_name": f, "last_name": l, "patronymic": p, "course": c} for (f, l, p), c in teacher_courses
+        ],
+    )
+
+
+async def timed_import(repo: CatalogImportRepository, bundle: CatalogImportBundle, label: str) -> None:
+    records = bundle_records(bundle)
+    rows = sum(len(section) for section in records.values())
+    started = time.perf_counter()
+    await repo.stage(records)
+    staged = time.perf_counter()
+    errors = await repo.validate()
+    validated = time.perf_counter()
+    if errors:
+        raise SystemExit(f"Synthetic bundle failed validation: {errors[:5]}")
+    counts = await repo.upsert()
+    finished = time.perf_counter()
+
+    total = finished - started
+    print(f"{label}: {rows} rows in {total * 1000:.0f} ms ({rows / total:.0f} rows/s) - "
+          f"copy {(staged - started) * 1000:.0f} ms, validation {(validated - staged) * 1000:.0f} ms, "
+          f"upsert {(finished - validated) * 1000:.0f} ms")
+    print("    " + ", ".join(f"{section} +{inserted}/~{updated}" for section, (inserted, updated) in counts.items()))
+
+
+async def baseline(session, n: int, tag: str) -> None:
+    """Per-entity creates through the services, as the single-row endpoints do."""
+    rooms, courses = RoomService(RoomRepository(session)), CourseService(CourseRepository(session))
+    groups, teachers = GroupService(GroupRepository(session)), TeacherService(TeacherRepository(session))
+    started = time.perf_counter()
+    for i in range(n):
+        await rooms.create_room(RoomCreate(name=f"{tag}-b-R{i}", capacity=30))
+        await courses.create_course(CourseCreate(name=f"{tag} b-course {i}", duration=60))
+        await groups.create_group(GroupCreate(name=f"{tag}-b-G{i}", size=30))
+        await teachers.create_teacher(
+            TeacherCreate(first_name=f"Name{i}", last_name=f"{tag}-b-Surname{i}", patronymic="P")
+        )
+    elapsed = time.perf_counter() - started
+    print(f"per-entity baseline: {n * 4} rows in {elapsed * 1000:.0f} ms ({n * 4 / elapsed:.0f} rows/s)")
+
+
+async def run(args) -> None:
+    tag = uuid.uuid4().hex[:6]
+    bundle = synthetic_bundle(args.rows, tag)
+    async with async_session_maker() as session:
+        try:
+            repo = CatalogImportRepository(session)
+            await timed_import(repo, bundle, "first import")
+            # Staging tables live until commit; drop them to stage the bundle again
+            for name, _ in STAGING_TABLES.values():
+                await session.execute(text(f"DROP TABLE {name}"))
+            await timed_import(repo, bundle, "re-import")
+            if args.baseline:
+                await baseline(session, args.baseline, tag)
+        finally:
+            await session.rollback()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000, help="Rows in the synthetic bundle")
+    parser.add_argument("--baseline", type=int, default=500,
+                        help="Rooms, courses, groups and teachers each to create one by one (0 to skip)")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Latency of "my current/next lesson" lookups on synthetic data, as served by
+GET /api/me/next once warm: a schedule of --entries lessons is expanded over
+an 18-week semester, then --requests lookups for random groups and teachers
+run with --concurrency of them in flight on one event loop. "service" is
+the lookup itself, "end-to-end" adds the time a request waits for the loop.
+
+    python -m benchmarks.next_lessons --entries 20000 --requests 20000 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import datetime
+import random
+import statistics
+import time
+import uuid
+
+from app.schemas.semester_calendar import LessonOccurrence
+from app.schemas.timetable import TimetableEntry
+from app.services.schedule_calendar import OccurrenceIndex, semester_days
+
+START = datetime.date(2026, 9, 1)
+END = START + datetime.timedelta(weeks=18)
+LESSON_STARTS = [datetime.time(8, 30), datetime.time(10, 0), datetime.time(11, 40),
+                 datetime.time(13, 30), datetime.time(15, 0), datetime.time(16, 40)]
+
+
+def synthetic_entries(n: int, groups: list, teachers: list, rooms: list) -> list:
+    entries = []
+    for _ in range(n):
+        lesson_id = random.randint(1, len(LESSON_STARTS))
+        start = LESSON_STARTS[lesson_id - 1]
+        entries.append(TimetableEntry(
+            assignment_id=uuid.uuid4(),
+            timeslot_id=random.randint(1, 90),
+            day=random.randint(1, 5),
+            lesson_id=lesson_id,
+            frequency=random.choice(["ALL", "ALL", "ODD", "EVEN"]),
+            start_time=start,
+            end_time=(datetime.datetime.combine(START, start) + datetime.timedelta(minutes=80)).time(),
+            group_id=random.choice(groups),
+            group_name="group",
+            subgroup_no=1,
+            course_id=uuid.uuid4(),
+            course_name="course",
+            course_type="lec",
+            teacher_id=random.choice(teachers),
+            teacher_name="teacher",
+            room_id=random.choice(rooms),
+            room_name="room",
+        ))
+    return entries
+
+
+async def lookup(index: OccurrenceIndex, groups: list, teachers: list, samples: list, service: list) -> None:
+    started = time.perf_counter()
+    await asyncio.sleep(0)
+    serving = time.perf_counter()
+    if random.random() < 0.8:
+        timeline = index.timeline(group_ids=[random.choice(groups)])
+    else:
+        timeline = index.timeline(teacher_id=random.choice(teachers))
+    moment = datetime.datetime.combine(
+        START + datetime.timedelta(days=random.randrange((END - START).days)),
+        datetime.time(random.randint(7, 19), random.randrange(60)),
+    )
+    current, upcoming = timeline.at(moment)
+    [LessonOccurrence(date=s.date(), **e.model_dump()) for s, e in current + upcoming]
+    finished = time.perf_counter()
+    samples.append((finished - started) * 1000)
+    service.append((finished - serving) * 1000)
+
+
+async def run(args) -> None:
+    groups = [uuid.uuid4() for _ in range(args.groups)]
+    teachers = [uuid.uuid4() for _ in range(args.teachers)]
+    rooms = [uuid.uuid4() for _ in range(100)]
+    entries = synthetic_entries(args.entries, groups, teachers, rooms)
+
+    started = time.perf_counter()
+    index = OccurrenceIndex(entries, *semester_days(START, END, START))
+    built = time.perf_counter()
+    for group_id in groups:
+        index.timeline(group_ids=[group_id])
+    for teacher_id in teachers:
+        index.timeline(teacher_id=teacher_id)
+    warmed = time.perf_counter()
+    print(f"entries: {len(entries)}, occurrences: {len(index)}, groups: {len(groups)}, teachers: {len(teachers)}")
+    print(f"expansion: {(built - started) * 1000:.1f} ms, all timelines: {(warmed - built) * 1000:.1f} ms")
+
+    samples: list = []
+    service: list = []
+    pending = set()
+    for _ in range(args.requests):
+        if len(pending) >= args.concurrency:
+            _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        pending.add(asyncio.create_task(lookup(index, groups, teachers, samples, service)))
+    await asyncio.wait(pending)
+
+    print(f"lookups: {len(samples)} at concurrency {args.concurrency}")
+    for label, values in (("service", service), ("end-to-end", samples)):
+        values.sort()
+        p = lambda q: values[min(int(len(values) * q), len(values) - 1)]
+        print(f"{label:>10}: p50 {statistics.median(values):.3f} ms, p95 {p(0.95):.3f} ms, "
+              f"p99 {p(0.99):.3f} ms, max {values[-1]:.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=20000, help="Timetable entries of the schedule")
+    parser.add_argument("--groups", type=int, default=400, help="Synthetic groups")
+    parser.add_argument("--teachers", type=int, default=600, help="Synthetic teachers")
+    parser.add_argument("--requests", type=int, default=20000, help="Lookups to time")
+    parser.add_argument("--concurrency", type=int, default=200, help="Lookups in flight at once")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Schedule quality metrics on synthetic data: one compute_metrics pass over a
+snapshot of --rows assignments, 5 days x 6 lessons x ALL/ODD/EVEN timeslots.
+
+    python -m benchmarks.schedule_metrics --rows 50000
+"""
+
+import argparse
+import random
+import statistics
+import time
+import uuid
+from types import SimpleNamespace
+
+import numpy as np
+
+from app.services.schedule_metrics import compute_metrics, preference_masks
+from app.services.schedule_snapshot import ScheduleSnapshot
+from app.services.timeslot_codec import TimeslotCodec
+from benchmarks.schedule_snapshots import synthetic_rows
+
+
+def synthetic_timeslots() -> list:
+    frequencies = ("ALL", "ODD", "EVEN")
+    return [
+        SimpleNamespace(timeslot_id=i + 1, day=i // 18 + 1, lesson_id=i // 3 % 6 + 1, frequency=frequencies[i % 3])
+        for i in range(90)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50000, help="Synthetic assignments")
+    parser.add_argument("--repeats", type=int, default=10, help="Runs to take the median of")
+    args = parser.parse_args()
+
+    codec = TimeslotCodec(synthetic_timeslots())
+    snapshot = ScheduleSnapshot.from_rows(synthetic_rows(args.rows))
+    teachers = [uuid.UUID(bytes=t.tobytes()) for t in snapshot.teachers]
+    preferences = {
+        t: {"preferred_days": random.sample(["mon", "tue", "wed", "thu", "fri"], 3), "avoid_slots": ["mon.all.1"]}
+        for t in teachers
+    }
+    allowed_days, avoided = preference_masks(teachers, preferences, codec)
+    group_size = np.random.randint(10, 35, len(snapshot.groups))
+    room_capacity = np.random.randint(20, 150, len(snapshot.rooms))
+
+    samples = []
+    for _ in range(args.repeats):
+        started = time.perf_counter()
+        metrics = compute_metrics(snapshot, codec, group_size, room_capacity, allowed_days, avoided)
+        samples.append((time.perf_counter() - started) * 1000)
+    print(f"assignments: {len(snapshot)}, groups: {len(snapshot.groups)}, "
+          f"teachers: {len(snapshot.teachers)}, rooms: {len(snapshot.rooms)}")
+    print(f"compute_metrics median: {statistics.median(samples):.1f} ms")
+    print(metrics["summary"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Storage and read latency of a delta-only schedule revision compared with
+a full copy of the same schedule.
+
+Creates a full clone and a revision of the source, records changes for a
+fraction of the revision's assignments (room reassignments and removals),
+then reports the bytes each one stores and the latency of group reads and
+whole-schedule reads, followed by the cost of materializing the revision.
+Everything runs in one transaction that is rolled back at the end.
+
+    python -m benchmarks.schedule_revisions --source <schedule_id> --changed 0.05
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+from sqlalchemy import text
+
+from app.db.session import async_session_maker
+from app.repositories.assignment_partition_repository import AssignmentPartitionRepository
+from app.repositories.assignment_repository import AssignmentRepository
+from app.repositories.constraint_repository import ConstraintRepository
+from app.repositories.schedule_repository import ScheduleRepository
+from app.repositories.schedule_revision_repository import ScheduleRevisionRepository
+from app.services.schedule_clone_service import ScheduleCloneService
+from app.services.schedule_revision_service import ScheduleRevisionService
+from benchmarks.timetable_reads import timed
+
+
+async def stored_bytes(session, table: str, schedule_id: uuid.UUID) -> int:
+    result = await session.execute(
+        text(f"SELECT coalesce(sum(pg_column_size(t.*)), 0) FROM {table} t WHERE schedule_id = :sid"),
+        {"sid": schedule_id},
+    )
+    return int(result.scalar())
+
+
+async def run(source_id: uuid.UUID, changed: float, repeats: int) -> None:
+    async with async_session_maker() as session:
+        schedule_repo = ScheduleRepository(session)
+        assignment_repo = AssignmentRepository(session)
+        partition_repo = AssignmentPartitionRepository(session)
+        revision_repo = ScheduleRevisionRepository(session)
+        revision_service = ScheduleRevisionService(revision_repo, schedule_repo, partition_repo)
+        clone_service = ScheduleCloneService(
+            schedule_repo, assignment_repo, ConstraintRepository(session), partition_repo, revision_service
+        )
+
+        source = await assignment_repo.find_by_schedule_id(source_id)
+        if not source:
+            raise SystemExit(f"Schedule {source_id} has no assignments")
+        group_id = source[0].group_id
+
+        try:
+            full = (await clone_service.clone_schedule(source_id, f"bench-full-{uuid.uuid4().hex[:8]}")).schedule
+            revision = await revision_service.create_revision(source_id, f"bench-rev-{uuid.uuid4().hex[:8]}")
+
+            # Every other changed assignment is removed, the rest lose their room
+            step = max(1, round(1 / changed)) if changed > 0 else len(source) + 1
+            deltas = []
+            for i, a in enumerate(source[::step]):
+                if i % 2:
+                    deltas.append({"op": "remove", "assignment_id": a.assignment_id})
+                else:
+                    deltas.append({
+                        "op": "add", "assignment_id": a.assignment_id, "timeslot_id": a.timeslot_id,
+                        "group_id": a.group_id, "subgroup_no": a.subgroup_no, "course_id": a.course_id,
+                        "teacher_id": a.teacher_id, "room_id": None, "course_type": a.course_type,
+                    })
+            await revision_repo.upsert_deltas(revision.schedule_id, deltas)
+            await session.execute(text("ANALYZE assignments"))
+            await session.execute(text("ANALYZE assignment_deltas"))
+
+            full_bytes = await stored_bytes(session, "assignments", full.schedule_id)
+            delta_bytes = await stored_bytes(session, "assignment_deltas", revision.schedule_id)
+            saved = 100 * (1 - delta_bytes / full_bytes) if full_bytes else 0.0
+            print(f"assignments: {len(source)}, changed: {len(deltas)}")
+            print(f"full copy: {full_bytes} bytes, revision: {delta_bytes} bytes ({saved:.1f}% saved)")
+
+            chain = await revision_repo.find_chain(revision.schedule_id)
+            print(f"{'read':>16} {'full p50':>10} {'full p95':>10} {'rev p50':>10} {'rev p95':>10}")
+            for name, full_read, rev_read in (
+                ("group",
+                 lambda: assignment_repo.find_by_schedule_and_group(full.schedule_id, group_id),
+                 lambda: revision_repo.find_resolved(chain, group_id=group_id)),
+                ("whole schedule",
+                 lambda: assignment_repo.find_by_schedule_id(full.schedule_id),
+                 lambda: revision_repo.find_resolved(chain)),
+            ):
+                f50, f95 = await timed(repeats, full_read)
+                r50, r95 = await timed(repeats, rev_read)
+                print(f"{name:>16} {f50:>8.2f}ms {f95:>8.2f}ms {r50:>8.2f}ms {r95:>8.2f}ms")
+
+            started = time.perf_counter()
+            await revision_service.ensure_materialized(revision.schedule_id)
+            print(f"materialization: {(time.perf_counter() - started) * 1000:.1f}ms")
+        finally:
+            await session.rollback()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", type=uuid.UUID, required=True, help="Schedule to derive from")
+    parser.add_argument("--changed", type=float, default=0.05, help="Fraction of assignments the revision changes")
+    parser.add_argument("--repeats", type=int, default=100, help="Reads per measurement")
+    args = parser.parse_args()
+    asyncio.run(run(args.source, args.changed, args.repeats))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Whole-schedule load time and memory: ORM objects vs the packed columnar
+snapshot.
+
+Without --source, 50k synthetic assignments are used: the ORM side builds
+Assignment instances from row tuples, the snapshot side unpacks the
+compressed payload into NumPy views. With --source the same comparison
+runs against the database (find_by_schedule_id vs fetching and unpacking
+the stored snapshot), inside a transaction that is rolled back.
+
+    python -m benchmarks.schedule_snapshots --rows 50000
+    python -m benchmarks.schedule_snapshots --source <schedule_id>
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import tracemalloc
+import uuid
+
+from app.db.models.scheduling.assignment import Assignment
+from app.services.schedule_snapshot import ScheduleSnapshot, pack_snapshot, unpack_snapshot
+
+
+def measure(repeats: int, fn) -> tuple:
+    """(median ms, peak MiB allocated during one call)."""
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    tracemalloc.start()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return statistics.median(samples), peak / 2 ** 20
+
+
+async def measure_async(repeats: int, fn) -> tuple:
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    tracemalloc.start()
+    result = await fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return statistics.median(samples), peak / 2 ** 20
+
+
+def synthetic_rows(n: int) -> list:
+    pick = lambda k: [uuid.uuid4() for _ in range(k)]
+    groups, courses, teachers, rooms = pick(300), pick(800), pick(400), pick(150)
+    return [
+        (uuid.uuid4(), random.randint(1, 84), random.choice(groups), random.randint(1, 3),
+         random.choice(courses), random.choice(teachers), random.choice(rooms + [None]),
+         random.choice(("lec", "prac", "lab")))
+        for _ in range(n)
+    ]
+
+
+HEADER = f"{'load':>28} {'median':>12} {'peak':>13}"
+
+
+def report(name: str, ms: float, mib: float) -> None:
+    print(f"{name:>28} {ms:>10.1f}ms {mib:>10.1f}MiB")
+
+
+def run_synthetic(n: int, repeats: int) -> None:
+    rows = synthetic_rows(n)
+    columns = ("assignment_id", "timeslot_id", "group_id", "subgroup_no",
+               "course_id", "teacher_id", "room_id", "course_type")
+    payload = pack_snapshot(ScheduleSnapshot.from_rows(rows))
+    print(f"assignments: {n}, snapshot payload: {len(payload) / 2 ** 20:.2f} MiB")
+    print(HEADER)
+    report("ORM objects", *measure(repeats, lambda: [Assignment(**dict(zip(columns, r))) for r in rows]))
+    report("snapshot unpack", *measure(repeats, lambda: unpack_snapshot(payload)))
+
+
+async def run_database(source_id: uuid.UUID, repeats: int) -> None:
+    from app.db.session import async_session_maker
+    from app.repositories.assignment_repository import AssignmentRepository
+    from app.repositories.schedule_snapshot_repository import ScheduleSnapshotRepository
+    from app.services.schedule_snapshot import SNAPSHOT_FORMAT
+    from app.services.schedule_snapshot_service import ScheduleSnapshotService
+
+    async with async_session_maker() as session:
+        assignment_repo = AssignmentRepository(session)
+        snapshot_repo = ScheduleSnapshotRepository(session)
+        try:
+            snapshot = await ScheduleSnapshotService(snapshot_repo, assignment_repo).refresh(source_id)
+            print(f"assignments: {len(snapshot)}")
+            print(HEADER)
+
+            async def orm_load():
+                result = await assignment_repo.find_by_schedule_id(source_id)
+                session.expunge_all()
+                return result
+
+            async def snapshot_load():
+                return unpack_snapshot(await snapshot_repo.find_payload(source_id, SNAPSHOT_FORMAT))
+
+            report("find_by_schedule_id", *await measure_async(repeats, orm_load))
+            report("snapshot fetch + unpack", *await measure_async(repeats, snapshot_load))
+        finally:
+            await session.rollback()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", type=uuid.UUID, help="Measure against this schedule in the database")
+    parser.add_argument("--rows", type=int, default=50000, help="Synthetic assignments")
+    parser.add_argument("--repeats", type=int, default=10, help="Loads per measurement")
+    args = parser.parse_args()
+    if args.source:
+        asyncio.run(run_database(args.source, args.repeats))
+    else:
+        run_synthetic(args.rows, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Latency of GET /api/search on --people synthetic users, of whom 90% are
+also students and 10% teachers, plus one group per 30 people. --queries
+lookups by a piece of a random surname, full name or email run one after
+another through SearchRepository; p50/p95/max are reported. Everything runs
+in one transaction that is rolled back.
+
+    python -m benchmarks.search --people 100000 --queries 500
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+
+from sqlalchemy import text
+
+from app.db.session import async_session_maker
+from app.repositories.search_repository import SEARCH_SOURCES, SearchRepository
+
+FIRST_NAMES = ["Олена", "Іван", "Марія", "Андрій", "Оксана", "Тарас", "Наталія", "Дмитро", "Юлія", "Богдан"]
+LAST_NAMES = ["Коваленко", "Шевченко", "Бондаренко", "Ткаченко", "Кравченко", "Мельник", "Петренко",
+              "Олійник", "Лисенко", "Руденко", "Савченко", "Марченко", "Гончаренко", "Мороз", "Поліщук"]
+
+# First label of each enum, whichever case the schema was created with
+_INSERT_PEOPLE = """
+    WITH people AS (
+        SELECT * FROM unnest(CAST(:ids AS uuid[]), CAST(:first AS text[]), CAST(:last AS text[]), CAST(:emails AS text[]))
+            AS p (user_id, first_name, last_name, email)
+    ), users AS (
+        INSERT INTO users (user_id, google_sub, email, first_name, last_name, role, is_active)
+        SELECT user_id, 'bench-' || user_id, email, first_name, last_name, (enum_range(NULL::user_role_enum))[1], true
+        FROM people
+    ), students AS (
+        INSERT INTO students (student_id, first_name, last_name, status)
+        SELECT gen_random_uuid(), first_name, last_name, (enum_range(NULL::student_status_enum))[1]
+        FROM people WHERE right(user_id::text, 1) <> '0'
+    )
+    INSERT INTO teachers (teacher_id, first_name, last_name, patronymic, status)
+    SELECT gen_random_uuid(), first_name, last_name, 'P' || user_id, (enum_range(NULL::teacher_status_enum))[1]
+    FROM people WHERE right(user_id::text, 1) = '0'
+"""
+
+
+def synthetic_people(n: int, tag: str):
+    ids = [uuid.uuid4() for _ in range(n)]
+    first = [random.choice(FIRST_NAMES) for _ in range(n)]
+    last = [f"{random.choice(LAST_NAMES)}-{random.randint(1, n)}" for _ in range(n)]
+    emails = [f"{tag}.{i}.{random.randint(1, n)}@example.edu" for i in range(n)]
+    return ids, first, last, emails
+
+
+def sample_query(first: list, last: list, emails: list) -> str:
+    i = random.randrange(len(first))
+    kind = random.random()
+    if kind < 0.4:
+        return last[i].split("-")[0][:random.randint(4, 9)]
+    if kind < 0.8:
+        return f"{last[i]} {first[i]}"
+    return emails[i].split("@")[0]
+
+
+async def run(args) -> None:
+    tag = uuid.uuid4().hex[:6]
+    ids, first, last, emails = synthetic_people(args.people, tag)
+    async with async_session_maker() as session:
+        try:
+            started = time.perf_counter()
+            await session.execute(
+                text(_INSERT_PEOPLE), {"ids": ids, "first": first, "last": last, "emails": emails}
+            )
+            await session.execute(text(
+                "INSERT INTO groups (group_id, name, size) "
+                "SELECT gen_random_uuid(), :tag || '-КН-' || i, 30 FROM generate_series(1, :n) AS i"
+            ), {"tag": tag, "n": max(1, args.people // 30)})
+            for table in ("users", "students", "teachers", "groups"):
+                await session.execute(text(f"ANALYZE {table}"))
+            print(f"loaded {args.people} people in {time.perf_counter() - started:.1f} s")
+
+            repo = SearchRepository(session)
+            latencies = []
+            for _ in range(args.queries):
+                q = sample_query(first, last, emails)
+                started = time.perf_counter()
+                await repo.search(q, list(SEARCH_SOURCES), args.limit)
+                latencies.append((time.perf_counter() - started) * 1000)
+
+            latencies.sort()
+            p95 = latencies[int(len(latencies) * 0.95) - 1]
+            print(f"{args.queries} searches: p50 {statistics.median(latencies):.1f} ms, "
+                  f"p95 {p95:.1f} ms, max {latencies[-1]:.1f} ms")
+        finally:
+            await session.rollback()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--people", type=int, default=100000, help="Synthetic users")
+    parser.add_argument("--queries", type=int, default=500, help="Searches to time")
+    parser.add_argument("--limit", type=int, default=5, help="Top results per type")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
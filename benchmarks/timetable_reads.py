@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Timetable read latency as the number of schedules grows.
+
+Clones an existing schedule (server-side, into its own partition when
+`assignments` is partitioned) until the table holds 1, 10, 50, ... copies,
+and after each step times group and teacher timetable reads of the newest
+copy. Each copy is committed, since partitions are created in their own
+transactions and cannot be rolled back; the copies and their partitions
+are removed again at the end.
+
+    python -m benchmarks.timetable_reads --source <schedule_id> --steps 1 10 50 100
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from sqlalchemy import text
+
+from app.db.session import async_session_maker
+from app.repositories.assignment_partition_repository import AssignmentPartitionRepository
+from app.repositories.assignment_repository import AssignmentRepository
+from app.repositories.constraint_repository import ConstraintRepository
+from app.repositories.schedule_repository import ScheduleRepository
+from app.services.schedule_clone_service import ScheduleCloneService
+
+
+async def timed(repeats: int, fn) -> tuple:
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+async def run(source_id: uuid.UUID, steps: list, repeats: int) -> None:
+    async with async_session_maker() as session:
+        assignment_repo = AssignmentRepository(session)
+        partition_repo = AssignmentPartitionRepository(session)
+        clone_service = ScheduleCloneService(
+            ScheduleRepository(session), assignment_repo, ConstraintRepository(session), partition_repo
+        )
+
+        sample = (await assignment_repo.find_by_schedule_id(source_id))[:1]
+        if not sample:
+            raise SystemExit(f"Schedule {source_id} has no assignments")
+        group_id, teacher_id = sample[0].group_id, sample[0].teacher_id
+        print(f"partitioned: {await partition_repo.is_partitioned()}")
+        await session.commit()
+        print(f"{'schedules':>10} {'rows':>10} {'group p50':>10} {'group p95':>10} {'teacher p50':>12} {'teacher p95':>12}")
+
+        copies, latest, created = 0, source_id, []
+        try:
+            for target in steps:
+                while copies < target:
+                    result = await clone_service.clone_schedule(source_id, f"bench-{uuid.uuid4().hex[:12]}")
+                    await session.commit()
+                    latest = result.schedule.schedule_id
+                    created.append(latest)
+                    copies += 1
+                await session.execute(text("ANALYZE assignments"))
+                rows = (await session.execute(text("SELECT count(*) FROM assignments"))).scalar()
+
+                g50, g95 = await timed(repeats, lambda: assignment_repo.find_by_schedule_and_group(latest, group_id))
+                t50, t95 = await timed(repeats, lambda: assignment_repo.find_by_schedule_and_teacher(latest, teacher_id))
+                print(f"{copies + 1:>10} {rows:>10} {g50:>9.2f}ms {g95:>9.2f}ms {t50:>11.2f}ms {t95:>11.2f}ms")
+        finally:
+            await session.rollback()
+            for schedule_id in created:
+                if not await partition_repo.drop_partition(schedule_id):
+                    await assignment_repo.delete_by_schedule_id(schedule_id)
+                await ConstraintRepository(session).delete_subgroup_constraints(schedule_id)
+                await ScheduleRepository(session).delete(schedule_id)
+                await session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", type=uuid.UUID, required=True, help="Schedule to clone")
+    parser.add_argument("--steps", type=int, nargs="+", default=[1, 10, 50, 100], help="Copies to measure at")
+    parser.add_argument("--repeats", type=int, default=200, help="Reads per measurement")
+    args = parser.parse_args()
+    asyncio.run(run(args.source, sorted(args.steps), args.repeats))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+import uuid
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+client = TestClient(app)
+
+
+class TestAdminGuards:
+
+    def test_publish_requires_authentication(self):
+        """Publishing switches what every student sees, so anonymous calls are refused"""
+        response = client.post(f"/api/schedules/{uuid.uuid4()}/publish")
+        assert response.status_code in (401, 403)
+
+    def test_availability_matrices_require_authentication(self):
+        for path in ("/api/availability/teachers", "/api/availability/groups"):
+            assert client.get(path).status_code in (401, 403)
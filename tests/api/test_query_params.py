@@ -0,0 +1,34 @@
+import uuid
+
+from fastapi.testclient import TestClient
+
+from app.core.security import get_current_admin
+from app.main import app
+
+client = TestClient(app)
+
+
+class TestQueryParams:
+    """Query parameters are snake_case."""
+
+    def test_occurrence_dates(self):
+        response = client.get(
+            f"/api/schedules/{uuid.uuid4()}/occurrences", params={"date_from": "2026-02-02", "date_to": "2026-02-01"}
+        )
+        assert response.status_code == 422
+        assert response.json()["detail"] == "date_to must not be before date_from"
+
+    def test_status_filters_are_validated(self):
+        """An unknown status is rejected instead of silently matching nothing"""
+        response = client.get("/api/teachers/", params={"status": "retired"})
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["query", "status"]
+
+    def test_preference_search_params(self):
+        app.dependency_overrides[get_current_admin] = lambda: None
+        try:
+            response = client.get("/api/teachers/preferences", params={"avoid_slot": "monday"})
+        finally:
+            app.dependency_overrides.pop(get_current_admin)
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["query", "avoid_slot"]
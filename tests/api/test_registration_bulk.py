@@ -0,0 +1,82 @@
+import uuid
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select
+
+from app.core.deps import get_session
+from app.core.security import get_current_admin
+from app.db.models.common_enums import StudentStatus, TeacherStatus
+from app.db.models.people.registration_request import RegistrationRequest, RegistrationStatus
+from app.db.models.people.student import Student
+from app.db.models.people.teacher import Teacher
+from app.db.models.people.user import UserRole
+from app.main import app
+
+
+def _request(suffix, role, status=RegistrationStatus.PENDING):
+    return RegistrationRequest(
+        email=f"{role.value}-{suffix}@example.com", first_name=f"Reg-{suffix}", last_name=role.value,
+        patronymic="P", requested_role=role, status=status,
+    )
+
+
+async def _post(session, path, body):
+    """Calls the API with the test session and an admin caller."""
+    async def session_override():
+        yield session
+
+    app.dependency_overrides[get_session] = session_override
+    app.dependency_overrides[get_current_admin] = lambda: None
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            return await client.post(path, json=body)
+    finally:
+        app.dependency_overrides.pop(get_session)
+        app.dependency_overrides.pop(get_current_admin)
+
+
+class TestBulkRegistrations:
+
+    def test_approve_and_reject_against_the_stored_enums(self, db):
+        """Pending requests are recognised, decided and turned into active profiles"""
+        async def scenario(session):
+            suffix = uuid.uuid4().hex[:8]
+            student, teacher, decided, rejected = requests = [
+                _request(suffix, UserRole.STUDENT), _request(suffix, UserRole.TEACHER),
+                _request(f"{suffix}-old", UserRole.STUDENT, RegistrationStatus.APPROVED),
+                _request(f"{suffix}-no", UserRole.STUDENT),
+            ]
+            session.add_all(requests)
+            await session.flush()
+
+            response = await _post(session, "/api/admin/registrations/bulk/approve", {"request_ids": [
+                str(student.request_id), str(teacher.request_id), str(decided.request_id),
+            ]})
+            assert response.status_code == 200
+            body = response.json()
+            assert [(i["outcome"], i["role"]) for i in body["items"]] == [
+                ("approved", "student"), ("approved", "teacher"), ("already_processed", None)
+            ]
+
+            response = await _post(session, "/api/admin/registrations/bulk/reject", {"request_ids": [
+                str(rejected.request_id), str(student.request_id),
+            ]})
+            assert [i["outcome"] for i in response.json()["items"]] == ["rejected", "already_processed"]
+
+            statuses = dict((await session.execute(
+                select(RegistrationRequest.request_id, RegistrationRequest.status)
+                .where(RegistrationRequest.first_name.startswith(f"Reg-{suffix}"))
+            )).all())
+            assert statuses == {
+                student.request_id: RegistrationStatus.APPROVED, teacher.request_id: RegistrationStatus.APPROVED,
+                decided.request_id: RegistrationStatus.APPROVED, rejected.request_id: RegistrationStatus.REJECTED,
+            }
+            user_ids = {i["role"]: uuid.UUID(i["user_id"]) for i in body["items"] if i["user_id"]}
+            assert await session.scalar(
+                select(Student.status).where(Student.user_id == user_ids["student"])
+            ) == StudentStatus.ACTIVE
+            assert await session.scalar(
+                select(Teacher.status).where(Teacher.user_id == user_ids["teacher"])
+            ) == TeacherStatus.ACTIVE
+
+        db(scenario)
@@ -1,8 +1,21 @@
 import pytest
 import asyncio
+import uuid
+from datetime import time
+from types import SimpleNamespace
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy import text
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.pool import NullPool
 from app.db.models.base import Base
+from app.db.models.catalog.course import Course
+from app.db.models.catalog.group import Group
+from app.db.models.catalog.lesson import Lesson
+from app.db.models.catalog.room import Room
+from app.db.models.common_enums import TimeslotFrequency
+from app.db.models.people.teacher import Teacher
+from app.db.models.scheduling.timeslot import Timeslot
 from app.main import app
 from fastapi.testclient import TestClient
 
@@ -54,6 +67,92 @@ async def test_session(setup_test_db):
         await trans.rollback()
 
 
+@pytest.fixture
+def db():
+    """
+    Runs `await fn(session)` against the test database in a transaction
+    that is rolled back afterwards (commits only release a savepoint).
+    Skips the test when the database is unreachable.
+    """
+    engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+
+    async def prepare():
+        async with engine.begin() as conn:
+            await conn.execute(text('CREATE EXTENSION IF NOT EXISTS "citext";'))
+            await conn.run_sync(Base.metadata.create_all)
+
+    try:
+        asyncio.run(prepare())
+    except (OSError, DBAPIError) as e:
+        pytest.skip(f"Test database is not reachable: {e}")
+
+    async def run(fn):
+        async with engine.connect() as conn:
+            trans = await conn.begin()
+            session = AsyncSession(bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint")
+            try:
+                return await fn(session)
+            finally:
+                await session.close()
+                await trans.rollback()
+
+    return lambda fn: asyncio.run(run(fn))
+
+
+class RecordingSession:
+    """Records executed statements and answers every one with the same rows (and `scalar`)."""
+
+    def __init__(self, rows=(), scalar=None):
+        self.rows = list(rows)
+        self.scalar = scalar
+        self.statements = []
+
+    async def execute(self, stmt, *args, **kwargs):
+        self.statements.append(stmt)
+        return SimpleNamespace(all=lambda: self.rows, scalar=lambda: self.scalar, scalar_one=lambda: self.scalar)
+
+
+@pytest.fixture
+def recording_session():
+    """`recording_session(rows, scalar)` builds a RecordingSession."""
+    return RecordingSession
+
+
+async def _seed_catalog(session, frequencies=(TimeslotFrequency.ODD, TimeslotFrequency.EVEN)):
+    """
+    Rows that assignments can reference: one timeslot per frequency (Sunday,
+    first lesson), plus a new group, course, teacher and room.
+    """
+    suffix = uuid.uuid4().hex[:8]
+    await session.execute(
+        pg_insert(Lesson).values(lesson_id=1, start_time=time(8, 30), end_time=time(9, 50)).on_conflict_do_nothing()
+    )
+    await session.execute(
+        pg_insert(Timeslot).values([{"day": 7, "lesson_id": 1, "frequency": f} for f in frequencies])
+        .on_conflict_do_nothing()
+    )
+    stmt = select(Timeslot.timeslot_id, Timeslot.frequency).where(
+        Timeslot.day == 7, Timeslot.lesson_id == 1, Timeslot.frequency.in_(frequencies)
+    )
+    timeslots = {frequency: timeslot_id for timeslot_id, frequency in (await session.execute(stmt)).all()}
+    catalog = SimpleNamespace(
+        timeslots=[timeslots[f] for f in frequencies],
+        group=Group(name=f"test-{suffix}", size=20),
+        course=Course(name=f"test-{suffix}", duration=30),
+        teacher=Teacher(first_name="Test", last_name=suffix, patronymic=""),
+        room=Room(name=f"test-{suffix}", capacity=30),
+    )
+    session.add_all([catalog.group, catalog.course, catalog.teacher, catalog.room])
+    await session.flush()
+    return catalog
+
+
+@pytest.fixture
+def seed_catalog():
+    """`await seed_catalog(session, frequencies)` inside a `db` scenario."""
+    return _seed_catalog
+
+
 @pytest.fixture
 def client():
     """Create test client"""
@@ -0,0 +1,28 @@
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.db.session import after_commit
+
+
+class TestAfterCommit:
+
+    def test_runs_only_after_the_outer_commit(self):
+        """Callbacks wait for the outer commit, survive savepoints and are dropped on rollback"""
+        calls = []
+        with Session(create_engine("sqlite://")) as session:
+            after_commit(session, lambda: calls.append("no transaction"))
+            session.execute(text("SELECT 1"))
+            after_commit(session, lambda: calls.append("outer"))
+            savepoint = session.begin_nested()
+            after_commit(session, lambda: calls.append("savepoint"))
+            savepoint.commit()
+            assert calls == ["no transaction"]
+            session.commit()
+            assert calls == ["no transaction", "outer", "savepoint"]
+
+            session.execute(text("SELECT 1"))
+            after_commit(session, lambda: calls.append("rolled back"))
+            session.rollback()
+            session.execute(text("SELECT 1"))
+            session.commit()
+        assert calls == ["no transaction", "outer", "savepoint"]
@@ -0,0 +1,37 @@
+import uuid
+
+from sqlalchemy import select
+
+from app.db.models.catalog.course import Course
+from app.db.models.common_enums import TeacherStatus
+from app.db.models.people.teacher import Teacher
+from app.repositories.catalog_import_repository import CatalogImportRepository
+
+
+class TestCatalogImportUpsert:
+
+    def test_teacher_statuses_and_course_codes(self, db):
+        """Statuses land as enum labels; a course imported without a code keeps its current one"""
+        async def scenario(session):
+            suffix = uuid.uuid4().hex[:8]
+            course = Course(name=f"import-{suffix}", code=f"C-{suffix}", duration=60)
+            session.add(course)
+            await session.flush()
+
+            repo = CatalogImportRepository(session)
+            await repo.stage({
+                "courses": [(course.name, None, 90)],
+                "teachers": [(f"Active-{suffix}", "Teacher", "T", "active"), (f"New-{suffix}", "Teacher", "T", None)],
+            })
+            assert await repo.validate() == []
+            counts = await repo.upsert()
+            assert counts["courses"] == (0, 1) and counts["teachers"] == (2, 0)
+
+            await session.refresh(course)
+            assert (course.code, course.duration) == (f"C-{suffix}", 90)
+            statuses = dict((await session.execute(
+                select(Teacher.first_name, Teacher.status).where(Teacher.first_name.endswith(suffix))
+            )).all())
+            assert statuses == {f"Active-{suffix}": TeacherStatus.ACTIVE, f"New-{suffix}": TeacherStatus.PENDING}
+
+        db(scenario)
@@ -0,0 +1,78 @@
+import uuid
+
+from sqlalchemy import select
+
+from app.db.models.scheduling.assignment import Assignment
+from app.db.models.scheduling.schedule import Schedule
+from app.repositories.schedule_revision_repository import ScheduleRevisionRepository
+
+
+async def _seed(session, seed_catalog):
+    """A materialized schedule with two lessons of one group and an empty revision of it."""
+    catalog = await seed_catalog(session)
+    suffix = uuid.uuid4().hex[:8]
+    base = Schedule(label=f"rev-base-{suffix}")
+    session.add(base)
+    await session.flush()
+    revision = Schedule(label=f"rev-draft-{suffix}", parent_schedule_id=base.schedule_id, materialized=False)
+    lessons = [
+        Assignment(schedule_id=base.schedule_id, timeslot_id=timeslot_id, group_id=catalog.group.group_id,
+                   subgroup_no=1, course_id=catalog.course.course_id, teacher_id=catalog.teacher.teacher_id,
+                   course_type="lec")
+        for timeslot_id in catalog.timeslots
+    ]
+    session.add_all([revision, *lessons])
+    await session.flush()
+    return base, revision, lessons, catalog.room, catalog.timeslots
+
+
+def _add(lesson, **changes):
+    row = {c: getattr(lesson, c) for c in ("timeslot_id", "group_id", "subgroup_no", "course_id", "teacher_id",
+                                             "room_id", "course_type")}
+    return {"assignment_id": lesson.assignment_id, "op": "add", **row, **changes}
+
+
+class TestScheduleRevisions:
+
+    def test_deltas_resolve_through_the_parent_and_materialize(self, db, seed_catalog):
+        """The nearest change of each assignment wins, removals drop it, materialize copies the result"""
+        async def scenario(session):
+            repo = ScheduleRevisionRepository(session)
+            base, revision, (kept, dropped), room, (first, _) = await _seed(session, seed_catalog)
+
+            await repo.upsert_deltas(revision.schedule_id, [_add(kept, timeslot_id=dropped.timeslot_id),
+                                                            {"assignment_id": dropped.assignment_id, "op": "remove"}])
+            await repo.upsert_deltas(revision.schedule_id, [_add(kept, timeslot_id=dropped.timeslot_id,
+                                                                 room_id=room.room_id)])
+            chain = await repo.find_chain(revision.schedule_id)
+            assert [row.schedule_id for row in chain] == [revision.schedule_id, base.schedule_id]
+
+            resolved = await repo.find_resolved(chain, group_id=kept.group_id)
+            assert [(r.schedule_id, r.assignment_id, r.timeslot_id, r.room_id) for r in resolved] == [
+                (revision.schedule_id, kept.assignment_id, dropped.timeslot_id, room.room_id)
+            ]
+            assert await repo.find_resolved(chain, teacher_id=uuid.uuid4()) == []
+            assert await repo.count_deltas(revision.schedule_id) == {"add": 1, "remove": 1}
+
+            assert await repo.materialize(chain) == 1
+            assert [row.materialized for row in await repo.find_chain(revision.schedule_id)] == [True]
+            rows = (await session.execute(
+                select(Assignment.schedule_id, Assignment.timeslot_id)
+                .where(Assignment.schedule_id.in_([base.schedule_id, revision.schedule_id]))
+            )).all()
+            assert sorted(rows) == sorted([
+                (base.schedule_id, first), (base.schedule_id, dropped.timeslot_id),
+                (revision.schedule_id, dropped.timeslot_id),
+            ])
+
+        db(scenario)
+
+    def test_open_revisions_of_a_schedule_are_listed_and_locked(self, db, seed_catalog):
+        async def scenario(session):
+            repo = ScheduleRevisionRepository(session)
+            base, revision, _, _, _ = await _seed(session, seed_catalog)
+            assert await repo.lock_unmaterialized_children(base.schedule_id) == [revision.schedule_id]
+            await repo.materialize(await repo.find_chain(revision.schedule_id))
+            assert await repo.lock_unmaterialized_children(base.schedule_id) == []
+
+        db(scenario)
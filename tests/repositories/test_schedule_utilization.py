@@ -0,0 +1,41 @@
+import asyncio
+import uuid
+
+from sqlalchemy.dialects import postgresql
+
+from app.db.models.common_enums import TimeslotFrequency
+from app.db.models.scheduling.assignment import Assignment
+from app.db.models.scheduling.schedule import Schedule
+from app.repositories.assignment_repository import UTILIZATION_BY_SLOT, AssignmentRepository
+
+
+class TestScheduleUtilization:
+
+    def test_rooms_are_counted_once_per_slot(self, recording_session):
+        """A room is counted once per (day, lesson), however many timeslot rows it appears in"""
+        session = recording_session()
+        asyncio.run(AssignmentRepository(session).find_utilization(uuid.uuid4()))
+        sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+        assert sql.count("count(DISTINCT assignments.room_id) FILTER") == 2
+
+    def test_slot_counts(self, db, seed_catalog):
+        """Lessons in the same room in ALL and ODD weeks: two odd lessons, one room"""
+        async def scenario(session):
+            catalog = await seed_catalog(session, (TimeslotFrequency.ALL, TimeslotFrequency.ODD))
+            schedule = Schedule(label=f"util-{uuid.uuid4().hex[:8]}")
+            session.add(schedule)
+            await session.flush()
+            session.add_all([
+                Assignment(schedule_id=schedule.schedule_id, timeslot_id=timeslot_id, group_id=catalog.group.group_id,
+                           subgroup_no=1, course_id=catalog.course.course_id, teacher_id=catalog.teacher.teacher_id,
+                           room_id=catalog.room.room_id, course_type="lec")
+                for timeslot_id in catalog.timeslots
+            ])
+            await session.flush()
+
+            rows = await AssignmentRepository(session).find_utilization(schedule.schedule_id)
+            slot = next(r for r in rows if r.grouping_set == UTILIZATION_BY_SLOT)
+            assert (slot.day, slot.lesson_id) == (7, 1)
+            assert (slot.lessons_odd, slot.lessons_even, slot.rooms_odd, slot.rooms_even) == (2, 1, 1, 1)
+
+        db(scenario)
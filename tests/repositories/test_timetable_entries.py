@@ -0,0 +1,63 @@
+import uuid
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.db.models.scheduling.assignment import Assignment
+from app.db.models.scheduling.schedule import Schedule
+from app.repositories.assignment_repository import AssignmentRepository
+from app.repositories.schedule_repository import ScheduleRepository
+from app.repositories.timetable_entry_repository import TimetableEntryRepository
+
+
+async def _schedule(session, seed_catalog):
+    """A schedule with one lesson per seeded timeslot."""
+    catalog = await seed_catalog(session)
+    schedule = Schedule(label=f"entries-{uuid.uuid4().hex[:8]}")
+    session.add(schedule)
+    await session.flush()
+    session.add_all([
+        Assignment(schedule_id=schedule.schedule_id, timeslot_id=timeslot_id, group_id=catalog.group.group_id,
+                   subgroup_no=1, course_id=catalog.course.course_id, teacher_id=catalog.teacher.teacher_id,
+                   course_type="lec")
+        for timeslot_id in catalog.timeslots
+    ])
+    await session.flush()
+    return schedule
+
+
+class TestTimetableEntries:
+
+    def test_entries_are_purged_in_batches_before_the_schedule(self, db, seed_catalog):
+        """Deleting a schedule does not cascade into its entries; the purge removes them batch by batch"""
+        async def scenario(session):
+            repo = TimetableEntryRepository(session)
+            schedule = await _schedule(session, seed_catalog)
+            assert await repo.rebuild(schedule.schedule_id) == 2
+            await AssignmentRepository(session).delete_batch_by_schedule_id(schedule.schedule_id, 10)
+
+            with pytest.raises(IntegrityError):
+                async with session.begin_nested():
+                    await ScheduleRepository(session).delete(schedule.schedule_id)
+            assert [await repo.delete_batch_by_schedule_id(schedule.schedule_id, 1) for _ in range(3)] == [1, 1, 0]
+
+        db(scenario)
+
+    def test_first_build_is_marked_even_without_lessons(self, db, seed_catalog):
+        """The built marker does not depend on rows, so an empty schedule is built once, not on every read"""
+        async def scenario(session):
+            repo = TimetableEntryRepository(session)
+            empty = Schedule(label=f"entries-empty-{uuid.uuid4().hex[:8]}")
+            session.add(empty)
+            await session.flush()
+            assert not await repo.is_built(empty.schedule_id)
+            assert await repo.build_missing(empty.schedule_id) == 0
+            assert await repo.is_built(empty.schedule_id)
+            assert await repo.build_missing(empty.schedule_id) is None
+
+            schedule = await _schedule(session, seed_catalog)
+            assert await repo.build_missing(schedule.schedule_id) == 2
+            assert await repo.rebuild(schedule.schedule_id) == 2
+            assert await repo.build_missing(uuid.uuid4()) is None
+
+        db(scenario)
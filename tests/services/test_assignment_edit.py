@@ -0,0 +1,198 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from app.db.models.common_enums import TimeslotFrequency
+from app.schemas.assignment import AssignmentEditOperation
+from app.services.assignment_edit_service import (
+    AssignmentConflictError,
+    AssignmentEditService,
+    GroupHierarchy,
+    ScheduleConflictChecker,
+)
+from app.services.timeslot_codec import TimeslotCodec
+
+CODEC = TimeslotCodec([
+    SimpleNamespace(timeslot_id=1, day=1, lesson_id=1, frequency=TimeslotFrequency.ALL),
+    SimpleNamespace(timeslot_id=2, day=1, lesson_id=2, frequency=TimeslotFrequency.ALL),
+    SimpleNamespace(timeslot_id=3, day=1, lesson_id=2, frequency=TimeslotFrequency.ODD),
+])
+
+
+class FakeAssignmentRepository:
+    """Holds one schedule's assignments; callbacks wait for commit()."""
+
+    def __init__(self, schedule_id, assignments, teachers=()):
+        self.schedule_id = schedule_id
+        self.assignments = {a.assignment_id: a for a in assignments}
+        self.teachers = set(teachers) | {a.teacher_id for a in assignments}
+        self.callbacks = []
+
+    def after_commit(self, callback):
+        self.callbacks.append(callback)
+
+    def commit(self):
+        for callback in self.callbacks:
+            callback()
+
+    async def find_by_schedule_id(self, schedule_id):
+        return list(self.assignments.values())
+
+    async def find_missing_resources(self, teacher_ids, room_ids):
+        return set(teacher_ids) - self.teachers, set(room_ids)
+
+    async def bulk_update_placements(self, schedule_id, placements):
+        for placement in placements:
+            for field, value in placement.items():
+                setattr(self.assignments[placement["assignment_id"]], field, value)
+        return [self.assignments[p["assignment_id"]] for p in placements]
+
+
+class FakeRevisionRepository:
+    """One unmaterialized revision of the edited schedule; records what it was materialized from."""
+
+    def __init__(self, schedule_id, assignments, revision_id):
+        self.schedule_id, self.assignments, self.revision_id = schedule_id, assignments, revision_id
+        self.materialized = {}
+
+    async def find_chain(self, schedule_id):
+        if schedule_id == self.schedule_id:
+            return [SimpleNamespace(schedule_id=schedule_id, materialized=True)]
+        return [SimpleNamespace(schedule_id=schedule_id, materialized=schedule_id in self.materialized),
+                SimpleNamespace(schedule_id=self.schedule_id, materialized=True)]
+
+    async def lock_unmaterialized_children(self, schedule_id):
+        return [self.revision_id] if self.revision_id not in self.materialized else []
+
+    async def materialize(self, chain):
+        self.materialized[chain[0].schedule_id] = [a.timeslot_id for a in self.assignments]
+        return len(self.assignments)
+
+
+class FakeEntriesRepository:
+    """Records which assignments had their timetable entries rebuilt."""
+
+    def __init__(self, built):
+        self.built = built
+        self.patched = []
+
+    async def is_built(self, schedule_id):
+        return self.built
+
+    async def patch(self, schedule_id, assignment_ids):
+        self.patched.append(list(assignment_ids))
+        return len(assignment_ids)
+
+
+class FakeAvailabilityRepository:
+    """No teacher has availability configured."""
+
+    async def get_teacher_availability_bits(self, teacher_ids, codec_key):
+        return {}
+
+    async def get_teacher_availability_matrix(self, teacher_ids):
+        return {}
+
+    async def save_teacher_availability_bits(self, bits, codec_key):
+        pass
+
+
+class FakeTimeslotService:
+    async def get_codec(self):
+        return CODEC
+
+
+def _placement(timeslot_id, teacher_id, group_id, room_id=None, subgroup_no=1):
+    return {
+        "timeslot_id": timeslot_id,
+        "teacher_id": teacher_id,
+        "room_id": room_id,
+        "group_id": group_id,
+        "subgroup_no": subgroup_no,
+    }
+
+
+class TestAssignmentBatchValidation:
+
+    def setup_method(self):
+        self.teacher = uuid.uuid4()
+        self.parent = uuid.uuid4()
+        self.child = uuid.uuid4()
+        self.hierarchy = GroupHierarchy([(self.parent, None), (self.child, self.parent)])
+
+    def _check(self, state, operations, availability=None):
+        touched, errors = AssignmentEditService._apply_operations(state, operations)
+        checker = ScheduleConflictChecker(CODEC, state, self.hierarchy, availability or {})
+        return errors + checker.check(list(touched), touched)
+
+    def test_swap_has_no_conflicts(self):
+        """Swapping two lessons of the same teacher is valid"""
+        a, b = uuid.uuid4(), uuid.uuid4()
+        state = {
+            a: _placement(1, self.teacher, self.parent),
+            b: _placement(2, self.teacher, self.parent),
+        }
+        ops = [AssignmentEditOperation(op="swap", assignment_id=a, other_assignment_id=b)]
+        assert self._check(state, ops) == []
+        assert state[a]["timeslot_id"] == 2 and state[b]["timeslot_id"] == 1
+
+    def test_all_conflicts_are_reported(self):
+        """Teacher, parent-group and availability conflicts are returned together"""
+        a, b = uuid.uuid4(), uuid.uuid4()
+        state = {
+            a: _placement(1, self.teacher, self.child),
+            b: _placement(3, self.teacher, self.parent),
+        }
+        ops = [AssignmentEditOperation(op="move", assignment_id=a, timeslot_id=2)]
+        kinds = {c.kind for c in self._check(state, ops, {self.teacher: CODEC.mask([1, 3])})}
+        assert kinds == {"teacher", "group", "teacher_availability"}
+
+    def test_unknown_assignment(self):
+        """Operations on assignments outside the schedule are reported"""
+        ops = [AssignmentEditOperation(op="reassign_room", assignment_id=uuid.uuid4(), room_id=None)]
+        assert [c.kind for c in self._check({}, ops)] == ["not_found"]
+
+
+class TestAssignmentBatchApply:
+
+    def setup_method(self):
+        self.schedule_id, self.teacher, self.group = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        self.lesson = SimpleNamespace(
+            assignment_id=uuid.uuid4(), schedule_id=self.schedule_id, timeslot_id=1, group_id=self.group,
+            subgroup_no=1, course_id=uuid.uuid4(), teacher_id=self.teacher, room_id=None, course_type="lec",
+        )
+        self.repo = FakeAssignmentRepository(self.schedule_id, [self.lesson])
+
+    def _service(self, entries_repo=None, revision_repo=None):
+        group_repo = SimpleNamespace(find_parent_links=lambda: asyncio.sleep(0, []))
+        return AssignmentEditService(
+            self.repo, group_repo, FakeAvailabilityRepository(), FakeTimeslotService(),
+            revision_repo=revision_repo, entries_repo=entries_repo,
+        )
+
+    def test_unknown_teacher_is_a_conflict(self):
+        """Reassigning to a teacher that does not exist is reported per operation, not as a DB error"""
+        unknown = uuid.uuid4()
+        ops = [AssignmentEditOperation(op="reassign_teacher", assignment_id=self.lesson.assignment_id, teacher_id=unknown)]
+        with pytest.raises(AssignmentConflictError) as e:
+            asyncio.run(self._service().apply_batch(self.schedule_id, ops))
+        assert [(c.kind, c.operation_index, c.resource_id) for c in e.value.conflicts] == [("unknown_teacher", 0, unknown)]
+        assert self.lesson.teacher_id == self.teacher and not self.repo.callbacks
+
+    def test_open_revisions_are_materialized_before_the_edit(self):
+        """A revision reading through the schedule is copied out before the parent changes"""
+        revision_id = uuid.uuid4()
+        revisions = FakeRevisionRepository(self.schedule_id, [self.lesson], revision_id)
+        ops = [AssignmentEditOperation(op="move", assignment_id=self.lesson.assignment_id, timeslot_id=2)]
+        asyncio.run(self._service(revision_repo=revisions).apply_batch(self.schedule_id, ops))
+        assert revisions.materialized == {revision_id: [1]} and self.lesson.timeslot_id == 2
+
+    def test_entries_are_patched_only_once_built(self):
+        """Edits patch an existing read model; an unbuilt one is left to the full build on first read"""
+        built, unbuilt = FakeEntriesRepository(True), FakeEntriesRepository(False)
+        for entries_repo, timeslot_id in ((built, 2), (unbuilt, 1)):
+            ops = [AssignmentEditOperation(op="move", assignment_id=self.lesson.assignment_id, timeslot_id=timeslot_id)]
+            asyncio.run(self._service(entries_repo=entries_repo).apply_batch(self.schedule_id, ops))
+        assert built.patched == [[self.lesson.assignment_id]] and unbuilt.patched == []
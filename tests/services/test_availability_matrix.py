@@ -0,0 +1,81 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from app.schemas.availability import AvailabilityMatrixUpdate
+from app.services.availability_matrix import decode_update, encode_matrix, load_bitsets
+from app.services.timeslot_codec import TimeslotCodec
+
+# Monday and Tuesday, lessons 1-3; IDs deliberately not in ordinal order
+TIMESLOTS = [
+    SimpleNamespace(timeslot_id=100 - (d * 3 + l), day=d + 1, lesson_id=l + 1, frequency="ALL")
+    for d in range(2) for l in range(3)
+]
+TEACHER = uuid.uuid4()
+OTHER_TEACHER = uuid.uuid4()
+
+
+class FakeMaskStorage:
+    """Stored bit strings keyed by codec key, plus the per-timeslot rows."""
+
+    def __init__(self, bits, cells):
+        self.bits = bits
+        self.cells = cells
+        self.saved = None
+
+    async def read_bits(self, owner_ids, codec_key):
+        return {owner_id: self.bits.get((owner_id, codec_key)) for owner_id in self.cells}
+
+    async def read_cells(self, owner_ids):
+        return {owner_id: self.cells[owner_id] for owner_id in owner_ids}
+
+    async def save_bits(self, bits, codec_key):
+        self.saved = (bits, codec_key)
+
+
+class TestAvailabilityMatrix:
+
+    def setup_method(self):
+        self.codec = TimeslotCodec(TIMESLOTS)
+
+    def test_bitmask_and_runs_round_trip(self):
+        """Cells encode over timeslot ordinals and decode back to the same IDs in both encodings"""
+        cells = {TEACHER: self.codec.mask([100, 99, 97, 96])}  # mon 1-2, tue 1-2
+        for encoding in ("bitmask", "rle"):
+            matrix = encode_matrix(self.codec, cells, encoding)
+            assert matrix.timeslots == [100, 99, 98, 97, 96, 95]
+            update = AvailabilityMatrixUpdate(timeslots=matrix.timeslots, rows=matrix.rows)
+            assert sorted(decode_update(self.codec, update)[TEACHER]) == [96, 97, 99, 100]
+        assert encode_matrix(self.codec, cells, "bitmask").rows[0].mask == "1b"
+        assert encode_matrix(self.codec, cells, "rle").rows[0].runs == [(0, 2), (3, 2)]
+
+    def test_stale_or_oversized_updates_are_rejected(self):
+        """A changed timeslot order or bits past the catalog are errors, not silent shifts"""
+        with pytest.raises(ValueError):
+            decode_update(self.codec, AvailabilityMatrixUpdate(
+                timeslots=[95, 96, 97, 98, 99, 100], rows=[{"id": TEACHER, "mask": "1"}]
+            ))
+        with pytest.raises(ValueError):
+            decode_update(self.codec, AvailabilityMatrixUpdate(rows=[{"id": TEACHER, "runs": [[5, 2]]}]))
+        with pytest.raises(ValueError, match="outside the 6 timeslots"):
+            decode_update(self.codec, AvailabilityMatrixUpdate(rows=[{"id": TEACHER, "runs": [[0, 10 ** 12]]}]))
+        with pytest.raises(ValueError):
+            AvailabilityMatrixUpdate(rows=[{"id": TEACHER, "mask": "1", "runs": [[0, 1]]}])
+
+    def test_stale_masks_fall_back_to_rows(self):
+        """Fresh masks are used as is; missing or stale ones are rebuilt from the rows and saved"""
+        mask = self.codec.mask([100, 97])
+        assert self.codec.to_bits(mask) == "100100"
+        assert self.codec.from_bits(self.codec.to_bits(mask)) == mask
+
+        storage = FakeMaskStorage(
+            bits={(TEACHER, self.codec.key): "100100", (OTHER_TEACHER, "old"): "111111"},
+            cells={TEACHER: [100, 97], OTHER_TEACHER: [95]},
+        )
+        bitsets = asyncio.run(load_bitsets(
+            self.codec, None, storage.read_bits, storage.read_cells, storage.save_bits
+        ))
+        assert bitsets == {TEACHER: mask, OTHER_TEACHER: 1 << 5}
+        assert storage.saved == ({OTHER_TEACHER: "000001"}, self.codec.key)
@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+
+from app.repositories.catalog_import_repository import STAGING_TABLES
+from app.services.catalog_import_service import CatalogImportService, bundle_from_csv, bundle_records
+from app.services.timetable_service import TimetableService
+
+
+class FakeImportRepository:
+    """Stages in memory and reports the given validation errors."""
+
+    def __init__(self, errors=()):
+        self.errors = list(errors)
+        self.staged = None
+        self.upserted = False
+        self.callbacks = []
+
+    def after_commit(self, callback):
+        self.callbacks.append(callback)
+
+    async def stage(self, records):
+        self.staged = records
+
+    async def validate(self):
+        return self.errors
+
+    async def upsert(self):
+        self.upserted = True
+        return {section: (len(rows), 0) for section, rows in self.staged.items()}
+
+
+CSV_FILES = {
+    "groups": "name,size,type,course,parent\nКН-21,30,bachelor,2,\nКН-21/1,15,,2,КН-21\n",
+    "courses": "\ufeffname,duration,code\nАлгоритми,60,\n",
+    "group_courses": "group,course,count_per_week\nКН-21,Алгоритми,2\n",
+}
+
+
+class TestCatalogImport:
+
+    def test_csv_bundle_and_staging_rows(self):
+        """CSV sections become a bundle; empty cells take defaults; rows match the staging columns"""
+        bundle = bundle_from_csv(CSV_FILES)
+        assert bundle.groups[1].parent == "КН-21" and bundle.groups[1].type == "bachelor"
+        assert bundle.groups[0].parent is None and bundle.courses[0].code is None
+        assert bundle.group_courses[0].frequency == "WEEKLY"
+
+        records = bundle_records(bundle)
+        for section, (_, columns) in STAGING_TABLES.items():
+            assert all(len(row) == len(columns) for row in records[section])
+
+        with pytest.raises(ValidationError):
+            bundle_from_csv({"rooms": "name,capacity\n101,0\n"})
+
+    def test_invalid_bundle_is_not_written(self):
+        """Any failed check rejects the whole bundle with a per-row report"""
+        repo = FakeImportRepository([("group_courses", 1, "course", "Unknown course 'X'")])
+        response = asyncio.run(CatalogImportService(repo).import_bundle(bundle_from_csv(CSV_FILES)))
+        assert not response.imported and not repo.upserted
+        assert [(e.section, e.row, e.field) for e in response.errors] == [("group_courses", 1, "course")]
+
+        repo = FakeImportRepository()
+        response = asyncio.run(CatalogImportService(repo).import_bundle(bundle_from_csv(CSV_FILES)))
+        assert response.imported and response.sections["groups"].inserted == 2
+        assert repo.callbacks == [TimetableService.invalidate_all]
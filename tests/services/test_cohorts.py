@@ -0,0 +1,94 @@
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.exc import NoResultFound
+
+from app.schemas.cohort import SemesterRolloverRequest, StudentTransferRequest
+from app.services.cohort_service import CohortService
+from app.services.timetable_service import TimetableService
+
+
+class FakeCohortRepository:
+    """Knows the given groups and records which statements ran in which preview."""
+
+    def __init__(self, groups=()):
+        self.groups = set(groups)
+        self.previews = []
+        self.calls = []
+        self.callbacks = []
+
+    def after_commit(self, callback):
+        self.callbacks.append(callback)
+
+    def commit(self):
+        for callback in self.callbacks:
+            callback()
+        self.callbacks.clear()
+
+    @asynccontextmanager
+    async def preview(self, dry_run):
+        self.previews.append(dry_run)
+        yield
+
+    async def find_missing_groups(self, group_ids):
+        return [g for g in group_ids if g not in self.groups]
+
+    async def find_missing_students(self, student_ids):
+        return []
+
+    async def transfer_students(self, target_group_id, student_ids, from_group_id, status):
+        self.calls.append(("transfer", target_group_id, from_group_id, status))
+        return 25, 3
+
+    async def advance_groups(self, group_type, courses, max_course):
+        self.calls.append(("advance", group_type, courses, max_course))
+        return 10, 2
+
+    async def clone_group_course_links(self, templates):
+        self.calls.append(("clone", templates))
+        return 4, 1, 2
+
+
+class TestCohorts:
+
+    def setup_method(self):
+        self.source, self.target = uuid.uuid4(), uuid.uuid4()
+        self.repo = FakeCohortRepository([self.source, self.target])
+
+    def test_transfer_dry_run_leaves_caches(self):
+        """A dry run reports the counts from a rolled-back preview and keeps caches"""
+        version = TimetableService.catalog_version
+        request = StudentTransferRequest(target_group_id=self.target, from_group_id=self.source, dry_run=True)
+        result = asyncio.run(CohortService(self.repo).transfer_students(request))
+        assert (result.dry_run, result.students, result.memberships) == (True, 25, 3)
+        assert self.repo.previews == [True] and not self.repo.callbacks
+
+        request = StudentTransferRequest(target_group_id=self.target, from_group_id=self.source)
+        asyncio.run(CohortService(self.repo).transfer_students(request))
+        assert self.repo.previews == [True, False] and TimetableService.catalog_version == version
+        self.repo.commit()
+        assert TimetableService.catalog_version == version + 1
+
+    def test_rollover_and_validation(self):
+        request = SemesterRolloverRequest(
+            type="bachelor", max_course=4,
+            link_templates=[{"group_id": self.source, "template_group_id": self.target}],
+        )
+        result = asyncio.run(CohortService(self.repo).rollover(request))
+        assert (result.advanced, result.kept, result.links.removed) == (10, 2, 2)
+        assert self.repo.calls == [("advance", "bachelor", None, 4), ("clone", {self.source: self.target})]
+
+        unknown = SemesterRolloverRequest(
+            all=True, link_templates=[{"group_id": uuid.uuid4(), "template_group_id": self.target}]
+        )
+        with pytest.raises(NoResultFound):
+            asyncio.run(CohortService(self.repo).rollover(unknown))
+        with pytest.raises(ValidationError):
+            StudentTransferRequest(target_group_id=self.target)
+        with pytest.raises(ValidationError):
+            StudentTransferRequest(target_group_id=self.target, from_group_id=self.source, status="graduated")
+        with pytest.raises(ValidationError, match="set all to advance every group"):
+            SemesterRolloverRequest(max_course=4)
@@ -0,0 +1,89 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.exc import NoResultFound
+
+from app.repositories.course_repository import CourseRepository
+from app.schemas.course import CourseLinksBulkUpdate
+from app.services.course_service import CourseService
+
+
+class LinkSession:
+    """Reports the given missing references and records the link diffs applied."""
+
+    def __init__(self, missing=()):
+        self.missing = list(missing)
+        self.applied = []
+
+    async def execute(self, stmt, params=None):
+        if "DELETE FROM" in str(stmt):
+            self.applied.append((str(stmt).split("DELETE FROM ")[1].split()[0], params))
+        return SimpleNamespace(all=lambda: self.missing, one=lambda: (1, 0))
+
+
+def _course_row(name, group_ids=(), teacher_ids=(), total=3):
+    return SimpleNamespace(
+        course_id=uuid.uuid4(), name=name, duration=60, code=None,
+        group_ids=list(group_ids), teacher_ids=list(teacher_ids), _mapping={"_total": total},
+    )
+
+
+class TestCourseQueries:
+
+    @pytest.fixture(autouse=True)
+    def _session(self, recording_session):
+        self.groups = [uuid.uuid4(), uuid.uuid4()]
+        self.teacher = uuid.uuid4()
+        self.session = recording_session([
+            _course_row("Algebra", self.groups, [self.teacher]),
+            _course_row("Biology", teacher_ids=[self.teacher]),
+            _course_row("Chemistry"),
+        ])
+        self.service = CourseService(CourseRepository(self.session))
+
+    def test_listing_is_a_single_query(self):
+        """Courses, their group/teacher links and the total come from one statement, whatever the course count"""
+        listing = asyncio.run(self.service.get_all_courses())
+        assert len(self.session.statements) == 1
+        assert listing.total == 3
+        assert [c.name for c in listing.courses] == ["Algebra", "Biology", "Chemistry"]
+        assert listing.courses[0].group_ids == self.groups
+        assert listing.courses[2].teacher_ids == []
+
+    def test_courses_of_teacher_and_by_id_are_single_queries(self):
+        """Per-teacher and per-ID reads use the same aggregated statement"""
+        assert len(asyncio.run(self.service.get_courses_by_teacher_id(self.teacher))) == 3
+        assert asyncio.run(self.service.get_course_by_id(uuid.uuid4())).name == "Algebra"
+        assert len(self.session.statements) == 2
+        sql = str(self.session.statements[0])
+        assert sql.count("SELECT") == 4 and "OVER" not in sql
+
+
+class TestCourseLinks:
+
+    def test_bulk_links_are_one_diff_per_table(self):
+        """All courses go into one statement per link table; omitted lists are left alone"""
+        courses = [uuid.uuid4(), uuid.uuid4()]
+        group, teacher = uuid.uuid4(), uuid.uuid4()
+        session = LinkSession()
+        result = asyncio.run(CourseService(CourseRepository(session)).apply_links(CourseLinksBulkUpdate(courses=[
+            {"course_id": courses[0], "group_ids": [group, group], "teacher_ids": []},
+            {"course_id": courses[1], "group_ids": [group]},
+        ])))
+        assert result.groups.added == 1 and result.teachers.removed == 0
+
+        (group_table, group_params), (teacher_table, teacher_params) = session.applied
+        assert group_table == "group_course" and group_params["courses"] == courses
+        assert sorted(group_params["link_courses"]) == sorted(courses)
+        assert teacher_table == "teacher_course" and teacher_params["courses"] == [courses[0]]
+        assert teacher_params["link_members"] == []
+
+    def test_unknown_references_write_nothing(self):
+        missing_group = uuid.uuid4()
+        session = LinkSession(missing=[("group", missing_group)])
+        update = CourseLinksBulkUpdate(courses=[{"course_id": uuid.uuid4(), "group_ids": [missing_group]}])
+        with pytest.raises(NoResultFound, match=str(missing_group)):
+            asyncio.run(CourseService(CourseRepository(session)).apply_links(update))
+        assert session.applied == []
@@ -0,0 +1,67 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.repositories.pagination import decode_cursor, encode_cursor
+from app.repositories.teacher_repository import TEACHER_SORTS, TeacherRepository
+
+
+def _row(last_name, teacher_id):
+    return SimpleNamespace(
+        Teacher=SimpleNamespace(last_name=last_name),
+        _mapping={"_key0": last_name, "_key1": "A", "_key2": teacher_id, "_total": 3},
+    )
+
+
+class TestKeysetPagination:
+
+    def test_cursor_round_trip(self):
+        """A cursor restores typed sort key values and is bound to its sort"""
+        teacher_id = uuid.uuid4()
+        cursor = encode_cursor("name", ["Шевченко", "Тарас", teacher_id])
+        assert decode_cursor(cursor, "name", TEACHER_SORTS["name"]) == ["Шевченко", "Тарас", teacher_id]
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, "created", TEACHER_SORTS["name"])
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor", "name", TEACHER_SORTS["name"])
+
+    def test_pages_seek_past_the_cursor(self, recording_session):
+        """The first page counts with a window, later ones seek by row comparison and count apart"""
+        ids = [uuid.uuid4() for _ in range(3)]
+        session = recording_session([_row("A", ids[0]), _row("B", ids[1]), _row("C", ids[2])], scalar=42)
+        repo = TeacherRepository(session)
+
+        first = asyncio.run(repo.find_page(limit=2, total="exact"))
+        assert [row.Teacher.last_name for row in first.rows] == ["A", "B"]
+        assert first.total == 3 and first.next_cursor is not None
+        sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+        assert "count(*) OVER ()" in sql and "LIMIT" in sql
+
+        second = asyncio.run(repo.find_page(limit=2, cursor=first.next_cursor, total="exact"))
+        assert second.total == 42
+        sql = str(session.statements[1].compile(dialect=postgresql.dialect()))
+        assert "(teachers.last_name, teachers.first_name, teachers.teacher_id) >" in sql
+        assert "OVER" not in sql and "OFFSET" not in sql
+
+    def test_exact_total_is_the_default(self, recording_session):
+        """Without a total mode the first page is counted exactly"""
+        session = recording_session([_row("A", uuid.uuid4())])
+        asyncio.run(TeacherRepository(session).find_page(limit=2))
+        assert "count(*) OVER ()" in str(session.statements[0].compile(dialect=postgresql.dialect()))
+
+    def test_estimated_total(self, recording_session):
+        """A page holding every row counts itself; otherwise the planner estimate is used, never a COUNT"""
+        ids = [uuid.uuid4() for _ in range(3)]
+        session = recording_session([_row("A", ids[0]), _row("B", ids[1]), _row("C", ids[2])], scalar=40)
+        repo = TeacherRepository(session)
+
+        whole = asyncio.run(repo.find_page(total="estimated"))
+        assert whole.total == 3 and whole.next_cursor is None and len(session.statements) == 1
+
+        first = asyncio.run(repo.find_page(limit=2, total="estimated"))
+        assert first.total == 40 and len(session.statements) == 3
+        assert "reltuples" in str(session.statements[2])
+        assert "OVER" not in str(session.statements[1].compile(dialect=postgresql.dialect()))
@@ -0,0 +1,68 @@
+import asyncio
+import uuid
+
+import pytest
+from pydantic import ValidationError
+
+from app.db.models.people.registration_request import RegistrationStatus
+from app.schemas.registration import BulkApproveRegistrations, BulkRejectRegistrations
+from app.services.registration_service import RegistrationService
+from app.services.timetable_service import TimetableService
+
+
+class FakeRegistrationRepository:
+    """Holds request statuses and approves or rejects whatever is still pending."""
+
+    def __init__(self, statuses, conflicts=None):
+        self.statuses = dict(statuses)
+        self.conflicts = dict(conflicts or {})
+        self.calls = []
+        self.callbacks = []
+
+    def after_commit(self, callback):
+        self.callbacks.append(callback)
+
+    async def lock_requests(self, request_ids):
+        self.calls.append("lock")
+        return {r: self.statuses[r] for r in request_ids if r in self.statuses}
+
+    async def find_approval_conflicts(self, request_ids, role):
+        self.calls.append("conflicts")
+        return {r: reason for r, reason in self.conflicts.items() if r in request_ids}
+
+    async def approve(self, request_ids, role, admin_note):
+        self.calls.append("approve")
+        return [(r, uuid.uuid4(), (role or "student")) for r in request_ids]
+
+    async def reject(self, request_ids, reason):
+        self.calls.append("reject")
+        return list(request_ids)
+
+
+class TestBulkRegistrations:
+
+    def setup_method(self):
+        self.pending, self.decided, self.clash, self.unknown = (uuid.uuid4() for _ in range(4))
+        self.repo = FakeRegistrationRepository(
+            {self.pending: RegistrationStatus.PENDING, self.decided: RegistrationStatus.APPROVED,
+             self.clash: RegistrationStatus.PENDING},
+            {self.clash: "A teacher with this name already exists"},
+        )
+
+    def test_approve_reports_every_request(self):
+        """Each distinct ID gets an outcome in request order; the batch takes the same statements at any size"""
+        ids = [self.unknown, self.pending, self.decided, self.clash, self.pending]
+        result = asyncio.run(RegistrationService(self.repo).approve(BulkApproveRegistrations(request_ids=ids)))
+        assert [item.outcome for item in result.items] == ["not_found", "approved", "already_processed", "conflict"]
+        assert result.processed == 1 and result.items[1].user_id is not None
+        assert result.items[3].detail and self.repo.calls == ["lock", "conflicts", "approve"]
+        assert self.repo.callbacks == [TimetableService.invalidate_user_contexts]
+
+    def test_reject_and_validation(self):
+        request = BulkRejectRegistrations(request_ids=[self.pending, self.decided], reason="Duplicate")
+        result = asyncio.run(RegistrationService(self.repo).reject(request))
+        assert [item.outcome for item in result.items] == ["rejected", "already_processed"]
+        assert self.repo.calls == ["lock", "reject"] and not self.repo.callbacks
+
+        with pytest.raises(ValidationError):
+            BulkApproveRegistrations(request_ids=[])
@@ -0,0 +1,68 @@
+import uuid
+from types import SimpleNamespace
+
+from app.db.models.common_enums import TimeslotFrequency
+from app.services.room_occupancy_service import RoomOccupancyIndex, RoomOccupancyService, _occupancy_indexes
+from app.services.timeslot_codec import TimeslotCodec
+from app.utils.cache import schedule_versions
+
+
+def _timeslot(timeslot_id, day, lesson, frequency):
+    return SimpleNamespace(timeslot_id=timeslot_id, day=day, lesson_id=lesson, frequency=frequency)
+
+
+def _room(name, capacity):
+    return SimpleNamespace(room_id=uuid.uuid4(), name=name, capacity=capacity)
+
+
+TIMESLOTS = [
+    _timeslot(1, 1, 1, TimeslotFrequency.ALL),
+    _timeslot(2, 1, 1, TimeslotFrequency.ODD),
+    _timeslot(3, 1, 1, TimeslotFrequency.EVEN),
+    _timeslot(4, 1, 2, TimeslotFrequency.ALL),
+]
+
+
+class TestRoomOccupancyIndex:
+
+    def setup_method(self):
+        self.small = _room("101", 20)
+        self.large = _room("201", 120)
+        self.index = RoomOccupancyIndex(TimeslotCodec(TIMESLOTS), [self.large, self.small])
+
+    def test_min_capacity_filters_and_sorts(self):
+        """Rooms are returned smallest first and filtered by capacity"""
+        assert self.index.free_rooms(1) == [self.small, self.large]
+        assert self.index.free_rooms(1, min_capacity=50) == [self.large]
+
+    def test_odd_even_weeks(self):
+        """An ODD lesson blocks ALL but leaves EVEN free"""
+        self.index.add([(self.small.room_id, 2)])
+        assert self.small not in self.index.free_rooms(1)
+        assert self.small not in self.index.free_rooms(2)
+        assert self.small in self.index.free_rooms(3)
+        assert self.small in self.index.free_rooms(4)
+
+    def test_incremental_remove_keeps_overlapping_placement(self):
+        """Removing one of two overlapping placements keeps the room busy"""
+        self.index.add([(self.small.room_id, 1), (self.small.room_id, 2)])
+        self.index.remove([(self.small.room_id, 1)])
+        assert self.small not in self.index.free_rooms(2)
+        assert self.small in self.index.free_rooms(3)
+        self.index.remove([(self.small.room_id, 2)])
+        assert self.small in self.index.free_rooms(1)
+
+    def test_apply_changes_only_patches_the_expected_version(self):
+        """An index at the expected version is patched and moves on; a stale one is dropped"""
+        schedule_id, occupancy = uuid.uuid4(), self.index.occupancy
+        _occupancy_indexes.set(schedule_id, self.index)
+        schedule_versions.bump(schedule_id)
+        RoomOccupancyService.apply_changes(schedule_id, 0, added=[(self.small.room_id, 4)])
+        assert self.small not in self.index.free_rooms(4)
+        assert self.index.version == schedule_versions.current(schedule_id) and self.index.occupancy is occupancy
+
+        schedule_versions.bump(schedule_id)
+        schedule_versions.bump(schedule_id)
+        RoomOccupancyService.apply_changes(schedule_id, self.index.version + 1, removed=[(self.small.room_id, 4)])
+        assert _occupancy_indexes.get(schedule_id) is None
+        assert self.small not in self.index.free_rooms(4)
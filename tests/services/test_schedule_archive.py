@@ -0,0 +1,45 @@
+import uuid
+from types import SimpleNamespace
+
+from app.services.schedule_archive_service import pack_payload, select_for_archival, unpack_payload
+
+
+def _schedule(label):
+    return SimpleNamespace(schedule_id=uuid.uuid4(), label=label)
+
+
+class TestScheduleRetention:
+
+    def test_keep_last_per_prefix(self):
+        """Older schedules of a prefix are archived; other labels are untouched"""
+        schedules = [_schedule("Manual"), _schedule("Gen 3"), _schedule("Gen 2"), _schedule("Gen 1"), _schedule("Draft")]
+        kept, to_archive = select_for_archival(schedules, ["Gen"], keep_last=1)
+        assert [s.label for s in kept] == ["Manual", "Gen 3"]
+        assert [s.label for s in to_archive] == ["Gen 2", "Gen 1"]
+
+    def test_latest_schedule_is_always_kept(self):
+        """The newest schedule survives even when the policy would drop it"""
+        schedules = [_schedule("Gen 2"), _schedule("Gen 1")]
+        kept, to_archive = select_for_archival(schedules, ["Gen"], keep_last=0)
+        assert [s.label for s in kept] == ["Gen 2"]
+        assert [s.label for s in to_archive] == ["Gen 1"]
+
+    def test_published_schedule_is_kept(self):
+        """Published schedules are never archived"""
+        schedules = [_schedule("Gen 3"), _schedule("Gen 2"), _schedule("Gen 1")]
+        kept, to_archive = select_for_archival(
+            schedules, ["Gen"], keep_last=1, protected=[schedules[2].schedule_id]
+        )
+        assert [s.label for s in kept] == ["Gen 3", "Gen 1"]
+        assert [s.label for s in to_archive] == ["Gen 2"]
+
+    def test_payload_round_trip(self):
+        """Archived rows are restored with their original values"""
+        assignment = SimpleNamespace(
+            assignment_id=uuid.uuid4(), timeslot_id=3, group_id=uuid.uuid4(), subgroup_no=1,
+            course_id=uuid.uuid4(), teacher_id=uuid.uuid4(), room_id=None, course_type="lab",
+        )
+        constraint = SimpleNamespace(group_id=uuid.uuid4(), course_id=uuid.uuid4(), subgroups_count=2)
+        assignments, constraints = unpack_payload(pack_payload([assignment], [constraint]))
+        assert assignments == [vars(assignment)]
+        assert constraints == [vars(constraint)]
@@ -0,0 +1,91 @@
+import datetime
+import uuid
+from types import SimpleNamespace
+
+from app.services.schedule_calendar import OccurrenceIndex, semester_days
+from app.services.timeslot_codec import EVEN_WEEK, ODD_WEEK
+
+GROUP = uuid.uuid4()
+OTHER_GROUP = uuid.uuid4()
+TEACHER = uuid.uuid4()
+
+# 2026-09-01 is a Tuesday
+START, END = datetime.date(2026, 9, 1), datetime.date(2026, 9, 30)
+
+
+def _entry(day, lesson_id, frequency="ALL", group_id=GROUP):
+    # Lesson 1 at 8:30-9:50, lesson 2 at 10:30-11:50, ...
+    hour = 8 + (lesson_id - 1) * 2
+    return SimpleNamespace(
+        day=day, lesson_id=lesson_id, frequency=frequency,
+        start_time=datetime.time(hour, 30), end_time=datetime.time(hour + 1, 50),
+        group_id=group_id, teacher_id=TEACHER, room_id=None
+    )
+
+
+def _dates(pairs):
+    return [(d.isoformat(), e.lesson_id) for d, e in pairs]
+
+
+class TestScheduleCalendar:
+
+    def test_week_parity_and_holidays(self):
+        """The anchor's week (Monday to Sunday) is odd, weeks alternate, holidays are dropped"""
+        dates, weekday, week = semester_days(
+            START, END, parity_anchor=datetime.date(2026, 9, 3), holidays=[datetime.date(2026, 9, 8)]
+        )
+        days = {d.isoformat(): (int(wd), int(w)) for d, wd, w in zip(dates.astype(object), weekday, week)}
+        assert days["2026-09-01"] == (2, ODD_WEEK)
+        assert days["2026-09-06"] == (7, ODD_WEEK)
+        assert days["2026-09-07"] == (1, EVEN_WEEK)
+        assert days["2026-09-14"] == (1, ODD_WEEK)
+        assert "2026-09-08" not in days
+        assert len(days) == 29
+
+    def test_occurrences_follow_frequency(self):
+        """ALL lessons are held every week, ODD and EVEN ones every second week, ordered by date and lesson"""
+        index = OccurrenceIndex(
+            [_entry(2, 3), _entry(2, 1, "ODD"), _entry(3, 2, "EVEN")],
+            *semester_days(START, END, START, holidays=[datetime.date(2026, 9, 15)])
+        )
+        assert _dates(index.between(START, END)) == [
+            ("2026-09-01", 1), ("2026-09-01", 3),
+            ("2026-09-08", 3), ("2026-09-09", 2),
+            ("2026-09-22", 3), ("2026-09-23", 2),
+            ("2026-09-29", 1), ("2026-09-29", 3),
+        ]
+
+    def test_date_range_and_entity_filters(self):
+        """A date range is a slice of the index; group and teacher filters narrow it"""
+        index = OccurrenceIndex(
+            [_entry(2, 1), _entry(2, 2, group_id=OTHER_GROUP), _entry(3, 1)],
+            *semester_days(START, END, START)
+        )
+        day = datetime.date(2026, 9, 8)
+        assert _dates(index.between(day, day)) == [("2026-09-08", 1), ("2026-09-08", 2)]
+        assert _dates(index.between(day, day, group_ids=[OTHER_GROUP])) == [("2026-09-08", 2)]
+        assert len(index.between(START, END, group_ids=[GROUP])) == 10
+        assert index.between(START, END, group_ids=[uuid.uuid4()]) == []
+        assert len(index.between(START, END, teacher_id=TEACHER)) == len(index)
+
+    def test_current_and_next_lessons(self):
+        """A per-entity timeline finds the lesson in progress and the next ones across days and parity"""
+        index = OccurrenceIndex(
+            [_entry(2, 1), _entry(2, 2, "ODD"), _entry(2, 2, "EVEN", group_id=OTHER_GROUP), _entry(3, 1)],
+            *semester_days(START, END, START)
+        )
+        timeline = index.timeline(group_ids=[GROUP])
+        assert index.timeline(group_ids=[GROUP]) is timeline
+
+        current, upcoming = timeline.at(datetime.datetime(2026, 9, 1, 9, 0))
+        assert [(s.isoformat(), e.lesson_id) for s, e in current] == [("2026-09-01T08:30:00", 1)]
+        assert [(s.isoformat(), e.lesson_id) for s, e in upcoming] == [("2026-09-01T10:30:00", 2)]
+
+        # Even week: lesson 2 is the other group's, so Wednesday comes next
+        current, upcoming = timeline.at(datetime.datetime(2026, 9, 8, 10, 0))
+        assert current == []
+        assert [(s.isoformat(), e.lesson_id) for s, e in upcoming] == [("2026-09-09T08:30:00", 1)]
+
+        both = index.timeline(group_ids=[GROUP, OTHER_GROUP])
+        assert len(both.at(datetime.datetime(2026, 9, 8, 11, 0))[0]) == 1
+        assert both.at(datetime.datetime(2026, 9, 30, 12, 0)) == ([], [])
@@ -0,0 +1,108 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+from app.services.schedule_diff_service import DiffTotals, ScheduleDiffService, diff_rows
+from app.utils.cache import schedule_versions
+
+GROUP = uuid.uuid4()
+COURSE = uuid.uuid4()
+TEACHER = uuid.uuid4()
+
+
+def _assignment(timeslot_id, teacher_id=TEACHER, room_id=None, subgroup_no=1):
+    return {
+        "assignment_id": uuid.uuid4(),
+        "group_id": GROUP,
+        "course_id": COURSE,
+        "subgroup_no": subgroup_no,
+        "course_type": "lec",
+        "timeslot_id": timeslot_id,
+        "teacher_id": teacher_id,
+        "room_id": room_id,
+    }
+
+
+class TestDiffRows:
+
+    def test_identical_schedules(self):
+        """Unchanged lessons do not show up in the diff"""
+        base = [_assignment(1), _assignment(2)]
+        target = [dict(a, assignment_id=uuid.uuid4()) for a in base]
+        assert diff_rows(base, target) == []
+
+    def test_added_removed_moved(self):
+        """Lessons are paired per (group, course, subgroup, type)"""
+        base = [_assignment(1), _assignment(2), _assignment(4, subgroup_no=2)]
+        target = [_assignment(1), _assignment(3), _assignment(5, subgroup_no=3)]
+        changes = {(c["change"], c["old_timeslot_id"], c["new_timeslot_id"]) for c in diff_rows(base, target)}
+        assert changes == {("moved", 2, 3), ("removed", 4, None), ("added", None, 5)}
+
+
+class FakeDiffRepository:
+    """Yields diff rows one at a time and records how many were pulled."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.pulled = 0
+
+    async def stream_diff(self, base_schedule_id, target_schedule_id):
+        for row in self.rows:
+            self.pulled += 1
+            yield row
+
+
+class TestDiffStream:
+
+    def test_changes_are_streamed_then_summarized(self):
+        """Changes are consumed as the cursor yields them; totals come at the end"""
+        rows = diff_rows([_assignment(1), _assignment(2)], [_assignment(3), _assignment(2, teacher_id=uuid.uuid4())])
+        repo = FakeDiffRepository(rows)
+        base, target = uuid.uuid4(), uuid.uuid4()
+
+        async def consume():
+            totals, pulled = DiffTotals(), []
+            async for change in ScheduleDiffService(repo).stream_changes(base, target):
+                pulled.append(repo.pulled)
+                totals.add(change)
+            return pulled, totals.summary(base, target)
+
+        pulled, summary = asyncio.run(consume())
+        assert pulled == list(range(1, len(rows) + 1))
+        assert summary.moved == 2 and summary.teachers[0].moved == 2
+
+
+class FakeCommitRepository:
+    """Defers after-commit callbacks until `commit`; never answers a diff query."""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def after_commit(self, callback):
+        self.callbacks.append(callback)
+
+    def commit(self):
+        for callback in self.callbacks:
+            callback()
+        self.callbacks = []
+
+    async def find_diff(self, base_schedule_id, target_schedule_id):
+        raise AssertionError("Remembered schedules are diffed in memory")
+
+
+class TestRememberedSchedules:
+
+    def test_snapshots_are_stored_under_the_committed_version(self):
+        """A saved schedule is remembered after the commit's version bump, so later diffs find it"""
+        base, target = uuid.uuid4(), uuid.uuid4()
+        repo = FakeCommitRepository()
+        service = ScheduleDiffService(repo)
+        for schedule_id, timeslot_id in ((base, 1), (target, 2)):
+            # Saving registers the version bump first, as AssignmentService does
+            repo.after_commit(lambda schedule_id=schedule_id: schedule_versions.bump(schedule_id))
+            service.remember(schedule_id, [SimpleNamespace(**_assignment(timeslot_id))])
+        assert service._snapshot(base) is None
+        repo.commit()
+
+        changes = asyncio.run(service.get_changes(base, target))
+        assert [(c.change, c.old_timeslot_id, c.new_timeslot_id) for c in changes] == [("moved", 1, 2)]
@@ -0,0 +1,72 @@
+import uuid
+from types import SimpleNamespace
+
+import numpy as np
+
+from app.schemas.teacher_preference import TeacherPreferences
+from app.services.schedule_metrics import compute_metrics, preference_masks
+from app.services.schedule_snapshot import ScheduleSnapshot
+from app.services.timeslot_codec import TimeslotCodec
+
+GROUP = uuid.uuid4()
+TEACHER = uuid.uuid4()
+ROOM = uuid.uuid4()
+
+# Monday (timeslots 1-4) and Tuesday (5-8) lessons 1-4 every week, Monday lesson 2 odd/even
+CODEC = TimeslotCodec(
+    [SimpleNamespace(timeslot_id=d * 4 + l + 1, day=d + 1, lesson_id=l + 1, frequency="ALL")
+     for d in range(2) for l in range(4)]
+    + [SimpleNamespace(timeslot_id=9, day=1, lesson_id=2, frequency="ODD"),
+       SimpleNamespace(timeslot_id=10, day=1, lesson_id=2, frequency="EVEN")]
+)
+
+
+def _row(timeslot_id, group_id=GROUP, subgroup_no=1, course_id=None):
+    return (uuid.uuid4(), timeslot_id, group_id, subgroup_no, course_id or uuid.uuid4(), TEACHER, ROOM, "lec")
+
+
+def _metrics(rows, group_sizes=(20,), capacity=30, preferences=None):
+    snapshot = ScheduleSnapshot.from_rows(rows)
+    allowed_days, avoided = preference_masks([TEACHER], preferences or {}, CODEC)
+    return compute_metrics(
+        snapshot, CODEC, np.array(group_sizes), np.array([capacity]), allowed_days, avoided
+    )
+
+
+class TestScheduleMetrics:
+
+    def test_windows_days_and_spread(self):
+        """Idle lessons between classes count per week; odd/even lessons fill a window half the time"""
+        metrics = _metrics([_row(1), _row(4), _row(9), _row(6), _row(7)])
+        group = metrics["groups"][0]
+        # Monday lessons 1 and 4, lesson 2 in odd weeks only: 1 window odd + 2 even
+        assert group["windows"] == 1.5
+        assert group["max_daily_windows"] == 2
+        assert group["days_used"] == 2
+        assert group["first_lesson_spread"] == 1
+        assert group["last_lesson_spread"] == 1
+
+    def test_teacher_preference_violations(self):
+        """Lessons outside preferred days and in avoided slots (including odd/even halves) are counted"""
+        metrics = _metrics(
+            [_row(1), _row(9), _row(6)],
+            preferences={TEACHER: TeacherPreferences.project({"preferred_days": ["mon"], "avoid_slots": ["mon.all.2"]})},
+        )
+        teacher = metrics["teachers"][0]
+        assert teacher["preferred_day_violations"] == 1
+        assert teacher["avoid_slot_violations"] == 1
+
+    def test_room_slack_counts_group_share(self):
+        """Split groups take their share of seats; groups sharing a lecture add up"""
+        course = uuid.uuid4()
+        other = uuid.uuid4()
+        rows = [
+            _row(1, subgroup_no=1, course_id=course), _row(2, subgroup_no=2, course_id=course),
+            _row(3, group_id=GROUP), _row(3, group_id=other),
+        ]
+        snapshot_groups = sorted([GROUP, other], key=lambda g: g.bytes)
+        sizes = [20 if g == GROUP else 15 for g in snapshot_groups]
+        room = _metrics(rows, group_sizes=sizes, capacity=30)["rooms"][0]
+        assert room["lessons"] == 6
+        assert room["min_slack"] == -5
+        assert room["overflows"] == 2
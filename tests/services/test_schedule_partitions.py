@@ -0,0 +1,74 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+from sqlalchemy.exc import DBAPIError
+
+from app.repositories import assignment_partition_repository
+from app.repositories.assignment_partition_repository import AssignmentPartitionRepository
+from app.services.schedule_service import ScheduleService
+
+
+class FakeScheduleRepository:
+
+    def __init__(self, calls):
+        self.calls = calls
+
+    async def create(self, label, schedule_id=None, **_):
+        self.calls.append(("insert", schedule_id))
+        return SimpleNamespace(schedule_id=schedule_id, label=label, created_at=None)
+
+    def after_commit(self, callback):
+        pass
+
+
+class FakePartitionRepository:
+
+    def __init__(self, calls):
+        self.calls = calls
+
+    async def create_partition(self, schedule_id):
+        self.calls.append(("partition", schedule_id))
+        return True
+
+
+class TestSchedulePartitions:
+
+    def test_partition_is_created_before_the_schedule(self):
+        """The partition's own transaction must not wait on the request's insert into `schedules`"""
+        calls = []
+        service = ScheduleService(FakeScheduleRepository(calls), FakePartitionRepository(calls))
+        schedule = asyncio.run(service.create_schedule("Gen 1"))
+        assert calls == [("partition", schedule.schedule_id), ("insert", schedule.schedule_id)]
+
+
+class LockedConnection:
+    """Grants SET LOCAL, then times out on the first DDL statement."""
+
+    def __init__(self, statements):
+        self.statements = statements
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt):
+        self.statements.append(str(stmt))
+        if not str(stmt).startswith("SET LOCAL"):
+            raise DBAPIError(str(stmt), None, Exception("canceling statement due to lock timeout"))
+
+
+class TestPartitionDrop:
+
+    def test_lock_timeout_falls_back_to_batched_deletes(self, monkeypatch, recording_session):
+        """A purge gives up on the partition rather than queue every assignment query behind it"""
+        monkeypatch.setattr(assignment_partition_repository, "_partitioned", True)
+        statements = []
+        session = recording_session(scalar=True)
+        session.bind = SimpleNamespace(begin=lambda: LockedConnection(statements))
+
+        dropped = asyncio.run(AssignmentPartitionRepository(session).drop_partition(uuid.uuid4()))
+        assert dropped is False
+        assert statements[0] == "SET LOCAL lock_timeout = '2s'" and "DETACH PARTITION" in statements[1]
@@ -0,0 +1,105 @@
+import asyncio
+import uuid
+
+import numpy as np
+
+from app.services.schedule_snapshot import NO_ROOM, ScheduleSnapshot, pack_snapshot, unpack_snapshot
+from app.services.schedule_snapshot_service import ScheduleSnapshotService
+from app.utils.cache import schedule_versions
+
+GROUP = uuid.uuid4()
+TEACHER = uuid.uuid4()
+ROOM = uuid.uuid4()
+
+
+def _row(timeslot_id, course_id, room_id=ROOM, course_type="lec"):
+    return (uuid.uuid4(), timeslot_id, GROUP, 1, course_id, TEACHER, room_id, course_type)
+
+
+class TestScheduleSnapshot:
+
+    def test_round_trip(self):
+        """Unpacked columns decode back to the original rows"""
+        courses = [uuid.uuid4(), uuid.uuid4()]
+        rows = [_row(1, courses[0]), _row(2, courses[1], room_id=None, course_type="lab"), _row(3, courses[0])]
+        snapshot = unpack_snapshot(pack_snapshot(ScheduleSnapshot.from_rows(rows)))
+        assert list(snapshot.rows()) == rows
+
+    def test_dictionary_encoding(self):
+        """Repeated IDs share one dictionary entry; remote lessons have no room"""
+        course = uuid.uuid4()
+        snapshot = ScheduleSnapshot.from_rows([_row(1, course), _row(2, course, room_id=None)])
+        assert len(snapshot.groups) == len(snapshot.teachers) == len(snapshot.rooms) == 1
+        assert np.array_equal(snapshot.room, [0, NO_ROOM])
+
+    def test_unpacked_columns_are_views(self):
+        """Columns point into the decompressed buffer instead of being copied"""
+        snapshot = unpack_snapshot(pack_snapshot(ScheduleSnapshot.from_rows([_row(5, uuid.uuid4())])))
+        assert snapshot.timeslot.base is not None
+        assert not snapshot.timeslot.flags.writeable
+
+    def test_empty_schedule(self):
+        """A schedule without assignments packs and unpacks"""
+        snapshot = unpack_snapshot(pack_snapshot(ScheduleSnapshot.from_rows([])))
+        assert len(snapshot) == 0
+
+
+class FakeSnapshotRepository:
+    """Stored payloads by schedule; after-commit callbacks wait for commit()."""
+
+    def __init__(self):
+        self.payloads = {}
+        self.callbacks = []
+
+    def after_commit(self, callback):
+        self.callbacks.append(callback)
+
+    def commit(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+    async def find_payload(self, schedule_id, format):
+        return self.payloads.get(schedule_id)
+
+    async def upsert(self, schedule_id, format, assignments_count, payload):
+        self.payloads[schedule_id] = payload
+
+
+class FakeAssignmentRepository:
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def find_rows_by_schedule_id(self, schedule_id):
+        return list(self.rows)
+
+
+class TestScheduleSnapshotService:
+
+    def setup_method(self):
+        self.schedule_id = uuid.uuid4()
+        self.stored = [_row(1, uuid.uuid4())]
+        self.repo = FakeSnapshotRepository()
+        self.repo.payloads[self.schedule_id] = pack_snapshot(ScheduleSnapshot.from_rows(self.stored))
+
+    def test_uncommitted_snapshot_is_not_cached(self):
+        """A snapshot written by a transaction that never commits is not served from memory"""
+        edited = [_row(2, uuid.uuid4())]
+        asyncio.run(ScheduleSnapshotService(self.repo, FakeAssignmentRepository(edited)).refresh(self.schedule_id))
+        self.repo.callbacks.clear()
+        self.repo.payloads[self.schedule_id] = pack_snapshot(ScheduleSnapshot.from_rows(self.stored))
+
+        snapshot = asyncio.run(ScheduleSnapshotService(self.repo, FakeAssignmentRepository([])).load(self.schedule_id))
+        assert list(snapshot.rows()) == self.stored
+
+    def test_stored_snapshot_older_than_the_version_is_rebuilt(self):
+        """After a committed change the stored payload is only used if it was rewritten at that version"""
+        edited = [_row(2, uuid.uuid4())]
+        schedule_versions.bump(self.schedule_id)
+        service = ScheduleSnapshotService(self.repo, FakeAssignmentRepository(edited))
+        assert list(asyncio.run(service.load(self.schedule_id)).rows()) == edited
+
+        self.repo.commit()
+        service.assignment_repo = FakeAssignmentRepository([])
+        assert list(asyncio.run(service.load(self.schedule_id)).rows()) == edited
@@ -0,0 +1,44 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from app.db.models.trigram import EMAIL, FULL_NAME
+from app.repositories.search_repository import SEARCH_SOURCES, _branch, like_pattern
+from app.services.search_service import SearchService
+
+
+class FakeSearchRepository:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    async def search(self, q, types, limit):
+        self.calls.append((q, list(types), limit))
+        return self.rows
+
+
+class TestSearch:
+
+    def test_queries_match_the_indexed_expressions(self):
+        """Each type searches only trigram-indexed expressions; LIKE wildcards in the query are literal"""
+        assert f"{FULL_NAME} ILIKE :pattern OR :q <% {FULL_NAME}" in _branch("teacher")
+        assert f"{EMAIL} ILIKE :pattern" in _branch("registration")
+        assert like_pattern("50%_a\\b") == "%50\\%\\_a\\\\b%"
+
+    def test_all_types_by_default(self):
+        row = SimpleNamespace(_mapping={
+            "type": "group", "id": uuid.uuid4(), "label": "КН-21", "detail": None, "score": 1.5
+        })
+        repo = FakeSearchRepository([row])
+        response = asyncio.run(SearchService(repo).search("  кн-2 ", limit=3))
+        assert repo.calls == [("кн-2", list(SEARCH_SOURCES), 3)]
+        assert response.results[0].label == "КН-21" and response.query == "кн-2"
+
+    def test_query_length_is_checked_after_stripping(self):
+        """Padding cannot sneak a one- or two-character query past the minimum length"""
+        repo = FakeSearchRepository([])
+        with pytest.raises(ValueError):
+            asyncio.run(SearchService(repo).search("  a  "))
+        assert repo.calls == []
@@ -0,0 +1,30 @@
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.teacher_preference import TeacherPreferences
+from app.services.teacher_preference_service import overlapping_slots
+
+
+class TestTeacherPreferences:
+
+    def test_validated_and_normalized_on_write(self):
+        """Entries are lower-cased and de-duplicated; unknown days and malformed slots are rejected"""
+        prefs = TeacherPreferences(preferred_days=["Mon", "mon", "fri"], avoid_slots=[" TUE.all.3", "tue.all.3"])
+        assert prefs.model_dump() == {"preferred_days": ["mon", "fri"], "avoid_slots": ["tue.all.3"]}
+        assert TeacherPreferences(avoid_slots=["mon.odd.1"]).solver_payload() == {"avoid_slots": ["mon.odd.1"]}
+
+        for bad in ({"preferred_days": ["monday"]}, {"avoid_slots": ["mon.1"]}, {"avoid_slots": ["mon.all.0"]}):
+            with pytest.raises(ValidationError):
+                TeacherPreferences(**bad)
+
+    def test_legacy_blobs_are_projected(self):
+        """Stored blobs from before validation keep only well-formed entries"""
+        prefs = TeacherPreferences.project(
+            {"preferred_days": ["mon", "funday", "mon"], "avoid_slots": ["mon.all.1", 5, "x"], "note": "?"}
+        )
+        assert prefs.preferred_days == ["mon"] and prefs.avoid_slots == ["mon.all.1"]
+        assert TeacherPreferences.project({}).solver_payload() == {}
+
+    def test_overlapping_slots(self):
+        assert overlapping_slots("mon.all.1") == ["mon.all.1", "mon.odd.1", "mon.even.1"]
+        assert overlapping_slots("tue.even.2") == ["tue.even.2", "tue.all.2"]